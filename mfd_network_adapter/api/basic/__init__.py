@@ -1,3 +1,52 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 """Module for basic static API."""
+
+import re
+import shlex
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+_section_regex = re.compile(r"^<<<(?P<index>\d+)\n(?P<output>.*?)(?=^<<<\d+$|\Z)", re.DOTALL | re.MULTILINE)
+
+
+def execute_sections(
+    connection: "Connection",
+    commands: Iterable[str],
+    namespace: Optional[str] = None,
+    prefix: str = "",
+    parallel: bool = False,
+) -> Dict[int, str]:
+    """
+    Execute many shell commands in a single call and get output of each of them.
+
+    Output of each command is preceded by `<<<index` marker line, failure of command doesn't stop the remaining ones.
+    With parallel, commands are run concurrently in subshells, output of each is printed at once when it finishes.
+
+    :param connection: Connection object
+    :param commands: Shell commands to execute
+    :param namespace: Namespace in which commands will be executed, optional
+    :param prefix: Shell statements executed before commands, e.g. variable assignments
+    :param parallel: Run commands concurrently
+    :return: Outputs keyed by index of command in passed commands, empty string for missing output
+    """
+    commands = list(commands)
+    if not commands:
+        return {}
+
+    if parallel:
+        payload = " ".join(
+            f"( out=$({command}); printf '<<<%s\\n%s\\n' {index} \"$out\" ) &" for index, command in enumerate(commands)
+        )
+        payload += " wait"
+    else:
+        payload = "; ".join(f'echo "<<<{index}"; {command}' for index, command in enumerate(commands))
+    payload = f"{prefix}{payload}"
+    if namespace is not None:
+        payload = f"ip netns exec {namespace} sh -c {shlex.quote(payload)}"
+
+    output = connection.execute_command(payload, shell=True, expected_return_codes=None).stdout
+    sections = {int(match.group("index")): match.group("output") for match in _section_regex.finditer(output)}
+    return {index: sections.get(index, "") for index in range(len(commands))}
@@ -3,16 +3,24 @@
 """Module for Linux static API."""
 
 import re
-from typing import TYPE_CHECKING, Optional
+from collections import defaultdict
+from dataclasses import fields
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from mfd_kernel_namespace import add_namespace_call_command
 from mfd_typing import MACAddress
 
+from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 from mfd_network_adapter.network_interface.exceptions import MacAddressNotFound
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
 
+    from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+    from mfd_network_adapter.network_interface.data_structures import ChannelSettings, RingBufferSettings
+
+SettingsType = TypeVar("SettingsType", bound=Union["RingBufferSettings", "ChannelSettings"])
+
 
 def get_mac_address(connection: "Connection", interface_name: str, namespace: Optional[str]) -> MACAddress:
     """
@@ -31,3 +39,145 @@ def get_mac_address(connection: "Connection", interface_name: str, namespace: Op
     if not match:
         raise MacAddressNotFound(f"No MAC address found for interface: {interface_name}")
     return MACAddress(match.group("mac_address"))
+
+
+def parse_ethtool_settings(output: str, settings_type: Type[SettingsType]) -> Optional[SettingsType]:
+    """
+    Parse pre-set maximums and current hardware settings from `ethtool -g` or `ethtool -l` output.
+
+    :param output: ethtool output
+    :param settings_type: RingBufferSettings or ChannelSettings
+    :return: Parsed settings, settings not available are None, None when output does not contain settings
+    """
+    matched_settings = re.search(
+        r"pre-set maximums:(?P<maximum>.*)current hardware settings:(?P<current>.*)", output, re.I | re.S
+    )
+    if matched_settings is None:
+        return None
+
+    settings = settings_type()
+    for settings_type_name in ("maximum", "current"):
+        options = getattr(settings, settings_type_name)
+        for option in fields(options):
+            setting_pattern = rf"^\s*{option.name.replace('_', ' ')}:\s+(?P<setting_value>\d+)"
+            matched_value = re.search(setting_pattern, matched_settings[settings_type_name], re.I | re.M)
+            if matched_value:
+                setattr(options, option.name, int(matched_value["setting_value"]))
+    return settings
+
+
+def execute_ip_batch(
+    connection: "Connection", commands: Iterable[str], namespace: Optional[str] = None
+) -> Dict[int, str]:
+    """
+    Execute many ip commands in a single `ip -batch` call.
+
+    Commands are passed without the leading `ip`, e.g. `addr add 1.1.1.1/24 dev eth0`.
+    Batch is executed with `-force`, so failure of one command doesn't stop the remaining ones.
+
+    :param connection: Connection object
+    :param commands: ip commands to execute
+    :param namespace: Namespace in which commands will be executed, optional
+    :return: Error messages of failed commands, keyed by index of command in passed commands
+    :raises NetworkAdapterModuleException: When ip failed without reporting any failed command
+    """
+    commands = list(commands)
+    if not commands:
+        return {}
+
+    result = connection.execute_command(
+        add_namespace_call_command("ip -force -batch -", namespace=namespace),
+        input_data="\n".join(commands) + "\n",
+        expected_return_codes=None,
+    )
+    if not result.return_code:
+        return {}
+
+    errors = {}
+    messages = []
+    for line in (result.stderr or "").splitlines():
+        match = re.match(r"^Command failed \S*:(?P<line>\d+)$", line.strip())
+        if match:
+            errors[int(match.group("line")) - 1] = "\n".join(messages)
+            messages = []
+        elif line.strip():
+            messages.append(line.strip())
+
+    if not errors:
+        raise NetworkAdapterModuleException(f"Execution of ip batch failed - {result.stderr}")
+    return errors
+
+
+def execute_tunnel_batch(
+    connection: "Connection",
+    tunnels: Iterable["TunnelSpec"],
+    get_commands: Callable[["TunnelSpec"], List[str]],
+    skipped_errors: Iterable[str] = (),
+    exception: Optional[Type[NetworkAdapterModuleException]] = None,
+    action: str = "execute ip commands of tunnels",
+) -> Dict[Tuple[Optional[str], str], str]:
+    """
+    Execute ip commands of many tunnels using single `ip -batch` call per namespace.
+
+    :param connection: Connection object
+    :param tunnels: Tunnels to process
+    :param get_commands: Function returning ip commands (without the leading `ip`) of single tunnel,
+                         the first one adds or deletes link of tunnel
+    :param skipped_errors: Error messages of the first command of tunnel, which are not treated as failure,
+                           e.g. 'File exists'
+    :param exception: Exception raised when any of tunnels failed, errors are only returned when not passed
+    :param action: Description of action used in exception message, e.g. 'create VxLAN tunnels'
+    :return: Error messages of failed tunnels, keyed by namespace and name of tunnel
+    :raises exception: When any of tunnels failed and exception is passed
+    """
+    skipped_errors = tuple(skipped_errors)
+    commands_per_namespace = defaultdict(list)
+    for tunnel in tunnels:
+        commands_per_namespace[tunnel.namespace_name].extend(
+            (tunnel.name, position, command) for position, command in enumerate(get_commands(tunnel))
+        )
+
+    errors = defaultdict(list)
+    for namespace, commands in commands_per_namespace.items():
+        failed = execute_ip_batch(connection, [command for *_, command in commands], namespace=namespace)
+        for index, message in sorted(failed.items()):
+            tunnel_name, position, command = commands[index]
+            if position == 0 and any(skipped_error in message for skipped_error in skipped_errors):
+                continue
+            errors[(namespace, tunnel_name)].append(f"{command}: {message}")
+    errors = {key: "\n".join(messages) for key, messages in errors.items()}
+    if errors and exception is not None:
+        failed = "\n".join(
+            f"{tunnel_name}{f' (namespace {namespace})' if namespace else ''}: {message}"
+            for (namespace, tunnel_name), message in errors.items()
+        )
+        raise exception(f"Failed to {action}:\n{failed}")
+    return errors
+
+
+def delete_tunnel_batch(
+    connection: "Connection",
+    tunnels: Iterable["TunnelSpec"],
+    exception: Optional[Type[NetworkAdapterModuleException]] = None,
+    action: str = "delete tunnels",
+) -> Dict[Tuple[Optional[str], str], str]:
+    """
+    Delete links of many tunnels using single `ip -batch` call per namespace.
+
+    Not existing tunnels are not treated as failure.
+
+    :param connection: Connection object
+    :param tunnels: Tunnels to delete, only name and namespace_name are used
+    :param exception: Exception raised when any of tunnels failed, errors are only returned when not passed
+    :param action: Description of action used in exception message, e.g. 'delete VxLAN tunnels'
+    :return: Error messages of failed tunnels, keyed by namespace and name of tunnel
+    :raises exception: When any of tunnels failed and exception is passed
+    """
+    return execute_tunnel_batch(
+        connection,
+        tunnels,
+        lambda tunnel: [f"link del {tunnel.name}"],
+        skipped_errors=("Cannot find device",),
+        exception=exception,
+        action=action,
+    )
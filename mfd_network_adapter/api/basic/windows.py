@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: MIT
 """Module for basic windows APIs."""
 
+import json
 import re
 import typing
+from typing import Any, Dict, List
 
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 
@@ -25,3 +27,29 @@ def get_logical_processors_count(connection: "Connection") -> int:
         return int(match.group("logical_processors_num"))
     else:
         raise NetworkAdapterModuleException("Failed to fetch the logical processors count")
+
+
+def execute_powershell_json(
+    connection: "Connection", queries: Dict[str, str], depth: int = 4
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Execute batch of PowerShell queries in single PowerShell process and get their results as JSON.
+
+    Each query is wrapped with try/catch, so failing query results in empty list and does not break the batch.
+    Queries should select required properties (Select-Object) to limit size of transferred output.
+
+    :param connection: Connection object
+    :param queries: Dict with name of query as key and PowerShell pipeline as value
+    :param depth: Depth of ConvertTo-Json serialization
+    :return: Dict with name of query as key and list of returned objects as value
+    :raises NetworkAdapterModuleException: if output is not valid JSON
+    """
+    entries = "; ".join(f"'{name}' = @(try {{ {query} }} catch {{ }})" for name, query in queries.items())
+    command = f"@{{ {entries} }} | ConvertTo-Json -Depth {depth} -Compress"
+    output = connection.execute_powershell(command, expected_return_codes={0}).stdout.strip()
+    try:
+        results = json.loads(output) if output else {}
+    except json.JSONDecodeError as e:
+        raise NetworkAdapterModuleException(f"Cannot parse PowerShell JSON output:\n{output}") from e
+    # ConvertTo-Json serializes single element array as object when nested value is unrolled
+    return {name: result if isinstance(result := results.get(name) or [], list) else [result] for name in queries}
@@ -2,12 +2,39 @@
 # SPDX-License-Identifier: MIT
 """Module for utils esxi static api."""
 
-from typing import TYPE_CHECKING
+import csv
+import json
+import re
+from typing import TYPE_CHECKING, Any, Iterable
+
+from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
 
 
+def execute_esxcli(connection: "Connection", command: str, formatter: str = "json", cli: str = "esxcli") -> Any:
+    """
+    Execute esxcli (or localcli) command with structured output formatter and parse its output.
+
+    :param connection: Connection to the machine
+    :param command: esxcli namespace and command with arguments, e.g. "network nic get -n vmnic0"
+    :param formatter: output formatter, "json" or "csv"
+    :param cli: cli tool with optional arguments, e.g. "esxcli" or "localcli --plugin-dir <dir>"
+    :return: parsed JSON for json formatter, list of rows (dictionaries) for csv formatter
+    :raises NetworkAdapterModuleException: when formatter is not supported or output cannot be parsed
+    """
+    if formatter not in ("json", "csv"):
+        raise NetworkAdapterModuleException(f"Not supported esxcli formatter: {formatter}")
+    output = connection.execute_command(f"{cli} --formatter={formatter} {command}").stdout
+    if formatter == "csv":
+        return list(csv.DictReader(output.strip().splitlines()))
+    try:
+        return json.loads(output)
+    except json.JSONDecodeError as e:
+        raise NetworkAdapterModuleException(f"Cannot parse output of {cli} {command}:\n{output}") from e
+
+
 def is_vib_installed(connection: "Connection", vib_name: str) -> bool:
     """
     Check if vib is installed.
@@ -20,3 +47,135 @@ def is_vib_installed(connection: "Connection", vib_name: str) -> bool:
         connection.execute_command(f"esxcli software vib get -n {vib_name}", expected_return_codes={0, 1}).return_code
         == 0
     )
+
+
+VSISH_TOKEN_REGEX = re.compile(
+    r'(?P<string>"(?:[^"\\]|\\.)*")|(?P<hex>0x[0-9a-fA-F]+)|(?P<punctuation>[{}\[\]:,])|(?P<word>[^\s{}\[\]:,"]+)'
+)
+VSISH_SECTION_REGEX = re.compile(
+    r"^<<<vsish (?P<path>\S+)\n(?P<output>.*?)^>>>vsish (?P<rc>\d+)$", re.DOTALL | re.MULTILINE
+)
+
+
+def parse_vsish_output(output: str, convert_hex: bool = True) -> Any:
+    """
+    Parse output of vsish pretty print mode (vsish -pe get) into python objects.
+
+    vsish pretty print is close to JSON, but contains trailing commas, unquoted hex values and unquoted words.
+
+    :param output: Output of vsish -pe get
+    :param convert_hex: Convert hex values into int, if False they are returned as strings, e.g. "0x7"
+    :return: Parsed structure - dict, list or single value
+    :raises NetworkAdapterModuleException: when output cannot be parsed
+    """
+    start = min((index for index in (output.find("{"), output.find("[")) if index != -1), default=0)
+    tokens = []
+    for match in VSISH_TOKEN_REGEX.finditer(output, start):
+        kind, value = match.lastgroup, match.group()
+        if kind == "hex":
+            value = str(int(value, 16)) if convert_hex else f'"{value}"'
+        elif kind == "punctuation" and value in "}]" and tokens and tokens[-1] == ",":
+            tokens.pop()
+        elif kind == "word" and not re.fullmatch(r"-?\d+(\.\d+)?|true|false|null", value):
+            value = json.dumps(value)
+        tokens.append(value)
+    try:
+        return json.loads("".join(tokens), strict=False)
+    except json.JSONDecodeError as e:
+        raise NetworkAdapterModuleException(f"Cannot parse vsish output:\n{output}") from e
+
+
+def _parse_vsish_sections(output: str) -> dict[str, str | None]:
+    """
+    Split output of batched vsish script into outputs of single vsish calls.
+
+    :param output: Output of batched vsish script
+    :return: Dictionary with vsish path as key and output as value, None when vsish call failed
+    """
+    return {
+        match.group("path"): match.group("output") if match.group("rc") == "0" else None
+        for match in VSISH_SECTION_REGEX.finditer(output)
+    }
+
+
+def _vsish_section_command(operation: str, path: str) -> str:
+    """
+    Prepare shell command printing delimited output of single vsish call.
+
+    :param operation: vsish operation with options, e.g. "-pe get"
+    :param path: vsish path, may contain shell variables
+    :return: shell command
+    """
+    return f'echo "<<<vsish {path}"; vsish {operation} "{path}" 2>&1; echo ">>>vsish $?"'
+
+
+def vsish_get_many(connection: "Connection", paths: Iterable[str], convert_hex: bool = True) -> dict[str, Any | None]:
+    """
+    Read many vsish nodes using single command executed on the host.
+
+    :param connection: Connection to the machine
+    :param paths: vsish paths to read, e.g. ["/net/pNics/vmnic0/rxqueues/info"]
+    :param convert_hex: Convert hex values into int, if False they are returned as strings
+    :return: Dictionary with path as key and parsed node as value, None when node cannot be read
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+    command = "; ".join(_vsish_section_command("-pe get", path) for path in paths)
+    sections = _parse_vsish_sections(connection.execute_command(command, shell=True).stdout)
+    return {
+        path: parse_vsish_output(sections[path], convert_hex=convert_hex) if sections.get(path) is not None else None
+        for path in paths
+    }
+
+
+def _parse_vsish_ls(output: str) -> list[str]:
+    """
+    Parse output of vsish -e ls into list of entries.
+
+    :param output: Output of vsish -e ls
+    :return: List of entries without trailing slashes
+    """
+    return [line.strip().rstrip("/") for line in output.splitlines() if line.strip()]
+
+
+def vsish_ls_many(connection: "Connection", paths: Iterable[str]) -> dict[str, list[str] | None]:
+    """
+    List many vsish directories using single command executed on the host.
+
+    :param connection: Connection to the machine
+    :param paths: vsish directories to list
+    :return: Dictionary with path as key and list of entries as value, None when directory cannot be listed
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+    command = "; ".join(_vsish_section_command("-e ls", path) for path in paths)
+    sections = _parse_vsish_sections(connection.execute_command(command, shell=True).stdout)
+    return {path: _parse_vsish_ls(sections[path]) if sections.get(path) is not None else None for path in paths}
+
+
+def vsish_ls_subtree(connection: "Connection", path: str, subpath: str) -> dict[str, list[str] | None]:
+    """
+    List <subpath> directory of every entry in vsish directory using single command executed on the host.
+
+    E.g. path="/net/pNics/vmnic0/rxqueues/queues", subpath="rss/rxSecQueues" lists secondary queues of all queues.
+
+    :param connection: Connection to the machine
+    :param path: vsish directory, which entries are listed
+    :param subpath: directory relative to each entry to list
+    :return: Dictionary with entry as key and list of <subpath> entries as value, None when it cannot be listed
+    """
+    path = path.rstrip("/")
+    command = (
+        f"for entry in $(vsish -e ls {path}); do entry=${{entry%/}}; "
+        f"{_vsish_section_command('-e ls', f'{path}/$entry/{subpath}')}; done"
+    )
+    sections = _parse_vsish_sections(connection.execute_command(command, shell=True).stdout)
+    entry_regex = re.compile(rf"^{re.escape(path)}/(?P<entry>[^/]+)/{re.escape(subpath)}$")
+    result = {}
+    for section_path, output in sections.items():
+        match = entry_regex.match(section_path)
+        if match:
+            result[match.group("entry")] = _parse_vsish_ls(output) if output is not None else None
+    return result
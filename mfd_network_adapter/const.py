@@ -2,6 +2,14 @@
 # SPDX-License-Identifier: MIT
 """Const.py."""
 
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+try:
+    from mfd_const_internal import SPEED_IDS, DEVICE_IDS
+except ImportError:
+    from mfd_const import SPEED_IDS, DEVICE_IDS
+
 LINUX_SYS_CLASS_NET_PCI_REGEX = r"(?P<pci_data>[0-9A-Fa-f]{4}\:[0-9A-Fa-f]{2}\:[0-9A-Fa-f]{2}\.[0-9A-Fa-f]{1,2})"
 LINUX_SYS_CLASS_UUID_VMNIC_REGEX = (
     r"(?P<pci_data>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
@@ -13,3 +21,26 @@ LINUX_SYS_CLASS_VIRTUAL_DEVICE_REGEX = r"virtual/net/(?P<name>.+)$"
 LINUX_SYS_CLASS_VMBUS_REGEX = r"VMBUS\S{20,60}\/net\/(?P<interface_name>\w+)"
 NETSTAT_REGEX_TEMPLATE = r":{}"
 NETSTAT_REGEX_FREEBSD_TEMPLATE = r".{}"
+# return code of ioctl-based ethtool when requested settings are already set
+ETHTOOL_NOT_CHANGED_RC = "80"
+
+
+def _build_device_id_index(ids: Dict[str, List[str]]) -> Mapping[int, Tuple[str, ...]]:
+    """
+    Build reverse index of device IDs consts.
+
+    :param ids: DEVICE_IDS or SPEED_IDS, keys with lists of "0x<device_id>" strings
+    :return: Read-only mapping of device ID to keys containing it, in order of consts
+    """
+    index: Dict[int, List[str]] = {}
+    for key, device_ids in ids.items():
+        for device_id in device_ids:
+            keys = index.setdefault(int(device_id, 16), [])
+            if key not in keys:
+                keys.append(key)
+    return MappingProxyType({device_id: tuple(keys) for device_id, keys in index.items()})
+
+
+# device ID -> families (DEVICE_IDS keys) and speeds (SPEED_IDS keys), built once on import
+FAMILIES_BY_DEVICE_ID = _build_device_id_index(DEVICE_IDS)
+SPEEDS_BY_DEVICE_ID = _build_device_id_index(SPEED_IDS)
@@ -0,0 +1,325 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for opt-in RPC call accounting of owners, interfaces and features."""
+
+import inspect
+import json
+import logging
+import sys
+import threading
+import typing
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from mfd_common_libs import log_levels, add_logging_level
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+PACKAGE_ROOT = str(Path(__file__).parent)
+INSTRUMENTED_METHODS = ("execute_command", "execute_powershell")
+UNATTRIBUTED_API = "<unattributed>"
+
+
+@dataclass
+class RPCCallRecord:
+    """Structure for single remote call."""
+
+    api: str
+    method: str
+    command: str
+    latency: float
+    stdout_bytes: int
+    return_code: Optional[int] = None
+    parse_time: Optional[float] = None
+
+
+@dataclass
+class RPCApiSummary:
+    """Structure for remote calls aggregated per public API method."""
+
+    api: str
+    rpc_count: int = 0
+    latency: float = 0.0
+    stdout_bytes: int = 0
+    parse_time: float = 0.0
+    commands: Counter = field(default_factory=Counter)
+
+    @property
+    def redundant_commands(self) -> Dict[str, int]:
+        """Commands called more than once by the same API method."""
+        return {command: count for command, count in self.commands.items() if count > 1}
+
+
+def _get_caller_api() -> tuple[str, Optional[FrameType]]:
+    """
+    Find the public API method of the package which triggered the remote call.
+
+    The outermost public method defined in this package is the one called by the user,
+    so all nested helpers and tool wrappers (e.g. mfd-ethtool) are accounted to it.
+
+    :return: Qualified name of API method and its frame
+    """
+    api, api_frame = UNATTRIBUTED_API, None
+    frame = inspect.currentframe()
+    while frame is not None:
+        code = frame.f_code
+        if (
+            code.co_filename.startswith(PACKAGE_ROOT)
+            and code.co_filename != __file__
+            and not code.co_name.startswith("_")
+        ):
+            api, api_frame = getattr(code, "co_qualname", code.co_name), frame
+        frame = frame.f_back
+    return api, api_frame
+
+
+class RPCRecorder:
+    """Recorder of remote calls made through instrumented connections."""
+
+    def __init__(self):
+        """Init of RPCRecorder."""
+        self.records: List[RPCCallRecord] = []
+        # per thread: frame of API method, its last record and end of that call, until the API method returns
+        self._pending = threading.local()
+
+    def clear(self) -> None:
+        """Remove all recorded calls."""
+        self.records.clear()
+        self._pending.call = None
+
+    def _record(self, method: str, command: str, start: float, end: float, output: Any) -> None:
+        """
+        Store remote call and account time spent after previous call of the same API method as its parse time.
+
+        Parse time of the last call of API method lasts until the method returns, which is caught by profile function.
+        It's not measured when other profiler (e.g. cProfile) is active.
+
+        :param method: Name of connection method
+        :param command: Executed command
+        :param start: Timestamp of call start
+        :param end: Timestamp of call end
+        :param output: Returned ConnectionCompletedProcess or None when call raised
+        """
+        api, api_frame = _get_caller_api()
+        pending = getattr(self._pending, "call", None)
+        # frame is referenced by pending call, so it can't be freed and its identity reused by another call
+        if pending is not None and pending[0] is api_frame:
+            pending[1].parse_time = start - pending[2]
+        stdout = getattr(output, "stdout", None) or ""
+        record = RPCCallRecord(
+            api=api,
+            method=method,
+            command=str(command),
+            latency=end - start,
+            stdout_bytes=len(stdout.encode(errors="replace")) if isinstance(stdout, str) else len(stdout),
+            return_code=getattr(output, "return_code", None),
+        )
+        self.records.append(record)
+        self._pending.call = (api_frame, record, end) if api_frame is not None else None
+        if api_frame is not None and sys.getprofile() is None:
+            sys.setprofile(self._profile)
+
+    def _profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        """
+        Profile function ending parse time of the last call of API method, when the method returns.
+
+        :param frame: Current frame
+        :param event: Profile event
+        :param arg: Event argument
+        """
+        if event != "return":
+            return
+        pending = getattr(self._pending, "call", None)
+        if pending is None:
+            sys.setprofile(None)
+        elif frame is pending[0]:
+            pending[1].parse_time = perf_counter() - pending[2]
+            self._pending.call = None
+            sys.setprofile(None)
+
+    def _stop_parse_timing(self) -> None:
+        """Remove profile function of current thread, parse time of not finished API method is not measured."""
+        self._pending.call = None
+        if sys.getprofile() == self._profile:
+            sys.setprofile(None)
+
+    def _wrap(self, method_name: str, method: Callable) -> Callable:
+        """
+        Wrap connection method with accounting.
+
+        :param method_name: Name of connection method
+        :param method: Bound connection method
+        :return: Wrapped method
+        """
+
+        def wrapper(command: str, *args, **kwargs) -> Any:
+            start = perf_counter()
+            output = None
+            try:
+                output = method(command, *args, **kwargs)
+                return output
+            finally:
+                self._record(method_name, command, start, perf_counter(), output)
+
+        wrapper.__wrapped__ = method
+        return wrapper
+
+    @contextmanager
+    def instrument(self, connection: "Connection") -> Iterator["RPCRecorder"]:
+        """
+        Record remote calls made through connection while in context.
+
+        Owners, interfaces and features share the connection object, so all of them are accounted.
+
+        :param connection: Connection to instrument
+        :return: Recorder
+        """
+        originals = {}
+        for method_name in INSTRUMENTED_METHODS:
+            method = getattr(connection, method_name, None)
+            if method is None:
+                continue
+            # methods defined by connection class are restored by removing instance override
+            is_class_method = hasattr(type(connection), method_name) and method_name not in vars(connection)
+            originals[method_name] = None if is_class_method else method
+            setattr(connection, method_name, self._wrap(method_name, method))
+        try:
+            yield self
+        finally:
+            self._stop_parse_timing()
+            for method_name, original in originals.items():
+                if original is None:
+                    delattr(connection, method_name)
+                else:
+                    setattr(connection, method_name, original)
+
+    def summary(self) -> Dict[str, RPCApiSummary]:
+        """
+        Aggregate recorded calls per public API method.
+
+        :return: Summaries keyed by API method, sorted by number of remote calls
+        """
+        summaries: Dict[str, RPCApiSummary] = {}
+        for record in self.records:
+            summary = summaries.setdefault(record.api, RPCApiSummary(api=record.api))
+            summary.rpc_count += 1
+            summary.latency += record.latency
+            summary.stdout_bytes += record.stdout_bytes
+            summary.parse_time += record.parse_time or 0.0
+            summary.commands[record.command] += 1
+        return dict(sorted(summaries.items(), key=lambda item: item[1].rpc_count, reverse=True))
+
+    def redundant_commands(self) -> Dict[str, int]:
+        """
+        Find commands executed more than once across all API methods.
+
+        :return: Number of executions keyed by command
+        """
+        counter = Counter(record.command for record in self.records)
+        return {command: count for command, count in counter.most_common() if count > 1}
+
+    def report(self) -> str:
+        """
+        Prepare human-readable report of recorded calls.
+
+        :return: Report
+        """
+        lines = [f"{'API':<60} {'RPCs':>6} {'latency[s]':>11} {'parse[s]':>9} {'stdout[B]':>10}"]
+        for summary in self.summary().values():
+            lines.append(
+                f"{summary.api:<60} {summary.rpc_count:>6} {summary.latency:>11.4f} "
+                f"{summary.parse_time:>9.4f} {summary.stdout_bytes:>10}"
+            )
+            for command, count in summary.redundant_commands.items():
+                lines.append(f"    {count}x {command}")
+        lines.append(f"Total RPCs: {len(self.records)}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Prepare JSON-serializable representation of recorded calls.
+
+        :return: Calls, per-API summary and redundant commands
+        """
+        return {
+            "calls": [asdict(record) for record in self.records],
+            "summary": [{**asdict(summary), "commands": dict(summary.commands)} for summary in self.summary().values()],
+            "redundant_commands": self.redundant_commands(),
+        }
+
+    def to_json(self, path: Optional[Path] = None) -> str:
+        """
+        Dump recorded calls as JSON.
+
+        :param path: Optional local path to write dump into
+        :return: JSON document
+        """
+        document = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            Path(path).write_text(document)
+        return document
+
+    def to_openmetrics(self, path: Optional[Path] = None) -> str:
+        """
+        Dump per-API counters in OpenMetrics text format.
+
+        :param path: Optional local path to write dump into
+        :return: OpenMetrics exposition
+        """
+        metrics = (
+            ("mfd_rpc_calls", "Number of remote calls", "rpc_count"),
+            ("mfd_rpc_latency_seconds", "Time spent waiting for remote calls", "latency"),
+            ("mfd_rpc_parse_seconds", "Time spent on controller between remote calls", "parse_time"),
+            ("mfd_rpc_stdout_bytes", "Bytes of stdout returned by remote calls", "stdout_bytes"),
+        )
+        summaries = self.summary().values()
+        lines = []
+        for name, help_text, attribute in metrics:
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"# HELP {name} {help_text}.")
+            for summary in summaries:
+                lines.append(f'{name}_total{{api="{_escape_label(summary.api)}"}} {getattr(summary, attribute)}')
+        lines.append("# EOF")
+        document = "\n".join(lines) + "\n"
+        if path is not None:
+            Path(path).write_text(document)
+        return document
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escape OpenMetrics label value.
+
+    :param value: Label value
+    :return: Escaped value
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@contextmanager
+def record_rpc_calls(connection: "Connection", recorder: Optional[RPCRecorder] = None) -> Iterator[RPCRecorder]:
+    """
+    Record remote calls made through connection while in context.
+
+    Example of per-test report:
+        with record_rpc_calls(connection) as recorder:
+            interface.stats.get_stats()
+        logger.info(recorder.report())
+
+    :param connection: Connection used by owner, interfaces and features
+    :param recorder: Recorder to extend, new one is created when not passed
+    :return: Recorder
+    """
+    recorder = recorder if recorder is not None else RPCRecorder()
+    with recorder.instrument(connection):
+        yield recorder
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Recorded {len(recorder.records)} remote calls.")
@@ -6,6 +6,7 @@ import logging
 import random
 import re
 import typing
+import weakref
 from ipaddress import IPv4Interface
 from typing import List, Optional, Union
 
@@ -14,14 +15,11 @@ from mfd_const import MANAGEMENT_NETWORK, Family, Speed
 from mfd_typing import OSName, PCIDevice, PCIAddress, VendorID, MACAddress
 from mfd_typing.network_interface import InterfaceInfo, WindowsInterfaceInfo, LinuxInterfaceInfo
 
+from .data_structures import InterfaceInfoIndex
 from .exceptions import NetworkAdapterConnectedOSNotSupported, NetworkAdapterIncorrectData
+from ..const import FAMILIES_BY_DEVICE_ID, SPEEDS_BY_DEVICE_ID
 from ..network_interface.base import NetworkInterface
 
-try:
-    from mfd_const_internal import SPEED_IDS, DEVICE_IDS
-except ImportError:
-    from mfd_const import SPEED_IDS, DEVICE_IDS
-
 if typing.TYPE_CHECKING:
     from mfd_connect import Connection
     from mfd_connect.base import ConnectionCompletedProcess
@@ -99,6 +97,8 @@ class NetworkAdapterOwner:
         :param connection: Object of mfd-connect
         """
         self._connection = connection
+        # interfaces created by owner, their cached hardware facts are cleared on driver reload
+        self._created_interfaces: "weakref.WeakSet[NetworkInterface]" = weakref.WeakSet()
 
         # features of owner to be lazy initialized
         self._arp: "ARPFeatureType | None" = None
@@ -419,7 +419,9 @@ class NetworkAdapterOwner:
         if not filtered_info:
             raise NetworkAdapterIncorrectData("No interfaces found.")
 
-        return [NetworkInterface(connection=self._connection, interface_info=info) for info in filtered_info]
+        interfaces = [NetworkInterface(connection=self._connection, interface_info=info) for info in filtered_info]
+        self._created_interfaces.update(interfaces)
+        return interfaces
 
     def get_interface(
         self,
@@ -452,6 +454,19 @@ class NetworkAdapterOwner:
         :param mac_address: MAC Address of the interface
         :return: Network Interface
         """
+        is_targeted = (interface_name is None) != (pci_address is None) and all(
+            arg is None for arg in (pci_device, family, speed, interface_index, mac_address)
+        )
+        info = (
+            self._get_single_interface_info(pci_address=pci_address, interface_name=interface_name, namespace=namespace)
+            if is_targeted
+            else None
+        )
+        if info is not None:
+            interface = NetworkInterface(connection=self._connection, interface_info=info)
+            self._created_interfaces.add(interface)
+            return interface
+
         all_interfaces_info: List[InterfaceInfoType] = self._get_all_interfaces_info()
         filtered_info: List[InterfaceInfoType] = self._filter_interfaces_info(
             all_interfaces_info=all_interfaces_info,
@@ -473,7 +488,29 @@ class NetworkAdapterOwner:
             raise NetworkAdapterIncorrectData("No interfaces found.")
 
         info = filtered_info[0]
-        return NetworkInterface(connection=self._connection, interface_info=info)
+        interface = NetworkInterface(connection=self._connection, interface_info=info)
+        self._created_interfaces.add(interface)
+        return interface
+
+    def _get_single_interface_info(
+        self, *, pci_address: Optional[PCIAddress], interface_name: Optional[str], namespace: Optional[str]
+    ) -> Optional[InterfaceInfoType]:
+        """
+        Resolve single interface by name or PCI address without discovering all interfaces.
+
+        OS owners, which can read the single interface cheaper than with full scan, override this method.
+
+        :param pci_address: PCI address
+        :param interface_name: Name of the interface
+        :param namespace: Namespace, in which interface is searched
+        :return: InterfaceInfo or None when full scan is required
+        """
+        return None
+
+    def _clear_interfaces_hardware_facts(self) -> None:
+        """Clear cached hardware facts of interfaces created by owner, should be called after driver reload."""
+        for interface in list(self._created_interfaces):
+            interface.clear_hardware_facts()
 
     def _filter_interfaces_info(
         self,
@@ -509,15 +546,15 @@ class NetworkAdapterOwner:
         )
 
         if pci_address is not None:
-            selected = [info for info in all_interfaces_info if info.pci_address == pci_address]
+            selected = InterfaceInfoIndex(all_interfaces_info).by_pci_address(pci_address)
         elif pci_device is not None:
             selected = [info for info in all_interfaces_info if info.pci_device == pci_device]
         elif interface_names:
-            selected = [info for info in all_interfaces_info if info.name in interface_names]
+            selected = InterfaceInfoIndex(all_interfaces_info).by_names(interface_names)
         elif family is not None or speed is not None:
             selected = self._get_info_by_speed_and_family(all_interfaces_info, family=family, speed=speed)
         elif mac_address is not None:
-            selected = [info for info in all_interfaces_info if info.mac_address == mac_address]
+            selected = InterfaceInfoIndex(all_interfaces_info).by_mac_address(mac_address)
         else:
             selected = all_interfaces_info
 
@@ -554,19 +591,20 @@ class NetworkAdapterOwner:
         :param speed: Speed str matching keys of SPEED_IDS from mfd-const or Speed Enum member from mfd-const
         :return: List of InterfaceInfo with matching speed or family
         """
-        searched_dev_ids = (
-            DEVICE_IDS[family.upper() if isinstance(family, str) else family.name] if family is not None else []
-        )
-        searched_dev_ids.extend(
-            SPEED_IDS[self._unify_speed_str(speed) if isinstance(speed, str) else speed.value]
-            if speed is not None
-            else []
+        family_name = (family.upper() if isinstance(family, str) else family.name) if family is not None else None
+        speed_name = (
+            (self._unify_speed_str(speed) if isinstance(speed, str) else speed.value) if speed is not None else None
         )
+        intel_vendor_id = VendorID("8086")
         return [
             info
             for info in all_interfaces_info
             if info.pci_device
-            and (info.pci_device.vendor_id == VendorID("8086") and f"0x{info.pci_device.device_id}" in searched_dev_ids)
+            and info.pci_device.vendor_id == intel_vendor_id
+            and (
+                family_name in FAMILIES_BY_DEVICE_ID.get(int(info.pci_device.device_id), ())
+                or speed_name in SPEEDS_BY_DEVICE_ID.get(int(info.pci_device.device_id), ())
+            )
         ]
 
     @staticmethod
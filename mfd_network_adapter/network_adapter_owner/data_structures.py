@@ -2,7 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for owner data structures."""
 
+from collections import defaultdict
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Dict, Hashable, Iterable, List, Optional, TYPE_CHECKING
+
+from mfd_typing import MACAddress
+
+if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv4Interface, IPv6Address, IPv6Interface
+
+    from mfd_typing import PCIAddress
+    from mfd_typing.network_interface import InterfaceInfo
 
 
 class TunnelType(Enum):
@@ -11,6 +22,30 @@ class TunnelType(Enum):
     GRE = "gre"
     VXLAN = "vxlan"
     GENEVE = "geneve"
+    GTP = "gtp"
+
+
+@dataclass
+class TunnelSpec:
+    """
+    Description of overlay tunnel to be created by bulk tunnel APIs.
+
+    Only fields required by given tunnel type have to be filled, e.g. vni, group_addr and interface_name for VxLAN.
+    """
+
+    name: str
+    tunnel_type: TunnelType | None = None
+    vni: int | None = None
+    ip_addr: "IPv4Interface | IPv6Interface | None" = None
+    remote_ip_addr: "IPv4Interface | IPv6Interface | IPv4Address | IPv6Address | None" = None
+    local_ip_addr: "IPv4Interface | IPv6Interface | IPv4Address | IPv6Address | None" = None
+    group_addr: "IPv4Interface | IPv6Interface | IPv4Address | IPv6Address | None" = None
+    interface_name: str | None = None
+    dstport: int | None = None
+    key_id: int | None = None
+    ttl: int | None = None
+    role: str = "sgsn"
+    namespace_name: str | None = None
 
 
 class DefInOutBoundActions(Enum):
@@ -37,3 +72,91 @@ class LoadBalancingAlgorithm(Enum):
     IPADDRESSES = "IPAddresses"
     MACADDRESSES = "MacAddresses"
     HYPERVPORT = "HyperVPort"
+
+
+class InterfaceInfoIndex:
+    """
+    Index of InterfaceInfo objects by name, PCI address and MAC address.
+
+    Keys are not unique (e.g. the same name in different namespaces, VPORTs sharing PCI address), so each lookup
+    returns all matching objects in order of indexing. Index reflects values of keys at the time of adding.
+    """
+
+    def __init__(self, interfaces: Iterable["InterfaceInfo"] = ()):
+        """
+        Init of InterfaceInfoIndex.
+
+        :param interfaces: InterfaceInfo objects to be indexed
+        """
+        self._by_name: Dict[str, List["InterfaceInfo"]] = defaultdict(list)
+        self._by_pci_address: Dict["PCIAddress", List["InterfaceInfo"]] = defaultdict(list)
+        self._by_mac_address: Dict["MACAddress", List["InterfaceInfo"]] = defaultdict(list)
+        self._positions: Dict[int, int] = {}
+        for interface in interfaces:
+            self.add(interface)
+
+    def add(self, interface: "InterfaceInfo") -> None:
+        """
+        Add InterfaceInfo object to the index.
+
+        :param interface: InterfaceInfo object
+        """
+        if id(interface) in self._positions:
+            return
+        self._positions[id(interface)] = len(self._positions)
+        for key, index in (
+            (interface.name, self._by_name),
+            (interface.pci_address, self._by_pci_address),
+            (self._mac_key(getattr(interface, "mac_address", None)), self._by_mac_address),
+        ):
+            if key is not None:
+                index[key].append(interface)
+
+    @staticmethod
+    def _mac_key(mac_address: "MACAddress | str | None") -> Optional[MACAddress]:
+        """Unify MAC address passed as string, so it matches the same key as MACAddress object."""
+        if mac_address is None or isinstance(mac_address, MACAddress):
+            return mac_address
+        return MACAddress(mac_address)
+
+    @staticmethod
+    def _get(index: Dict[Hashable, List[Any]], key: Optional[Hashable]) -> List["InterfaceInfo"]:
+        """Get copy of list of interfaces stored under key."""
+        return list(index.get(key, [])) if key is not None else []
+
+    def by_name(self, name: Optional[str]) -> List["InterfaceInfo"]:
+        """
+        Get interfaces with given name.
+
+        :param name: Interface name
+        :return: Matching InterfaceInfo objects
+        """
+        return self._get(self._by_name, name)
+
+    def by_names(self, names: Iterable[str]) -> List["InterfaceInfo"]:
+        """
+        Get interfaces with any of given names, in order of indexing.
+
+        :param names: Interface names
+        :return: Matching InterfaceInfo objects
+        """
+        found = {id(interface): interface for name in set(names) for interface in self._get(self._by_name, name)}
+        return sorted(found.values(), key=lambda interface: self._positions[id(interface)])
+
+    def by_pci_address(self, pci_address: Optional["PCIAddress"]) -> List["InterfaceInfo"]:
+        """
+        Get interfaces with given PCI address.
+
+        :param pci_address: PCI address
+        :return: Matching InterfaceInfo objects
+        """
+        return self._get(self._by_pci_address, pci_address)
+
+    def by_mac_address(self, mac_address: "MACAddress | str | None") -> List["InterfaceInfo"]:
+        """
+        Get interfaces with given MAC address.
+
+        :param mac_address: MAC address
+        :return: Matching InterfaceInfo objects
+        """
+        return self._get(self._by_mac_address, self._mac_key(mac_address))
@@ -16,15 +16,12 @@ from mfd_typing import VendorID
 from mfd_typing.network_interface import InterfaceInfo
 
 from .base import NetworkAdapterOwner
+from ..api.basic import execute_sections
+from ..const import FAMILIES_BY_DEVICE_ID, SPEEDS_BY_DEVICE_ID
 from .exceptions import NetworkAdapterNotFound, ESXiInterfacesLinkUpTimeout
 from ..network_interface.esxi import ESXiNetworkInterface
 from ..network_interface.feature.link import LinkState
 
-try:
-    from mfd_const_internal import SPEED_IDS, DEVICE_IDS
-except ImportError:
-    from mfd_const import SPEED_IDS, DEVICE_IDS
-
 if TYPE_CHECKING:
     from mfd_connect import Connection
     from .. import NetworkInterface
@@ -40,14 +37,32 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
     _pci_address_core_regex = r"(?P<domain>[0-9a-f]+):(?P<bus>[0-9a-f]+):(?P<slot>[0-9a-f]+)"
     _full_pci_address_regex = rf"{_pci_address_core_regex}.(?P<func>\d+)"
 
+    def __init__(self, *, connection: "Connection", **kwargs):
+        """
+        Initialize ESXi owner.
+
+        :param connection: Object of mfd-connect
+        """
+        super().__init__(connection=connection, **kwargs)
+        # PCI IDs of devices do not change at runtime, so lspci -p output is read once and reused by discovery
+        self._pci_devices: Dict[PCIAddress, PCIDevice] = {}
+
     def _get_net_devices(self) -> List[PCIAddress]:
         """
         Get list of all network (Class 0200) devices from lspci.
 
+        :return: List of devices
+        """
+        return self._parse_net_devices(self.execute_command('lspci -n|grep "Class 0200:"', shell=True).stdout)
+
+    def _parse_net_devices(self, output: str) -> List[PCIAddress]:
+        """
+        Parse network (Class 0200) devices from lspci -n output, virtual functions are skipped.
+
+        :param output: Output of lspci -n
         :return: List of devices
         """
         devices = []
-        output = self.execute_command('lspci -n|grep "Class 0200:"', shell=True).stdout
         for line in output.splitlines():
             match = re.search(self._full_pci_address_regex, line)
             if match is None:
@@ -62,7 +77,7 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
                 continue
             if match.group("vid") == "8086":
                 d_id = DeviceID(match.group("did"))
-                if f"0x{d_id}" in DEVICE_IDS["VF"]:
+                if "VF" in FAMILIES_BY_DEVICE_ID.get(int(d_id), ()):
                     continue
             address = PCIAddress(**address_dict)
             devices.append(address)
@@ -72,6 +87,15 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
         """
         Get list of devices matching list of pci_addresses.
 
+        :return: Dict of devices with PCI addresses
+        """
+        return self._parse_devices(self.execute_command(r"lspci -p", shell=True).stdout)
+
+    def _parse_devices(self, output: str) -> Dict[PCIAddress, PCIDevice]:
+        """
+        Parse PCI devices from lspci -p output.
+
+        :param output: Output of lspci -p
         :return: Dict of devices with PCI addresses
         """
         pattern = (
@@ -80,7 +104,6 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
         )
 
         devices = {}
-        output = self.execute_command(r"lspci -p", shell=True).stdout
         for line in output.splitlines():
             match = re.search(pattern, line)
             if match is not None:
@@ -102,6 +125,16 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
         """
         Get dictionary with devices from esxcfg-nics -l.
 
+        :return: Dict of devices with name, MAC and branding string, driver, link, speed, duplex, mtu.
+        """
+        return ESXiNetworkAdapterOwner._parse_esxcfg_nics(connection.execute_command("esxcfg-nics -l").stdout)
+
+    @staticmethod
+    def _parse_esxcfg_nics(output: str) -> Dict[PCIAddress, Dict[str, LinkState]]:
+        """
+        Parse dictionary with devices from esxcfg-nics -l output.
+
+        :param output: Output of esxcfg-nics -l
         :return: Dict of devices with name, MAC and branding string, driver, link, speed, duplex, mtu.
         """
         pattern = (
@@ -110,7 +143,6 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
             r"\s+(?P<mac>\S+)\s+(?P<mtu>\S+)\s+(?P<brand>.+)"
         )
         devices = {}
-        output = connection.execute_command("esxcfg-nics -l").stdout
         for line in output.splitlines():
             match = re.search(pattern, line)
             if match is not None:
@@ -140,15 +172,50 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
                 }
         return devices
 
+    def _execute_discovery_commands(self, commands: List[str]) -> Dict[str, str]:
+        """
+        Execute discovery commands using single shell payload.
+
+        :param commands: Commands to execute
+        :return: Dict with command as key and its output as value
+        """
+        outputs = execute_sections(self._connection, commands)
+        return {command: outputs[index] for index, command in enumerate(commands)}
+
+    def _get_link_states(self) -> Dict[PCIAddress, LinkState]:
+        """
+        Get link state of all interfaces, only PCI address and link columns of esxcfg-nics -l are transferred.
+
+        :return: Dict of link states with PCI addresses
+        """
+        output = self.execute_command("esxcfg-nics -l | awk 'NR>1 {print $2, $4}'", shell=True).stdout
+        link_states = {}
+        for line in output.splitlines():
+            match = re.match(rf"{self._full_pci_address_regex}\s+(?P<state>\S+)", line.strip())
+            if match is None:
+                continue
+            address = PCIAddress(**{key: int(match.group(key), base=16) for key in ("domain", "bus", "slot", "func")})
+            link_states[address] = LinkState.UP if match.group("state") == "Up" else LinkState.DOWN
+        return link_states
+
     def _get_all_interfaces_info(self) -> List[InterfaceInfo]:
         """
         Get list of all network interfaces on system.
 
         :return: List of all interfaces with PCI address, name, MAC and branding string
         """
-        net_devices = self._get_net_devices()
-        devices = self._get_devices()
-        nics = self._get_esxcfg_nics(self._connection)
+        commands = ['lspci -n | grep "Class 0200:"', "esxcfg-nics -l"]
+        if not self._pci_devices:
+            commands.append("lspci -p")
+        outputs = self._execute_discovery_commands(commands)
+        net_devices = self._parse_net_devices(outputs[commands[0]])
+        nics = self._parse_esxcfg_nics(outputs[commands[1]])
+        if not self._pci_devices:
+            self._pci_devices = self._parse_devices(outputs[commands[2]])
+        if any(net not in self._pci_devices for net in net_devices):
+            # new device appeared on the system (e.g. after PCI passthrough change), refresh PCI devices table
+            self._pci_devices = self._get_devices()
+        devices = self._pci_devices
 
         interfaces = []
         for net in net_devices:
@@ -205,6 +272,8 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
 
         if speed is not None:
             speed = self._unify_speed_str(speed) if isinstance(speed, str) else speed.value
+        if family is not None:
+            family = family.upper() if isinstance(family, str) else family.name
 
         for interface in all_interfaces_info:
             if pci_address and pci_address != interface.pci_address:
@@ -216,13 +285,12 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
                 continue
             if family and (
                 interface.pci_device.vendor_id != VendorID("8086")
-                or f"0x{interface.pci_device.device_id}"
-                not in DEVICE_IDS[family.upper() if isinstance(family, str) else family.name]
+                or family not in FAMILIES_BY_DEVICE_ID.get(int(interface.pci_device.device_id), ())
             ):
                 continue
             if speed and (
                 interface.pci_device.vendor_id != VendorID("8086")
-                or f"0x{interface.pci_device.device_id}" not in SPEED_IDS[speed]
+                or speed not in SPEEDS_BY_DEVICE_ID.get(int(interface.pci_device.device_id), ())
             ):
                 continue
             if interface_names and interface.name not in interface_names:
@@ -298,11 +366,9 @@ class ESXiNetworkAdapterOwner(NetworkAdapterOwner):
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Waiting {timeout}sec for Link UP on input interfaces...")
         timeout_counter = TimeoutCounter(timeout)
         while not timeout_counter:
-            all_interfaces = self._get_esxcfg_nics(self._connection)
-            for interface in interfaces:
-                if all_interfaces[interface.pci_address]["link"] != LinkState.UP:
-                    break
-            else:
+            link_states = self._get_link_states()
+            # all links have to be up in the same sample
+            if all(link_states.get(interface.pci_address) == LinkState.UP for interface in interfaces):
                 return
             sleep(1)
         raise ESXiInterfacesLinkUpTimeout("Timeout wait for interfaces up!")
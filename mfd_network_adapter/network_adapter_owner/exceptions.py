@@ -122,3 +122,7 @@ class AnsFeatureException(NetworkAdapterModuleException):
 
 class GTPFeatureException(NetworkAdapterModuleException):
     """Handle GTP feature exceptions."""
+
+
+class QueueFeatureException(NetworkAdapterModuleException):
+    """Handle Queue feature exceptions."""
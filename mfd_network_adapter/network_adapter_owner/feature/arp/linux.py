@@ -3,8 +3,10 @@
 """Module for ARP feature for Linux."""
 
 import ipaddress
+import json
 import logging
 import re
+from collections import defaultdict
 from ipaddress import IPv4Interface, IPv6Interface
 from typing import List, Union, TYPE_CHECKING, Dict, Optional
 
@@ -12,9 +14,11 @@ from mfd_common_libs import log_levels, add_logging_level
 from mfd_kernel_namespace import add_namespace_call_command
 from mfd_typing import MACAddress
 
+from mfd_network_adapter.api.basic.linux import execute_ip_batch
 from mfd_network_adapter.data_structures import State
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 from .base import BaseARPFeature
+from ...exceptions import ARPFeatureException
 
 if TYPE_CHECKING:
     from mfd_connect.base import ConnectionCompletedProcess
@@ -54,6 +58,118 @@ class LinuxARPFeature(BaseARPFeature):
 
         return output_dict
 
+    def get_neighbor_table(
+        self,
+        ip_ver: IPVersion = IPVersion.V4,
+        allowed_states: Optional[List[str]] = None,
+        interface: "LinuxNetworkInterface | None" = None,
+    ) -> Dict[int, MACAddress]:
+        """
+        Return neighbor (ARP/NDP) table dictionary keyed by IP address as integer.
+
+        Entries are read from `ip -j neigh show`, filtered by interface and states on the host.
+
+        :param ip_ver: IPVersion field
+        :param allowed_states: list of states to accept entries from
+        :param interface: Interface to read entries of, all interfaces (of default namespace) if not passed
+        :return: Dictionary {int(ip address): mac address}
+        """
+        if allowed_states is None:
+            allowed_states = ["REACHABLE", "DELAY"]
+
+        command = f"ip -j -{ip_ver.value} neigh show"
+        if interface is not None:
+            command += f" dev {interface.name}"
+        command += "".join(f" nud {state.lower()}" for state in allowed_states)
+        namespace = interface.namespace if interface is not None else None
+        output = self._connection.execute_command(add_namespace_call_command(command, namespace=namespace)).stdout
+
+        return {
+            int(ipaddress.ip_address(entry["dst"])): MACAddress(entry["lladdr"].lower())
+            for entry in json.loads(output or "[]")
+            if "lladdr" in entry
+        }
+
+    def refresh_neighbor_table(
+        self,
+        table: Dict[int, MACAddress],
+        ip_ver: IPVersion = IPVersion.V4,
+        allowed_states: Optional[List[str]] = None,
+        interface: "LinuxNetworkInterface | None" = None,
+    ) -> set[int]:
+        """
+        Update neighbor table dictionary in place with entries currently present on the host.
+
+        Only entries matching interface and states are read, so refresh of single interface is cheap.
+
+        :param table: Dictionary {int(ip address): mac address} to update
+        :param ip_ver: IPVersion field
+        :param allowed_states: list of states to accept entries from
+        :param interface: Interface to read entries of, all interfaces (of default namespace) if not passed
+        :return: Keys of added or changed entries
+        """
+        current = self.get_neighbor_table(ip_ver=ip_ver, allowed_states=allowed_states, interface=interface)
+        changed = {ip for ip, mac in current.items() if table.get(ip) != mac}
+        table.update(current)
+        return changed
+
+    def add_arp_entries(
+        self, entries: Dict["LinuxNetworkInterface", Dict[Union[IPv4Interface, IPv6Interface], MACAddress]]
+    ) -> None:
+        """
+        Add many entries to arp table (ndp neighbours for ipv6) using single `ip -batch` call per namespace.
+
+        Already existing entries are skipped, same as in add_arp_entry.
+
+        :param entries: Dictionary {ip address: mac address} of entries to add, grouped by interface
+        :raises ARPFeatureException: When adding of any entry failed
+        """
+        self._execute_neighbor_batch(entries, action="add", skipped_error="File exists")
+
+    def del_arp_entries(
+        self, entries: Dict["LinuxNetworkInterface", Dict[Union[IPv4Interface, IPv6Interface], MACAddress]]
+    ) -> None:
+        """
+        Delete many entries from arp table (ndp neighbours for ipv6) using single `ip -batch` call per namespace.
+
+        Not existing entries are skipped, same as in del_arp_entry.
+
+        :param entries: Dictionary {ip address: mac address} of entries to delete, grouped by interface
+        :raises ARPFeatureException: When deletion of any entry failed
+        """
+        self._execute_neighbor_batch(entries, action="del", skipped_error="No such file or directory")
+
+    def _execute_neighbor_batch(
+        self,
+        entries: Dict["LinuxNetworkInterface", Dict[Union[IPv4Interface, IPv6Interface], MACAddress]],
+        action: str,
+        skipped_error: str,
+    ) -> None:
+        """
+        Execute neighbor commands for all entries, with single `ip -batch` call per namespace.
+
+        :param entries: Dictionary {ip address: mac address} of entries, grouped by interface
+        :param action: Action of `ip neigh` command - add or del
+        :param skipped_error: Error message, which is not treated as failure
+        :raises ARPFeatureException: When any command failed
+        """
+        commands_per_namespace = defaultdict(list)
+        for interface, neighbors in entries.items():
+            commands_per_namespace[interface.namespace].extend(
+                f"neigh {action} {ip.ip} lladdr {mac} dev {interface.name}" for ip, mac in neighbors.items()
+            )
+
+        failed = []
+        for namespace, commands in commands_per_namespace.items():
+            errors = execute_ip_batch(self._connection, commands, namespace=namespace)
+            failed.extend(
+                f"{commands[index]}: {message}" for index, message in errors.items() if skipped_error not in message
+            )
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Executed {len(commands)} neighbor {action} command(s)")
+
+        if failed:
+            raise ARPFeatureException(returncode=1, cmd=f"ip neigh {action}", stderr="\n".join(failed))
+
     def send_arp(
         self, interface: "LinuxNetworkInterface", destination: IPv4Interface, count: int = 1
     ) -> "ConnectionCompletedProcess":
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for bonding feature data structures."""
 
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -12,3 +13,34 @@ class BondingParams(Enum):
     MODE = auto()
     UPDELAY = auto()
     DOWNDELAY = auto()
+
+
+@dataclass
+class BondSpec:
+    """Description of bond interface to be created by bulk bond builder."""
+
+    name: str
+    children: list[str] = field(default_factory=list)
+    params: dict[BondingParams, str | int] = field(default_factory=dict)
+    active_child: str | None = None
+
+
+@dataclass(frozen=True)
+class FailoverResult:
+    """Result of active child failover measurement, timestamps taken on the host."""
+
+    bonding_interface: str
+    previous_active_child: str
+    new_active_child: str | None
+    start_timestamp_ns: int
+    end_timestamp_ns: int
+
+    @property
+    def failover_time(self) -> float:
+        """Time in seconds between bringing active child down and bond switching to new active child."""
+        return (self.end_timestamp_ns - self.start_timestamp_ns) / 1e9
+
+    @property
+    def failed_over(self) -> bool:
+        """Whether bond switched to a different active child."""
+        return bool(self.new_active_child) and self.new_active_child != self.previous_active_child
@@ -3,12 +3,16 @@
 """Module for bonding feature for Linux."""
 
 import logging
+import re
 
 from mfd_common_libs import add_logging_level, log_levels, add_logging_group, LevelGroup
 
+from mfd_network_adapter.api.basic.linux import execute_ip_batch
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.network_adapter_owner.feature.bonding.data_structures import (
     BondingParams,
+    BondSpec,
+    FailoverResult,
 )
 from .base import BaseFeatureBonding
 from ...exceptions import BondingFeatureException
@@ -337,3 +341,104 @@ class LinuxBonding(BaseFeatureBonding):
         return self._connection.execute_command(
             f"cat /sys/class/net/{bonding_interface_name}/bonding/slaves"
         ).stdout.split()
+
+    def get_all_children(self) -> dict[str, list[str]]:
+        """
+        Get children of all bond interfaces using single command.
+
+        :return: dictionary with bond interface name as key and list of its children as value
+        """
+        logger.log(level=log_levels.MFD_INFO, msg="Get children of all bond interfaces.")
+        command = (
+            "for bond in $(cat /sys/class/net/bonding_masters); do "
+            'echo "$bond: $(cat /sys/class/net/$bond/bonding/slaves)"; done'
+        )
+        result = self._connection.execute_command(command, shell=True, expected_return_codes=None)
+        if result.return_code != 0:
+            return {}
+
+        children = {}
+        for line in result.stdout.splitlines():
+            bond, separator, slaves = line.partition(":")
+            if separator and bond.strip():
+                children[bond.strip()] = slaves.split()
+        return children
+
+    def create_bonds(self, bonds: list[BondSpec]) -> list[LinuxNetworkInterface]:
+        """
+        Create multiple bond interfaces with their children and params using single ip batch.
+
+        Children are brought down before being enslaved, bonds are brought up after all children are attached.
+
+        :param bonds: list of bond descriptions, e.g.
+            [BondSpec(name="bond0", children=["eth0", "eth1"], params={BondingParams.MODE: "active-backup"})]
+        :return: list of created bond interfaces, in order of provided descriptions
+        :raises BondingFeatureException: when any of batched commands failed or bond was not created properly
+        """
+        logger.log(level=log_levels.MFD_INFO, msg=f"Create bond interfaces: {[bond.name for bond in bonds]}.")
+        commands = []
+        for bond in bonds:
+            params = "".join(f" {name.name.lower()} {value}" for name, value in bond.params.items())
+            commands.append(f"link add {bond.name} type bond{params}")
+            for child in bond.children:
+                commands.append(f"link set dev {child} down")
+                commands.append(f"link set dev {child} master {bond.name}")
+            commands.append(f"link set dev {bond.name} up")
+            if bond.active_child is not None:
+                commands.append(f"link set dev {bond.name} type bond active_slave {bond.active_child}")
+
+        errors = execute_ip_batch(self._connection, commands)
+        if errors:
+            failed = "\n".join(f"{commands[index]}: {message}" for index, message in sorted(errors.items()))
+            raise BondingFeatureException(f"Failed to create bond interfaces:\n{failed}")
+
+        interfaces = {interface.name: interface for interface in self._owner().get_interfaces()}
+        missing = [bond.name for bond in bonds if bond.name not in interfaces]
+        if missing:
+            raise BondingFeatureException(f"{', '.join(missing)} was not created properly!")
+        return [interfaces[bond.name] for bond in bonds]
+
+    def measure_failover(
+        self,
+        bonding_interface: str | LinuxNetworkInterface,
+        timeout: int = 10,
+        restore_child: bool = True,
+    ) -> FailoverResult:
+        """
+        Measure failover time of bond interface.
+
+        Active child is brought down and active_slave of the bond is polled on the host until it changes,
+        both moments are timestamped on the host, so measurement does not include connection latency.
+
+        :param bonding_interface: bonding interface
+        :param timeout: maximum time (in seconds) to wait for active child change
+        :param restore_child: bring previous active child up after measurement
+        :return: failover measurement result, new_active_child is None when failover did not happen within timeout
+        :raises BondingFeatureException: when bond has no active child
+        """
+        bonding_interface_name = self._get_interface_name(bonding_interface)
+        logger.log(level=log_levels.MFD_INFO, msg=f"Measure failover time of bond: {bonding_interface_name}.")
+        active_slave_path = f"/sys/class/net/{bonding_interface_name}/bonding/active_slave"
+        script = (
+            f"old=$(cat {active_slave_path}); "
+            'if [ -z "$old" ]; then exit 1; fi; '
+            "start=$(date +%s%N); "
+            'ip link set dev "$old" down; '
+            f"while :; do new=$(cat {active_slave_path}); now=$(date +%s%N); "
+            'if [ -n "$new" ] && [ "$new" != "$old" ]; then break; fi; '
+            f'if [ $((now - start)) -gt {timeout * 1_000_000_000} ]; then new=""; break; fi; done; '
+            + ('ip link set dev "$old" up; ' if restore_child else "")
+            + 'echo "old=$old"; echo "new=$new"; echo "start=$start"; echo "end=$now"'
+        )
+        result = self._connection.execute_command(script, shell=True, expected_return_codes=None, timeout=timeout + 10)
+        if result.return_code != 0:
+            raise BondingFeatureException(f"{bonding_interface_name} has no active child!")
+
+        values = dict(re.findall(r"^(old|new|start|end)=(.*)$", result.stdout, re.MULTILINE))
+        return FailoverResult(
+            bonding_interface=bonding_interface_name,
+            previous_active_child=values["old"].strip(),
+            new_active_child=values["new"].strip() or None,
+            start_timestamp_ns=int(values["start"]),
+            end_timestamp_ns=int(values["end"]),
+        )
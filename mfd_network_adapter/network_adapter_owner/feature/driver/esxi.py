@@ -46,7 +46,9 @@ class EsxiDriver(BaseDriverFeature):
         :param params: Parameters to be set
         :return: Result of loading module
         """
-        return self._package_manager.load_module(module_name=module_name, params=params)
+        result = self._package_manager.load_module(module_name=module_name, params=params)
+        self._owner()._clear_interfaces_hardware_facts()
+        return result
 
     def unload_module(self, module_name: str) -> "ConnectionCompletedProcess":
         """
@@ -55,7 +57,9 @@ class EsxiDriver(BaseDriverFeature):
         :param module_name: Module to unload
         :return: Result of unloading
         """
-        return self._package_manager.unload_module(module_name=module_name)
+        result = self._package_manager.unload_module(module_name=module_name)
+        self._owner()._clear_interfaces_hardware_facts()
+        return result
 
     def reload_module(
         self,
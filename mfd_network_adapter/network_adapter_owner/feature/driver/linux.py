@@ -42,7 +42,9 @@ class LinuxDriver(BaseDriverFeature):
         :param params: Optional parameters for loading process.
         :return: Result of operation
         """
-        return self._package_manager.load_module(module_name=module_name, params=params)
+        result = self._package_manager.load_module(module_name=module_name, params=params)
+        self._owner()._clear_interfaces_hardware_facts()
+        return result
 
     def load_module_file(
         self, *, module_filepath: "Path", params: Optional[str] = None
@@ -54,7 +56,9 @@ class LinuxDriver(BaseDriverFeature):
         :param params: Optional parameters for loading process.
         :return: Result of operation
         """
-        return self._package_manager.insert_module(module_path=module_filepath, params=params)
+        result = self._package_manager.insert_module(module_path=module_filepath, params=params)
+        self._owner()._clear_interfaces_hardware_facts()
+        return result
 
     def unload_module(
         self, *, module_name: str, params: Optional[str] = None, with_dependencies: bool = False
@@ -67,9 +71,11 @@ class LinuxDriver(BaseDriverFeature):
         :param with_dependencies: If true modprobe -r will be used, otherwise rmmod
         :return: Result of unloading
         """
-        return self._package_manager.unload_module(
+        result = self._package_manager.unload_module(
             module_name=module_name, options=params, with_dependencies=with_dependencies
         )
+        self._owner()._clear_interfaces_hardware_facts()
+        return result
 
     def reload_module(
         self,
@@ -4,10 +4,14 @@
 
 import logging
 from ipaddress import IPv4Interface, IPv6Interface
+from typing import Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic.linux import delete_tunnel_batch, execute_tunnel_batch
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+
 from .base import BaseGeneveTunnelFeature
 from ...exceptions import GeneveFeatureException
 
@@ -160,3 +164,68 @@ class LinuxGeneveTunnel(BaseGeneveTunnelFeature):
             raise GeneveFeatureException(
                 f"An error occurred while deleting the Geneve device {tunnel_name} - {output.stderr}"
             )
+
+    def create_setup_geneve_tunnels(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Create and set up many Geneve tunnels using single `ip -batch` call per namespace.
+
+        Each tunnel requires name, vni and remote_ip_addr, dstport, ip_addr and namespace_name are optional.
+        Already existing tunnels are not treated as failure, same as in create_setup_geneve_tunnel.
+
+        :param tunnels: Descriptions of Geneve tunnels
+        :param raise_on_error: Raise GeneveFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by execute_tunnel_batch
+        :raises GeneveFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = execute_tunnel_batch(
+            self._connection,
+            tunnels,
+            self._get_setup_commands,
+            skipped_errors=("File exists",),
+            exception=GeneveFeatureException if raise_on_error else None,
+            action="create Geneve tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Geneve: {len(tunnels) - len(errors)} tunnel(s) created.")
+        return errors
+
+    def delete_geneve_tunnels(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Delete many Geneve tunnels added by create_setup_geneve_tunnels, not existing ones are skipped.
+
+        :param tunnels: Descriptions of Geneve tunnels
+        :param raise_on_error: Raise GeneveFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by delete_tunnel_batch
+        :raises GeneveFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = delete_tunnel_batch(
+            self._connection,
+            tunnels,
+            exception=GeneveFeatureException if raise_on_error else None,
+            action="delete Geneve tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Geneve: {len(tunnels) - len(errors)} tunnel(s) deleted.")
+        return errors
+
+    @staticmethod
+    def _get_setup_commands(tunnel: TunnelSpec) -> list[str]:
+        """
+        Get ip commands creating and setting up single Geneve tunnel.
+
+        :param tunnel: Description of Geneve tunnel
+        :return: ip commands without the leading `ip`
+        """
+        remote_ip_addr = getattr(tunnel.remote_ip_addr, "ip", tunnel.remote_ip_addr)
+        dstport = f" dstport {tunnel.dstport}" if tunnel.dstport is not None else ""
+        commands = [
+            f"link add {tunnel.name} type geneve remote {remote_ip_addr} id {tunnel.vni}{dstport}",
+            f"link set {tunnel.name} up",
+        ]
+        if tunnel.ip_addr is not None:
+            commands.append(f"addr add {tunnel.ip_addr} dev {tunnel.name}")
+        return commands
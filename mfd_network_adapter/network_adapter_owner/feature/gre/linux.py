@@ -4,10 +4,14 @@
 
 import logging
 from ipaddress import IPv4Interface, IPv6Interface
+from typing import Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic.linux import delete_tunnel_batch, execute_tunnel_batch
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+
 from .base import BaseGREFeature
 from ...exceptions import GREFeatureException
 
@@ -73,3 +77,69 @@ class LinuxGRE(BaseGREFeature):
             )
 
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"GRE: {gre_tunnel_name} deleted!")
+
+    def create_setup_gres(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Create and set up many GRE tunnels using single `ip -batch` call per namespace.
+
+        Each tunnel requires name, local_ip_addr, remote_ip_addr, key_id and interface_name,
+        ip_addr and namespace_name are optional.
+        Tunnels are created as gretap devices, same as in create_setup_gre, and additionally brought up.
+
+        :param tunnels: Descriptions of GRE tunnels
+        :param raise_on_error: Raise GREFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by execute_tunnel_batch
+        :raises GREFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = execute_tunnel_batch(
+            self._connection,
+            tunnels,
+            self._get_setup_commands,
+            exception=GREFeatureException if raise_on_error else None,
+            action="create GRE tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"GRE: {len(tunnels) - len(errors)} tunnel(s) created.")
+        return errors
+
+    def delete_gres(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Delete many GRE tunnels added by create_setup_gres, not existing ones are skipped.
+
+        :param tunnels: Descriptions of GRE tunnels
+        :param raise_on_error: Raise GREFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by delete_tunnel_batch
+        :raises GREFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = delete_tunnel_batch(
+            self._connection,
+            tunnels,
+            exception=GREFeatureException if raise_on_error else None,
+            action="delete GRE tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"GRE: {len(tunnels) - len(errors)} tunnel(s) deleted.")
+        return errors
+
+    @staticmethod
+    def _get_setup_commands(tunnel: TunnelSpec) -> list[str]:
+        """
+        Get ip commands creating and setting up single GRE tunnel.
+
+        :param tunnel: Description of GRE tunnel
+        :return: ip commands without the leading `ip`
+        """
+        local_ip_addr = getattr(tunnel.local_ip_addr, "ip", tunnel.local_ip_addr)
+        remote_ip_addr = getattr(tunnel.remote_ip_addr, "ip", tunnel.remote_ip_addr)
+        commands = [
+            f"link add {tunnel.name} type gretap local {local_ip_addr} remote {remote_ip_addr} "
+            f"key {tunnel.key_id} dev {tunnel.interface_name}",
+            f"link set {tunnel.name} up",
+        ]
+        if tunnel.ip_addr is not None:
+            commands.append(f"addr add {tunnel.ip_addr} dev {tunnel.name}")
+        return commands
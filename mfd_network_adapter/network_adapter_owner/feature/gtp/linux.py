@@ -3,10 +3,14 @@
 """Module for GTP feature for Linux systems."""
 
 import logging
+from typing import Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic.linux import delete_tunnel_batch, execute_tunnel_batch
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+
 from .base import BaseGTPTunnelFeature
 from ...exceptions import GTPFeatureException
 
@@ -64,3 +68,65 @@ class LinuxGTPTunnel(BaseGTPTunnelFeature):
             )
 
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"GTP: {tunnel_name} deleted!")
+
+    def create_setup_gtp_tunnels(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Create and set up many GTP tunnels using single `ip -batch` call per namespace.
+
+        Each tunnel requires only name, role, ip_addr and namespace_name are optional.
+        Tunnels are created the same way as in create_setup_gtp_tunnel and additionally brought up.
+
+        :param tunnels: Descriptions of GTP tunnels
+        :param raise_on_error: Raise GTPFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by execute_tunnel_batch
+        :raises GTPFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = execute_tunnel_batch(
+            self._connection,
+            tunnels,
+            self._get_setup_commands,
+            exception=GTPFeatureException if raise_on_error else None,
+            action="create GTP tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"GTP: {len(tunnels) - len(errors)} tunnel(s) created.")
+        return errors
+
+    def delete_gtp_tunnels(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Delete many GTP tunnels added by create_setup_gtp_tunnels, not existing ones are skipped.
+
+        :param tunnels: Descriptions of GTP tunnels
+        :param raise_on_error: Raise GTPFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by delete_tunnel_batch
+        :raises GTPFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = delete_tunnel_batch(
+            self._connection,
+            tunnels,
+            exception=GTPFeatureException if raise_on_error else None,
+            action="delete GTP tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"GTP: {len(tunnels) - len(errors)} tunnel(s) deleted.")
+        return errors
+
+    @staticmethod
+    def _get_setup_commands(tunnel: TunnelSpec) -> list[str]:
+        """
+        Get ip commands creating and setting up single GTP tunnel.
+
+        :param tunnel: Description of GTP tunnel
+        :return: ip commands without the leading `ip`
+        """
+        commands = [
+            f"link add {tunnel.name} type gtp role {tunnel.role}",
+            f"link set {tunnel.name} up",
+        ]
+        if tunnel.ip_addr is not None:
+            commands.append(f"addr add {tunnel.ip_addr} dev {tunnel.name}")
+        return commands
@@ -6,5 +6,7 @@ from typing import Union
 
 from .base import BaseInterruptFeature
 from .esxi import ESXiInterruptFeature
+from .freebsd import FreeBSDInterruptFeature
+from .linux import LinuxInterruptFeature
 
-InterruptFeatureType = Union[BaseInterruptFeature, ESXiInterruptFeature]
+InterruptFeatureType = Union[BaseInterruptFeature, ESXiInterruptFeature, FreeBSDInterruptFeature, LinuxInterruptFeature]
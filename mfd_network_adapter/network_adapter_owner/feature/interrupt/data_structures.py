@@ -0,0 +1,81 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Interrupt feature data structures."""
+
+import typing
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+if typing.TYPE_CHECKING:
+    from mfd_connect.process import RemoteProcess
+
+
+@dataclass(frozen=True)
+class IrqRateSample:
+    """Dataclass for single interrupt rate sample of queue."""
+
+    timestamp: int  # host time (seconds since epoch) of the sampling interval
+    count: int  # number of interrupts in the sampling interval
+    rate: int  # interrupts per second in the sampling interval
+
+
+@dataclass
+class InterruptRateCollector:
+    """Dataclass for state of interrupt rate collector running in the background on the host."""
+
+    process: "RemoteProcess"
+    output_path: str
+    interface_names: List[str] | None = None
+    series: Dict[str, Dict[str, List[IrqRateSample]]] = field(default_factory=dict)
+    offset: int = 0
+    blocks: int = 0
+    timestamp: int | None = None
+
+
+@dataclass(frozen=True)
+class CoalescingSetting:
+    """Dataclass for single point of coalescing sweep, settings which are None are not changed."""
+
+    rx_usecs: int | None = None
+    tx_usecs: int | None = None
+    adaptive_rx: bool | None = None
+    adaptive_tx: bool | None = None
+
+    @property
+    def ethtool_options(self) -> str:
+        """Options of `ethtool -C`, adaptive mode is set before usecs."""
+        options = {
+            "adaptive-rx": self.adaptive_rx,
+            "adaptive-tx": self.adaptive_tx,
+            "rx-usecs": self.rx_usecs,
+            "tx-usecs": self.tx_usecs,
+        }
+        return " ".join(
+            f"{name} {('on' if value else 'off') if isinstance(value, bool) else value}"
+            for name, value in options.items()
+            if value is not None
+        )
+
+
+@dataclass
+class CoalescingSweepResult:
+    """Dataclass for measurement of single interface in single point of coalescing sweep."""
+
+    interface_name: str
+    setting: CoalescingSetting
+    duration: float  # host-measured length of the measurement window in seconds
+    interrupts: int  # number of interrupts of interface vectors in the measurement window
+    rx_packets: Dict[int, int] = field(default_factory=dict)  # queue index -> packets in the measurement window
+    tx_packets: Dict[int, int] = field(default_factory=dict)
+    error: str | None = None  # output of `ethtool -C` when setting could not be applied
+
+    @property
+    def interrupt_rate(self) -> float:
+        """Interrupts per second."""
+        return self.interrupts / self.duration if self.duration else 0.0
+
+    @property
+    def packets_per_interrupt(self) -> float:
+        """Packets (rx and tx) handled per interrupt."""
+        packets = sum(self.rx_packets.values()) + sum(self.tx_packets.values())
+        return packets / self.interrupts if self.interrupts else 0.0
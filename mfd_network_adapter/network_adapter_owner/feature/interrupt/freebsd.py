@@ -0,0 +1,114 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Interrupt feature for FreeBSD systems."""
+
+import logging
+import re
+from typing import Dict, List
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .base import BaseInterruptFeature
+from .data_structures import InterruptRateCollector, IrqRateSample
+from ...exceptions import InterruptFeatureException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+TIMESTAMP_MARKER = "@@@"
+
+
+class FreeBSDInterruptFeature(BaseInterruptFeature):
+    """FreeBSD class for Interrupt feature."""
+
+    _irq_line_regex = re.compile(
+        r"^irq\d+: (?P<interface>[a-z]+\d+):(?P<queue>\S+)\s+(?P<count>\d+)\s+(?P<rate>\d+)\s*$"
+    )
+
+    def start_interrupt_rate_collector(
+        self,
+        interface_names: List[str] | None = None,
+        interval: int = 1,
+        output_path: str = "/tmp/vmstat_interrupts.log",
+    ) -> InterruptRateCollector:
+        """
+        Start collecting interrupt rates of queues in the background on the host.
+
+        Single vmstat stream serves all interfaces, every vmstat block is prefixed with host timestamp.
+
+        :param interface_names: Names of interfaces to collect samples for, all interfaces when None
+        :param interval: Sampling interval of vmstat in seconds
+        :param output_path: Path of file on the host where vmstat output is stored
+        :return: Collector to be passed to get_interrupt_rate_series and stop_interrupt_rate_collector
+        """
+        command = (
+            f"stdbuf -oL vmstat -ia -w{interval} | while IFS= read -r line; do "
+            f'case "$line" in interrupt*) echo "{TIMESTAMP_MARKER} $(date +%s)";; esac; '
+            f'echo "$line"; done > {output_path} 2>&1'
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Starting interrupt rate collector, output: {output_path}")
+        process = self._connection.start_process(command, shell=True)
+        return InterruptRateCollector(process=process, output_path=output_path, interface_names=interface_names)
+
+    def get_interrupt_rate_series(self, collector: InterruptRateCollector) -> Dict[str, Dict[str, List[IrqRateSample]]]:
+        """
+        Get interrupt rate series gathered by collector so far, call does not block.
+
+        Only output appended since the previous call is transferred from the host.
+
+        :param collector: Collector returned by start_interrupt_rate_collector
+        :return: Dict of interface name -> queue name -> list of samples
+        """
+        output = self._connection.execute_command(
+            f"tail -c +{collector.offset + 1} {collector.output_path}", expected_return_codes=None
+        ).stdout
+        # last line can be still written by vmstat, it will be read during next call
+        complete_output = output[: output.rfind("\n") + 1]
+        collector.offset += len(complete_output.encode())
+        for line in complete_output.splitlines():
+            self._parse_collector_line(collector, line)
+        return collector.series
+
+    def stop_interrupt_rate_collector(
+        self, collector: InterruptRateCollector, remove_output: bool = True
+    ) -> Dict[str, Dict[str, List[IrqRateSample]]]:
+        """
+        Stop collector and get all gathered interrupt rate series.
+
+        :param collector: Collector returned by start_interrupt_rate_collector
+        :param remove_output: Remove output file from the host
+        :return: Dict of interface name -> queue name -> list of samples
+        :raises InterruptFeatureException: When collector stopped before gathering any sample
+        """
+        if collector.process.running:
+            collector.process.kill()
+        series = self.get_interrupt_rate_series(collector)
+        if remove_output:
+            self._connection.execute_command(f"rm -f {collector.output_path}", expected_return_codes=None)
+        if not collector.blocks:
+            raise InterruptFeatureException(f"vmstat did not produce any output to {collector.output_path}")
+        return series
+
+    def _parse_collector_line(self, collector: InterruptRateCollector, line: str) -> None:
+        """
+        Parse single line of collector output and update series.
+
+        First vmstat block contains counters since boot, so samples are gathered starting from second block.
+
+        :param collector: Collector returned by start_interrupt_rate_collector
+        :param line: Line of collector output
+        """
+        if line.startswith(TIMESTAMP_MARKER):
+            collector.timestamp = int(line[len(TIMESTAMP_MARKER) :])
+            collector.blocks += 1
+            return
+        match = self._irq_line_regex.match(line.strip())
+        if match is None or collector.blocks < 2:
+            return
+        interface = match.group("interface")
+        if collector.interface_names is not None and interface not in collector.interface_names:
+            return
+        sample = IrqRateSample(
+            timestamp=collector.timestamp, count=int(match.group("count")), rate=int(match.group("rate"))
+        )
+        collector.series.setdefault(interface, {}).setdefault(match.group("queue"), []).append(sample)
@@ -0,0 +1,203 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Interrupt feature for Linux systems."""
+
+import logging
+import re
+from itertools import product
+from typing import Dict, Iterable, List, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_kernel_namespace import add_namespace_call_command
+
+from mfd_network_adapter.api.basic import execute_sections
+from mfd_network_adapter.const import ETHTOOL_NOT_CHANGED_RC
+from .base import BaseInterruptFeature
+from .data_structures import CoalescingSetting, CoalescingSweepResult
+from ...exceptions import InterruptFeatureException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+class LinuxInterruptFeature(BaseInterruptFeature):
+    """Linux class for Interrupt feature."""
+
+    # rx_queue_0_packets (ice, ixgbe), rx-0.packets (i40e, iavf), rx0_packets (mlx5)
+    _queue_packets_regex = re.compile(
+        r"^\s*(?P<direction>[rt]x)(?:_queue_|-)?(?P<queue>\d+)[_.]packets:\s*(?P<value>\d+)\s*$", re.MULTILINE
+    )
+
+    @staticmethod
+    def get_coalescing_grid(
+        rx_usecs: Iterable[int], tx_usecs: Iterable[int] | None = None, adaptive: Iterable[bool] = (False,)
+    ) -> List[CoalescingSetting]:
+        """
+        Prepare points of coalescing sweep.
+
+        With adaptive mode usecs are managed by driver, so single point is prepared for it.
+
+        :param rx_usecs: Values of rx-usecs
+        :param tx_usecs: Values of tx-usecs, tx-usecs equal to rx-usecs when None
+        :param adaptive: Adaptive modes (applied for both rx and tx)
+        :return: Points of sweep
+        """
+        rx_usecs = list(rx_usecs)
+        tx_usecs = list(tx_usecs) if tx_usecs is not None else None
+        grid = []
+        for adaptive_mode in adaptive:
+            if adaptive_mode:
+                grid.append(CoalescingSetting(adaptive_rx=True, adaptive_tx=True))
+                continue
+            usecs = zip(rx_usecs, rx_usecs) if tx_usecs is None else product(rx_usecs, tx_usecs)
+            grid.extend(
+                CoalescingSetting(rx_usecs=rx, tx_usecs=tx, adaptive_rx=False, adaptive_tx=False) for rx, tx in usecs
+            )
+        return grid
+
+    def sweep_coalescing(
+        self,
+        interface_names: List[str],
+        settings: Iterable[CoalescingSetting],
+        window: float = 5,
+        settle_time: float = 1,
+        namespace: str | None = None,
+    ) -> List[CoalescingSweepResult]:
+        """
+        Apply coalescing settings on interfaces point by point and measure interrupts and per-queue packets.
+
+        Each point is handled with single call: settings are applied on all interfaces and interrupts
+        (/proc/interrupts) and packets (ethtool -S) are sampled at the beginning and at the end of window on the host.
+        Traffic has to be running during the sweep. Settings of the last point stay applied,
+        use config_snapshot()/config_restore() of interfaces to revert them.
+
+        :param interface_names: Names of interfaces
+        :param settings: Points of sweep, e.g. from get_coalescing_grid()
+        :param window: Length of measurement window in seconds
+        :param settle_time: Time in seconds between applying settings and start of measurement
+        :param namespace: Namespace of interfaces
+        :return: Measurements, ordered by point and then by interface
+        :raises InterruptFeatureException: When output of measurement is not complete
+        """
+        results = []
+        for setting in settings:
+            sections = execute_sections(
+                self._connection, self._get_sweep_commands(interface_names, setting, window, settle_time, namespace)
+            )
+            results.extend(self._parse_sweep_sections(sections, interface_names, setting))
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Measured coalescing {setting} on {interface_names}")
+        return results
+
+    def _get_sweep_commands(
+        self, interface_names: List[str], setting: CoalescingSetting, window: float, settle_time: float, namespace: str
+    ) -> List[str]:
+        """
+        Prepare commands applying settings and measuring single point of sweep.
+
+        Sections: `ethtool -C` of each interface, then two samples of timestamp with /proc/interrupts
+        followed by `ethtool -S` of each interface. Each sample is preceded by sleep.
+
+        :param interface_names: Names of interfaces
+        :param setting: Point of sweep
+        :param window: Length of measurement window in seconds
+        :param settle_time: Time in seconds between applying settings and start of measurement
+        :param namespace: Namespace of interfaces
+        :return: Commands
+        """
+        options = setting.ethtool_options
+        commands = [
+            f"{add_namespace_call_command(f'ethtool -C {name} {options}', namespace)} 2>&1; echo rc=$?"
+            if options
+            else "echo rc=0"
+            for name in interface_names
+        ]
+        sample = [
+            f"{add_namespace_call_command(f'ethtool -S {name}', namespace)} 2>/dev/null" for name in interface_names
+        ]
+        return (
+            commands
+            + [f"sleep {settle_time}; date +%s.%N; cat /proc/interrupts"]
+            + sample
+            + [f"sleep {window}; date +%s.%N; cat /proc/interrupts"]
+            + sample
+        )
+
+    def _parse_sweep_sections(
+        self, sections: Dict[int, str], interface_names: List[str], setting: CoalescingSetting
+    ) -> List[CoalescingSweepResult]:
+        """
+        Parse outputs of single point of sweep.
+
+        :param sections: Outputs of commands prepared by _get_sweep_commands
+        :param interface_names: Names of interfaces
+        :param setting: Point of sweep
+        :return: Measurements of interfaces
+        :raises InterruptFeatureException: When output of measurement is not complete
+        """
+        count = len(interface_names)
+        if not sections[count] or not sections[2 * count + 1]:
+            raise InterruptFeatureException(f"Incomplete output of coalescing measurement: {sections}")
+        before_timestamp, before_interrupts = self._parse_interrupts_sample(sections[count], interface_names)
+        after_timestamp, after_interrupts = self._parse_interrupts_sample(sections[2 * count + 1], interface_names)
+
+        results = []
+        for index, name in enumerate(interface_names):
+            apply_output, _, return_code = sections[index].strip().rpartition("rc=")
+            before_packets = self._parse_queue_packets(sections[count + 1 + index])
+            after_packets = self._parse_queue_packets(sections[2 * count + 2 + index])
+            rx_packets, tx_packets = (
+                {
+                    queue: after_packets[direction][queue] - value
+                    for queue, value in before_packets[direction].items()
+                    if queue in after_packets[direction]
+                }
+                for direction in ("rx", "tx")
+            )
+            results.append(
+                CoalescingSweepResult(
+                    interface_name=name,
+                    setting=setting,
+                    duration=after_timestamp - before_timestamp,
+                    interrupts=after_interrupts[name] - before_interrupts[name],
+                    rx_packets=rx_packets,
+                    tx_packets=tx_packets,
+                    error=None if return_code in ("0", ETHTOOL_NOT_CHANGED_RC) else apply_output.strip(),
+                )
+            )
+        return results
+
+    @staticmethod
+    def _parse_interrupts_sample(output: str, interface_names: List[str]) -> Tuple[float, Dict[str, int]]:
+        """
+        Parse timestamp and /proc/interrupts sample.
+
+        Interrupts of vectors named with interface name (e.g. 'eth0-TxRx-0', 'ice-eth0-TxRx-0') are summed
+        over all CPUs.
+
+        :param output: Timestamp line followed by /proc/interrupts
+        :param interface_names: Names of interfaces
+        :return: Host timestamp and interrupts keyed by interface name
+        """
+        timestamp, _, proc_interrupts = output.partition("\n")
+        patterns = {name: re.compile(rf"(?:^|-){re.escape(name)}(?:-|$)") for name in interface_names}
+        interrupts = dict.fromkeys(interface_names, 0)
+        for line in proc_interrupts.splitlines()[1:]:
+            columns = line.split()
+            if len(columns) < 2:
+                continue
+            for name, pattern in patterns.items():
+                if pattern.search(columns[-1]):
+                    interrupts[name] += sum(int(column) for column in columns[1:] if column.isdigit())
+        return float(timestamp), interrupts
+
+    def _parse_queue_packets(self, output: str) -> Dict[str, Dict[int, int]]:
+        """
+        Parse per-queue packet counters from `ethtool -S` output.
+
+        :param output: ethtool -S output
+        :return: Packets keyed by direction ('rx', 'tx') and queue index
+        """
+        packets = {"rx": {}, "tx": {}}
+        for match in self._queue_packets_regex.finditer(output):
+            packets[match.group("direction")][int(match.group("queue"))] = int(match.group("value"))
+        return packets
@@ -2,14 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for IP feature for Linux."""
 
+import json
 import logging
-from typing import Optional
+from collections import defaultdict
+from ipaddress import IPv4Interface, IPv6Interface, ip_address, IPv4Address, IPv6Address
+from time import sleep
+from typing import Optional, TYPE_CHECKING
 
-from mfd_common_libs import add_logging_level, log_levels
+from mfd_common_libs import add_logging_level, log_levels, TimeoutCounter
 from mfd_kernel_namespace import add_namespace_call_command
 
 from .base import BaseIPFeature
 from ...exceptions import IPFeatureException
+from mfd_network_adapter.api.basic.linux import execute_ip_batch
+
+if TYPE_CHECKING:
+    from mfd_network_adapter import NetworkInterface
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -186,3 +194,176 @@ class LinuxIP(BaseIPFeature):
         if result.return_code != 0:
             logger.log(level=log_levels.MODULE_DEBUG, msg=f"Could not find new interface's name ({new_name})")
             raise IPFeatureException("Rename of interface failed")
+
+    def add_ips_bulk(
+        self,
+        mapping: dict["NetworkInterface", list[IPv4Interface | IPv6Interface]],
+        wait_for_dad: bool = True,
+        timeout: int = 15,
+    ) -> None:
+        """
+        Add IPs to many interfaces using single `ip -batch` call per namespace.
+
+        Already assigned IPs are skipped, same as in interface's add_ip.
+
+        :param mapping: IPs to add, grouped by interface
+        :param wait_for_dad: Wait for added IPv6 addresses to exit tentative state
+        :param timeout: Timeout of waiting for DAD
+        :raises IPFeatureException: When unknown error returned, while adding IPs
+        """
+        already_assigned_messages = ["rtnetlink answers: file exists", "address already assigned"]
+        unknown_errors = []
+        for namespace, interfaces_ips in self._group_by_namespace(mapping).items():
+            self._enable_ipv6_persistence_bulk(
+                [
+                    interface.name
+                    for interface, ips in interfaces_ips
+                    if any(isinstance(ip, IPv6Interface) for ip in ips)
+                ],
+                namespace=namespace,
+            )
+            commands = [f"link set dev {interface.name} dynamic off" for interface, _ in interfaces_ips]
+            dynamic_commands_count = len(commands)
+            commands.extend(f"addr add {ip} dev {interface.name}" for interface, ips in interfaces_ips for ip in ips)
+            errors = execute_ip_batch(self._connection, commands, namespace=namespace)
+            for index, message in errors.items():
+                if index < dynamic_commands_count:
+                    logger.warning(msg=f"Failed to disable dynamic IP - {commands[index]}: {message}")
+                elif any(known in message.lower() for known in already_assigned_messages):
+                    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Already assigned - {commands[index]}")
+                else:
+                    unknown_errors.append(f"{commands[index]}: {message}")
+
+        if unknown_errors:
+            raise IPFeatureException("Unknown error msg returned, while setting IPs:\n" + "\n".join(unknown_errors))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"IPs added to {len(mapping)} interface(s)")
+
+        if wait_for_dad:
+            self.wait_till_tentative_exit_bulk(mapping, timeout=timeout)
+
+    def del_ips_bulk(self, mapping: dict["NetworkInterface", list[IPv4Interface | IPv6Interface]]) -> None:
+        """
+        Delete IPs from many interfaces using single `ip -batch` call per namespace.
+
+        Already deleted IPs are skipped, same as in interface's del_ip.
+
+        :param mapping: IPs to delete, grouped by interface
+        :raises IPFeatureException: When unknown error returned, while deleting IPs
+        """
+        unknown_errors = []
+        for namespace, interfaces_ips in self._group_by_namespace(mapping).items():
+            commands = [f"addr del {ip} dev {interface.name}" for interface, ips in interfaces_ips for ip in ips]
+            errors = execute_ip_batch(self._connection, commands, namespace=namespace)
+            for index, message in errors.items():
+                if "cannot assign requested address" in message.casefold():
+                    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Already deleted - {commands[index]}")
+                else:
+                    unknown_errors.append(f"{commands[index]}: {message}")
+
+        if unknown_errors:
+            raise IPFeatureException("Unknown error msg returned, while deleting IPs:\n" + "\n".join(unknown_errors))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"IPs deleted from {len(mapping)} interface(s)")
+
+    def wait_till_tentative_exit_bulk(
+        self, mapping: dict["NetworkInterface", list[IPv4Interface | IPv6Interface]], timeout: int = 15
+    ) -> None:
+        """
+        Wait till all given IPv6 addresses exit tentative state.
+
+        Addresses of all interfaces are checked with single `ip -j addr show` read per namespace in each iteration.
+
+        :param mapping: IPs on which we'll wait, grouped by interface
+        :param timeout: Timeout
+        :raises IPFeatureException: When timeout, while waiting on status change
+        :raises IPFeatureException: When IP not found on interface or DAD failed
+        """
+        pending = {
+            namespace: {
+                (interface.name, ip.ip)
+                for interface, ips in interfaces_ips
+                for ip in ips
+                if isinstance(ip, IPv6Interface)
+            }
+            for namespace, interfaces_ips in self._group_by_namespace(mapping).items()
+        }
+        pending = {namespace: addresses for namespace, addresses in pending.items() if addresses}
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Waiting for {sum(len(addresses) for addresses in pending.values())} IP(s) to exit tentative state.",
+        )
+
+        timeout_counter = TimeoutCounter(timeout)
+        while pending:
+            for namespace, addresses in list(pending.items()):
+                flags = self._get_addresses_flags(namespace=namespace)
+                for name, ip in list(addresses):
+                    if (name, ip) not in flags:
+                        raise IPFeatureException(f"Not found {ip} on {name}.")
+                    if "dadfailed" in flags[(name, ip)]:
+                        raise IPFeatureException(f"Duplicate address detection failed for {ip} on {name}.")
+                    if "tentative" not in flags[(name, ip)]:
+                        addresses.discard((name, ip))
+                if not addresses:
+                    del pending[namespace]
+
+            if not pending:
+                break
+            if timeout_counter:
+                tentative = [f"{ip} on {name}" for addresses in pending.values() for name, ip in addresses]
+                raise IPFeatureException(f"{', '.join(tentative)} still in tentative mode after {timeout}s.")
+            sleep(1)
+
+        logger.log(level=log_levels.MODULE_DEBUG, msg="All IPs are not in tentative state.")
+
+    def _get_addresses_flags(
+        self, namespace: str | None = None
+    ) -> dict[tuple[str, IPv4Address | IPv6Address], set[str]]:
+        """
+        Get flags of all addresses assigned in namespace, based on `ip -j addr show` output.
+
+        :param namespace: Name of network namespace
+        :return: Flags (like tentative, dadfailed) keyed by interface name and address
+        """
+        output = self._connection.execute_command(add_namespace_call_command("ip -j addr show", namespace=namespace))
+        flags = {}
+        for interface in json.loads(output.stdout or "[]"):
+            for address in interface.get("addr_info", []):
+                if "local" not in address:
+                    continue
+                flags[(interface["ifname"], ip_address(address["local"]))] = {
+                    key for key, value in address.items() if value is True
+                }
+        return flags
+
+    def _enable_ipv6_persistence_bulk(self, interface_names: list[str], namespace: str | None = None) -> None:
+        """
+        Enable IPv6 persistence on all given interfaces with single command.
+
+        :param interface_names: Names of interfaces
+        :param namespace: Name of network namespace
+        """
+        if not interface_names:
+            return
+
+        cmd = (
+            f"for dev in {' '.join(interface_names)}; do f=/proc/sys/net/ipv6/conf/$dev/keep_addr_on_down; "
+            "if [ -f $f ]; then echo 1 > $f; fi; done"
+        )
+        self._connection.execute_command(
+            add_namespace_call_command(cmd, namespace=namespace), shell=True, expected_return_codes=None
+        )
+
+    @staticmethod
+    def _group_by_namespace(
+        mapping: dict["NetworkInterface", list[IPv4Interface | IPv6Interface]],
+    ) -> dict[str | None, list[tuple["NetworkInterface", list[IPv4Interface | IPv6Interface]]]]:
+        """
+        Group interfaces with their IPs by namespace of interface.
+
+        :param mapping: IPs grouped by interface
+        :return: Interfaces with IPs grouped by namespace
+        """
+        grouped = defaultdict(list)
+        for interface, ips in mapping.items():
+            grouped[interface.namespace].append((interface, ips))
+        return dict(grouped)
@@ -0,0 +1,46 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Queue feature data structures."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from mfd_network_adapter.network_interface.data_structures import (
+    Channels,
+    ChannelSettings,
+    RingBuffer,
+    RingBufferSettings,
+)
+
+
+@dataclass
+class QueueSettings:
+    """Structure for ring buffer and channel settings of interface."""
+
+    rings: RingBufferSettings = field(default_factory=RingBufferSettings)
+    channels: ChannelSettings = field(default_factory=ChannelSettings)
+
+
+@dataclass
+class QueueSettingsTarget:
+    """Structure for target ring buffer and channel sizes of interface, settings which are None are not changed."""
+
+    rings: Optional[RingBuffer] = None
+    channels: Optional[Channels] = None
+
+
+@dataclass
+class RingSizeRecommendation:
+    """Structure for rx ring size recommended based on drop counters."""
+
+    interface_name: str
+    current: int  # rx ring size at the time of measurement
+    maximum: int
+    recommended: int
+    drops: Dict[str, int] = field(default_factory=dict)  # drop counter -> drops in the last measurement window
+    verified: bool = False  # recommended size was applied and no drops were seen with it
+
+    @property
+    def total_drops(self) -> int:
+        """Drops of all counters in the last measurement window."""
+        return sum(self.drops.values())
@@ -3,18 +3,36 @@
 """Module for Queue feature for Linux systems."""
 
 import logging
+import re
+from itertools import zip_longest
+from typing import Dict, List, Type
 
 from mfd_common_libs import add_logging_level, log_levels
+from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic import execute_sections
+from mfd_network_adapter.api.basic.linux import SettingsType, parse_ethtool_settings
+from mfd_network_adapter.const import ETHTOOL_NOT_CHANGED_RC
+from mfd_network_adapter.network_interface.data_structures import ChannelSettings, RingBuffer, RingBufferSettings
 from .base import BaseQueueFeature
+from .data_structures import QueueSettings, QueueSettingsTarget, RingSizeRecommendation
+from ...exceptions import QueueFeatureException
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+RX_DROP_COUNTERS = ("rx_dropped", "rx_missed_errors", "rx_missed", "rx_no_buffer_count", "rx_no_buffer")
+
 
 class LinuxQueue(BaseQueueFeature):
     """Linux class for Queue feature."""
 
+    # outputs of commands followed by their return codes, as printed by set_queue_settings()
+    _results_regex = re.compile(r"(?P<output>.*?)^rc=(?P<return_code>\d+)$\n?", re.DOTALL | re.MULTILINE)
+    _drop_counters_regex = re.compile(
+        rf"^\s*(?P<name>{'|'.join(RX_DROP_COUNTERS)}):\s*(?P<value>\d+)\s*$", re.MULTILINE
+    )
+
     def get_queue_number_from_proc_interrupts(self, interface_name: str) -> str:
         """
         Get queues number from /proc/interrupts.
@@ -26,3 +44,176 @@ class LinuxQueue(BaseQueueFeature):
         output = self._connection.execute_command(command, shell=True, expected_return_codes={0})
 
         return output.stdout.replace("\n", "")
+
+    def get_queue_settings(self, interface_names: List[str], namespace: str | None = None) -> Dict[str, QueueSettings]:
+        """
+        Get current and maximum ring buffer and channel settings of many interfaces with single call.
+
+        :param interface_names: Names of interfaces
+        :param namespace: Namespace of interfaces
+        :return: Settings keyed by interface name
+        :raises QueueFeatureException: When settings of any interface could not be read
+        """
+        commands = []
+        for name in interface_names:
+            commands.append(add_namespace_call_command(f"ethtool -g {name}", namespace))
+            commands.append(add_namespace_call_command(f"ethtool -l {name}", namespace))
+        sections = execute_sections(self._connection, [f"{command} 2>/dev/null" for command in commands])
+        return {
+            name: QueueSettings(
+                rings=self._parse_settings(sections.get(2 * index, ""), RingBufferSettings, name),
+                channels=self._parse_settings(sections.get(2 * index + 1, ""), ChannelSettings, name),
+            )
+            for index, name in enumerate(interface_names)
+        }
+
+    def set_queue_settings(self, targets: Dict[str, QueueSettingsTarget], namespace: str | None = None) -> None:
+        """
+        Apply ring buffer and channel sizes on many interfaces concurrently with single call.
+
+        Commands of different interfaces are run in parallel on the host, channels are set before rings of interface,
+        as changing number of channels may reallocate rings.
+
+        :param targets: Target sizes keyed by interface name
+        :param namespace: Namespace of interfaces
+        :raises QueueFeatureException: When any of settings could not be applied
+        """
+        interface_commands = []
+        for name, target in targets.items():
+            commands = [
+                add_namespace_call_command(f"ethtool {option} {name} {settings!r}", namespace)
+                for option, settings in (("-L", target.channels), ("-G", target.rings))
+                if settings is not None and repr(settings)
+            ]
+            if commands:
+                interface_commands.append(commands)
+        if not interface_commands:
+            return
+        sections = execute_sections(
+            self._connection,
+            ["; ".join(f"{command} 2>&1; echo rc=$?" for command in commands) for commands in interface_commands],
+            parallel=True,
+        )
+        failed = []
+        for index, commands in enumerate(interface_commands):
+            results = self._results_regex.findall(sections[index])
+            for command, (command_output, return_code) in zip_longest(
+                commands, results[: len(commands)], fillvalue=("", "")
+            ):
+                if return_code not in ("0", ETHTOOL_NOT_CHANGED_RC):
+                    failed.append(f"{command}: {command_output.strip()}")
+        if failed:
+            raise QueueFeatureException("Failed to set queue settings:\n" + "\n".join(failed))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Queue settings applied: {interface_commands}")
+
+    def recommend_ring_sizes(
+        self,
+        interface_names: List[str],
+        window: float = 10,
+        apply: bool = False,
+        namespace: str | None = None,
+        max_iterations: int = 8,
+    ) -> Dict[str, RingSizeRecommendation]:
+        """
+        Recommend rx ring sizes based on drop counters (rx_dropped, rx_missed, rx_no_buffer) gathered over window.
+
+        Traffic has to be running during the measurement. Ring of interface with drops is recommended to be doubled
+        (up to maximum). With apply, recommended sizes are set and measured again, until drops are eliminated,
+        maximum is reached, size did not change after applying or max_iterations is reached; applied sizes stay set.
+        Interfaces with unknown (0) rx ring size are not resized.
+        Every measurement (rings, counters before and after window) is done with single call.
+
+        :param interface_names: Names of interfaces
+        :param window: Length of measurement window in seconds
+        :param apply: Apply recommended sizes and verify them
+        :param namespace: Namespace of interfaces
+        :param max_iterations: Maximum number of apply and measure iterations
+        :return: Recommendations keyed by interface name
+        """
+        recommendations = self._measure_ring_drops(interface_names, window, namespace)
+        pending = [name for name, recommendation in recommendations.items() if self._can_grow(recommendation)]
+        for _ in range(max_iterations if apply else 0):
+            if not pending:
+                break
+            previous = {name: recommendations[name].current for name in pending}
+            self.set_queue_settings(
+                {name: QueueSettingsTarget(rings=RingBuffer(rx=recommendations[name].recommended)) for name in pending},
+                namespace=namespace,
+            )
+            measured = self._measure_ring_drops(pending, window, namespace)
+            recommendations.update(measured)
+            for name in pending:
+                measured[name].verified = not measured[name].total_drops
+            pending = [
+                name for name in pending if measured[name].current != previous[name] and self._can_grow(measured[name])
+            ]
+        return recommendations
+
+    @staticmethod
+    def _can_grow(recommendation: RingSizeRecommendation) -> bool:
+        """
+        Check whether rx ring of interface should be resized to recommended size.
+
+        :param recommendation: Recommendation from the last measurement
+        :return: True when drops were seen and current size is known and below maximum
+        """
+        return bool(recommendation.total_drops) and 0 < recommendation.current < recommendation.maximum
+
+    def _measure_ring_drops(
+        self, interface_names: List[str], window: float, namespace: str | None
+    ) -> Dict[str, RingSizeRecommendation]:
+        """
+        Measure rx drops of interfaces over window and prepare recommendations.
+
+        :param interface_names: Names of interfaces
+        :param window: Length of measurement window in seconds
+        :param namespace: Namespace of interfaces
+        :return: Recommendations keyed by interface name
+        """
+        count = len(interface_names)
+        rings = [
+            f"{add_namespace_call_command(f'ethtool -g {name}', namespace)} 2>/dev/null" for name in interface_names
+        ]
+        stats = [
+            f"{add_namespace_call_command(f'ethtool -S {name}', namespace)} 2>/dev/null" for name in interface_names
+        ]
+        stats_after_window = [f"sleep {window}; {stats[0]}"] + stats[1:]
+        sections = execute_sections(self._connection, rings + stats + stats_after_window)
+
+        recommendations = {}
+        for index, name in enumerate(interface_names):
+            settings = self._parse_settings(sections.get(index, ""), RingBufferSettings, name)
+            before = self._parse_drop_counters(sections.get(count + index, ""))
+            after = self._parse_drop_counters(sections.get(2 * count + index, ""))
+            drops = {counter: after[counter] - value for counter, value in before.items() if counter in after}
+            current, maximum = settings.current.rx or 0, settings.maximum.rx or 0
+            recommended = min(current * 2, maximum) if sum(drops.values()) else current
+            recommendations[name] = RingSizeRecommendation(
+                interface_name=name, current=current, maximum=maximum, recommended=recommended, drops=drops
+            )
+        return recommendations
+
+    @staticmethod
+    def _parse_settings(output: str, settings_type: Type[SettingsType], interface_name: str) -> SettingsType:
+        """
+        Parse maximum and current settings from `ethtool -g` or `ethtool -l` output.
+
+        :param output: ethtool output
+        :param settings_type: RingBufferSettings or ChannelSettings
+        :param interface_name: Name of interface
+        :return: Parsed settings
+        :raises QueueFeatureException: When output does not contain settings
+        """
+        settings = parse_ethtool_settings(output, settings_type)
+        if settings is None:
+            raise QueueFeatureException(f"Cannot read queue settings of {interface_name}: {output}")
+        return settings
+
+    def _parse_drop_counters(self, output: str) -> Dict[str, int]:
+        """
+        Parse rx drop counters from `ethtool -S` output.
+
+        :param output: ethtool -S output
+        :return: Values keyed by counter name
+        """
+        return {match.group("name"): int(match.group("value")) for match in self._drop_counters_regex.finditer(output)}
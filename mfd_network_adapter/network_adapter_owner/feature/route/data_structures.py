@@ -0,0 +1,66 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Route feature data structures."""
+
+from dataclasses import dataclass, field
+
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
+
+
+@dataclass(frozen=True)
+class RouteEntry:
+    """Dataclass for single route of routing table."""
+
+    destination: str
+    device: str | None = None
+    gateway: str | None = None
+    route_type: str | None = None
+    protocol: str | None = None
+    scope: str | None = None
+    source: str | None = None
+    metric: int | None = None
+    table: str | None = None
+    onlink: bool = False
+    ip_version: IPVersion = IPVersion.V4
+
+    def to_command_args(self) -> str:
+        """
+        Get route specification in format accepted by `ip route add/del`.
+
+        IPv6 default route is given as `::/0`, as `ip -batch` has no family option and would treat it as IPv4.
+
+        :return: Route specification, e.g. '10.0.0.0/24 via 10.0.0.1 dev eth0 metric 100'
+        """
+        destination = "::/0" if self.ip_version is IPVersion.V6 and self.destination == "default" else self.destination
+        args = [self.route_type, destination] if self.route_type else [destination]
+        for keyword, value in (
+            ("via", self.gateway),
+            ("dev", self.device),
+            ("proto", self.protocol),
+            ("scope", self.scope),
+            ("src", self.source),
+            ("metric", self.metric),
+            ("table", self.table),
+        ):
+            if value is not None:
+                args.append(f"{keyword} {value}")
+        if self.onlink:
+            args.append("onlink")
+        return " ".join(args)
+
+
+@dataclass(frozen=True)
+class RouteTableSnapshot:
+    """Dataclass for snapshot of routing table."""
+
+    routes: frozenset[RouteEntry]
+    namespace: str | None = None
+    table: str = "main"
+
+
+@dataclass
+class RouteTableDiff:
+    """Dataclass for difference between routing table snapshot and current routing table."""
+
+    added: list[RouteEntry] = field(default_factory=list)
+    removed: list[RouteEntry] = field(default_factory=list)
@@ -2,14 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for Route feature for Linux systems."""
 
+import json
 import logging
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic.linux import execute_ip_batch
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 from .base import BaseRouteFeature
+from .data_structures import RouteEntry, RouteTableSnapshot, RouteTableDiff
 from ...exceptions import RouteFeatureException
 
 if TYPE_CHECKING:
@@ -136,3 +140,139 @@ class LinuxRoute(BaseRouteFeature):
         """
         cmd = f"ip route flush dev {device}"
         self._connection.execute_command(add_namespace_call_command(cmd, namespace))
+
+    def add_routes(self, routes: Iterable[RouteEntry], namespace: str | None = None) -> None:
+        """
+        Add many ip routes using single `ip -batch` call.
+
+        Already existing routes are skipped, same as in add_route.
+
+        :param routes: Routes to add
+        :param namespace: Name of network namespace
+        :raises RouteFeatureException: on failure
+        """
+        commands = [f"route add {route.to_command_args()}" for route in routes]
+        errors = execute_ip_batch(self._connection, commands, namespace=namespace)
+        failed = [
+            f"{commands[index]}: {message}"
+            for index, message in errors.items()
+            if "file exists" not in message.casefold()
+        ]
+        if failed:
+            raise RouteFeatureException("IP route commands failed with errors:\n" + "\n".join(failed))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Added {len(commands)} route(s)")
+
+    def delete_routes(self, routes: Iterable[RouteEntry], namespace: str | None = None) -> None:
+        """
+        Delete many ip routes using single `ip -batch` call.
+
+        :param routes: Routes to delete
+        :param namespace: Name of network namespace
+        :raises RouteFeatureException: on failure
+        """
+        commands = [f"route del {route.to_command_args()}" for route in routes]
+        errors = execute_ip_batch(self._connection, commands, namespace=namespace)
+        if errors:
+            failed = [f"{commands[index]}: {message}" for index, message in errors.items()]
+            raise RouteFeatureException("IP route commands failed with errors:\n" + "\n".join(failed))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Deleted {len(commands)} route(s)")
+
+    def get_routes(
+        self, namespace: str | None = None, table: str = "main", skip_kernel_routes: bool = True
+    ) -> list[RouteEntry]:
+        """
+        Get IPv4 and IPv6 routes of routing table.
+
+        :param namespace: Name of network namespace
+        :param table: Routing table
+        :param skip_kernel_routes: Skip routes created by kernel (e.g. for assigned IP addresses)
+        :return: List of routes
+        """
+        cmd = " && ".join(
+            add_namespace_call_command(f"ip -j -{version} route show table {table}", namespace) for version in (4, 6)
+        )
+        output = self._connection.execute_command(cmd, shell=True).stdout
+        routes = []
+        for ip_version, line in zip((IPVersion.V4, IPVersion.V6), output.splitlines()):
+            if not line.strip():
+                continue
+            for route in json.loads(line):
+                if skip_kernel_routes and route.get("protocol") == "kernel":
+                    continue
+                routes.append(
+                    RouteEntry(
+                        destination=route["dst"],
+                        device=route.get("dev"),
+                        gateway=route.get("gateway"),
+                        route_type=route["type"] if route.get("type", "unicast") != "unicast" else None,
+                        protocol=route.get("protocol"),
+                        scope=route.get("scope"),
+                        source=route.get("prefsrc"),
+                        metric=route.get("metric"),
+                        table=table if table != "main" else None,
+                        onlink="onlink" in route.get("flags", []),
+                        ip_version=ip_version,
+                    )
+                )
+        return routes
+
+    def snapshot(
+        self, namespace: str | None = None, table: str = "main", skip_kernel_routes: bool = True
+    ) -> RouteTableSnapshot:
+        """
+        Take snapshot of routing table, which can be used later to revert changes.
+
+        :param namespace: Name of network namespace
+        :param table: Routing table
+        :param skip_kernel_routes: Skip routes created by kernel (e.g. for assigned IP addresses)
+        :return: Snapshot of routing table
+        """
+        routes = self.get_routes(namespace=namespace, table=table, skip_kernel_routes=skip_kernel_routes)
+        return RouteTableSnapshot(routes=frozenset(routes), namespace=namespace, table=table)
+
+    def diff(self, snapshot: RouteTableSnapshot, skip_kernel_routes: bool = True) -> RouteTableDiff:
+        """
+        Compare current routing table with snapshot.
+
+        :param snapshot: Snapshot of routing table
+        :param skip_kernel_routes: Skip routes created by kernel (e.g. for assigned IP addresses)
+        :return: Routes added and removed since snapshot was taken
+        """
+        current = self.get_routes(
+            namespace=snapshot.namespace, table=snapshot.table, skip_kernel_routes=skip_kernel_routes
+        )
+        current_set = set(current)
+        # routes via gateway depend on link routes, so they're deleted first and added last
+        return RouteTableDiff(
+            added=sorted(
+                (route for route in current if route not in snapshot.routes), key=lambda route: route.gateway is None
+            ),
+            removed=sorted(
+                (route for route in snapshot.routes if route not in current_set),
+                key=lambda route: route.gateway is not None,
+            ),
+        )
+
+    def restore(self, snapshot: RouteTableSnapshot, skip_kernel_routes: bool = True) -> RouteTableDiff:
+        """
+        Revert routing table to snapshot, touching only routes changed since snapshot was taken.
+
+        Added routes are deleted and removed routes are added back with single `ip -batch` call.
+
+        :param snapshot: Snapshot of routing table
+        :param skip_kernel_routes: Skip routes created by kernel (e.g. for assigned IP addresses)
+        :return: Reverted difference
+        :raises RouteFeatureException: on failure
+        """
+        diff = self.diff(snapshot, skip_kernel_routes=skip_kernel_routes)
+        commands = [f"route del {route.to_command_args()}" for route in diff.added]
+        commands.extend(f"route add {route.to_command_args()}" for route in diff.removed)
+        errors = execute_ip_batch(self._connection, commands, namespace=snapshot.namespace)
+        if errors:
+            failed = [f"{commands[index]}: {message}" for index, message in errors.items()]
+            raise RouteFeatureException("Restore of routing table failed with errors:\n" + "\n".join(failed))
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Routing table restored: {len(diff.added)} route(s) deleted, {len(diff.removed)} route(s) added",
+        )
+        return diff
@@ -5,13 +5,15 @@
 import logging
 import re
 import typing
+from typing import Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_network_adapter import NetworkInterface
 
+from mfd_network_adapter.api.basic.linux import delete_tunnel_batch, execute_tunnel_batch
 from mfd_network_adapter.const import NETSTAT_REGEX_TEMPLATE
 from .base import BaseUtilsFeature
-from ...data_structures import TunnelType
+from ...data_structures import TunnelSpec, TunnelType
 from ...exceptions import UtilsFeatureException
 
 logger = logging.getLogger(__name__)
@@ -84,34 +86,105 @@ class LinuxUtils(BaseUtilsFeature):
         :param interface_name: Interface name for VXLAN tunnel
         :param local_ip: Local IP for GRE tunnel
         """
+        tunnel = TunnelSpec(
+            name=tun_name,
+            tunnel_type=tun_type,
+            remote_ip_addr=remote,
+            vni=vni,
+            group_addr=group,
+            dstport=dst_port,
+            ttl=ttl,
+            interface_name=interface_name,
+            local_ip_addr=local_ip,
+        )
+        cmd = f"ip {self._get_tunnel_endpoint_command(tunnel)}"
         if tun_type is TunnelType.GRE:
-            gre_required_params = (local_ip, remote, ttl)
-            if any(param is None for param in gre_required_params):
-                raise ValueError(f"{gre_required_params} cannot be None for GRE tunnel")
-            cmd = f"ip tunnel add {tun_name} mode gre remote {remote} local {local_ip} ttl {ttl}"
             # Creating a GRE tunnel creates a helper netdev 'gre0'. Creating additional GRE tunnels will throw an error.
             result = self._connection.execute_command(cmd, expected_return_codes={0, 1}, stderr_to_stdout=True)
             if result.return_code != 0 and '"gre0" failed' not in result.stdout:
                 raise UtilsFeatureException("Failed to add gre tunnel")
             return
 
-        elif tun_type is TunnelType.VXLAN:
-            vxlan_required_params = (vni, group, interface_name)
+        self._connection.execute_command(cmd, expected_return_codes={0})
+
+    def add_tunnel_endpoints(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Add many tunnel endpoints using single `ip -batch` call per namespace.
+
+        Required fields of each tunnel depend on its tunnel_type, same as parameters of add_tunnel_endpoint.
+
+        :param tunnels: Descriptions of tunnels
+        :param raise_on_error: Raise UtilsFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by execute_tunnel_batch
+        :raises ValueError: When required field of any tunnel is not set
+        :raises UtilsFeatureException: When tunnel type is invalid or any of tunnels failed and raise_on_error is set
+        """
+        return execute_tunnel_batch(
+            self._connection,
+            tunnels,
+            lambda tunnel: [self._get_tunnel_endpoint_command(tunnel)],
+            skipped_errors=('"gre0" failed',),
+            exception=UtilsFeatureException if raise_on_error else None,
+            action="add tunnel endpoints",
+        )
+
+    def delete_tunnel_endpoints(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Delete many tunnel endpoints added by add_tunnel_endpoints, not existing ones are skipped.
+
+        :param tunnels: Descriptions of tunnels
+        :param raise_on_error: Raise UtilsFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by delete_tunnel_batch
+        :raises UtilsFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        return delete_tunnel_batch(
+            self._connection,
+            tunnels,
+            exception=UtilsFeatureException if raise_on_error else None,
+            action="delete tunnel endpoints",
+        )
+
+    @staticmethod
+    def _get_tunnel_endpoint_command(tunnel: TunnelSpec) -> str:
+        """
+        Get ip command adding tunnel endpoint.
+
+        :param tunnel: Description of tunnel
+        :return: ip command without the leading `ip`
+        :raises ValueError: When required field of tunnel is not set
+        :raises UtilsFeatureException: When tunnel type is invalid
+        """
+        if tunnel.tunnel_type is TunnelType.GRE:
+            gre_required_params = (tunnel.local_ip_addr, tunnel.remote_ip_addr, tunnel.ttl)
+            if any(param is None for param in gre_required_params):
+                raise ValueError(f"{gre_required_params} cannot be None for GRE tunnel")
+            return (
+                f"tunnel add {tunnel.name} mode gre remote {tunnel.remote_ip_addr} "
+                f"local {tunnel.local_ip_addr} ttl {tunnel.ttl}"
+            )
+
+        elif tunnel.tunnel_type is TunnelType.VXLAN:
+            vxlan_required_params = (tunnel.vni, tunnel.group_addr, tunnel.interface_name)
             if any(param is None for param in vxlan_required_params):
                 raise ValueError(f"{vxlan_required_params} cannot be None for VXLAN tunnel")
-            port = dst_port if dst_port else 0
-            cmd = f"ip link add {tun_name} type vxlan id {vni} group {group} dev {interface_name} dstport {port}"
-
-        elif tun_type is TunnelType.GENEVE:
-            geneve_required_params = (remote, vni)
+            port = tunnel.dstport if tunnel.dstport else 0
+            return (
+                f"link add {tunnel.name} type vxlan id {tunnel.vni} group {tunnel.group_addr} "
+                f"dev {tunnel.interface_name} dstport {port}"
+            )
+
+        elif tunnel.tunnel_type is TunnelType.GENEVE:
+            geneve_required_params = (tunnel.remote_ip_addr, tunnel.vni)
             if any(param is None for param in geneve_required_params):
                 raise ValueError(f"{geneve_required_params} cannot be None for GENEVE tunnel")
-            port = dst_port if dst_port else 0
-            cmd = f"ip link add {tun_name} type geneve remote {remote} vni {vni} dstport {port}"
-        else:
-            raise UtilsFeatureException(f"Invalid tunnel type {tun_type}")
+            port = tunnel.dstport if tunnel.dstport else 0
+            return f"link add {tunnel.name} type geneve remote {tunnel.remote_ip_addr} vni {tunnel.vni} dstport {port}"
 
-        self._connection.execute_command(cmd, expected_return_codes={0})
+        raise UtilsFeatureException(f"Invalid tunnel type {tunnel.tunnel_type}")
 
     def get_memory_values(self) -> dict[str, int]:
         """
@@ -4,19 +4,23 @@
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from ipaddress import IPv4Interface, IPv6Interface
+from typing import TYPE_CHECKING, Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_kernel_namespace import add_namespace_call_command
 from mfd_package_manager import LinuxPackageManager
 from mfd_typing import MACAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType, VlanInterfaceInfo
 
+from mfd_network_adapter.api.basic.linux import execute_ip_batch
 from .base import BaseVLANFeature
 from ...exceptions import VLANFeatureException
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
+    from mfd_network_adapter import NetworkInterface
     from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
 
 logger = logging.getLogger(__name__)
@@ -98,8 +102,102 @@ class LinuxVLAN(BaseVLANFeature):
         vlans = sorted(
             [vlan_name.strip() for vlan_name in result.stdout.split() if "config" not in vlan_name], reverse=True
         )
-        for vlan_name in vlans:
-            self.remove_vlan(vlan_name=vlan_name)
+        self.remove_vlans(vlan_names=vlans)
+
+    def create_vlans(
+        self,
+        interface_name: str,
+        vlan_ids: Iterable[int],
+        protocol: str | None = None,
+        reorder: bool = True,
+        namespace_name: str | None = None,
+        ips: dict[int, list[IPv4Interface | IPv6Interface]] | None = None,
+        link_up: bool = False,
+    ) -> list["NetworkInterface"]:
+        """
+        Create many VLANs on interface using single `ip -batch` call.
+
+        VLANs are named '<interface_name>.<vlan_id>'.
+        Created VLAN interfaces are returned directly, so there is no need to re-discover interfaces of owner.
+
+        :param interface_name: Network interface name (parent of VLANs).
+        :param vlan_ids: IDs of VLANs.
+        :param protocol: Specify '802.1ad' or '802.1Q' protocol type.
+        :param reorder: Specifies whether ethernet headers are reordered or not.
+        :param namespace_name: Namespace of VLANs
+        :param ips: IPs to add on VLAN interfaces, keyed by VLAN ID
+        :param link_up: Set link of created VLAN interfaces up
+        :return: Created VLAN interfaces.
+        :raises VLANFeatureException: When any of commands failed
+        """
+        from mfd_network_adapter.network_interface.base import NetworkInterface
+
+        protocol = f" protocol {protocol}" if protocol else ""
+        reorder = " reorder_hdr off" if not reorder else ""
+        ips = ips or {}
+
+        vlan_ids = list(vlan_ids)
+        commands = []
+        for vlan_id in vlan_ids:
+            vlan_name = f"{interface_name}.{vlan_id}"
+            commands.append(
+                f"link add link {interface_name} name {vlan_name} type vlan{protocol} id {vlan_id}{reorder}"
+            )
+            commands.extend(f"addr add {ip} dev {vlan_name}" for ip in ips.get(vlan_id, []))
+            if link_up:
+                commands.append(f"link set dev {vlan_name} up")
+
+        self._raise_on_batch_errors(commands, execute_ip_batch(self._connection, commands, namespace=namespace_name))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Created {len(vlan_ids)} VLAN(s) on {interface_name}")
+
+        return [
+            NetworkInterface(
+                connection=self._connection,
+                interface_info=LinuxInterfaceInfo(
+                    name=f"{interface_name}.{vlan_id}",
+                    interface_type=InterfaceType.VLAN,
+                    vlan_info=VlanInterfaceInfo(vlan_id=vlan_id, parent=interface_name),
+                    installed=True,
+                    namespace=namespace_name,
+                ),
+            )
+            for vlan_id in vlan_ids
+        ]
+
+    def remove_vlans(
+        self,
+        vlan_names: Iterable[str] | None = None,
+        vlan_ids: Iterable[int] | None = None,
+        interface_name: str | None = None,
+        namespace_name: str | None = None,
+    ) -> None:
+        """
+        Remove many VLANs using single `ip -batch` call.
+
+        :param vlan_names: Names of existing VLAN interfaces.
+        :param vlan_ids: IDs of VLANs to remove, used together with interface_name when names are not passed.
+        :param interface_name: Network interface name.
+        :param namespace_name: Namespace of VLANs
+        :raises VLANFeatureException: When any of commands failed
+        """
+        if vlan_names is None:
+            vlan_names = [f"{interface_name}.{vlan_id}" for vlan_id in vlan_ids or []]
+        commands = [f"link del {vlan_name}" for vlan_name in vlan_names]
+        self._raise_on_batch_errors(commands, execute_ip_batch(self._connection, commands, namespace=namespace_name))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Removed {len(commands)} VLAN(s)")
+
+    @staticmethod
+    def _raise_on_batch_errors(commands: list[str], errors: dict[int, str]) -> None:
+        """
+        Raise exception with all failed commands of `ip -batch` call.
+
+        :param commands: Executed commands
+        :param errors: Error messages of failed commands, keyed by index of command
+        :raises VLANFeatureException: When any of commands failed
+        """
+        if errors:
+            failed = "\n".join(f"{commands[index]}: {message}" for index, message in errors.items())
+            raise VLANFeatureException(f"Failed to execute VLAN commands:\n{failed}")
 
     def create_macvlan(self, interface_name: str, mac: MACAddress, macvlan_name: str) -> ConnectionCompletedProcess:
         """Create MACVLAN on interface.
@@ -4,11 +4,14 @@
 
 import logging
 from ipaddress import IPv4Interface, IPv6Interface
-from typing import Union
+from typing import Iterable, Union
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.api.basic.linux import delete_tunnel_batch, execute_tunnel_batch
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+
 from .base import BaseVxLANFeature
 from ...exceptions import VxLANFeatureException
 
@@ -97,3 +100,68 @@ class LinuxVxLAN(BaseVxLANFeature):
             )
 
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"VxLAN: {vxlan_name} deleted!")
+
+    def create_setup_vxlans(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Create and set up many VxLAN tunnels using single `ip -batch` call per namespace.
+
+        Each tunnel requires name, vni, group_addr and interface_name, dstport, ip_addr and namespace_name are optional.
+        Already existing tunnels are not treated as failure, same as in create_setup_vxlan.
+
+        :param tunnels: Descriptions of VxLAN tunnels
+        :param raise_on_error: Raise VxLANFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by execute_tunnel_batch
+        :raises VxLANFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = execute_tunnel_batch(
+            self._connection,
+            tunnels,
+            self._get_setup_commands,
+            skipped_errors=("File exists",),
+            exception=VxLANFeatureException if raise_on_error else None,
+            action="create VxLAN tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"VxLAN: {len(tunnels) - len(errors)} tunnel(s) created.")
+        return errors
+
+    def delete_vxlans(
+        self, tunnels: Iterable[TunnelSpec], raise_on_error: bool = True
+    ) -> dict[tuple[str | None, str], str]:
+        """
+        Delete many VxLAN tunnels added by create_setup_vxlans, not existing ones are skipped.
+
+        :param tunnels: Descriptions of VxLAN tunnels
+        :param raise_on_error: Raise VxLANFeatureException when any of tunnels failed
+        :return: Error messages of failed tunnels returned by delete_tunnel_batch
+        :raises VxLANFeatureException: When any of tunnels failed and raise_on_error is set
+        """
+        tunnels = list(tunnels)
+        errors = delete_tunnel_batch(
+            self._connection,
+            tunnels,
+            exception=VxLANFeatureException if raise_on_error else None,
+            action="delete VxLAN tunnels",
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"VxLAN: {len(tunnels) - len(errors)} tunnel(s) deleted.")
+        return errors
+
+    @staticmethod
+    def _get_setup_commands(tunnel: TunnelSpec) -> list[str]:
+        """
+        Get ip commands creating and setting up single VxLAN tunnel.
+
+        :param tunnel: Description of VxLAN tunnel
+        :return: ip commands without the leading `ip`
+        """
+        group_addr = getattr(tunnel.group_addr, "ip", tunnel.group_addr)
+        commands = [
+            f"link add {tunnel.name} type vxlan id {tunnel.vni} group {group_addr} "
+            f"dev {tunnel.interface_name} dstport {tunnel.dstport or 0}",
+            f"link set {tunnel.name} up",
+        ]
+        if tunnel.ip_addr is not None:
+            commands.append(f"addr add {tunnel.ip_addr} dev {tunnel.name}")
+        return commands
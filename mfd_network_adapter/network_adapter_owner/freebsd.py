@@ -7,7 +7,7 @@ import io
 import logging
 import re
 from ipaddress import IPv4Interface
-from typing import List, Pattern, Iterator, Match, TYPE_CHECKING
+from typing import Dict, List, Pattern, Iterator, Match, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels, os_supported
 from mfd_typing import PCIDevice, PCIAddress, OSName, VendorID, DeviceID, SubVendorID, SubDeviceID
@@ -15,11 +15,13 @@ from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType, Vlan
 
 from .base import NetworkAdapterOwner
 from .exceptions import NetworkAdapterNotFound
+from ..api.basic import execute_sections
 from ..api.utils.freebsd import update_num_vfs_in_config, convert_to_vf_config_format
 from ..exceptions import VirtualFunctionCreationException
 
 if TYPE_CHECKING:
     from pathlib import Path  # noqa: F401
+    from mfd_connect import Connection
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -28,10 +30,37 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
     """Class for handle owner of network adapters in FreeBSD systems."""
 
-    __init__ = os_supported(OSName.FREEBSD)(NetworkAdapterOwner.__init__)
-
     _pci_address_core_regex = r"(?P<domain>[0-9a-f]+):(?P<bus>[0-9a-f]+):(?P<slot>[0-9a-f]+)"
     _full_pci_address_regex = rf"{_pci_address_core_regex}.(?P<func>[0-7]+)"
+    _vlan_regex = (
+        r"\svlan: (?P<vlan_id>\d+)"
+        r"(?:\svlanproto: \d+.\dq|\svlanpcp: \d+)(?:\svlanpcp: \d+)?"
+        r"\sparent interface: (?P<parent>\w+)"
+    )
+    # only naming nodes of device tree are transferred instead of whole kernel MIB
+    _device_names_command = r"sysctl dev | grep -E '\.(%parent|conf\.device_name): '"
+    _vlan_interfaces_command = "for vlan in $(ifconfig -g vlan); do ifconfig $vlan; done"
+
+    @os_supported(OSName.FREEBSD)
+    def __init__(self, *, connection: "Connection", **kwargs):
+        """
+        Initialize FreeBSD owner.
+
+        :param connection: Object of mfd-connect
+        """
+        super().__init__(connection=connection, **kwargs)
+        # kernel version does not change during connection lifetime, so uname -K is read once
+        self._os_version: int | None = None
+
+    def _get_os_version(self) -> int:
+        """
+        Get FreeBSD kernel version, value is read once per connection.
+
+        :return: Version from uname -K
+        """
+        if self._os_version is None:
+            self._os_version = int(self._connection.execute_command("uname -K").stdout)
+        return self._os_version
 
     def _get_regex_pattern(self) -> Pattern:
         """
@@ -65,8 +94,7 @@ class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
             r"(?:\n\s+class.*)?"
             r"(?:\n\s+subclass.*)?"
         )
-        os_version = self._connection.execute_command("uname -K").stdout
-        if int(os_version) < 1300085:
+        if self._get_os_version() < 1300085:
             pattern = re.compile(pattern_old, re.M)
         else:
             pattern = re.compile(pattern_new, re.M)
@@ -76,34 +104,58 @@ class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
         """
         Get output from pciconf command filtered by device class.
 
+        :return: list of entries from command
+        """
+        return self._parse_pciconf_output(self._connection.execute_command("pciconf -l -v").stdout)
+
+    def _parse_pciconf_output(self, output: str) -> List[Match[str]]:
+        """
+        Parse output of pciconf -l -v filtered by device class.
+
+        :param output: Output of pciconf -l -v
         :return: list of entries from command
         """
         entries = []
-        output = self._connection.execute_command("pciconf -l -v").stdout
         for match in self._get_regex_pattern().finditer(output):
             if not match.group("class").startswith("0x02"):
                 continue
             entries.append(match)
         return entries
 
+    def _execute_discovery_commands(self, commands: List[str]) -> Dict[str, str]:
+        """
+        Execute discovery commands using single shell payload.
+
+        :param commands: Commands to execute
+        :return: Dict with command as key and its output as value
+        """
+        outputs = execute_sections(self._connection, commands)
+        return {command: outputs[index] for index, command in enumerate(commands)}
+
     def _get_all_interfaces_info(self) -> List[LinuxInterfaceInfo]:
         """
         Get all interfaces info for each InterfaceType.
 
+        pciconf, sysctl and ifconfig outputs are gathered using single payload.
+
         :return: List of LinuxInterfaceInfo
         """
+        commands = ["pciconf -l -v", self._device_names_command, "ifconfig -a inet", self._vlan_interfaces_command]
+        if self._os_version is None:
+            commands.append("uname -K")
+        outputs = self._execute_discovery_commands(commands)
+        if self._os_version is None:
+            self._os_version = int(outputs["uname -K"])
+
         info: List[LinuxInterfaceInfo] = []
-        for match in self._get_output_from_pciconf():
+        for match in self._parse_pciconf_output(outputs["pciconf -l -v"]):
             name = match.group("name")
             if name.startswith("virtio_pci") or name.startswith("mlx5_core"):
-                result = self._connection.execute_command(
-                    f"sysctl -a | grep -F ': {name}'", shell=True, expected_return_codes=None
-                )
-                if result.return_code != 0:
-                    # If an error occurred while getting virtio_pci configuration
+                if not re.search(rf": {name}$", outputs[self._device_names_command], re.MULTILINE):
+                    # If virtio_pci configuration is not available
                     # - most probably it's not the interface we're looking for
                     continue
-                name = self._virtio_mlx_wa_name(name, result.stdout)
+                name = self._virtio_mlx_wa_name(name, outputs[self._device_names_command])
 
             data = {
                 "pci_device": PCIDevice(
@@ -122,9 +174,9 @@ class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
             }
             info.append(LinuxInterfaceInfo(**data))
 
-        info.extend(self._get_vlan_interfaces_data())
+        info.extend(self._parse_vlan_interfaces_data(outputs[self._vlan_interfaces_command]))
 
-        inet_info_iterator = self._get_inet_information()
+        inet_info_iterator = self._parse_inet_information(outputs["ifconfig -a inet"])
         self._mark_management_interface(info, inet_info_iterator)
 
         return info
@@ -160,11 +212,21 @@ class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
         """
         cmd = "ifconfig -a inet"
         result = self._connection.execute_command(cmd)
+        return self._parse_inet_information(result.stdout)
+
+    @staticmethod
+    def _parse_inet_information(output: str) -> Iterator[Match[str]]:
+        """
+        Parse name, flags, options and IP address of the interfaces from ifconfig output.
+
+        :param output: Output of ifconfig -a inet
+        :return finditer matches from ifconfig inet
+        """
         return re.finditer(
             r"\s*(?P<name>\w+):\s+(flags=(?P<flags>.*))\n"
             r"\s+(options=(?P<options>.*))(?:\n\s+)?"
             r"(inet\s?(?P<inet>.*))?",
-            result.stdout,
+            output,
             re.MULTILINE,
         )
 
@@ -198,26 +260,39 @@ class FreeBSDNetworkAdapterOwner(NetworkAdapterOwner):
         :return: List of LinuxInterfaceInfo including Vlan information
         """
         vlan_interfaces_data = []
-        vlan_re = re.compile(
-            r"\svlan: (?P<vlan_id>\d+)"
-            r"(?:\svlanproto: \d+.\dq|\svlanpcp: \d+)(?:\svlanpcp: \d+)?"
-            r"\sparent interface: (?P<parent>\w+)"
-        )
         result = self._connection.execute_command("ifconfig -g vlan")
         for vlan_interface in result.stdout.splitlines():
             cmd = f"ifconfig {vlan_interface}"
             result = self._connection.execute_command(cmd)
-            match = vlan_re.search(result.stdout)
-            if not match:
-                raise NetworkAdapterNotFound(f"Cannot get vlan id and parent device\n{result.stdout}")
-            vlan_interfaces_data.append(
-                LinuxInterfaceInfo(
-                    interface_type=InterfaceType.VLAN,
-                    vlan_info=VlanInterfaceInfo(parent=match.group("parent"), vlan_id=int(match.group("vlan_id"))),
-                )
-            )
+            vlan_interfaces_data.append(self._parse_vlan_interface(result.stdout))
         return vlan_interfaces_data
 
+    def _parse_vlan_interfaces_data(self, output: str) -> List[LinuxInterfaceInfo]:
+        """
+        Parse data related with VLAN interfaces from concatenated ifconfig outputs of all VLAN interfaces.
+
+        :param output: Output of ifconfig called for each VLAN interface
+        :return: List of LinuxInterfaceInfo including Vlan information
+        """
+        blocks = re.split(r"^(?=\S+: flags=)", output, flags=re.MULTILINE)
+        return [self._parse_vlan_interface(block) for block in blocks if block.strip()]
+
+    def _parse_vlan_interface(self, output: str) -> LinuxInterfaceInfo:
+        """
+        Parse vlan id and parent device from ifconfig output of VLAN interface.
+
+        :param output: Output of ifconfig for VLAN interface
+        :return: LinuxInterfaceInfo including Vlan information
+        :raises NetworkAdapterNotFound: When vlan id or parent device cannot be found
+        """
+        match = re.search(self._vlan_regex, output)
+        if not match:
+            raise NetworkAdapterNotFound(f"Cannot get vlan id and parent device\n{output}")
+        return LinuxInterfaceInfo(
+            interface_type=InterfaceType.VLAN,
+            vlan_info=VlanInterfaceInfo(parent=match.group("parent"), vlan_id=int(match.group("vlan_id"))),
+        )
+
     def _load_config_file(
         self, interface_name: str, config_dir: "Path | str" = "/home/user", config_name: str | None = None
     ) -> bool:
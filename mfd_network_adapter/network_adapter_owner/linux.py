@@ -17,6 +17,8 @@ from mfd_typing import PCIDevice, PCIAddress, OSName, MACAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType, VlanInterfaceInfo
 
 from .base import NetworkAdapterOwner
+from .data_structures import InterfaceInfoIndex
+from ..api.basic import execute_sections
 from ..const import (
     LINUX_SYS_CLASS_FULL_REGEX,
     LINUX_SYS_CLASS_VIRTUAL_DEVICE_REGEX,
@@ -130,10 +132,11 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         :param destination_list:
         :return: None
         """
+        source_index = InterfaceInfoIndex(source_list)
         for destination_interface in destination_list:  # updating PCIDevice
-            for source_interface in source_list:
-                if destination_interface.pci_address == source_interface.pci_address:
-                    destination_interface.pci_device = source_interface.pci_device
+            matching_sources = source_index.by_pci_address(destination_interface.pci_address)
+            if matching_sources:
+                destination_interface.pci_device = matching_sources[-1].pci_device
 
     @staticmethod
     def _mark_vport_interfaces(
@@ -151,27 +154,31 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         :param interfaces: Target list of interfaces
         :return: None
         """
+        sys_class_index = InterfaceInfoIndex(sys_class_interfaces)
+        lspci_index = InterfaceInfoIndex(interfaces)
         counter = Counter(x.pci_address for x in sys_class_interfaces)
-        to_be_removed = []
-        for pci_address_tuple in counter.most_common():
-            pci_address, no = pci_address_tuple
+        vports = []
+        replaced_ids = set()
+        for pci_address, no in counter.most_common():
             # Check if PCIAddress exists (filter out virtual devices) + multiple Interfaces
-            if pci_address is not None and no > 1:
-                matching_lspci_interface = None
-                for sys_class_interface in sys_class_interfaces:
-                    if sys_class_interface.pci_address == pci_address and (
-                        sys_class_interface.pci_device and f"0x{sys_class_interface.pci_device.device_id}" in MEV_IDs
-                    ):
-                        sys_class_interface.interface_type = InterfaceType.VPORT
-                        matching_lspci_interface = next(
-                            x for x in interfaces if x.pci_address == sys_class_interface.pci_address
-                        )
-                        interfaces.append(sys_class_interface)  # adding VPORT Interface
-                        to_be_removed.append(sys_class_interface)
-                if matching_lspci_interface is not None:
-                    interfaces.remove(matching_lspci_interface)  # removing ETHCONTROLLER Interface
-        for iface in to_be_removed:
-            sys_class_interfaces.remove(iface)
+            if pci_address is None or no <= 1:
+                continue
+            pci_vports = [
+                sys_class_interface
+                for sys_class_interface in sys_class_index.by_pci_address(pci_address)
+                if sys_class_interface.pci_device and f"0x{sys_class_interface.pci_device.device_id}" in MEV_IDs
+            ]
+            matching_lspci_interfaces = lspci_index.by_pci_address(pci_address)
+            if pci_vports and matching_lspci_interfaces:
+                replaced_ids.add(id(matching_lspci_interfaces[0]))  # removing ETHCONTROLLER Interface
+            for sys_class_interface in pci_vports:
+                sys_class_interface.interface_type = InterfaceType.VPORT
+            vports.extend(pci_vports)
+        if not vports:
+            return
+        vport_ids = {id(vport) for vport in vports}
+        interfaces[:] = [x for x in interfaces if id(x) not in replaced_ids] + vports  # adding VPORT Interfaces
+        sys_class_interfaces[:] = [x for x in sys_class_interfaces if id(x) not in vport_ids]
 
     def _mark_bts_interfaces(self, interfaces: List[LinuxInterfaceInfo]) -> None:
         """
@@ -208,26 +215,26 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         :param sys_class_interfaces: `InterfaceInfo` objects created based on `sys class` output
         :return: None
         """
-        to_be_removed = []
+        sys_class_index = InterfaceInfoIndex(sys_class_interfaces)
+        covered_ids = set()
         for interface in interfaces:
-            for sys_class_interface in sys_class_interfaces:
-                # Updating list of PFs
-                if interface.pci_address == sys_class_interface.pci_address:
-                    interface.installed = True
-                    interface.name = sys_class_interface.name
-                    interface.interface_type = (
-                        InterfaceType.PF
-                        if interface.interface_type == InterfaceType.ETH_CONTROLLER
-                        else interface.interface_type
-                    )
-                    interface.namespace = sys_class_interface.namespace
-                    to_be_removed.append(sys_class_interface)
-                    break
+            matching_sys_class_interfaces = sys_class_index.by_pci_address(interface.pci_address)
+            if not matching_sys_class_interfaces:
+                continue
+            # Updating list of PFs
+            sys_class_interface = matching_sys_class_interfaces[0]
+            interface.installed = True
+            interface.name = sys_class_interface.name
+            interface.interface_type = (
+                InterfaceType.PF
+                if interface.interface_type == InterfaceType.ETH_CONTROLLER
+                else interface.interface_type
+            )
+            interface.namespace = sys_class_interface.namespace
+            covered_ids.add(id(sys_class_interface))
 
         # removing PFs already covered
-        for iface in to_be_removed:
-            if iface in sys_class_interfaces:
-                sys_class_interfaces.remove(iface)
+        sys_class_interfaces[:] = [x for x in sys_class_interfaces if id(x) not in covered_ids]
         # Adding remaining items, which weren't listed on lspci (?)
         interfaces.extend(sys_class_interfaces)
 
@@ -344,24 +351,30 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         """
         Update VLAN info for all VLAN interfaces from provided list.
 
-        Gather all vlan interfaces (parse output from ls /proc/net/vlan) then for each of them:
+        Gather all vlan interfaces (parse output from ls /proc/net/vlan), read details of all of them
+        with single `ip -d link show type vlan` call, then for each of them:
         - get VLAN ID and Parent name and store them in matching InterfaceInfo object.
         :param interfaces: List of LinuxInterfaceInfo objects
         :return: None
         """
         vlan_interfaces = self._get_vlan_interfaces(namespace=namespace)
+        if not vlan_interfaces:
+            return
 
-        for vlan_interface in vlan_interfaces:
-            command_list_vlan_ids = add_namespace_call_command(
-                command=f"ip -d link show dev {vlan_interface}", namespace=namespace
-            )
-            res = self._connection.execute_command(command=command_list_vlan_ids, shell=True)
+        command_list_vlan_ids = add_namespace_call_command(command="ip -d link show type vlan", namespace=namespace)
+        res = self._connection.execute_command(command=command_list_vlan_ids, shell=True)
+        vlan_details = {}
+        for block in re.split(r"^(?=\d+:\s)", res.stdout, flags=re.MULTILINE):
+            match = re.match(r"^\d+:\s+(?P<name>[^@:\s]+)", block)
+            if match:
+                vlan_details[match.group("name")] = block
 
-            vlan_info = self._get_vlan_info(string=res.stdout)
-            for interface in interfaces:
-                if interface.name == vlan_interface:
-                    interface.vlan_info = vlan_info
-                    interface.interface_type = InterfaceType.VLAN
+        interfaces_index = InterfaceInfoIndex(interfaces)
+        for vlan_interface in vlan_interfaces:
+            vlan_info = self._get_vlan_info(string=vlan_details.get(vlan_interface, ""))
+            for interface in interfaces_index.by_name(vlan_interface):
+                interface.vlan_info = vlan_info
+                interface.interface_type = InterfaceType.VLAN
 
     def _update_data_based_on_sys_class_net(self, interfaces: List[LinuxInterfaceInfo], namespace: str = None) -> None:
         """
@@ -400,10 +413,10 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         physfn_output = self._connection.execute_command(command=find_command, expected_return_codes={0, 1}).stdout
         pattern = r"/sys/class/net/(?P<name>.*)/device/physfn"
 
+        interfaces_index = InterfaceInfoIndex(interfaces)
         for name in re.findall(pattern=pattern, string=physfn_output, flags=re.MULTILINE):
-            for iface in interfaces:
-                if iface.name == name:
-                    iface.interface_type = InterfaceType.VF
+            for iface in interfaces_index.by_name(name):
+                iface.interface_type = InterfaceType.VF
 
     def _get_lspci_interfaces(self, namespace: Optional[str] = None) -> List[LinuxInterfaceInfo]:
         """
@@ -514,10 +527,10 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 mac = match_mac.group("mac")
                 macs[name] = mac
 
-        for interface in interfaces:
-            for name, mac in macs.items():
-                if interface.name == name:
-                    interface.mac_address = MACAddress(addr=mac)
+        interfaces_index = InterfaceInfoIndex(interfaces)
+        for name, mac in macs.items():
+            for interface in interfaces_index.by_name(name):
+                interface.mac_address = MACAddress(addr=mac)
 
     def _get_all_interfaces_info(self) -> List[LinuxInterfaceInfo]:
         """
@@ -569,7 +582,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
 
         for namespace in namespaces:
             temp_interfaces = self._get_lspci_interfaces(namespace=namespace)
-            pci_addresses = [x.pci_address for x in interfaces]
+            pci_addresses = {x.pci_address for x in interfaces}
             for temp_iface in temp_interfaces:
                 if temp_iface.pci_address not in pci_addresses:
                     interfaces.append(temp_iface)
@@ -584,12 +597,115 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
 
         return interfaces
 
+    def _get_single_interface_info(
+        self, *, pci_address: Optional[PCIAddress], interface_name: Optional[str], namespace: Optional[str]
+    ) -> Optional[LinuxInterfaceInfo]:
+        """
+        Resolve single PF/VF by name or PCI address from sysfs, lspci and ip outputs read in one call.
+
+        Interfaces which require context of other interfaces (VPORT, BTS, bonding, VLAN, virtual devices, interfaces
+        in other namespaces) are not resolved, full scan is used for them. Lookup by name is resolved only when there
+        are no network namespaces, as the same name can be used in many of them.
+
+        :param pci_address: PCI address
+        :param interface_name: Name of the interface
+        :param namespace: Namespace, in which interface is searched
+        :return: LinuxInterfaceInfo or None when full scan is required
+        """
+        if interface_name is not None:
+            device_path = f"$(readlink -f /sys/class/net/{interface_name}/device 2>/dev/null)"
+        else:
+            device_path = f"/sys/bus/pci/devices/{pci_address}"
+        commands = [
+            "ls $d/net 2>/dev/null",
+            "test -e $d/physfn && echo physfn",
+            'test -n "$d" && lspci -D -nnvvvmm -s ${d##*/}',
+            'test -n "$n" && test -e /sys/class/net/$n/master -o -e /sys/class/net/$n/bonding && echo bond',
+            'test -n "$n" && cat /sys/class/net/$n/address',
+            'test -n "$n" && ip -o -4 addr show dev $n',
+            "ip netns list",
+        ]
+        sections = execute_sections(
+            self._connection,
+            commands,
+            namespace=namespace,
+            prefix=f"d={device_path}; n=$(ls $d/net 2>/dev/null | head -n 1); ",
+        )
+        netdevs, physfn, lspci_block, bond, address, ip_addresses, namespaces = sections.values()
+        return self._parse_single_interface_info(
+            interface_name=interface_name,
+            namespace=namespace,
+            netdevs=netdevs.split(),
+            is_physfn=bool(physfn.strip()),
+            lspci_block=lspci_block.strip(),
+            is_bonding=bool(bond.strip()),
+            address=address.strip(),
+            ip_addresses=ip_addresses,
+            namespaces=namespaces.split(),
+        )
+
+    def _parse_single_interface_info(
+        self,
+        *,
+        interface_name: Optional[str],
+        namespace: Optional[str],
+        netdevs: List[str],
+        is_physfn: bool,
+        lspci_block: str,
+        is_bonding: bool,
+        address: str,
+        ip_addresses: str,
+        namespaces: List[str],
+    ) -> Optional[LinuxInterfaceInfo]:
+        """
+        Build LinuxInterfaceInfo of single interface or decide that full scan is required.
+
+        :param interface_name: Requested name of the interface or None for lookup by PCI address
+        :param namespace: Namespace, in which interface was searched
+        :param netdevs: Names of netdevs of PCI device
+        :param is_physfn: Whether PCI device is VF (has physfn link)
+        :param lspci_block: lspci output of PCI device
+        :param is_bonding: Whether netdev is bonding master or slave
+        :param address: MAC address of netdev
+        :param ip_addresses: Output of ip -o -4 addr show dev <netdev>
+        :param namespaces: Network namespaces existing on host
+        :return: LinuxInterfaceInfo or None when full scan is required
+        """
+        if not re.search(r"^Class:.*Ethernet controller", lspci_block, re.MULTILINE) or len(netdevs) > 1:
+            return None  # not a NIC or possible VPORTs sharing PCI address
+        if interface_name is not None and (netdevs != [interface_name] or namespaces):
+            return None  # interface with the same name can exist in other namespace
+        if not netdevs and (namespaces or namespace is not None):
+            return None  # netdev can be in other namespace
+        name = netdevs[0] if netdevs else None
+        if name is not None and (name.startswith("nac_") or is_bonding):
+            return None  # BTS and bonding interfaces are marked based on other interfaces
+
+        match = re.search(rf"^Slot:\s+{self._full_pci_address_regex}", lspci_block, re.MULTILINE)
+        is_virtual = is_physfn or bool(re.search("^Device.+Virtual", lspci_block, re.MULTILINE))
+        if name is None:
+            interface_type = InterfaceType.VF if is_virtual else InterfaceType.ETH_CONTROLLER
+        else:
+            interface_type = InterfaceType.VF if is_virtual else InterfaceType.PF
+        for ip in re.findall(r"inet\s(?P<ip>[\d.]+)/\d+.*scope global", ip_addresses):
+            if self.is_management_interface(IPv4Interface(ip)):
+                interface_type = InterfaceType.MANAGEMENT
+        return LinuxInterfaceInfo(
+            name=name,
+            pci_address=PCIAddress(**walk_values(partial(int, base=16), match.groupdict())),
+            pci_device=self._get_device_from_lspci_output(lspci_block),
+            interface_type=interface_type,
+            installed=name is not None,
+            namespace=namespace if name is not None else None,
+            mac_address=MACAddress(addr=address) if name is not None and address else None,
+        )
+
     def _mark_bonding_interfaces(self, interfaces: list[LinuxInterfaceInfo]) -> None:
         """
         Mark bonding interfaces.
 
         Flow:
-        1. Get bonding interfaces from bonding module
+        1. Get bonding interfaces with their children from bonding module (single read)
         2. Get interface flags from ip addr show
         3. Check if interface is in bonding interfaces list
         4. Check if interface is a master/slave
@@ -600,17 +716,17 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
 
         :param interfaces: List of LinuxInterfaceInfo
         """
-        bonding_interfaces = self.bonding.get_bond_interfaces()
-        if not bonding_interfaces:
+        bonding_children = self.bonding.get_all_children()
+        if not bonding_children:
             return
 
-        slaves = []
+        slaves = set()
         for interface in interfaces:
             if interface.name is None:
                 continue
-            if interface.name in bonding_interfaces:
+            if interface.name in bonding_children:
                 interface.interface_type = InterfaceType.BOND
-                slaves.extend(self.bonding.get_children(bonding_interface=interface.name))
+                slaves.update(bonding_children[interface.name])
 
         for interface in interfaces:
             if interface.name in slaves:
@@ -681,6 +797,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         if params:
             command.extend([f"{key}={val}" for (key, val) in params.items()])
         self._connection.execute_command(" ".join(command))
+        self._clear_interfaces_hardware_facts()
 
     def load_driver_file(self, *, driver_filepath: "Path", params: Optional[Dict] = None) -> None:
         """
@@ -695,6 +812,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         if params:
             command.extend([f"{key}={val}" for (key, val) in params.items()])
         self._connection.execute_command(" ".join(command))
+        self._clear_interfaces_hardware_facts()
 
     def unload_driver_module(self, *, driver_name: str) -> None:
         """
@@ -704,6 +822,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         """
         logger.warning("This API is deprecated. Please use NetworkAdapterOwner.driver.unload_driver_module() instead.")
         self._connection.execute_command(f"modprobe -r {driver_name}")
+        self._clear_interfaces_hardware_facts()
 
     def reload_driver_module(self, *, driver_name: str, reload_time: float = 5, params: Optional[Dict] = None) -> None:
         """
@@ -7,12 +7,9 @@ import re
 from collections import defaultdict
 from mfd_typing.utils import strtobool
 from ipaddress import IPv4Interface
-from time import sleep
-from typing import List, Dict, DefaultDict, Optional
+from typing import Any, List, Dict, DefaultDict, Optional, Tuple
 
 from mfd_common_libs import os_supported, add_logging_level, log_levels
-from mfd_connect.exceptions import ConnectionCalledProcessError
-from mfd_connect.util.powershell_utils import parse_powershell_list
 from mfd_typing import PCIDevice, OSName, VendorID, DeviceID, SubVendorID, SubDeviceID, PCIAddress, MACAddress
 from mfd_typing.network_interface import (
     WindowsInterfaceInfo,
@@ -23,7 +20,7 @@ from mfd_typing.network_interface import (
 )
 
 from .base import NetworkAdapterOwner
-from ..api.basic.windows import get_logical_processors_count
+from ..api.basic.windows import execute_powershell_json, get_logical_processors_count
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -36,41 +33,59 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
 
     __init__ = os_supported(OSName.WINDOWS)(NetworkAdapterOwner.__init__)
 
-    def _get_all_interfaces_info(self) -> List[WindowsInterfaceInfo]:
+    _vlan_query = "Get-NetAdapter | Select InterfaceAlias, VlanID"
+    _hardware_query = "Get-NetAdapterHardwareInfo | Select Name, Segment, Bus, Device, Function"
+    _config_query = "Get-WmiObject Win32_NetworkAdapterConfiguration | Select Index, IPAddress"
+    _cluster_query = (
+        "Get-Cluster -ErrorAction Stop | Out-Null; "
+        "Get-ClusterNetworkInterface | Select Name, @{n='Network';e={$_.Network.Name}}"
+    )
+
+    def _get_all_interfaces_info(self, retries: int = 4) -> List[WindowsInterfaceInfo]:
         """
         Get all interfaces info for each InterfaceType.
 
+        Interfaces, VLANs, PCI addresses and IP addresses are read using single PowerShell call,
+        installed state consistency is verified (and query retried) on the host.
+        Cluster networks are read in separate call only when vSMB interfaces are present.
+
+        :param retries: Number of retries of interfaces query when installed states are inconsistent
         :return: List of WindowsInterfaceInfo
         """
-        nic_list: List[WindowsInterfaceInfo] = self._get_interfaces_and_verify_states()
-        return_list: List[WindowsInterfaceInfo] = []
-        is_ashci_cluster: bool = False
-        cluster_check_attempted: bool = False
+        results = execute_powershell_json(
+            self._connection,
+            {
+                "interfaces": self._get_consistent_interfaces_query(retries),
+                "vlans": self._vlan_query,
+                "hardware": self._hardware_query,
+                # $nics is set by interfaces query, which is evaluated first
+                "registry": self._get_registry_query("$nics.PNPDeviceID"),
+                "config": self._config_query,
+            },
+        )
+        nic_list = self._parse_and_verify_interfaces(results["interfaces"])
 
+        return_list: List[WindowsInterfaceInfo] = []
         for nic in nic_list:
             if nic.mac_address is None:
                 logger.log(level=log_levels.MODULE_DEBUG, msg=f"{nic.name} is a miniport driver. Skipping")
                 continue
             nic.pci_device = WindowsNetworkAdapterOwner._get_pci_device(nic)
             WindowsNetworkAdapterOwner._update_nic_if_virtual(nic)
-
             return_list.append(nic)
-            if nic.name.startswith("vSMB") and not cluster_check_attempted:
-                cluster_check_attempted = True
-                try:
-                    self._connection.execute_powershell("Get-Cluster")
-                    is_ashci_cluster = True
-                except ConnectionCalledProcessError as e:
-                    logger.log(
-                        level=log_levels.MODULE_DEBUG,
-                        msg=f"Get-Cluster failed, assuming non-cluster environment: {e}",
-                    )
-
-        self._update_vlan_info(nics=return_list)
-        self._update_pci_addresses(nics=return_list)
-        if is_ashci_cluster:
-            self._update_cluster(nics=return_list)
-        self._mark_mng_interface(nics=return_list)
+
+        self._apply_vlan_info(nics=return_list, entries=results["vlans"])
+        self._apply_pci_addresses(nics=return_list, hardware=results["hardware"], registry=results["registry"])
+        if any(nic.name.startswith("vSMB") for nic in return_list):
+            # failing Get-Cluster (non-cluster environment) results in empty list
+            cluster = execute_powershell_json(self._connection, {"cluster": self._cluster_query})["cluster"]
+            self._apply_cluster_info(
+                nics=return_list,
+                cluster_names_and_networks=[
+                    (entry.get("Name", "").split(" - ", 1)[-1], entry.get("Network") or "") for entry in cluster
+                ],
+            )
+        self._apply_mng_interface(nics=return_list, entries=results["config"])
         return return_list
 
     def _update_cluster(self, nics: List[WindowsInterfaceInfo]) -> None:
@@ -83,6 +98,18 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
         cmd_output = self._connection.execute_powershell(command=cluster_network_command).stdout
         pattern = r"^NODE-.\s-\s(?P<name>.*)\s+(?P<cluster_network>Cluster.+)$"
         cluster_names_and_networks = re.findall(pattern=pattern, string=cmd_output, flags=re.MULTILINE)
+        self._apply_cluster_info(nics=nics, cluster_names_and_networks=cluster_names_and_networks)
+
+    @staticmethod
+    def _apply_cluster_info(
+        nics: List[WindowsInterfaceInfo], cluster_names_and_networks: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Update Cluster Info in provided list of interfaces based on cluster network interfaces.
+
+        :param nics: list of InterfaceInfo objects
+        :param cluster_names_and_networks: List of tuples with interface name and cluster network name
+        """
         for nic in nics:
             for cluster_name, cluster_network in cluster_names_and_networks:
                 cluster_name = cluster_name.strip()
@@ -95,12 +122,12 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
                     if nic.name == "Management":
                         nic.interface_type = InterfaceType.CLUSTER_MANAGEMENT
 
-    def _get_available_interfaces(self, only_installed: bool = True) -> List[WindowsInterfaceInfo]:
+    @staticmethod
+    def _get_available_interfaces_queries() -> Tuple[str, str]:
         """
-        Return list of interfaces available on host.
+        Get PowerShell queries of installed and not installed interfaces.
 
-        :param only_installed: If set to True return only installed interfaces else all
-        :return: List containing WindowsInterfaceInfo with basic info
+        :return: Tuple of installed and not installed interfaces queries
         """
         installed_property_list = list(win_interface_properties.values())
         not_installed_property_list = ["Description", "Manufacturer", "Name", "PNPDeviceID"]
@@ -109,17 +136,56 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
                          OR PNPDeviceID like 'B06BDRV%' OR ServiceName like 'l2nd' OR ServiceName like 'iANSMiniport'
                          OR PNPDeviceID like '%VMS_MP%' OR ServiceName like 'netvsc' OR ServiceName like 'TbtP2pNdisDrv'
                          OR ServiceName like 'NdisImPlatformMp'" -Property """ + ", ".join(installed_property_list)
+        installed_interfaces += " | Select-Object " + ", ".join(installed_property_list)
 
         not_installed_interfaces = r"""gwmi win32_PNPEntity -Filter "ConfigManagerErrorCode != 0
                          AND Name like 'Ethernet%'
                          AND (PNPDeviceID like 'USB%' OR PNPDeviceID like 'PCI%'
                          OR PNPDeviceID like 'B06BDRV%')" -Property """ + ", ".join(not_installed_property_list)
+        not_installed_interfaces += " | Select-Object " + ", ".join(not_installed_property_list)
+        return installed_interfaces, not_installed_interfaces
 
-        cmd_output = self._connection.execute_powershell(installed_interfaces).stdout
+    def _get_consistent_interfaces_query(self, retries: int) -> str:
+        """
+        Get PowerShell query of all interfaces, retried on the host until their installed states are consistent.
+
+        Family of interface is second part of PNPDeviceID, as in _verify_all_interfaces_are_in_same_installed_state.
+
+        :param retries: Number of tries
+        :return: PowerShell query
+        """
+        installed_interfaces, not_installed_interfaces = self._get_available_interfaces_queries()
+        return (
+            f"for ($try = 1; $try -le {retries}; $try++) {{ "
+            f"$nics = @({installed_interfaces}) + @({not_installed_interfaces}); "
+            r"$inconsistent = @($nics | Group-Object { ($_.PNPDeviceID -split '\\')[1] } "
+            r"| Where-Object { $states = @($_.Group | ForEach-Object { [bool]$_.Installed }); "
+            r"($states -contains $true) -and ($states -contains $false) }); "
+            r"if ($inconsistent.Count -eq 0) { break }; Start-Sleep -Seconds 5 }; $nics"
+        )
+
+    def _get_available_interfaces(self, only_installed: bool = True) -> List[WindowsInterfaceInfo]:
+        """
+        Return list of interfaces available on host.
+
+        :param only_installed: If set to True return only installed interfaces else all
+        :return: List containing WindowsInterfaceInfo with basic info
+        """
+        installed_interfaces, not_installed_interfaces = self._get_available_interfaces_queries()
+        queries = {"installed": installed_interfaces}
         if not only_installed:
-            cmd_output += self._connection.execute_powershell(not_installed_interfaces).stdout
+            queries["not_installed"] = not_installed_interfaces
+        results = execute_powershell_json(self._connection, queries)
+        return self._parse_available_interfaces([entry for entries in results.values() for entry in entries])
+
+    def _parse_available_interfaces(self, entries: List[Dict[str, Any]]) -> List[WindowsInterfaceInfo]:
+        """
+        Parse interfaces deserialized from PowerShell JSON output.
 
-        nic_list: List[Dict[str, str]] = parse_powershell_list(cmd_output)
+        :param entries: List of Win32_NetworkAdapter or Win32_PNPEntity objects
+        :return: List containing WindowsInterfaceInfo with basic info
+        """
+        nic_list: List[Dict[str, str]] = [self._stringify_entry(entry) for entry in entries]
         interfaces_info: List[WindowsInterfaceInfo] = []
 
         for nic in nic_list:
@@ -140,6 +206,16 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
 
         return interfaces_info
 
+    @staticmethod
+    def _stringify_entry(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Convert values of object deserialized from PowerShell JSON to strings, as they would be in Format-List output.
+
+        :param entry: Object deserialized from JSON
+        :return: Dict with string values, None is converted to empty string
+        """
+        return {key: "" if value is None else str(value) for key, value in entry.items()}
+
     @staticmethod
     def _verify_all_interfaces_are_in_same_installed_state(nic_list: List[WindowsInterfaceInfo]) -> bool:
         """
@@ -242,15 +318,21 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
 
         :param nics: List of WindowsInterfaceInfo
         """
-        output = self._connection.execute_powershell(
-            "Get-WmiObject Win32_NetworkAdapterConfiguration | Select Index, IPAddress | Format-List"
-        ).stdout
-        parsed_output = parse_powershell_list(output)
+        entries = execute_powershell_json(self._connection, {"config": self._config_query})["config"]
+        self._apply_mng_interface(nics=nics, entries=entries)
+
+    def _apply_mng_interface(self, nics: List[WindowsInterfaceInfo], entries: List[Dict[str, Any]]) -> None:
+        """
+        Mark management interface with proper InterfaceType based on Win32_NetworkAdapterConfiguration objects.
+
+        :param nics: List of WindowsInterfaceInfo
+        :param entries: List of Win32_NetworkAdapterConfiguration objects with Index and IPAddress
+        """
         ipv4_pattern = r"(?P<ip>(\d{1,3}\.){3}\d{1,3})"
-        for entry in parsed_output:
-            for ip in re.finditer(ipv4_pattern, entry.get("IPAddress", "")):
+        for entry in entries:
+            for ip in re.finditer(ipv4_pattern, " ".join(entry.get("IPAddress") or [])):
                 if self.is_management_interface(IPv4Interface(ip.group("ip"))):
-                    nic = next(n for n in nics if n.index == entry.get("Index"))
+                    nic = next(n for n in nics if n.index == str(entry.get("Index")))
                     nic.interface_type = InterfaceType.MANAGEMENT
                     return
 
@@ -258,16 +340,25 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
         """
         Get InterfaceInfo for all interfaces and verify state consistency.
 
+        Query is retried on the host, so only single PowerShell call is made.
+
         :param retries: Number of retries
         :return: List of WindowsInterfaceInfo
         """
-        for nr in range(1, retries + 1):
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Get interfaces info. Try no: {nr}")
-            nic_list = self._get_available_interfaces(only_installed=False)
-            if WindowsNetworkAdapterOwner._verify_all_interfaces_are_in_same_installed_state(nic_list):
-                break
-            sleep(5)
-        else:
+        entries = execute_powershell_json(
+            self._connection, {"interfaces": self._get_consistent_interfaces_query(retries)}
+        )["interfaces"]
+        return self._parse_and_verify_interfaces(entries)
+
+    def _parse_and_verify_interfaces(self, entries: List[Dict[str, Any]]) -> List[WindowsInterfaceInfo]:
+        """
+        Parse interfaces returned by consistent interfaces query and log if their states are still inconsistent.
+
+        :param entries: List of Win32_NetworkAdapter or Win32_PNPEntity objects
+        :return: List of WindowsInterfaceInfo
+        """
+        nic_list = self._parse_available_interfaces(entries)
+        if not WindowsNetworkAdapterOwner._verify_all_interfaces_are_in_same_installed_state(nic_list):
             logger.log(
                 level=log_levels.MODULE_DEBUG,
                 msg="Interfaces are in inconsistent installed state, it may affect test results",
@@ -276,33 +367,30 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Total interfaces found on host: {len(nic_list)}")
         return nic_list
 
-    def _update_nic_with_current_control_set_output(self, nic: WindowsInterfaceInfo) -> None:
+    def _update_vlan_info(self, nics: List[WindowsInterfaceInfo]) -> None:
         """
-        Update pci_address based on CurrentControlSet output.
+        Update vlan info based on registry output.
 
-        :param nic: WindowsInterfaceInfo
+        :param nics: List of WindowsInterfaceInfo
         """
-        cmd = rf"Get-ItemProperty -path 'HKLM:\SYSTEM\CurrentControlSet\Enum\{nic.pnp_device_id}'"
-        output = self._connection.execute_powershell(cmd).stdout
-        nic.pci_address = WindowsNetworkAdapterOwner._parse_pci(output)
+        entries = execute_powershell_json(self._connection, {"vlans": self._vlan_query})["vlans"]
+        self._apply_vlan_info(nics=nics, entries=entries)
 
-    def _update_vlan_info(self, nics: List[WindowsInterfaceInfo]) -> None:
+    @staticmethod
+    def _apply_vlan_info(nics: List[WindowsInterfaceInfo], entries: List[Dict[str, Any]]) -> None:
         """
-        Update vlan info based on registry output.
+        Update vlan info based on Get-NetAdapter objects.
 
         :param nics: List of WindowsInterfaceInfo
+        :param entries: List of Get-NetAdapter objects with InterfaceAlias and VlanID
         """
-        output = self._connection.execute_powershell(
-            "Get-NetAdapter | Select InterfaceAlias, vlanid | Format-List"
-        ).stdout
-        parsed_output = parse_powershell_list(output)
-        for entry in parsed_output:
-            if entry.get("vlanid") in ["0", "", None]:
+        for entry in entries:
+            if entry.get("VlanID") in [0, "0", "", None]:
                 continue
 
             nic = next((n for n in nics if n.name == entry.get("InterfaceAlias")), None)
             if nic is not None:
-                nic.vlan_info = VlanInterfaceInfo(vlan_id=int(entry.get("vlanid")))
+                nic.vlan_info = VlanInterfaceInfo(vlan_id=int(entry.get("VlanID")))
 
     @staticmethod
     def _update_nic_if_virtual(nic: WindowsInterfaceInfo) -> None:
@@ -337,20 +425,56 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
         Get pci addresses from Get-NetAdapterHardwareInfo and update nics.
 
         This PS command will not show Hyper-V interfaces, but we're by default setting pci_address=None for them.
-        If interface is not Hyper-V and is not listed in output of the above cmd, we will try to call Get-ItemProperty.
+        If interface is not Hyper-V and is not listed in output of the above cmd, location from registry is used.
+        Both are read in single PowerShell call.
+
+        :param nics: List of WindowsInterfaceInfo
+        """
+        pnp_device_ids = ", ".join(
+            "'{}'".format(nic.pnp_device_id.replace("'", "''")) for nic in nics if nic.pnp_device_id
+        )
+        results = execute_powershell_json(
+            self._connection,
+            {"hardware": self._hardware_query, "registry": self._get_registry_query(f"@({pnp_device_ids})")},
+        )
+        self._apply_pci_addresses(nics=nics, hardware=results["hardware"], registry=results["registry"])
+
+    @staticmethod
+    def _get_registry_query(pnp_device_ids: str) -> str:
+        """
+        Get PowerShell query of registry locations of devices, used for interfaces not listed by hardware query.
+
+        :param pnp_device_ids: PowerShell expression with PNPDeviceIDs of devices, e.g. `$nics.PNPDeviceID`
+        :return: PowerShell query
+        """
+        return (
+            f"{pnp_device_ids} | Where-Object {{ $_ }} | ForEach-Object {{ "
+            r'Get-ItemProperty -LiteralPath "HKLM:\SYSTEM\CurrentControlSet\Enum\$_" -ErrorAction Ignore } '
+            r"| Select @{n='PNPDeviceID';e={$_.PSPath -replace '^.*\\Enum\\', ''}}, LocationInformation"
+        )
+
+    @staticmethod
+    def _apply_pci_addresses(
+        nics: List[WindowsInterfaceInfo], hardware: List[Dict[str, Any]], registry: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Update pci addresses of nics based on Get-NetAdapterHardwareInfo objects and registry locations.
 
         :param nics: List of WindowsInterfaceInfo
+        :param hardware: List of Get-NetAdapterHardwareInfo objects
+        :param registry: List of registry entries with PNPDeviceID and LocationInformation
         """
-        output = self._connection.execute_powershell(
-            "Get-NetAdapterHardwareInfo | Select Name, Segment, Bus, Device, Function | Format-List"
-        ).stdout
-        parsed_output = parse_powershell_list(output)
+        hardware_info = {entry.get("Name"): entry for entry in hardware}
+        # registry key path and WMI PNPDeviceID may differ in case
+        locations = {
+            (entry.get("PNPDeviceID") or "").upper(): entry.get("LocationInformation") or "" for entry in registry
+        }
 
         for nic in nics:
             if nic.service_name in HYPER_V_SERVICES:
                 continue
 
-            matched_nic = next((entry for entry in parsed_output if nic.name == entry.get("Name")), None)
+            matched_nic = hardware_info.get(nic.name)
             if matched_nic is not None:
                 nic.pci_address = PCIAddress(
                     domain=matched_nic.get("Segment"),
@@ -360,8 +484,10 @@ class WindowsNetworkAdapterOwner(NetworkAdapterOwner):
                 )
                 continue
 
-            # It's not Hyper-V and it's not listed in PS above, let's try Get-ItemProperty
-            self._update_nic_with_current_control_set_output(nic)
+            # It's not Hyper-V and it's not listed in PS above, let's use location from registry
+            nic.pci_address = WindowsNetworkAdapterOwner._parse_pci(
+                locations.get((nic.pnp_device_id or "").upper(), "")
+            )
 
     def get_log_cpu_no(self) -> int:
         """Get the number of logical cpus.
@@ -18,21 +18,17 @@ from mfd_typing.network_interface import (
     InterfaceInfo,
 )
 
+from mfd_network_adapter.const import FAMILIES_BY_DEVICE_ID, SPEEDS_BY_DEVICE_ID
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException, NetworkInterfaceIncomparableObject
 from .exceptions import NetworkInterfaceConnectedOSNotSupported, DeviceIDException
 
 from ..stat_checker import StatChecker
 
-try:
-    from mfd_const_internal import SPEED_IDS, DEVICE_IDS
-except ImportError:
-    from mfd_const import SPEED_IDS, DEVICE_IDS
-
 if typing.TYPE_CHECKING:
     from mfd_model.config import NetworkInterfaceModelBase
     from mfd_connect import Connection
 
-    from .data_structures import RingBufferSettings, RingBuffer, SwitchInfo
+    from .data_structures import RingBufferSettings, RingBuffer, SwitchInfo, HardwareFacts
     from ..network_adapter_owner.base import NetworkAdapterOwner, InterfaceInfoType
 
     from .feature.buffers import BuffersFeatureType
@@ -155,6 +151,7 @@ class NetworkInterface(ABC):
         ]:
             self.stat_checker = StatChecker(network_interface=self)
         self._switch_info: "SwitchInfo | None" = None
+        self._hardware_facts: "HardwareFacts | None" = None
         # Feature lazy initialization in properties
         self._ip: Optional["IPFeatureType"] = None
         self._link: Optional["LinkFeatureType"] = None
@@ -516,10 +513,7 @@ class NetworkInterface(ABC):
         """Get family."""
         self._check_if_intel_vendor()
 
-        interface_family = next(
-            (fam for fam, dev_ids in DEVICE_IDS.items() if f"0x{self.pci_device.device_id}" in dev_ids),
-            None,
-        )
+        interface_family = next(iter(FAMILIES_BY_DEVICE_ID.get(int(self.pci_device.device_id), ())), None)
         if interface_family is None:
             raise DeviceIDException(f"Device ID of {self.pci_device} was not found in DEVICE_IDS consts.")
         return getattr(Family, interface_family)
@@ -529,14 +523,15 @@ class NetworkInterface(ABC):
         """Get speed."""
         self._check_if_intel_vendor()
 
-        interface_speed = next(
-            (speed for speed, dev_ids in SPEED_IDS.items() if f"0x{self.pci_device.device_id}" in dev_ids),
-            None,
-        )
+        interface_speed = next(iter(SPEEDS_BY_DEVICE_ID.get(int(self.pci_device.device_id), ())), None)
         if interface_speed is None:
             raise DeviceIDException(f"Device ID of {self.pci_device} was not found in SPEED_IDS consts.")
         return Speed(interface_speed)
 
+    def clear_hardware_facts(self) -> None:
+        """Clear cached hardware facts, should be called after driver reload, restart or firmware update."""
+        self._hardware_facts = None
+
     def _check_conn_and_owner_args(self) -> None:
         """Check if connection or owner passed, warn if owner still passed."""
         if self._connection is None:
@@ -5,12 +5,13 @@
 from collections import namedtuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from mfd_network_adapter.data_structures import State
 
 if TYPE_CHECKING:
     from mfd_typing import MACAddress
+    from mfd_typing.driver_info import DriverInfo
 
 
 class Switch:
@@ -44,6 +45,29 @@ class RingBufferSettings:
     current: RingBuffer = field(default_factory=RingBuffer)
 
 
+@dataclass
+class Channels:
+    """Structure for channel options."""
+
+    rx: Optional[int] = None
+    tx: Optional[int] = None
+    other: Optional[int] = None
+    combined: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return " ".join(
+            f"{field_name} {field_value}" for field_name, field_value in asdict(self).items() if field_value is not None
+        )
+
+
+@dataclass
+class ChannelSettings:
+    """Structure for channel settings' types."""
+
+    maximum: Channels = field(default_factory=Channels)
+    current: Channels = field(default_factory=Channels)
+
+
 class VlanProto(Enum):
     """Vlan protocols enum."""
 
@@ -79,3 +103,36 @@ class SwitchInfo:
 
     switch: "Switch"
     port: str
+
+
+@dataclass(frozen=True)
+class HardwareFacts:
+    """Facts about interface hardware, which change only on driver reload or firmware update."""
+
+    branding_string: Optional[str] = None
+    device_string: Optional[str] = None
+    numa_node: Optional[int] = None
+    number_of_ports: Optional[int] = None
+    driver_name: Optional[str] = None
+    driver_version: Optional[str] = None
+    firmware_version: Optional[str] = None
+    driver_info: Optional["DriverInfo"] = None
+
+
+@dataclass
+class InterfaceConfigSnapshot:
+    """
+    Configuration of interface, which can be restored with config_restore().
+
+    Settings are stored with names used by ethtool/ip set commands, e.g. {"rx-usecs": "50"} for coalescing.
+    """
+
+    mtu: Optional[int] = None
+    ip_addresses: List[str] = field(default_factory=list)  # static global addresses with prefix length
+    offload: Dict[str, str] = field(default_factory=dict)
+    coalescing: Dict[str, str] = field(default_factory=dict)
+    rings: Dict[str, str] = field(default_factory=dict)
+    channels: Dict[str, str] = field(default_factory=dict)
+    flow_control: Dict[str, str] = field(default_factory=dict)
+    vfs_count: Optional[int] = None
+    vfs: Dict[int, Dict[str, str]] = field(default_factory=dict)
@@ -25,6 +25,14 @@ logger = logging.getLogger(__name__)
 class ESXiNetworkInterface(NetworkInterface):
     """Class to handle Network Port in ESXi."""
 
+    def clear_hardware_facts(self) -> None:
+        """Clear cached hardware facts, driver information and ENS settings, should be called after driver reload."""
+        super().clear_hardware_facts()
+        if self._driver is not None:
+            self._driver.clear_cache()
+        if self._ens is not None:
+            self._ens.clear_cache()
+
     def update_name_mac_branding_string(self) -> None:
         """Update Name, MAC Address & Branding string of the interface.
 
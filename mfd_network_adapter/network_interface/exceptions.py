@@ -205,3 +205,11 @@ class MACFeatureError(NetworkAdapterModuleException):
 
 class MACFeatureExecutionError(NetworkAdapterModuleException, subprocess.CalledProcessError):
     """Handle MAC feature execution exceptions."""
+
+
+class CaptureFeatureException(NetworkAdapterModuleException):
+    """Handle Capture feature exceptions."""
+
+
+class InterfaceConfigRestoreException(NetworkAdapterModuleException):
+    """Handle interface configuration restore exceptions."""
@@ -59,8 +59,8 @@ class EsxiBuffers(BaseFeatureBuffers):
         if tx_ring_size:
             parameter += f" -t {tx_ring_size}"
 
-        driver_info = self._interface().driver.get_driver_info()
-        if driver_info and self._interface().ens.is_ens_enabled():
+        driver_info = self._interface().driver.get_driver_info(cached=True)
+        if driver_info and self._interface().ens.is_ens_enabled(cached=True):
             command = f"nsxdp-cli ens uplink ring set {parameter} -n {self._interface().name}"
         else:
             command = f"esxcli network nic ring current set {parameter} -n {self._interface().name}"
@@ -72,8 +72,8 @@ class EsxiBuffers(BaseFeatureBuffers):
 
         :param preset: Return preset ring size, if false return current ring size
         """
-        driver_info = self._interface().driver.get_driver_info()
-        if driver_info and self._interface().ens.is_ens_enabled():
+        driver_info = self._interface().driver.get_driver_info(cached=True)
+        if driver_info and self._interface().ens.is_ens_enabled(cached=True):
             command = f"nsxdp-cli ens uplink ring get -n {self._interface().name}"
             output = self._connection.execute_command(command, expected_return_codes=[0]).stdout
             tx_ring_size = re.findall(r"^Tx Ring Size: (\d+)\n", output, re.MULTILINE)[0]
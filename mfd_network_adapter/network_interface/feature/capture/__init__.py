@@ -5,5 +5,6 @@
 from typing import Union
 
 from .base import BaseFeatureCapture
+from .linux import LinuxCapture
 
-CaptureFeatureType = Union[BaseFeatureCapture]
+CaptureFeatureType = Union[BaseFeatureCapture, LinuxCapture]
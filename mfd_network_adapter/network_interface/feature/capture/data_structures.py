@@ -0,0 +1,57 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Capture feature data structures."""
+
+import typing
+from dataclasses import dataclass
+from enum import Enum
+
+if typing.TYPE_CHECKING:
+    from mfd_connect.process import RemoteProcess
+
+
+class CaptureTool(Enum):
+    """Tools, which can be used for capture summarized on the host."""
+
+    TSHARK = "tshark"
+    TCPDUMP = "tcpdump"
+
+
+class CaptureCounterKey(Enum):
+    """Keys, by which captured packets are counted on the host."""
+
+    FLOW = "flow"
+    VLAN = "vlan"
+
+
+@dataclass(frozen=True)
+class FlowKey:
+    """Dataclass for flow (protocol and addresses of IP packet), fields are empty for non-IP packets."""
+
+    protocol: str
+    src_ip: str
+    src_port: str
+    dst_ip: str
+    dst_port: str
+
+
+@dataclass(frozen=True)
+class CaptureCounter:
+    """Dataclass for packets counted on the host for single key in single interval."""
+
+    timestamp: float  # host time (seconds since epoch) of the last packet in the interval
+    key: "FlowKey | int | None"  # FlowKey for FLOW, VLAN ID or None for untagged packets for VLAN
+    packets: int
+    bytes: int
+
+
+@dataclass
+class CaptureCounterCollector:
+    """Dataclass for state of capture summarized in the background on the host."""
+
+    process: "RemoteProcess"
+    output_path: str
+    pid_path: str
+    key: CaptureCounterKey
+    ring_buffer_path: str | None = None
+    offset: int = 0
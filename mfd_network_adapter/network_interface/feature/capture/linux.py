@@ -0,0 +1,226 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Capture feature for Linux."""
+
+import logging
+import shlex
+import time
+from typing import Iterator, List, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect.exceptions import RemoteProcessTimeoutExpired
+
+from mfd_network_adapter.network_interface.exceptions import CaptureFeatureException
+from .base import BaseFeatureCapture
+from .data_structures import CaptureCounter, CaptureCounterCollector, CaptureCounterKey, CaptureTool, FlowKey
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+COUNTER_MARKER = "C"
+# mawk reads pipe in blocks, so counters would be delayed until block is filled
+MAWK_LINE_BUFFERING = '$(awk -W version 2>/dev/null | grep -q mawk && echo "-W interactive")'
+
+TSHARK_FIELDS = (
+    "frame.time_epoch",
+    "frame.len",
+    "vlan.id",
+    "ip.src",
+    "ip.dst",
+    "ip.proto",
+    "ipv6.src",
+    "ipv6.dst",
+    "ipv6.nxt",
+    "tcp.srcport",
+    "tcp.dstport",
+    "udp.srcport",
+    "udp.dstport",
+)
+# awk statements setting t, len, vlan, proto, src, sport, dst, dport from single line of tool output
+TSHARK_PARSER = (
+    "t = $1; len = $2; vlan = $3; src = $4 $7; dst = $5 $8; proto = $6 $9; sport = $10 $12; dport = $11 $13;"
+)
+# tcpdump -tt -nn -e -q line, e.g.
+# 1700000000.000001 aa:bb:cc:dd:ee:ff > 00:11:22:33:44:55, ethertype 802.1Q (0x8100), length 102: vlan 10, p 0,
+# ethertype IPv4 (0x0800), 10.0.0.1.5000 > 10.0.0.2.6000: UDP, length 60
+TCPDUMP_PARSER = (
+    'split($0, w, " "); t = w[1]; len = 0; vlan = ""; proto = ""; src = ""; sport = ""; dst = ""; dport = ""; '
+    "if (match($0, /length [0-9]+: /)) len = substr($0, RSTART + 7, RLENGTH - 9); "
+    "if (match($0, /vlan [0-9]+, /)) vlan = substr($0, RSTART + 5, RLENGTH - 7); "
+    "if (match($0, /[0-9a-f.:]+ > [0-9a-f.:]+: [A-Za-z0-9]+/)) { "
+    'split(substr($0, RSTART, RLENGTH), a, " "); src = a[1]; dst = substr(a[3], 1, length(a[3]) - 1); '
+    'proto = a[4] == "UDP" ? 17 : a[4] == "tcp" || a[4] == "Flags" ? 6 : a[4] == "ICMP" ? 1 : '
+    'a[4] == "ICMP6" ? 58 : ""; '
+    "if (proto == 6 || proto == 17) { sport = port(src); src = host(src); dport = port(dst); dst = host(dst) } }"
+)
+# counts packets per key and prints counters of all keys once per interval, keys are tab separated
+COUNTER_AGGREGATOR = (
+    "function host(a) { return match(a, /\\.[0-9]+$/) ? substr(a, 1, RSTART - 1) : a } "
+    'function port(a) { return match(a, /\\.[0-9]+$/) ? substr(a, RSTART + 1) : "" } '
+    "function flush(k) { for (k in packets) print "
+    f'"{COUNTER_MARKER}", last, k, packets[k], bytes[k]; delete packets; delete bytes; fflush() }} '
+    'BEGIN { FS = "\\t"; OFS = "\\t" } '
+    '{ PARSER if (t == "") next; if (start == "") start = t; '
+    "if (t - start >= interval) { flush(); start = t } "
+    "k = KEY; packets[k]++; bytes[k] += len; last = t } "
+    'END { if (last != "") flush() }'
+)
+# awk variables forming the key, in order of FlowKey fields
+COUNTER_KEYS = {
+    CaptureCounterKey.FLOW: ("proto", "src", "sport", "dst", "dport"),
+    CaptureCounterKey.VLAN: ("vlan",),
+}
+
+
+class LinuxCapture(BaseFeatureCapture):
+    """Linux class for Capture feature."""
+
+    def start_counter_capture(
+        self,
+        key: CaptureCounterKey = CaptureCounterKey.FLOW,
+        tool: CaptureTool = CaptureTool.TSHARK,
+        capture_filter: str | None = None,
+        interval: float = 1,
+        output_path: str | None = None,
+        ring_buffer_path: str | None = None,
+        ring_file_size: int = 10240,
+        ring_files: int = 4,
+    ) -> CaptureCounterCollector:
+        """
+        Start capture summarized on the host, which counts packets and bytes per key instead of moving pcap.
+
+        Packet fields are extracted by tshark (-T fields) or tcpdump (text output) and counted by awk on the host,
+        counters of all keys seen in interval are appended to output file when first packet of next interval
+        arrives and when capture is stopped.
+
+        :param key: Key by which packets are counted
+        :param tool: Tool used for capture
+        :param capture_filter: Capture filter in pcap-filter syntax
+        :param interval: Counting interval in seconds
+        :param output_path: Path of file on the host where counters are stored, by default based on interface name
+        :param ring_buffer_path: Path of pcap file on the host, when passed raw packets are additionally stored
+                                 in ring buffer of rotated files, which stays on the host
+        :param ring_file_size: Size of single ring buffer file in kB
+        :param ring_files: Number of ring buffer files
+        :return: Collector to be passed to read_counters, stream_counters and stop_counter_capture
+        """
+        interface_name = self._interface().name
+        output_path = output_path or f"/tmp/capture_counters_{interface_name}.tsv"
+        pid_path = f"{output_path}.pid"
+        capture_filter = f" {shlex.quote(capture_filter)}" if capture_filter else ""
+        if tool is CaptureTool.TSHARK:
+            ring_buffer = (
+                f" -w {ring_buffer_path} -b filesize:{ring_file_size} -b files:{ring_files} -P"
+                if ring_buffer_path
+                else ""
+            )
+            fields = " ".join(f"-e {field}" for field in TSHARK_FIELDS)
+            capture_command = (
+                f"tshark -i {interface_name} -l -n{ring_buffer} -T fields -E separator=/t -E occurrence=f "
+                f"{fields}{' -f' if capture_filter else ''}{capture_filter}"
+            )
+            parser = TSHARK_PARSER
+        else:
+            ring_buffer = (
+                f" -w {ring_buffer_path} -C {max(1, ring_file_size // 1000)} -W {ring_files} --print"
+                if ring_buffer_path
+                else ""
+            )
+            capture_command = f"tcpdump -i {interface_name} -l -tt -nn -e -q{ring_buffer}{capture_filter}"
+            parser = TCPDUMP_PARSER
+        program = COUNTER_AGGREGATOR.replace("PARSER", parser).replace("KEY", ' "\\t" '.join(COUNTER_KEYS[key]))
+        command = (
+            f"sh -c {shlex.quote(f'echo $$ > {pid_path}; exec {capture_command} 2>/dev/null')} "
+            f"| awk {MAWK_LINE_BUFFERING} -v interval={interval} '{program}' > {output_path}"
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Starting {tool.value} counter capture on {interface_name}")
+        process = self._connection.start_process(command, shell=True)
+        return CaptureCounterCollector(
+            process=process, output_path=output_path, pid_path=pid_path, key=key, ring_buffer_path=ring_buffer_path
+        )
+
+    def read_counters(self, collector: CaptureCounterCollector) -> Iterator[CaptureCounter]:
+        """
+        Read counters stored by collector since the previous read, call does not block.
+
+        Only output appended since the previous read is transferred from the host.
+
+        :param collector: Collector returned by start_counter_capture
+        :return: Generator of counters
+        """
+        output = self._connection.execute_command(
+            f"tail -c +{collector.offset + 1} {collector.output_path}", expected_return_codes=None
+        ).stdout
+        # last line can be still written by awk, it will be read during next call
+        complete_output = output[: output.rfind("\n") + 1]
+        collector.offset += len(complete_output.encode())
+        for line in complete_output.splitlines():
+            counter = self._parse_counter_line(collector.key, line)
+            if counter is not None:
+                yield counter
+
+    def stream_counters(
+        self, collector: CaptureCounterCollector, poll_interval: float = 1, duration: float | None = None
+    ) -> Iterator[CaptureCounter]:
+        """
+        Stream counters of collector until capture ends or duration passes.
+
+        :param collector: Collector returned by start_counter_capture
+        :param poll_interval: Time in seconds between reads of counters from the host
+        :param duration: Maximum time of streaming in seconds, until capture ends when None
+        :return: Generator of counters
+        """
+        end_time = None if duration is None else time.monotonic() + duration
+        while True:
+            running = collector.process.running
+            yield from self.read_counters(collector)
+            if not running or (end_time is not None and time.monotonic() >= end_time):
+                return
+            time.sleep(poll_interval)
+
+    def stop_counter_capture(
+        self, collector: CaptureCounterCollector, remove_output: bool = True
+    ) -> List[CaptureCounter]:
+        """
+        Stop capture of collector and get counters not read so far.
+
+        Capture tool is interrupted, so awk flushes counters of the last interval before exiting.
+
+        :param collector: Collector returned by start_counter_capture
+        :param remove_output: Remove counters output file from the host, ring buffer files are kept
+        :return: List of counters
+        :raises CaptureFeatureException: When capture did not start
+        """
+        result = self._connection.execute_command(
+            f"kill -INT $(cat {collector.pid_path})", shell=True, expected_return_codes=None
+        )
+        if collector.process.running:
+            try:
+                collector.process.wait(timeout=10)
+            except RemoteProcessTimeoutExpired:
+                collector.process.kill()
+        counters = list(self.read_counters(collector))
+        paths = f"{collector.output_path} {collector.pid_path}" if remove_output else collector.pid_path
+        self._connection.execute_command(f"rm -f {paths}", expected_return_codes=None)
+        if result.return_code and not counters:
+            raise CaptureFeatureException(f"Counter capture did not start, check {collector.output_path}")
+        return counters
+
+    @staticmethod
+    def _parse_counter_line(key: CaptureCounterKey, line: str) -> Optional[CaptureCounter]:
+        """
+        Parse single line of collector output.
+
+        :param key: Key by which packets were counted
+        :param line: Line of collector output
+        :return: Counter or None when line is not a counter
+        """
+        fields = line.split("\t")
+        if fields[0] != COUNTER_MARKER or len(fields) != len(COUNTER_KEYS[key]) + 4:
+            return None
+        timestamp, *keys, packets, bytes_ = fields[1:]
+        if key is CaptureCounterKey.FLOW:
+            counter_key = FlowKey(*keys)
+        else:
+            counter_key = int(keys[0]) if keys[0] else None
+        return CaptureCounter(timestamp=float(timestamp), key=counter_key, packets=int(packets), bytes=int(bytes_))
@@ -2,36 +2,69 @@
 # SPDX-License-Identifier: MIT
 """Module for Driver feature for ESXI."""
 
-import re
 from typing import TYPE_CHECKING
 
+from mfd_network_adapter.api.utils.esxi import execute_esxcli
 from .base import BaseFeatureDriver
 from ...exceptions import DriverInfoNotFound
 
 if TYPE_CHECKING:
+    from mfd_connect import Connection
     from mfd_typing.driver_info import DriverInfo
+    from mfd_network_adapter.network_interface.base import NetworkInterface
 
 
 class EsxiDriver(BaseFeatureDriver):
     """ESXI class for Driver feature."""
 
+    def __init__(self, *, connection: "Connection", interface: "NetworkInterface"):
+        """
+        Initialize EsxiDriver.
+
+        :param connection: Object of mfd-connect
+        :param interface: NetworkInterface object, parent of feature
+        """
+        super().__init__(connection=connection, interface=interface)
+        self._driver_info: "DriverInfo | None" = None
+        self._module_params: dict[str, str] | None = None
+
+    def clear_cache(self) -> None:
+        """Clear cached driver information, should be called after driver reload or update."""
+        self._driver_info = None
+        self._module_params = None
+
     def get_firmware_version(self) -> str:
         """
         Get firmware version of adapter.
 
         :return: Firmware version
+        :raises DriverInfoNotFound: when firmware version is not reported for adapter
         """
-        pattern = r"Driver:\s*(?P<driver>.+)\s*Firmware Version:\s*(?P<firmware>.+)\s*Version:\s*(?P<version>.+)\s+"
-        output = self._connection.execute_command(f"esxcli network nic get -n {self._interface().name}").stdout
-        match = re.search(pattern, output, re.M)
-        if not match:
+        nic_info = execute_esxcli(self._connection, f"network nic get -n {self._interface().name}")
+        firmware = nic_info.get("DriverInfo", {}).get("FirmwareVersion") if isinstance(nic_info, dict) else None
+        if not firmware:
             raise DriverInfoNotFound(f"Could not find driver info for adapter {self._interface().name}")
-        return match.group("firmware")
+        return firmware
 
-    def get_driver_info(self) -> "DriverInfo":
+    def get_driver_info(self, cached: bool = False) -> "DriverInfo":
         """
         Get information about driver name and version.
 
+        :param cached: return driver information read previously, if available
         :return: DriverInfo dataclass that contains driver_name and driver_version.
         """
-        return self.package_manager.get_driver_info(self._interface().name)
+        if not cached or self._driver_info is None:
+            self._driver_info = self.package_manager.get_driver_info(self._interface().name)
+        return self._driver_info
+
+    def get_module_params_as_dict(self, cached: bool = False) -> dict[str, str]:
+        """
+        Get parameters of driver module.
+
+        :param cached: return module parameters read previously, if available
+        :return: dictionary with module parameter name and its value
+        """
+        if not cached or self._module_params is None:
+            driver_name = self.get_driver_info(cached=cached).driver_name
+            self._module_params = self.package_manager.get_module_params_as_dict(driver_name)
+        return self._module_params
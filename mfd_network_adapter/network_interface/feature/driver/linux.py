@@ -42,8 +42,13 @@ class LinuxDriver(BaseFeatureDriver):
         """
         Get information about driver name and version.
 
+        Driver information is read once with interface hardware facts, see NetworkInterface.get_hardware_facts().
+
         :return: DriverInfo dataclass that contains driver_name and driver_version.
         """
+        facts = self._interface().get_hardware_facts()
+        if facts.driver_info is not None:
+            return facts.driver_info
         return self.package_manager.get_driver_info(
             self._ethtool.get_driver_information(self._interface().name).driver[0]
         )
@@ -55,10 +60,12 @@ class LinuxDriver(BaseFeatureDriver):
         :return: Driver version in form major, minor, build, and rc values
         :raises DriverInfoNotFound: When driver version is not unavailable
         """
-        interface_info = self._ethtool.get_driver_information(device_name=self._interface().name)
-        driver_version = interface_info.version[0]
-        # interface_info = driver=['virtio_net'], version=['1.0.0'], firmware_version=['']
-        # interface_info.version is a list and contains only 1 element is the driver version.
+        driver_version = self._interface().get_hardware_facts().driver_version
+        if driver_version is None:
+            interface_info = self._ethtool.get_driver_information(device_name=self._interface().name)
+            # interface_info = driver=['virtio_net'], version=['1.0.0'], firmware_version=['']
+            # interface_info.version is a list and contains only 1 element is the driver version.
+            driver_version = interface_info.version[0]
         if self.utils.is_speed_eq(speed=Speed.G10):
             pattern = r"(?P<major>\d)\.(?P<minor>\d{1,2})\.(?P<build>\d+)\.?(?P<build2>\d+)?(?:_rc(?P<rc>\d+))?"
             ver_match = re.match(pattern, driver_version)
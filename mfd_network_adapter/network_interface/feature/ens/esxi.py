@@ -26,6 +26,8 @@ class ESXiFeatureENS(BaseFeatureENS):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
+        self._ens_settings: "ConnectionCompletedProcess | None" = None
+        self._driver_service_name: str | None = None
 
     def _check_if_nsxt_present(self, result: "ConnectionCompletedProcess") -> bool:
         """
@@ -36,15 +38,16 @@ class ESXiFeatureENS(BaseFeatureENS):
         """
         return not (result.return_code != 0 or "esxcfg-nics: invalid option -- 'e'" in result.stdout)
 
-    def is_ens_capable(self) -> bool:
+    def is_ens_capable(self, cached: bool = False) -> bool:
         """
         Get vmnic ens capability.
 
         - esxcg-nics -e is supported only on hosts with NSX-T libs.
 
+        :param cached: use ENS settings read previously, if available
         :return: True if a driver is ENS capable, False if not.
         """
-        result = self._get_ens_settings()
+        result = self._get_ens_settings(cached=cached)
         if not self._check_if_nsxt_present(result):
             return False
         found = re.search(
@@ -55,17 +58,18 @@ class ESXiFeatureENS(BaseFeatureENS):
         capable = found.group("ens_capable").strip().lower() if found else ""
         return capable == "true"
 
-    def is_ens_enabled(self) -> bool:
+    def is_ens_enabled(self, cached: bool = False) -> bool:
         """
         Get vmnic ens status.
 
         - esxcg-nics -e is supported only on hosts with NSX-T libs.
 
+        :param cached: use ENS settings read previously, if available
         :return: True if driver is ENS enabled, False if not.
         """
-        result = self._get_ens_settings()
+        result = self._get_ens_settings(cached=cached)
         if not self._check_if_nsxt_present(result):
-            service_name = self._interface().driver.get_drv_info(refresh=True).get("driver")
+            service_name = self._get_driver_service_name(cached=cached)
         else:
             found = re.search(
                 ENS_DATA_REGEX_TEMPLATE.format(interface_name=self._interface().name),
@@ -88,15 +92,16 @@ class ESXiFeatureENS(BaseFeatureENS):
         service_name = self._interface().driver.get_drv_info(refresh=True).get("driver")
         return not service_name.endswith("_ens") and self.is_ens_enabled()
 
-    def is_ens_interrupt_capable(self) -> bool:
+    def is_ens_interrupt_capable(self, cached: bool = False) -> bool:
         """
         Get vmnic ens interrupt capability.
 
         - esxcg-nics -e is supported only on hosts with NSX-T libs.
 
+        :param cached: use ENS settings read previously, if available
         :return: True if driver is ENS INTERRUPT capable, False if not.
         """
-        result = self._get_ens_settings()
+        result = self._get_ens_settings(cached=cached)
         if not self._check_if_nsxt_present(result):
             return False
 
@@ -112,23 +117,45 @@ class ESXiFeatureENS(BaseFeatureENS):
         )
         return intr_capable == "true"
 
-    def _get_ens_settings(self) -> "ConnectionCompletedProcess":
+    def _get_ens_settings(self, cached: bool = False) -> "ConnectionCompletedProcess":
         """
         Get vmnic ens settings.
 
+        :param cached: return settings read previously, if available
         :return: ConnectionCompletedProcess object
         """
-        return self._connection.execute_command("esxcfg-nics -e", expected_return_codes=None, stderr_to_stdout=True)
+        if not cached or self._ens_settings is None:
+            self._ens_settings = self._connection.execute_command(
+                "esxcfg-nics -e", expected_return_codes=None, stderr_to_stdout=True
+            )
+        return self._ens_settings
+
+    def _get_driver_service_name(self, cached: bool = False) -> str:
+        """
+        Get name of driver service, used to check ENS status on hosts without NSX-T.
+
+        :param cached: return name read previously, if available
+        :return: Driver service name, e.g. 'icen' or 'icen_ens'
+        """
+        if not cached or self._driver_service_name is None:
+            self._driver_service_name = self._interface().driver.get_drv_info(refresh=True).get("driver")
+        return self._driver_service_name
+
+    def clear_cache(self) -> None:
+        """Clear cached ENS settings, should be called after ENS mode or driver change."""
+        self._ens_settings = None
+        self._driver_service_name = None
 
-    def is_ens_interrupt_enabled(self) -> bool:
+    def is_ens_interrupt_enabled(self, cached: bool = False) -> bool:
         """
         Get vmnic ens interrupt status.
 
         - esxcg-nics -e is supported only on hosts with NSX-T libs.
 
+        :param cached: use ENS settings read previously, if available
         :return: True if a driver has ENS INTERRUPT enabled, False if not.
         """
-        result = self._get_ens_settings()
+        result = self._get_ens_settings(cached=cached)
         if not self._check_if_nsxt_present(result):
             return False
 
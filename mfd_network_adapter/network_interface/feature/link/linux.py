@@ -185,6 +185,7 @@ class LinuxLink(BaseFeatureLink):
         pci_address = self._interface()._interface_info.pci_address
         if pci_address is None:
             raise IPFeatureException(f"No pci address found for {self._interface().name}")
+        self._interface().clear_hardware_facts()
         self._connection.execute_command(
             (
                 "echo 1 > /sys/bus/pci/devices/0000"
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: MIT
 """Module for queue feature for ESXI."""
 
-import json
 import logging
 import re
 from collections import namedtuple
@@ -11,6 +10,7 @@ from typing import Any, AnyStr
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_typing import MACAddress
 
+from mfd_network_adapter.api.utils.esxi import parse_vsish_output, vsish_ls_subtree
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 from .base import BaseFeatureQueue
 from ...exceptions import QueueFeatureInvalidValueException
@@ -37,11 +37,7 @@ class ESXiQueue(BaseFeatureQueue):
         out = self._connection.execute_command(
             f"vsish -pe get /net/pNics/{self._interface().name}/{queues}queues/info", expected_return_codes=[0]
         ).stdout
-        # Conforming output for json specific
-        change_hex_value = re.sub(r"(0x[0-9a-fA-F]+)", r'"\1"', out[out.find("{") :])
-        out_for_json = re.sub(r",\n}", "}", change_hex_value)
-        queues_info = json.loads(out_for_json, strict=False)
-        return queues_info
+        return parse_vsish_output(out, convert_hex=False)
 
     def get_queues(self, queues: str) -> str:
         """Get queues information for interface as raw output.
@@ -69,6 +65,17 @@ class ESXiQueue(BaseFeatureQueue):
         ).stdout
         return self.read_primary_or_secondary_queues_vsish(output)
 
+    def get_all_rx_sec_queues(self) -> dict[str, list[str] | None]:
+        """
+        Get rxSecQueues of all primary rxqueues using single vsish script.
+
+        :return: Dictionary with primary queue as key and list of secondary queues as value,
+            None when primary queue does not have RSS queues
+        """
+        return vsish_ls_subtree(
+            self._connection, f"/net/pNics/{self._interface().name}/rxqueues/queues", "rss/rxSecQueues"
+        )
+
     @staticmethod
     def read_primary_or_secondary_queues_vsish(raw_vsish_output: str) -> list[str]:
         """Read primary or secondary queues from vsish.
@@ -36,9 +36,11 @@ class ESXiRSS(BaseFeatureRSS):
     def get_rx_pkts_stats(self) -> dict[str, str]:
         """Get privstats for Pkts rx queues using localcli command.
 
+        ENS state is cached per interface, call interface.ens.clear_cache() after changing ENS mode.
+
         :return: pkts rx queue statistics
         """
-        if not self._interface().ens.is_ens_enabled():
+        if not self._interface().ens.is_ens_enabled(cached=True):
             command = (
                 f"localcli --plugin-dir /usr/lib/vmware/esxcli/int networkinternal "
                 f"nic privstats get -n {self._interface().name}"
@@ -73,11 +75,10 @@ class ESXiRSS(BaseFeatureRSS):
                 primary_q is a key, but will be also included in the value,
                 because traffic is received on primary and/or secondary queues for given RSS engine
         """
-        driver = self.package_manager.get_driver_info(self._interface().name)
-        driver = driver.driver_name
+        driver = self._interface().driver.get_driver_info(cached=True).driver_name
         primary_with_secondary_queues = {}
 
-        if "icen" in driver and self._interface().ens.is_ens_enabled():
+        if "icen" in driver and self._interface().ens.is_ens_enabled(cached=True):
             try:
                 output_rss_info = self._connection.execute_command(
                     f"nsxdp-cli ens uplink rss list -n {self._interface().name}", shell=True
@@ -98,7 +99,7 @@ class ESXiRSS(BaseFeatureRSS):
                     level=log_levels.MODULE_DEBUG,
                     msg="nsxdp-cli ens uplink rss command is not supported for that version of NSX-T.",
                 )
-                params = self.package_manager.get_module_params_as_dict(driver)
+                params = self._interface().driver.get_module_params_as_dict(cached=True)
                 drss = params["DRSS"].split(",")[0] if "DRSS" in params else "4"
                 primary_with_secondary_queues["0"] = [str(secondary_q) for secondary_q in range(1, int(drss))]
 
@@ -116,23 +117,13 @@ class ESXiRSS(BaseFeatureRSS):
                 because traffic is received on primary and/or secondary queues for given RSS engine
         """
         primary_with_secondary_queues = {}
-        output_primary = self._connection.execute_command(
-            f"vsish -e ls /net/pNics/{self._interface().name}/rxqueues/queues", shell=True
-        ).stdout
-
-        primary_queues = self._interface().queue.read_primary_or_secondary_queues_vsish(output_primary)
-        for primary_q in primary_queues:
-            output = self._connection.execute_command(
-                command=f"vsish -e ls /net/pNics/{self._interface().name}/rxqueues/queues/{primary_q}/rss/rxSecQueues",
-                expected_return_codes={},
-            )
+        secondary_queues = self._interface().queue.get_all_rx_sec_queues()
+        for primary_q, secondary in secondary_queues.items():
             primary_with_secondary_queues[primary_q] = [primary_q]
-            if output.return_code != 0:
+            if secondary is None:
                 # This queue do not have RSS queues
                 continue
-            primary_with_secondary_queues[primary_q].extend(
-                self._interface().queue.read_primary_or_secondary_queues_vsish(output.stdout)
-            )
+            primary_with_secondary_queues[primary_q].extend(secondary)
 
             if primary_q == "0" and "ixgben" in driver:
                 if primary_with_secondary_queues[primary_q][:2] != ["0", "1"]:
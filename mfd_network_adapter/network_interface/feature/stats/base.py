@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: MIT
 """Base Module for Stats feature."""
 
+import re
 import typing
 from abc import ABC
+from typing import Dict, Tuple
 
 from ..base import BaseFeature
+from .data_structures import QueueCounterLayout, QueueCounters
 
 if typing.TYPE_CHECKING:
     from mfd_connect import Connection
@@ -15,6 +18,9 @@ if typing.TYPE_CHECKING:
 class BaseFeatureStats(BaseFeature, ABC):
     """Base class for Stats feature."""
 
+    # patterns of per-queue statistics names with named groups: direction (rx/tx), queue, counter (packets/bytes)
+    _queue_counter_patterns: Tuple["re.Pattern", ...] = ()
+
     def __init__(self, *, connection: "Connection", interface: "NetworkInterface"):
         """
         Initialize BaseFeatureStats.
@@ -23,3 +29,48 @@ class BaseFeatureStats(BaseFeature, ABC):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
+        self._queue_counter_layout: QueueCounterLayout | None = None
+
+    def get_queue_counters(self) -> QueueCounters:
+        """
+        Get rx/tx packets and bytes of all queues as lists indexed by queue number, with single call.
+
+        Layout of per-queue statistics is learned from statistics names at the first call and reused,
+        it's learned again when number of statistics changes (e.g. after changing number of queues).
+
+        :return: Per-queue counters
+        """
+        timestamp, stats = self._read_queue_counter_stats()
+        layout = self._queue_counter_layout
+        if layout is None or layout.stats_count != len(stats):
+            layout = self._queue_counter_layout = self._learn_queue_counter_layout(stats)
+        counters = {name: [0] * layout.queues for name in ("rx_packets", "tx_packets", "rx_bytes", "tx_bytes")}
+        for stat_name, (counter, queue) in layout.positions.items():
+            counters[counter][queue] = int(stats[stat_name])
+        return QueueCounters(timestamp=timestamp, **counters)
+
+    def _learn_queue_counter_layout(self, stats: Dict[str, str]) -> QueueCounterLayout:
+        """
+        Learn positions of per-queue counters from statistics names.
+
+        :param stats: All statistics of interface
+        :return: Layout of per-queue counters
+        """
+        layout = QueueCounterLayout(stats_count=len(stats))
+        for stat_name in stats:
+            for pattern in self._queue_counter_patterns:
+                match = pattern.search(stat_name)
+                if match:
+                    queue = int(match.group("queue"))
+                    layout.positions[stat_name] = (f"{match.group('direction')}_{match.group('counter')}", queue)
+                    layout.queues = max(layout.queues, queue + 1)
+                    break
+        return layout
+
+    def _read_queue_counter_stats(self) -> Tuple[float, Dict[str, str]]:
+        """
+        Read timestamp and all statistics containing per-queue counters with single call.
+
+        :return: Timestamp and statistics keyed by name
+        """
+        raise NotImplementedError
@@ -3,7 +3,8 @@
 """Module for Stats data structures."""
 
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 
 class Protocol(Enum):
@@ -28,3 +29,66 @@ class ESXiVfStats:
 
     general: dict
     detailed: dict
+
+    def delta(self, previous: "ESXiVfStats") -> "ESXiVfStats":
+        """
+        Calculate difference between these statistics and previously gathered ones.
+
+        :param previous: Statistics gathered earlier
+        :return: Statistics containing increase of each counter, VFs missing in previous statistics are compared to 0
+        """
+        general = {name: value - previous.general.get(name, 0) for name, value in self.general.items()}
+        detailed = {
+            vf_id: {name: value - previous.detailed.get(vf_id, {}).get(name, 0) for name, value in stats.items()}
+            for vf_id, stats in self.detailed.items()
+        }
+        return ESXiVfStats(general, detailed)
+
+
+@dataclass
+class QueueCounterLayout:
+    """Structure for per-queue counters layout of driver, learned once from statistics names."""
+
+    positions: Dict[str, Tuple[str, int]] = field(default_factory=dict)  # stat name -> (counter, queue index)
+    queues: int = 0
+    stats_count: int = 0  # number of all statistics, layout is learned again when it changes
+
+
+@dataclass
+class QueueCounters:
+    """Structure for per-queue counters, lists are indexed by queue number."""
+
+    timestamp: float  # seconds since epoch, taken on the host when available
+    rx_packets: List[int]
+    tx_packets: List[int]
+    rx_bytes: List[int]
+    tx_bytes: List[int]
+
+    def delta(self, previous: "QueueCounters") -> "QueueCounters":
+        """
+        Calculate difference between these counters and previously gathered ones.
+
+        :param previous: Counters gathered earlier with the same layout
+        :return: Counters containing increase of each counter, timestamp is the one of these counters
+        """
+        return QueueCounters(
+            timestamp=self.timestamp,
+            rx_packets=[value - old for value, old in zip(self.rx_packets, previous.rx_packets)],
+            tx_packets=[value - old for value, old in zip(self.tx_packets, previous.tx_packets)],
+            rx_bytes=[value - old for value, old in zip(self.rx_bytes, previous.rx_bytes)],
+            tx_bytes=[value - old for value, old in zip(self.tx_bytes, previous.tx_bytes)],
+        )
+
+    def rates(self, previous: "QueueCounters") -> Dict[str, List[float]]:
+        """
+        Calculate per second rates of counters between previously gathered counters and these ones.
+
+        :param previous: Counters gathered earlier with the same layout
+        :return: Rates keyed by counter name (rx_packets, tx_packets, rx_bytes, tx_bytes)
+        """
+        interval = self.timestamp - previous.timestamp
+        delta = self.delta(previous)
+        return {
+            name: [value / interval if interval else 0.0 for value in getattr(delta, name)]
+            for name in ("rx_packets", "tx_packets", "rx_bytes", "tx_bytes")
+        }
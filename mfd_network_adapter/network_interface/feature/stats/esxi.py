@@ -5,8 +5,11 @@
 import logging
 import json
 import re
+from time import sleep
+from typing import Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
+from mfd_network_adapter.api.utils.esxi import parse_vsish_output, vsish_get_many
 from mfd_network_adapter.network_interface.exceptions import StatisticNotFoundException
 from .data_structures import ESXiVfStats
 
@@ -29,6 +32,9 @@ RX_PKTS = ["rxUnicastPkts", "rxMulticastPkts", "rxBroadcastPkts"]
 class ESXiStats(BaseFeatureStats):
     """ESXi class for Stats feature."""
 
+    # statistics named by _read_queue_counter_stats, e.g. rxq0.packets
+    _queue_counter_patterns = (re.compile(r"^(?P<direction>[rt]x)q(?P<queue>\d+)\.(?P<counter>packets|bytes)$"),)
+
     def __init__(self, *, connection: "Connection", interface: "NetworkInterface") -> None:
         """
         Initialize ESXi Stats feature.
@@ -88,53 +94,65 @@ class ESXiStats(BaseFeatureStats):
         """
         command = f"vsish -pe get /net/sriov/{self._interface().name}/vfs/{vf_id}/stats"
         output = self._connection.execute_command(command=command, expected_return_codes={0}).stdout
-        result = output[output.find("{") :]
-        result_parsed = json.loads(result.replace(",\n}", "}"), strict=False)
-        for key, value in result_parsed.items():
-            result_parsed[key] = int(value)
-        return result_parsed
+        return {key: int(value) for key, value in parse_vsish_output(output).items()}
+
+    def get_multiple_vf_stats(self, vf_ids: Iterable[int | str]) -> dict[str, dict[str, int]]:
+        """
+        Return statistics for VFs with given IDs, read using single vsish script.
 
-    def get_vf_stats(self) -> ESXiVfStats:
+        :param vf_ids: IDs of VFs which will have statistics retrieved
+        :return: dictionary with VF ID (as string) as key and statistics of VF as value
+        :raises StatisticNotFoundException: when statistics of any VF cannot be read
+        """
+        paths = {str(vf_id): f"/net/sriov/{self._interface().name}/vfs/{vf_id}/stats" for vf_id in vf_ids}
+        nodes = vsish_get_many(self._connection, paths.values())
+        missing = [vf_id for vf_id, path in paths.items() if nodes[path] is None]
+        if missing:
+            raise StatisticNotFoundException(f"Missing statistics for VFs {missing} on {self._interface().name}")
+        return {vf_id: {key: int(value) for key, value in nodes[path].items()} for vf_id, path in paths.items()}
+
+    def get_vf_stats(self, vf_ids: Iterable[int | str] | None = None) -> ESXiVfStats:
         """
         Get statistics of all VFs enabled on adapter.
 
+        :param vf_ids: IDs of VFs to get statistics of, if not passed connected VFs are read from the adapter
         :return: tuple containing general VF statistics and detailed VF statistics
         """
-        from collections import defaultdict
+        if vf_ids is None:
+            vf_ids = [vf.vf_id for vf in self._interface().virtualization.get_connected_vfs_info()]
+        detailed_stats = self.get_multiple_vf_stats(vf_ids)
 
-        used_vfs = self._interface().virtualization.get_connected_vfs_info()
         general_stats = {}
-        detailed_stats = defaultdict(dict)
-
-        for vf in used_vfs:
-            result = self.get_single_vf_stats(vf.vf_id)
-            for key, value in result.items():
-                detailed_stats[str(vf.vf_id)][key] = value
-                if used_vfs.index(vf) == 0:
-                    general_stats[key] = value
-                else:
-                    general_stats[key] += value
-
-        # calculate and add additional stats
-        stats_to_add = ["txbytes", "rxbytes", "txpkt", "rxpkt"]
-        for name in stats_to_add:
-            general_stats[name] = 0
-        for tx_b_stat, rx_b_stat, tx_p_stat, rx_p_stat in zip(TX_BYTES, RX_BYTES, TX_PKTS, RX_PKTS):
-            general_stats["txbytes"] += general_stats[tx_b_stat]
-            general_stats["rxbytes"] += general_stats[rx_b_stat]
-            general_stats["txpkt"] += general_stats[tx_p_stat]
-            general_stats["rxpkt"] += general_stats[rx_p_stat]
-        for vf in used_vfs:
-            vf_id = str(vf.vf_id)
-            for name in stats_to_add:
-                detailed_stats[vf.vf_id][name] = 0
-            for tx_b_stat, rx_b_stat, tx_p_stat, rx_p_stat in zip(TX_BYTES, RX_BYTES, TX_PKTS, RX_PKTS):
-                detailed_stats[vf_id]["txbytes"] += detailed_stats[vf_id][tx_b_stat]
-                detailed_stats[vf_id]["rxbytes"] += detailed_stats[vf_id][rx_b_stat]
-                detailed_stats[vf_id]["txpkt"] += detailed_stats[vf_id][tx_p_stat]
-                detailed_stats[vf_id]["rxpkt"] += detailed_stats[vf_id][rx_p_stat]
+        for stats in detailed_stats.values():
+            # calculate and add additional stats
+            stats["txbytes"] = sum(stats[name] for name in TX_BYTES)
+            stats["rxbytes"] = sum(stats[name] for name in RX_BYTES)
+            stats["txpkt"] = sum(stats[name] for name in TX_PKTS)
+            stats["rxpkt"] = sum(stats[name] for name in RX_PKTS)
+            for key, value in stats.items():
+                general_stats[key] = general_stats.get(key, 0) + value
         return ESXiVfStats(general_stats, detailed_stats)
 
+    def get_vf_stats_deltas(self, interval: float, samples: int) -> list[ESXiVfStats]:
+        """
+        Sample statistics of connected VFs periodically and return increase of counters between samples.
+
+        Connected VFs are read once, each sample costs single command on the host.
+
+        :param interval: time (in seconds) between samples
+        :param samples: number of deltas to gather
+        :return: list of statistics deltas, one per interval
+        """
+        vf_ids = [vf.vf_id for vf in self._interface().virtualization.get_connected_vfs_info()]
+        previous = self.get_vf_stats(vf_ids)
+        deltas = []
+        for _ in range(samples):
+            sleep(interval)
+            current = self.get_vf_stats(vf_ids)
+            deltas.append(current.delta(previous))
+            previous = current
+        return deltas
+
     def get_pf_stats(self, name: str | None = None) -> dict:
         """
         Get adapter statistics via vsish -pe get /net/pNics to get general PF statistics and PF queues statistics.
@@ -149,7 +167,7 @@ class ESXiStats(BaseFeatureStats):
         result = re.sub(r'"dumsw" : ".*?",\n', "", output[output.find("{") :], flags=re.DOTALL)
         result_parsed = json.loads(result.replace(",\n}", "}"), strict=False)
 
-        if self._interface().ens.is_ens_enabled():
+        if self._interface().ens.is_ens_enabled(cached=True):
             for key, pattern in (
                 ("txXon", r"(txXon=|TxXon:\s)(.*)"),
                 ("rxXon", r"(rxXon=|RxXon:\s)(.*)"),
@@ -171,7 +189,7 @@ class ESXiStats(BaseFeatureStats):
         for key, value in result_parsed.items():
             stats[key] = str(value)
 
-        if not self._interface().ens.is_ens_enabled():
+        if not self._interface().ens.is_ens_enabled(cached=True):
             localcli_stats = self.get_localcli_stats()
             stats.update(localcli_stats)
 
@@ -279,3 +297,30 @@ class ESXiStats(BaseFeatureStats):
             stats[f"txq{i}bytes"] = int(lines[nr].split()[field].split("=")[1])
             nr += 1
         return stats
+
+    def _read_queue_counter_stats(self) -> tuple[float, dict[str, str]]:
+        """
+        Read host timestamp and per-queue statistics from privstats (ENS uplink stats when ENS is enabled).
+
+        Queue lines (e.g. 'rxq0: totalPkts=10 totalBytes=640') are converted to statistics named 'rxq0.packets',
+        'rxq0.bytes'. ENS state is cached per interface, call interface.ens.clear_cache() after changing ENS mode.
+
+        :return: Timestamp and statistics keyed by name
+        """
+        if not self._interface().ens.is_ens_enabled(cached=True):
+            command = (
+                'localcli --plugin-dir "/usr/lib/vmware/esxcli/int"'
+                f" networkinternal nic privstats get -n {self._interface().name}"
+            )
+        else:
+            command = f"nsxdp-cli ens uplink stats get -n {self._interface().name}"
+        output = self._connection.execute_command(f"date +%s; {command}", shell=True, expected_return_codes={0}).stdout
+        timestamp, _, stats_output = output.partition("\n")
+        stats = {}
+        for queue_match in re.finditer(r"^\s*(?P<queue>[rt]xq\d+):?(?P<values>.*)$", stats_output, re.MULTILINE):
+            for value_match in re.finditer(
+                r"(?:total|rx|tx)(?P<counter>Pkts|Bytes)=(?P<value>\d+)", queue_match["values"]
+            ):
+                counter = "packets" if value_match["counter"] == "Pkts" else "bytes"
+                stats[f"{queue_match['queue']}.{counter}"] = value_match["value"]
+        return float(timestamp), stats
@@ -4,7 +4,7 @@
 
 import logging
 import re
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_sysctl.freebsd import FreebsdSysctl
@@ -24,6 +24,12 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 class FreeBsdStats(BaseFeatureStats):
     """FreeBSD class for Stats feature."""
 
+    # rxq00.packets (iflib drivers, e.g. ixl, ice), queue0.rx_packets (ix)
+    _queue_counter_patterns = (
+        re.compile(r"(?:^|\.)(?P<direction>[rt]x)q(?P<queue>\d+)\.(?P<counter>packets|bytes)$"),
+        re.compile(r"(?:^|\.)queue(?P<queue>\d+)\.(?P<direction>[rt]x)_(?P<counter>packets|bytes)$"),
+    )
+
     def __init__(self, *, connection: "Connection", interface: "NetworkInterface") -> None:
         """
         Initialize FreeBSD Stats feature.
@@ -54,11 +60,35 @@ class FreeBsdStats(BaseFeatureStats):
         :return: dictionary containing statistics and their values.
         """
         output = self.freebsd_sysctl._get_sysctl_value(sysctl_name="", interface=self._interface().name, options="")
+        return self._parse_stats(str(output))
+
+    @staticmethod
+    def _parse_stats(output: str) -> Dict[str, str]:
+        """Parse sysctl statistics of interface.
 
+        :param output: Output of sysctl dev.<drv>.<num>.
+        :return: dictionary containing statistics and their values.
+        """
         regex = re.compile(r"dev\..*\.\d+\.%?(?P<name>\S+):\s*(?P<value>.*)")
 
         stats = {}
-        for match in regex.finditer(str(output).replace("dev.", "\ndev.")):
+        for match in regex.finditer(output.replace("dev.", "\ndev.")):
             stats[match.group("name")] = match.group("value")
 
         return stats
+
+    def _read_queue_counter_stats(self) -> Tuple[float, Dict[str, str]]:
+        """
+        Read host timestamp and all sysctl statistics of interface with single call.
+
+        :return: Timestamp and statistics keyed by name
+        """
+        name = self._interface().name
+        sysctl_name = (
+            f"dev.{self.freebsd_sysctl.get_driver_name(name)}.{self.freebsd_sysctl.get_driver_interface_number(name)}."
+        )
+        output = self._connection.execute_command(
+            f"date +%s; sysctl {sysctl_name}", shell=True, expected_return_codes={0}
+        ).stdout
+        timestamp, _, stats_output = output.partition("\n")
+        return float(timestamp), self._parse_stats(stats_output)
@@ -4,7 +4,7 @@
 
 import logging
 import re
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 import yaml
 
 from mfd_common_libs import add_logging_level, log_levels
@@ -28,6 +28,13 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 class LinuxStats(BaseFeatureStats):
     """Linux class for Stats feature."""
 
+    # rx_queue_0_packets (ice, ixgbe), rx-0.packets (i40e), rx-queue-0.rx_packets (100G), rx0_packets (mlx5)
+    _queue_counter_patterns = (
+        re.compile(
+            r"^(?P<direction>[rt]x)(?:_queue_|-queue-|-)?(?P<queue>\d+)[._]+(?:[rt]x_)?(?P<counter>packets|bytes)$"
+        ),
+    )
+
     def __init__(self, *, connection: "Connection", interface: "NetworkInterface") -> None:
         """
         Initialize Linux Stats feature.
@@ -68,6 +75,22 @@ class LinuxStats(BaseFeatureStats):
         stats.update(netdev_stats)
         return stats
 
+    def _read_queue_counter_stats(self) -> Tuple[float, Dict[str, str]]:
+        """
+        Read host timestamp and ethtool statistics with single call.
+
+        :return: Timestamp and statistics keyed by name
+        """
+        command = add_namespace_call_command(f"ethtool -S {self._interface().name}", self._interface().namespace)
+        output = self._connection.execute_command(f"date +%s.%N; {command}", shell=True).stdout
+        timestamp, _, stats_output = output.partition("\n")
+        stats = {}
+        for line in stats_output.splitlines():
+            name, separator, value = line.partition(":")
+            if separator:
+                stats[name.strip()] = value.strip()
+        return float(timestamp), stats
+
     def get_netdev_stats(self) -> Dict:
         """Get statistics from iproute2 which are not available in ethtool -S.
 
@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: MIT
 """Module for Network Interface for Linux."""
 
+import json
 import logging
 import re
-from dataclasses import fields
-from typing import Dict, Optional, TYPE_CHECKING, Union
+from dataclasses import asdict
+from itertools import groupby
+from typing import Dict, List, Optional, TYPE_CHECKING, Union
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.base import ConnectionCompletedProcess
@@ -17,7 +19,13 @@ from mfd_typing.network_interface import LinuxInterfaceInfo, VsiInfo
 
 from mfd_network_adapter import NetworkAdapterOwner
 from .base import NetworkInterface
-from .data_structures import RingBufferSettings, RingBuffer
+from .data_structures import (
+    ChannelSettings,
+    RingBufferSettings,
+    RingBuffer,
+    HardwareFacts,
+    InterfaceConfigSnapshot,
+)
 from .exceptions import (
     BrandingStringException,
     DeviceStringException,
@@ -28,8 +36,10 @@ from .exceptions import (
     RingBufferSettingException,
     FirmwareVersionNotFound,
     DeviceSetupException,
+    InterfaceConfigRestoreException,
 )
-from ..api.basic.linux import get_mac_address
+from ..api.basic import execute_sections
+from ..api.basic.linux import get_mac_address, parse_ethtool_settings
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
@@ -44,6 +54,8 @@ class LinuxNetworkInterface(NetworkInterface):
     """Class to handle Network Interface in Linux."""
 
     _ibv_devices: "IBVDevices" = None
+    # labels of ethtool -a output mapped to names of parameters of ethtool -A
+    _flow_control_names = {"Autonegotiate": "autoneg", "RX": "rx", "TX": "tx"}
 
     def __init__(
         self,
@@ -74,6 +86,96 @@ class LinuxNetworkInterface(NetworkInterface):
         """Get VSI Info."""
         return self._interface_info.vsi_info
 
+    def get_hardware_facts(self, cached: bool = True) -> HardwareFacts:
+        """
+        Get facts about interface hardware: branding, device string, NUMA node, number of ports, driver and firmware.
+
+        All facts are read with single call to the host. They change only on driver reload, restart or firmware
+        update, so they are cached until clear_hardware_facts() is called.
+
+        :param cached: return facts read previously, if available
+        :return: HardwareFacts
+        """
+        if not cached or self._hardware_facts is None:
+            self._hardware_facts = self._read_hardware_facts()
+        return self._hardware_facts
+
+    def _read_hardware_facts(self) -> HardwareFacts:
+        """
+        Read hardware facts with lspci, sysfs, ethtool -i and modinfo outputs batched into single command.
+
+        :return: HardwareFacts
+        """
+        no_output = "true"
+        ethtool_info = add_namespace_call_command(f"ethtool -i {self.name}", self.namespace)
+        commands = [
+            add_namespace_call_command(f"lspci -s {self.pci_address.lspci} -v", self.namespace)
+            if self.pci_address is not None
+            else no_output,
+            add_namespace_call_command(f"cat /sys/class/net/{self.name}/device/numa_node", self.namespace)
+            if self.name
+            else no_output,
+            ethtool_info if self.name else no_output,
+            "lspci | grep Eth" if self.pci_address is not None else no_output,
+            f"modinfo $({ethtool_info} | sed -n 's/^driver: //p')" if self.name else no_output,
+        ]
+        sections = execute_sections(self._connection, commands).values()
+        lspci_output, numa_output, ethtool_output, ethernet_devices_output, modinfo_output = sections
+
+        branding_match = re.search(r"\s*Subsystem: (?P<branding_string>.+)", lspci_output)
+        device_string_match = re.search(
+            r"\d+:\d+.\d\s*(?:Ethernet controller|Class \d+): (?P<device_string>.+)", lspci_output
+        )
+        device_string = device_string_match.group("device_string").rstrip() if device_string_match else None
+        numa_output = numa_output.strip()
+        driver_match = re.search(r"^driver: (?P<driver>.+)$", ethtool_output, re.MULTILINE)
+        version_match = re.search(r"^version: (?P<version>.+)$", ethtool_output, re.MULTILINE)
+        firmware_match = re.search(r"firmware-version: (?P<firmware_version>.+)", ethtool_output, re.MULTILINE)
+        return HardwareFacts(
+            branding_string=branding_match.group("branding_string").rstrip() if branding_match else None,
+            device_string=device_string,
+            numa_node=int(numa_output) if re.fullmatch(r"-?\d+", numa_output) else None,
+            number_of_ports=self._count_ports(ethernet_devices_output, device_string),
+            driver_name=driver_match.group("driver").strip() if driver_match else None,
+            driver_version=version_match.group("version").strip() if version_match else None,
+            firmware_version=firmware_match.group("firmware_version") if firmware_match else None,
+            driver_info=self._parse_modinfo(modinfo_output),
+        )
+
+    @staticmethod
+    def _count_ports(ethernet_devices_output: str, device_string: Optional[str]) -> Optional[int]:
+        """
+        Count adjacent Ethernet functions with the same device string, as `uniq -c` does.
+
+        :param ethernet_devices_output: Output of `lspci | grep Eth`
+        :param device_string: Device string of interface
+        :return: Number of ports or None if not found
+        """
+        if not device_string:
+            return None
+        devices = [line.split(":")[-1] for line in ethernet_devices_output.splitlines() if line.strip()]
+        for device, group in groupby(devices):
+            if device_string in device:
+                return len(list(group))
+        return None
+
+    @staticmethod
+    def _parse_modinfo(modinfo_output: str) -> Optional[DriverInfo]:
+        """
+        Parse driver name and version from modinfo output.
+
+        :param modinfo_output: Output of modinfo
+        :return: DriverInfo or None if module was not found
+        """
+        name_match = re.search(r"^\s*name:\s+(?P<name>.*)", modinfo_output, flags=re.MULTILINE)
+        version_match = re.search(r"^\s*version:\s+(?P<version>.*)", modinfo_output, flags=re.MULTILINE)
+        if name_match is None and version_match is None:
+            return None
+        return DriverInfo(
+            driver_name=name_match.group("name") if name_match is not None else "N/A",
+            driver_version=version_match.group("version") if version_match is not None else "N/A",
+        )
+
     def get_branding_string(self) -> str:
         """
         Get branding string.
@@ -81,15 +183,12 @@ class LinuxNetworkInterface(NetworkInterface):
         :return: Branding string
         :raises BrandingStringException: if branding string not found
         """
-        command = add_namespace_call_command(f"lspci -s {self.pci_address.lspci} -v", self.namespace)
-        subsystem_pattern = r"\s*Subsystem: (?P<branding_string>.+)"
-        lspci_output = self._connection.execute_command(command).stdout
-        match = re.search(subsystem_pattern, lspci_output)
-        if not match:
+        branding_string = self.get_hardware_facts().branding_string
+        if branding_string is None:
             raise BrandingStringException(
                 f"No matching branding string found for pci address: {self.pci_address.lspci}"
             )
-        return match.group("branding_string").rstrip()
+        return branding_string
 
     def get_device_string(self) -> str:
         """
@@ -98,13 +197,10 @@ class LinuxNetworkInterface(NetworkInterface):
         :return: Device string
         :raises DeviceStringException: if device string not found
         """
-        command = add_namespace_call_command(f"lspci -s {self.pci_address.lspci} -v", self.namespace)
-        device_string_pattern = r"\d+:\d+.\d\s*(?:Ethernet controller|Class \d+): (?P<device_string>.+)"
-        lspci_output = self._connection.execute_command(command).stdout
-        match = re.search(device_string_pattern, lspci_output)
-        if not match:
+        device_string = self.get_hardware_facts().device_string
+        if device_string is None:
             raise DeviceStringException(f"No matching device string found for pci address: {self.pci_address.lspci}")
-        return match.group("device_string").rstrip()
+        return device_string
 
     def get_mac_address(self) -> MACAddress:
         """
@@ -124,19 +220,8 @@ class LinuxNetworkInterface(NetworkInterface):
         """
         ethtool_command = add_namespace_call_command(f"ethtool -l {self.name}", self.namespace)
         ethtool_output = self._connection.execute_command(ethtool_command).stdout
-        queues_pattern = r"settings:"
-        queue_types = ["RX", "TX", "Other", "Combined"]
-        for queue_type in queue_types:
-            queues_pattern += rf"\n{queue_type}:\s+(?P<{queue_type.lower()}>[0-9]+|n/a)"
-
-        queues_pattern = re.compile(queues_pattern)
-
-        queues = {}
-        for match in queues_pattern.finditer(ethtool_output):
-            queues = match.groupdict()
-            for key, value in queues.items():
-                _value = int(value) if value.isdigit() else None
-                queues[key] = _value
+        settings = parse_ethtool_settings(ethtool_output, ChannelSettings)
+        queues = asdict(settings.current) if settings is not None else {}
         if not queues:
             raise NetworkQueuesException(f"Could not read network queues for interface {self.name}")
         return queues
@@ -223,13 +308,10 @@ class LinuxNetworkInterface(NetworkInterface):
         :raises NumaNodeException if numa file is not preset for interface.
         :return (int): NUMA node of the test network interface.
         """
-        try:
-            node = self._connection.execute_command(
-                add_namespace_call_command(f"cat /sys/class/net/{self.name}/device/numa_node", namespace=self.namespace)
-            ).stdout
-        except ConnectionCalledProcessError:
+        numa_node = self.get_hardware_facts().numa_node
+        if numa_node is None:
             raise NumaNodeException(f"NUMA node cannot be determined for interface: {self.name}")
-        return int(node)
+        return numa_node
 
     def get_ring_settings(self) -> RingBufferSettings:
         """
@@ -241,26 +323,9 @@ class LinuxNetworkInterface(NetworkInterface):
         ethtool_output = self._connection.execute_command(
             add_namespace_call_command(f"ethtool -g {self.name}", namespace=self.namespace)
         ).stdout.strip()
-        ethtool_output_pattern = (
-            r"pre-set maximums:(?P<maximum_settings>.*)current hardware settings:(?P<current_settings>.*)"
-        )
-
-        matched_settings = re.search(ethtool_output_pattern, ethtool_output, re.I | re.S | re.M)
-        if matched_settings is None:
-            raise RingBufferException(
-                f"Regex expression {ethtool_output_pattern} didn't match ethtool output {ethtool_output}"
-            )
-
-        settings = RingBufferSettings()
-        for settings_type_name, settings_type in settings.__dict__.items():
-            for setting in fields(settings_type):
-                setting_pattern = rf'{setting.name.replace("_", " ")}:\s+(?P<setting_value>\d+)'
-                matched_setting_value = re.search(
-                    setting_pattern, matched_settings[f"{settings_type_name}_settings"], re.I
-                )
-                if matched_setting_value:
-                    setattr(settings_type, setting.name, int(matched_setting_value["setting_value"]))
-
+        settings = parse_ethtool_settings(ethtool_output, RingBufferSettings)
+        if settings is None:
+            raise RingBufferException(f"Cannot parse ring buffer settings from ethtool output {ethtool_output}")
         return settings
 
     def set_ring_settings(self, settings: RingBuffer) -> None:
@@ -281,14 +346,10 @@ class LinuxNetworkInterface(NetworkInterface):
         :return: Firmware version
         :raises FirmwareVersionNotFound: If firmware version was not found
         """
-        command_ethtool = add_namespace_call_command(f"ethtool -i {self.name}", self.namespace)
-        interface_info = self._connection.execute_command(command_ethtool).stdout
-
-        version_match = re.search(r"firmware-version: (?P<firmware_version>.+)", interface_info, re.MULTILINE)
-        if not version_match:
+        firmware_version = self.get_hardware_facts().firmware_version
+        if firmware_version is None:
             raise FirmwareVersionNotFound(f"Can't find firmware version for [{self.name}]!")
-
-        return version_match.group("firmware_version")
+        return firmware_version
 
     def get_driver_info(self) -> DriverInfo:
         """
@@ -306,17 +367,11 @@ class LinuxNetworkInterface(NetworkInterface):
         :return: Number of ports in tested adapter
         :raise: DeviceSetupException: when any number of ports not found
         """
-        result = self._connection.execute_command(
-            command=f"lspci | grep Eth | awk -F ':' '{{print $NF}}' | uniq -c | grep '{self.get_device_string()}'",
-            shell=True,
-            expected_return_codes={0},
-        )
-
-        regex = re.search(r"^\s*(?P<number_ports>\d+)", result.stdout)
-        if regex:
-            return int(regex.group("number_ports"))
-        else:
+        self.get_device_string()
+        number_of_ports = self.get_hardware_facts().number_of_ports
+        if number_of_ports is None:
             raise DeviceSetupException("Can't find number of ports in tested adapter.")
+        return number_of_ports
 
     def reload_adapter_devlink(self) -> ConnectionCompletedProcess:
         """
@@ -325,6 +380,7 @@ class LinuxNetworkInterface(NetworkInterface):
         :return: ConnectionCompletedProcess
         """
         logger.log(level=log_levels.MFD_DEBUG, msg=f"Reloading adapter {self.name} using devlink")
+        self.clear_hardware_facts()
         return self._connection.execute_command(
             f"devlink dev reload pci/{self.pci_address}", expected_return_codes={0, 1}
         )
@@ -332,3 +388,238 @@ class LinuxNetworkInterface(NetworkInterface):
     def restart(self) -> None:
         """Restart interface."""
         raise NotImplementedError
+
+    def config_snapshot(self) -> InterfaceConfigSnapshot:
+        """
+        Take snapshot of interface configuration, which can be used later to revert changes.
+
+        MTU, static IPs, offloads, coalescing, rings, channels, flow control and VFs are read with single call.
+
+        :return: InterfaceConfigSnapshot
+        """
+        commands = [
+            f"ip -j link show dev {self.name}",
+            f"ip -j addr show dev {self.name}",
+            f"ethtool -k {self.name}",
+            f"ethtool -c {self.name}",
+            f"ethtool -g {self.name}",
+            f"ethtool -l {self.name}",
+            f"ethtool -a {self.name}",
+            f"cat /sys/class/net/{self.name}/device/sriov_numvfs",
+        ]
+        sections = list(
+            execute_sections(
+                self._connection, [f"{command} 2>/dev/null" for command in commands], namespace=self.namespace
+            ).values()
+        )
+        link_output, addr_output, offload_output, coalescing_output, rings_output, channels_output = sections[:6]
+        flow_control_output, vfs_count_output = sections[6:]
+        link, addr = self._load_ip_json(link_output), self._load_ip_json(addr_output)
+        return InterfaceConfigSnapshot(
+            mtu=link.get("mtu"),
+            ip_addresses=[
+                f"{address['local']}/{address['prefixlen']}"
+                for address in addr.get("addr_info", [])
+                if address.get("scope") == "global" and not address.get("dynamic")
+            ],
+            offload=dict(re.findall(r"^\s*(?P<name>[a-z][\w-]*): (?P<value>on|off)$", offload_output, re.MULTILINE)),
+            coalescing=self._parse_coalescing(coalescing_output),
+            rings=self._get_current_settings(parse_ethtool_settings(rings_output, RingBufferSettings)),
+            channels=self._get_current_settings(parse_ethtool_settings(channels_output, ChannelSettings)),
+            flow_control=self._parse_flow_control(flow_control_output),
+            vfs_count=int(vfs_count_output) if vfs_count_output.strip().isdigit() else None,
+            vfs={vf["vf"]: self._parse_vf_config(vf) for vf in link.get("vfinfo_list", [])},
+        )
+
+    def config_restore(self, snapshot: InterfaceConfigSnapshot) -> List[str]:
+        """
+        Revert interface configuration to snapshot, touching only settings changed since snapshot was taken.
+
+        Current configuration is read and all differences are applied with single call: one ethtool command
+        per settings group and single `ip -batch` for MTU, IPs and VF settings.
+
+        :param snapshot: Snapshot returned by config_snapshot()
+        :return: Executed commands, empty when nothing changed
+        :raises InterfaceConfigRestoreException: When any of commands failed
+        """
+        commands = self._get_config_restore_commands(self.config_snapshot(), snapshot)
+        if not commands:
+            return commands
+        sections = execute_sections(self._connection, [f'{{ {command}; }} 2>&1; echo "rc=$?"' for command in commands])
+        failed = []
+        for command, section in zip(commands, sections.values()):
+            command_output, _, return_code = section.strip().rpartition("rc=")
+            if return_code != "0":
+                failed.append(f"{command}: {command_output.strip()}")
+        if failed:
+            raise InterfaceConfigRestoreException(
+                f"Failed to restore configuration of {self.name}:\n" + "\n".join(failed)
+            )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Configuration of {self.name} restored: {commands}")
+        return commands
+
+    def _get_config_restore_commands(
+        self, current: InterfaceConfigSnapshot, snapshot: InterfaceConfigSnapshot
+    ) -> List[str]:
+        """
+        Prepare commands applying differences between current configuration and snapshot.
+
+        VFs are recreated first, as it resets their settings, channels and rings are changed before other settings,
+        as they may reset the link.
+
+        :param current: Current configuration
+        :param snapshot: Configuration to restore
+        :return: Commands
+        """
+        commands = []
+        current_vfs = current.vfs
+        if snapshot.vfs_count is not None and current.vfs_count != snapshot.vfs_count:
+            numvfs_path = f"/sys/class/net/{self.name}/device/sriov_numvfs"
+            command = f"echo 0 > {numvfs_path}"
+            if snapshot.vfs_count:
+                command += f" && echo {snapshot.vfs_count} > {numvfs_path}"
+            commands.append(add_namespace_call_command(command, self.namespace))
+            current_vfs = {}
+
+        for option, attribute in (("-L", "channels"), ("-G", "rings")):
+            changed = self._get_changed_settings(getattr(current, attribute), getattr(snapshot, attribute))
+            if changed:
+                commands.append(add_namespace_call_command(f"ethtool {option} {self.name} {changed}", self.namespace))
+
+        ip_commands = []
+        if snapshot.mtu is not None and current.mtu != snapshot.mtu:
+            ip_commands.append(f"link set dev {self.name} mtu {snapshot.mtu}")
+        ip_commands.extend(
+            f"addr del {ip} dev {self.name}" for ip in current.ip_addresses if ip not in snapshot.ip_addresses
+        )
+        ip_commands.extend(
+            f"addr add {ip} dev {self.name}" for ip in snapshot.ip_addresses if ip not in current.ip_addresses
+        )
+        for vf_id, vf_config in snapshot.vfs.items():
+            changed = {key for key, value in vf_config.items() if current_vfs.get(vf_id, {}).get(key) != value}
+            if changed & {"vlan", "qos"}:
+                changed |= {"vlan", "qos"}  # qos can be set only together with vlan
+            if changed:
+                settings = " ".join(f"{key} {value}" for key, value in vf_config.items() if key in changed)
+                ip_commands.append(f"link set dev {self.name} vf {vf_id} {settings}")
+        if ip_commands:
+            lines = " ".join(f'"{command}"' for command in ip_commands)
+            ip_batch = add_namespace_call_command("ip -force -batch -", self.namespace)
+            commands.append(f'printf "%s\\n" {lines} | {ip_batch}')
+
+        coalescing = dict(snapshot.coalescing)
+        for direction in ("rx", "tx"):
+            if coalescing.get(f"adaptive-{direction}") == "on":
+                coalescing.pop(f"{direction}-usecs", None)  # usecs are managed by driver with adaptive mode
+        for option, current_settings, settings in (
+            ("-K", current.offload, snapshot.offload),
+            ("-C", current.coalescing, coalescing),
+            ("-A", current.flow_control, snapshot.flow_control),
+        ):
+            changed = self._get_changed_settings(current_settings, settings)
+            if changed:
+                commands.append(add_namespace_call_command(f"ethtool {option} {self.name} {changed}", self.namespace))
+        return commands
+
+    @staticmethod
+    def _get_changed_settings(current: Dict[str, str], snapshot: Dict[str, str]) -> str:
+        """
+        Get settings of snapshot, which differ from current ones, as arguments of ethtool command.
+
+        Settings not reported currently (e.g. offloads, which became fixed) are skipped.
+
+        :param current: Current settings
+        :param snapshot: Settings to restore
+        :return: Arguments, e.g. 'rx 512 tx 512', empty when nothing changed
+        """
+        return " ".join(
+            f"{name} {value}" for name, value in snapshot.items() if name in current and current[name] != value
+        )
+
+    @staticmethod
+    def _load_ip_json(output: str) -> Dict:
+        """
+        Load details of single interface from `ip -j` output.
+
+        :param output: Output of `ip -j` command
+        :return: Details of interface, empty when output is not available
+        """
+        try:
+            return json.loads(output)[0]
+        except (ValueError, IndexError):
+            return {}
+
+    @staticmethod
+    def _get_current_settings(settings: Optional[Union[RingBufferSettings, ChannelSettings]]) -> Dict[str, str]:
+        """
+        Get current ring buffer or channel settings as arguments of ethtool -G/-L.
+
+        :param settings: Settings parsed from ethtool -g/-l output, None when not available
+        :return: Settings keyed by names of ethtool set parameters, settings not available are skipped
+        """
+        if settings is None:
+            return {}
+        return {
+            name.replace("_", "-"): str(value) for name, value in asdict(settings.current).items() if value is not None
+        }
+
+    def _parse_flow_control(self, output: str) -> Dict[str, str]:
+        """
+        Parse ethtool -a output.
+
+        :param output: ethtool output
+        :return: Settings keyed by names of ethtool -A parameters, settings not available are skipped
+        """
+        settings = {}
+        for line in output.splitlines():
+            label, separator, value = line.partition(":")
+            value = value.strip()
+            if separator and label.strip() in self._flow_control_names and value not in ("", "n/a"):
+                settings[self._flow_control_names[label.strip()]] = value
+        return settings
+
+    @staticmethod
+    def _parse_coalescing(output: str) -> Dict[str, str]:
+        """
+        Parse ethtool -c output.
+
+        :param output: ethtool output
+        :return: Settings keyed by names of ethtool -C parameters, settings not available are skipped
+        """
+        settings = {}
+        adaptive_match = re.search(r"^Adaptive RX:\s*(?P<rx>\S+)\s+TX:\s*(?P<tx>\S+)", output, re.MULTILINE)
+        if adaptive_match:
+            settings.update(
+                (f"adaptive-{direction}", value)
+                for direction, value in adaptive_match.groupdict().items()
+                if value != "n/a"
+            )
+        settings.update(
+            (name, value)
+            for name, value in re.findall(r"^(?P<name>[a-z][a-z0-9-]*):\s+(?P<value>\S+)$", output, re.MULTILINE)
+            if value != "n/a"
+        )
+        return settings
+
+    @staticmethod
+    def _parse_vf_config(vf: Dict) -> Dict[str, str]:
+        """
+        Parse settings of VF from `ip -j link show` output.
+
+        :param vf: Element of vfinfo_list
+        :return: Settings keyed by names of `ip link set vf` parameters
+        """
+        vlan = vf["vlan_list"][0] if vf.get("vlan_list") else vf
+        config = {
+            "mac": vf.get("address"),
+            "vlan": vlan.get("vlan"),
+            "qos": vlan.get("qos"),
+            "spoofchk": vf.get("spoofchk"),
+            "trust": vf.get("trust"),
+            "state": vf.get("link_state"),
+        }
+        return {
+            key: ("on" if value else "off") if isinstance(value, bool) else str(value)
+            for key, value in config.items()
+            if value is not None
+        }
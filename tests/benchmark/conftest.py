@@ -0,0 +1,31 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Fixtures for benchmarks of public API calls."""
+
+import json
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .replay import BenchmarkResult
+
+LATENCY_ENV = "MFD_BENCHMARK_LATENCY"
+REPORT_ENV = "MFD_BENCHMARK_REPORT"
+
+
+@pytest.fixture(scope="session")
+def latency() -> float:
+    """Get simulated per-call latency in seconds, set via MFD_BENCHMARK_LATENCY."""
+    return float(os.environ.get(LATENCY_ENV, 0))
+
+
+@pytest.fixture(scope="session")
+def benchmark_results() -> List[BenchmarkResult]:
+    """Collect results of all benchmarks, dumped as JSON to path from MFD_BENCHMARK_REPORT at the end of session."""
+    results: List[BenchmarkResult] = []
+    yield results
+    report_path = os.environ.get(REPORT_ENV)
+    if report_path:
+        Path(report_path).write_text(json.dumps([result.to_dict() for result in results], indent=2))
@@ -0,0 +1,169 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Replay connection and measurement helpers for benchmarks of public API calls."""
+
+import json
+import re
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSBitness, OSName, OSType
+
+TRANSCRIPTS_DIR = Path(__file__).parent / "transcripts"
+
+
+class TranscriptMissError(Exception):
+    """Handle command not present in transcript."""
+
+
+@dataclass
+class CallRecord:
+    """Dataclass for single command executed on replay connection."""
+
+    command: str
+    stdout_bytes: int
+    return_code: int
+
+
+@dataclass
+class BenchmarkResult:
+    """Dataclass for measurement of single public API call."""
+
+    api: str
+    rpc_count: int
+    bytes_transferred: int
+    cpu_time: float
+    wall_time: float
+    commands: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get result as dict, e.g. to be dumped as JSON report.
+
+        :return: Dict with result fields
+        """
+        return asdict(self)
+
+
+@Connection.register
+class ReplayConnection:
+    """
+    Fake connection replaying recorded command outputs with configurable per-call latency.
+
+    Transcript is JSON file with os_name, ip and list of entries with command (exact) or pattern (regex),
+    stdout (string or list of lines), optional stderr and return_code.
+    When the same command is recorded multiple times, outputs are replayed in order and the last one is repeated.
+    """
+
+    def __init__(self, transcript: str | Path, latency: float = 0.0, strict: bool = True):
+        """
+        Initialize replay connection.
+
+        :param transcript: Name of transcript in transcripts directory or path to transcript file
+        :param latency: Simulated round trip time of every call in seconds
+        :param strict: Raise TranscriptMissError for unknown commands, otherwise replay empty output
+        """
+        path = Path(transcript)
+        if not path.is_file():
+            path = TRANSCRIPTS_DIR / f"{transcript}.json"
+        data = json.loads(path.read_text())
+        self._os_name = OSName(data["os_name"])
+        self._ip = data.get("ip", "10.10.10.10")
+        self.latency = latency
+        self.strict = strict
+        self.calls: List[CallRecord] = []
+        self._outputs: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._patterns: List[tuple[re.Pattern, Dict[str, Any]]] = []
+        for entry in data["commands"]:
+            if "pattern" in entry:
+                self._patterns.append((re.compile(entry["pattern"], re.DOTALL), entry))
+            else:
+                self._outputs[entry["command"]].append(entry)
+
+    def get_os_name(self) -> OSName:
+        """Get name of replayed OS."""
+        return self._os_name
+
+    def get_os_type(self) -> OSType:
+        """Get type of replayed OS."""
+        return OSType.WINDOWS if self._os_name is OSName.WINDOWS else OSType.POSIX
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get bitness of replayed OS."""
+        return OSBitness.OS_64BIT
+
+    def _find_entry(self, command: str) -> Dict[str, Any]:
+        outputs = self._outputs.get(command)
+        if outputs:
+            return outputs.popleft() if len(outputs) > 1 else outputs[0]
+        for pattern, entry in self._patterns:
+            if pattern.fullmatch(command):
+                return entry
+        if not self.strict:
+            return {}
+        raise TranscriptMissError(f"Command not found in transcript: {command!r}")
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Optional[frozenset] = frozenset({0}),
+        custom_exception: Optional[type] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Replay output of command.
+
+        :param command: Command to execute
+        :param expected_return_codes: Return codes which are not considered as failure, None to accept all
+        :param custom_exception: Exception raised instead of ConnectionCalledProcessError
+        :return: Recorded output
+        :raises TranscriptMissError: if command is not present in transcript
+        """
+        entry = self._find_entry(command)
+        if self.latency:
+            time.sleep(self.latency)
+        stdout = entry.get("stdout", "")
+        stdout = "\n".join(stdout) if isinstance(stdout, list) else stdout
+        stderr = entry.get("stderr", "")
+        return_code = entry.get("return_code", 0)
+        self.calls.append(CallRecord(command=command, stdout_bytes=len(stdout) + len(stderr), return_code=return_code))
+        if expected_return_codes is not None and return_code not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(
+                returncode=return_code, cmd=command, output=stdout, stderr=stderr
+            )
+        return ConnectionCompletedProcess(args=command, stdout=stdout, stderr=stderr, return_code=return_code)
+
+    execute_powershell = execute_command
+
+
+def measure(connection: ReplayConnection, api: str, call: Callable[[], Any]) -> BenchmarkResult:
+    """
+    Measure number of RPCs, bytes transferred and controller CPU time of single public API call.
+
+    CPU time does not include simulated latency, as sleep does not consume CPU.
+
+    :param connection: Replay connection used by measured objects
+    :param api: Name of measured API, e.g. 'LinuxNetworkAdapterOwner.get_interfaces'
+    :param call: Callable performing measured call
+    :return: BenchmarkResult
+    """
+    first_call = len(connection.calls)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    call()
+    cpu_time, wall_time = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    calls = connection.calls[first_call:]
+    return BenchmarkResult(
+        api=api,
+        rpc_count=len(calls),
+        bytes_transferred=sum(len(c.command) + c.stdout_bytes for c in calls),
+        cpu_time=cpu_time,
+        wall_time=wall_time,
+        commands=[c.command for c in calls],
+    )
@@ -0,0 +1,67 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks of RPC count, bytes transferred and controller CPU time of public API calls."""
+
+import pytest
+
+from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
+from .replay import ReplayConnection, TranscriptMissError, measure
+
+# (transcript, interface name or None for owner API, api, call, max number of RPCs)
+# budgets are the current round-trip counts, raise them only together with justification in the change
+BENCHMARKS = [
+    ("linux_x550_e810", None, "get_interfaces", lambda owner: owner.get_interfaces(), 9),
+    (
+        "linux_x550_e810",
+        None,
+        "get_interface",
+        lambda owner: owner.get_interface(interface_name="ens801f0"),
+        1,
+    ),
+    ("linux_x550_e810", "ens801f0", "stats.get_stats", lambda interface: interface.stats.get_stats(), 6),
+    ("linux_x550_e810", "ens801f0", "rss.get_queues", lambda interface: interface.rss.get_queues(), 10),
+    (
+        "linux_x550_e810",
+        "ens801f0",
+        "interrupt.get_per_queue_interrupts_delta",
+        lambda interface: interface.interrupt.get_per_queue_interrupts_delta(interval=0),
+        4,
+    ),
+    ("esxi_e810_x710", None, "get_interfaces", lambda owner: owner.get_interfaces(), 1),
+    ("windows_x710", None, "get_interfaces", lambda owner: owner.get_interfaces(), 1),
+    ("freebsd_x710", None, "get_interfaces", lambda owner: owner.get_interfaces(), 1),
+]
+
+
+@pytest.mark.parametrize(
+    "transcript, interface_name, api, call, max_rpc_count", BENCHMARKS, ids=[f"{b[0]}-{b[2]}" for b in BENCHMARKS]
+)
+def test_benchmark(transcript, interface_name, api, call, max_rpc_count, latency, benchmark_results):
+    connection = ReplayConnection(transcript, latency=latency)
+    target = NetworkAdapterOwner(connection=connection)
+    if interface_name is not None:
+        # discovery is not part of measured feature call
+        target = target.get_interface(interface_name=interface_name)
+    result = measure(connection, f"{transcript}:{api}", lambda: call(target))
+    benchmark_results.append(result)
+    assert result.rpc_count <= max_rpc_count, f"{api} made {result.rpc_count} RPCs:\n" + "\n".join(result.commands)
+
+
+def test_replay_connection_transcript_miss():
+    connection = ReplayConnection("linux_x550_e810")
+    with pytest.raises(TranscriptMissError, match="not found in transcript"):
+        connection.execute_command("ethtool -i ens801f0")
+    assert connection.calls == []
+
+
+def test_replay_connection_sequence_and_latency(tmp_path, mocker):
+    transcript = tmp_path / "transcript.json"
+    transcript.write_text(
+        '{"os_name": "Linux", "commands": [{"command": "cat x", "stdout": "1"}, {"command": "cat x", "stdout": "2"}]}'
+    )
+    sleep_mock = mocker.patch("tests.benchmark.replay.time.sleep")
+    connection = ReplayConnection(transcript, latency=0.01)
+    assert [connection.execute_command("cat x").stdout for _ in range(3)] == ["1", "2", "2"]
+    assert sleep_mock.call_count == 3
+    result = measure(connection, "cat", lambda: connection.execute_command("cat x"))
+    assert (result.rpc_count, result.bytes_transferred, result.commands) == (1, 6, ["cat x"])
@@ -0,0 +1,64 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_network_adapter.api.basic import execute_sections
+
+
+class TestBasicAPI:
+    @pytest.fixture()
+    def connection(self, mocker):
+        yield mocker.create_autospec(RPyCConnection)
+
+    def test_execute_sections(self, connection):
+        output = dedent(
+            """\
+            <<<0
+            first line
+            second line
+            <<<2
+            third
+            """
+        )
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout=output, stderr=""
+        )
+        assert execute_sections(connection, ["cmd0", "cmd1", "cmd2"]) == {
+            0: "first line\nsecond line\n",
+            1: "",
+            2: "third\n",
+        }
+        connection.execute_command.assert_called_once_with(
+            'echo "<<<0"; cmd0; echo "<<<1"; cmd1; echo "<<<2"; cmd2', shell=True, expected_return_codes=None
+        )
+
+    def test_execute_sections_namespace_and_prefix(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="<<<0\nout\n", stderr=""
+        )
+        assert execute_sections(connection, ["cat '$f'"], namespace="ns1", prefix="f=x; ") == {0: "out\n"}
+        connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 sh -c 'f=x; echo \"<<<0\"; cat '\"'\"'$f'\"'\"''",
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test_execute_sections_parallel(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="<<<1\nout1\n<<<0\nout0\n", stderr=""
+        )
+        assert execute_sections(connection, ["cmd0", "cmd1"], parallel=True) == {0: "out0\n", 1: "out1\n"}
+        connection.execute_command.assert_called_once_with(
+            "( out=$(cmd0); printf '<<<%s\\n%s\\n' 0 \"$out\" ) & "
+            "( out=$(cmd1); printf '<<<%s\\n%s\\n' 1 \"$out\" ) & wait",
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test_execute_sections_no_commands(self, connection):
+        assert execute_sections(connection, []) == {}
+        connection.execute_command.assert_not_called()
@@ -11,8 +11,16 @@ from mfd_network_adapter.api.link.esxi import (
     set_administrative_privileges,
     get_administrative_privileges,
 )
+from mfd_network_adapter.api.utils.esxi import (
+    execute_esxcli,
+    parse_vsish_output,
+    vsish_get_many,
+    vsish_ls_many,
+    vsish_ls_subtree,
+)
 from mfd_network_adapter.api.vlan.esxi import set_vlan_tpid, get_vlan_tpid
 from mfd_network_adapter.data_structures import State
+from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 from mfd_network_adapter.network_interface.exceptions import LinkStateException
 
 
@@ -80,3 +88,85 @@ class TestESXiAPI:
             args="", stdout="Link privilege disabled for interface_name"
         )
         assert get_administrative_privileges(connection, "interface_name") is State.DISABLED
+
+    def test_parse_vsish_output(self):
+        output = (
+            "rxqueues info {\n"
+            '{\n   "maxQueues" : 9,\n   "features" : 0x482,\n   "name" : "q, {0}",\n'
+            '   "state" : ACTIVE,\n   "list" : [\n      1,\n      2,\n   ],\n   "sub" : {\n      "a" : -1,\n   },\n}'
+        )
+        expected = {
+            "maxQueues": 9,
+            "features": 1154,
+            "name": "q, {0}",
+            "state": "ACTIVE",
+            "list": [1, 2],
+            "sub": {"a": -1},
+        }
+        assert parse_vsish_output(output[output.find("\n") + 1 :]) == expected
+        assert parse_vsish_output('{\n   "features" : 0x482,\n}', convert_hex=False) == {"features": "0x482"}
+
+    def test_parse_vsish_output_invalid(self):
+        with pytest.raises(NetworkAdapterModuleException, match="Cannot parse vsish output"):
+            parse_vsish_output('{"a" : 1 "b" : 2}')
+
+    def test_vsish_get_many(self, connection):
+        output = (
+            '<<<vsish /net/sriov/vmnic1/vfs/0/stats\n{\n   "rxUnicastPkts" : 5,\n}\n>>>vsish 0\n'
+            "<<<vsish /net/sriov/vmnic1/vfs/1/stats\nError: node not found\n>>>vsish 1\n"
+        )
+        connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout=output)
+        paths = ["/net/sriov/vmnic1/vfs/0/stats", "/net/sriov/vmnic1/vfs/1/stats"]
+        assert vsish_get_many(connection, paths) == {paths[0]: {"rxUnicastPkts": 5}, paths[1]: None}
+        connection.execute_command.assert_called_once_with(
+            'echo "<<<vsish /net/sriov/vmnic1/vfs/0/stats"; vsish -pe get "/net/sriov/vmnic1/vfs/0/stats" 2>&1; '
+            'echo ">>>vsish $?"; echo "<<<vsish /net/sriov/vmnic1/vfs/1/stats"; '
+            'vsish -pe get "/net/sriov/vmnic1/vfs/1/stats" 2>&1; echo ">>>vsish $?"',
+            shell=True,
+        )
+
+    def test_vsish_get_many_no_paths(self, connection):
+        assert vsish_get_many(connection, []) == {}
+        connection.execute_command.assert_not_called()
+
+    def test_vsish_ls_many(self, connection):
+        output = "<<<vsish /net/pNics/vmnic1/rxqueues\ninfo\nqueues/\n>>>vsish 0\n"
+        connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout=output)
+        assert vsish_ls_many(connection, ["/net/pNics/vmnic1/rxqueues"]) == {
+            "/net/pNics/vmnic1/rxqueues": ["info", "queues"]
+        }
+
+    def test_vsish_ls_subtree(self, connection):
+        output = (
+            "<<<vsish /net/pNics/vmnic1/rxqueues/queues/0/rss/rxSecQueues\n1/\n2/\n>>>vsish 0\n"
+            "<<<vsish /net/pNics/vmnic1/rxqueues/queues/4/rss/rxSecQueues\n>>>vsish 1\n"
+        )
+        connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout=output)
+        assert vsish_ls_subtree(connection, "/net/pNics/vmnic1/rxqueues/queues/", "rss/rxSecQueues") == {
+            "0": ["1", "2"],
+            "4": None,
+        }
+
+    def test_execute_esxcli_json(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout='[{"Name": "vmnic0", "Driver": "i40en"}]'
+        )
+        assert execute_esxcli(connection, "network nic list") == [{"Name": "vmnic0", "Driver": "i40en"}]
+        connection.execute_command.assert_called_once_with("esxcli --formatter=json network nic list")
+
+    def test_execute_esxcli_csv(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="Name,Driver,\nvmnic0,i40en,\n"
+        )
+        result = execute_esxcli(connection, "network nic list", formatter="csv", cli="localcli --plugin-dir /dir")
+        assert result == [{"Name": "vmnic0", "Driver": "i40en", "": ""}]
+        connection.execute_command.assert_called_once_with(
+            "localcli --plugin-dir /dir --formatter=csv network nic list"
+        )
+
+    def test_execute_esxcli_errors(self, connection):
+        with pytest.raises(NetworkAdapterModuleException, match="Not supported esxcli formatter"):
+            execute_esxcli(connection, "network nic list", formatter="xml")
+        connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout="Error")
+        with pytest.raises(NetworkAdapterModuleException, match="Cannot parse output"):
+            execute_esxcli(connection, "network nic list")
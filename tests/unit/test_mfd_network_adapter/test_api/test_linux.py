@@ -2,13 +2,23 @@
 # SPDX-License-Identifier: MIT
 from textwrap import dedent
 from unittest import mock
+from unittest.mock import call
 
 import pytest
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import MACAddress
 
-from mfd_network_adapter.api.basic.linux import get_mac_address
+from mfd_network_adapter.api.basic.linux import (
+    get_mac_address,
+    execute_ip_batch,
+    delete_tunnel_batch,
+    execute_tunnel_batch,
+    parse_ethtool_settings,
+)
+from mfd_network_adapter.exceptions import NetworkAdapterModuleException
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+from mfd_network_adapter.network_interface.data_structures import Channels, ChannelSettings, RingBufferSettings
 from mfd_network_adapter.network_interface.exceptions import MacAddressNotFound
 
 
@@ -43,3 +53,155 @@ class TestLinuxAPI:
         assert get_mac_address(connection=connection, interface_name="eth3", namespace=None) == MACAddress(
             "00:00:00:00:00:00"
         )
+
+    def test_execute_ip_batch(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        assert execute_ip_batch(connection, ["addr add 1.1.1.1/24 dev eth0", "link set eth0 up"], namespace="ns1") == {}
+        connection.execute_command.assert_called_with(
+            "ip netns exec ns1 ip -force -batch -",
+            input_data="addr add 1.1.1.1/24 dev eth0\nlink set eth0 up\n",
+            expected_return_codes=None,
+        )
+
+    def test_execute_ip_batch_errors(self, connection):
+        stderr = dedent(
+            """\
+            RTNETLINK answers: File exists
+            Command failed -:1
+            Error: ipv4: Address already assigned.
+            Command failed -:3
+            """
+        )
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="", stderr=stderr
+        )
+        assert execute_ip_batch(connection, ["cmd1", "cmd2", "cmd3"]) == {
+            0: "RTNETLINK answers: File exists",
+            2: "Error: ipv4: Address already assigned.",
+        }
+
+    def test_execute_ip_batch_failure(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=127, args="command", stdout="", stderr="ip: command not found"
+        )
+        with pytest.raises(NetworkAdapterModuleException, match="ip: command not found"):
+            execute_ip_batch(connection, ["cmd1"])
+
+    def test_execute_ip_batch_no_commands(self, connection):
+        connection.execute_command.reset_mock()
+        assert execute_ip_batch(connection, []) == {}
+        connection.execute_command.assert_not_called()
+
+    def test_execute_tunnel_batch(self, connection):
+        stderr = dedent(
+            """\
+            RTNETLINK answers: File exists
+            Command failed -:1
+            Error: either "local" is duplicate, or "up" is garbage.
+            Command failed -:2
+            """
+        )
+        connection.execute_command.reset_mock()
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=1, args="command", stdout="", stderr=stderr),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+        ]
+        tunnels = [
+            TunnelSpec(name="vx0"),
+            TunnelSpec(name="vx1", namespace_name="ns1"),
+            TunnelSpec(name="vx2"),
+        ]
+        errors = execute_tunnel_batch(
+            connection,
+            tunnels,
+            lambda tunnel: [f"link add {tunnel.name}", f"link set {tunnel.name} up"],
+            skipped_errors=("File exists",),
+        )
+        connection.execute_command.side_effect = None
+        assert errors == {(None, "vx0"): 'link set vx0 up: Error: either "local" is duplicate, or "up" is garbage.'}
+        assert connection.execute_command.call_args_list == [
+            call(
+                "ip -force -batch -",
+                input_data="link add vx0\nlink set vx0 up\nlink add vx2\nlink set vx2 up\n",
+                expected_return_codes=None,
+            ),
+            call(
+                "ip netns exec ns1 ip -force -batch -",
+                input_data="link add vx1\nlink set vx1 up\n",
+                expected_return_codes=None,
+            ),
+        ]
+
+    def test_execute_tunnel_batch_same_name_in_namespaces(self, connection):
+        connection.execute_command.reset_mock()
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                return_code=1, args="command", stdout="", stderr="Error: argument is wrong.\nCommand failed -:2\n"
+            ),
+            ConnectionCompletedProcess(
+                return_code=1, args="command", stdout="", stderr="RTNETLINK answers: File exists\nCommand failed -:2\n"
+            ),
+        ]
+        errors = execute_tunnel_batch(
+            connection,
+            [TunnelSpec(name="vx0", namespace_name="ns1"), TunnelSpec(name="vx0", namespace_name="ns2")],
+            lambda tunnel: [f"link add {tunnel.name}", f"addr add 10.0.0.1/24 dev {tunnel.name}"],
+            skipped_errors=("File exists",),
+        )
+        connection.execute_command.side_effect = None
+        assert errors == {
+            ("ns1", "vx0"): "addr add 10.0.0.1/24 dev vx0: Error: argument is wrong.",
+            ("ns2", "vx0"): "addr add 10.0.0.1/24 dev vx0: RTNETLINK answers: File exists",
+        }
+
+    def test_delete_tunnel_batch(self, connection):
+        connection.execute_command.reset_mock()
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="", stderr='Cannot find device "vx0"\nCommand failed -:1\n'
+        )
+        assert delete_tunnel_batch(connection, [TunnelSpec(name="vx0"), TunnelSpec(name="vx1")]) == {}
+        connection.execute_command.assert_called_once_with(
+            "ip -force -batch -", input_data="link del vx0\nlink del vx1\n", expected_return_codes=None
+        )
+
+    def test_execute_tunnel_batch_raises_exception(self, connection):
+        connection.execute_command.reset_mock()
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="", stderr='Cannot find device "vx0"\nCommand failed -:1\n'
+        )
+        with pytest.raises(
+            NetworkAdapterModuleException,
+            match=r"Failed to delete tunnels:\nvx0 \(namespace ns1\): link del vx0: Cannot",
+        ):
+            execute_tunnel_batch(
+                connection,
+                [TunnelSpec(name="vx0", namespace_name="ns1")],
+                lambda tunnel: [f"link del {tunnel.name}"],
+                exception=NetworkAdapterModuleException,
+                action="delete tunnels",
+            )
+
+    def test_parse_ethtool_settings(self):
+        output = dedent(
+            """\
+            Channel parameters for eth1:
+            Pre-set maximums:
+            RX:\t\tn/a
+            TX:\t\tn/a
+            Other:\t\t1
+            Combined:\t64
+            Current hardware settings:
+            RX:\t\tn/a
+            TX:\t\tn/a
+            Other:\t\t1
+            Combined:\t8
+            """
+        )
+        assert parse_ethtool_settings(output, ChannelSettings) == ChannelSettings(
+            maximum=Channels(other=1, combined=64), current=Channels(other=1, combined=8)
+        )
+
+    def test_parse_ethtool_settings_not_available(self):
+        assert parse_ethtool_settings("netlink error: Operation not supported", RingBufferSettings) is None
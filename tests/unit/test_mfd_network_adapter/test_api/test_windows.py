@@ -6,7 +6,7 @@ from unittest import mock
 import pytest
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
-from mfd_network_adapter.api.basic.windows import get_logical_processors_count
+from mfd_network_adapter.api.basic.windows import execute_powershell_json, get_logical_processors_count
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 
 
@@ -37,3 +37,33 @@ class TestWindowsAPI:
         )
         with pytest.raises(NetworkAdapterModuleException, match="Failed to fetch the logical processors count"):
             get_logical_processors_count(connection=connection)
+
+    def test_execute_powershell_json(self, connection):
+        connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout='{"adapters":[{"Name":"Ethernet 1"},{"Name":"Ethernet 2"}],"vlans":{"VlanID":5},"empty":[]}\n',
+            stderr="",
+        )
+        result = execute_powershell_json(
+            connection,
+            {"adapters": "Get-NetAdapter | Select Name", "vlans": "Get-NetAdapter | Select VlanID", "empty": "x"},
+        )
+        assert result == {
+            "adapters": [{"Name": "Ethernet 1"}, {"Name": "Ethernet 2"}],
+            "vlans": [{"VlanID": 5}],
+            "empty": [],
+        }
+        connection.execute_powershell.assert_called_with(
+            "@{ 'adapters' = @(try { Get-NetAdapter | Select Name } catch { }); "
+            "'vlans' = @(try { Get-NetAdapter | Select VlanID } catch { }); "
+            "'empty' = @(try { x } catch { }) } | ConvertTo-Json -Depth 4 -Compress",
+            expected_return_codes={0},
+        )
+
+    def test_execute_powershell_json_invalid_output(self, connection):
+        connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="Name : Ethernet 1", stderr=""
+        )
+        with pytest.raises(NetworkAdapterModuleException, match="Cannot parse PowerShell JSON output"):
+            execute_powershell_json(connection, {"adapters": "Get-NetAdapter | Select Name"})
@@ -0,0 +1,19 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_const import DEVICE_IDS, SPEED_IDS
+
+from mfd_network_adapter.const import FAMILIES_BY_DEVICE_ID, SPEEDS_BY_DEVICE_ID, _build_device_id_index
+
+
+class TestDeviceIdIndex:
+    def test_build_device_id_index(self):
+        index = _build_device_id_index({"FVL": ["0x1572", "0x154C"], "VF": ["0x154C", "0x154C"]})
+        assert dict(index) == {0x1572: ("FVL",), 0x154C: ("FVL", "VF")}
+        with pytest.raises(TypeError):
+            index[0x1592] = ("CVL",)
+
+    def test_index_covers_consts(self):
+        for families_or_speeds, index in ((DEVICE_IDS, FAMILIES_BY_DEVICE_ID), (SPEED_IDS, SPEEDS_BY_DEVICE_ID)):
+            for key, device_ids in families_or_speeds.items():
+                assert all(key in index[int(device_id, 16)] for device_id in device_ids)
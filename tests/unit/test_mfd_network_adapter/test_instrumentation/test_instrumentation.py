@@ -0,0 +1,106 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+import sys
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.instrumentation import RPCRecorder, record_rpc_calls, UNATTRIBUTED_API
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+
+
+class TestRPCRecorder:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout="out\n")
+        mocker.patch("mfd_network_adapter.network_adapter_owner.linux.time.sleep")
+        yield LinuxNetworkAdapterOwner(connection=connection)
+
+    def test_calls_attributed_to_outermost_public_api(self, owner):
+        with record_rpc_calls(owner._connection) as recorder:
+            owner.reload_driver_module(driver_name="ice", reload_time=0)
+            owner.unload_driver_module(driver_name="ice")
+        assert [(record.api, record.command) for record in recorder.records] == [
+            ("LinuxNetworkAdapterOwner.reload_driver_module", "modprobe -r ice"),
+            ("LinuxNetworkAdapterOwner.reload_driver_module", "modprobe ice"),
+            ("LinuxNetworkAdapterOwner.unload_driver_module", "modprobe -r ice"),
+        ]
+        assert all(record.stdout_bytes == 4 and record.return_code == 0 for record in recorder.records)
+        assert all(record.parse_time is not None for record in recorder.records)
+        assert recorder.redundant_commands() == {"modprobe -r ice": 2}
+
+    def test_parse_time_ends_when_api_returns(self, owner):
+        with record_rpc_calls(owner._connection) as recorder:
+            for _ in range(2):
+                owner.unload_driver_module(driver_name="ice")
+                assert sys.getprofile() is None
+                time.sleep(0.05)
+        assert len(recorder.records) == 2
+        assert all(record.parse_time is not None and record.parse_time < 0.05 for record in recorder.records)
+
+    def test_parse_time_not_measured_with_other_profiler(self, owner):
+        def profiler(frame, event, arg):
+            pass
+
+        sys.setprofile(profiler)
+        try:
+            with record_rpc_calls(owner._connection) as recorder:
+                owner.unload_driver_module(driver_name="ice")
+            assert sys.getprofile() is profiler
+        finally:
+            sys.setprofile(None)
+        assert recorder.records[0].parse_time is None
+
+    def test_connection_restored(self, owner):
+        original = owner._connection.execute_command
+        with record_rpc_calls(owner._connection):
+            assert owner._connection.execute_command is not original
+        assert owner._connection.execute_command is original
+        owner._connection.execute_command("ls")
+        original.assert_called_once_with("ls")
+
+    def test_call_outside_package_and_failed_call(self, owner):
+        owner._connection.execute_command.side_effect = [None, RuntimeError("connection lost")]
+        with record_rpc_calls(owner._connection) as recorder:
+            owner._connection.execute_command(command="ls")
+            with pytest.raises(RuntimeError):
+                owner._connection.execute_command("ls")
+        assert [(record.api, record.stdout_bytes, record.return_code) for record in recorder.records] == [
+            (UNATTRIBUTED_API, 0, None),
+            (UNATTRIBUTED_API, 0, None),
+        ]
+
+    def test_summary_report_and_dumps(self, owner, tmp_path):
+        recorder = RPCRecorder()
+        with record_rpc_calls(owner._connection, recorder):
+            owner.reload_driver_module(driver_name="ice", reload_time=0)
+            owner.load_driver_module(driver_name="ice")
+        summary = recorder.summary()
+        assert list(summary) == [
+            "LinuxNetworkAdapterOwner.reload_driver_module",
+            "LinuxNetworkAdapterOwner.load_driver_module",
+        ]
+        assert summary["LinuxNetworkAdapterOwner.reload_driver_module"].rpc_count == 2
+        assert summary["LinuxNetworkAdapterOwner.reload_driver_module"].stdout_bytes == 8
+        assert summary["LinuxNetworkAdapterOwner.load_driver_module"].redundant_commands == {}
+        assert "Total RPCs: 3" in recorder.report()
+
+        document = json.loads(recorder.to_json(tmp_path / "rpc.json"))
+        assert json.loads((tmp_path / "rpc.json").read_text()) == document
+        assert len(document["calls"]) == 3
+        assert "parse_time" in document["calls"][0]
+        assert document["redundant_commands"] == {"modprobe ice": 2}
+
+        metrics = recorder.to_openmetrics()
+        assert 'mfd_rpc_calls_total{api="LinuxNetworkAdapterOwner.reload_driver_module"} 2' in metrics
+        assert 'mfd_rpc_stdout_bytes_total{api="LinuxNetworkAdapterOwner.load_driver_module"} 4' in metrics
+        assert metrics.endswith("# EOF\n")
+
+        recorder.clear()
+        assert recorder.records == []
@@ -0,0 +1,31 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from mfd_typing import MACAddress, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.network_adapter_owner.data_structures import InterfaceInfoIndex
+
+
+class TestInterfaceInfoIndex:
+    def test_lookups(self):
+        pf = LinuxInterfaceInfo(
+            name="eth0", pci_address=PCIAddress(data="0000:18:00.0"), mac_address=MACAddress("00:00:00:00:00:01")
+        )
+        vport = LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(data="0000:18:00.0"))
+        namespaced = LinuxInterfaceInfo(name="eth0", namespace="ns1")
+        virtual = LinuxInterfaceInfo(name="br0")
+        index = InterfaceInfoIndex([pf, vport, namespaced, virtual])
+        index.add(pf)
+
+        assert index.by_pci_address(PCIAddress(0, 0x18, 0, 0)) == [pf, vport]
+        assert index.by_pci_address(None) == []
+        assert index.by_name("eth0") == [pf, namespaced]
+        assert index.by_names(["br0", "eth0", "eth0"]) == [pf, namespaced, virtual]
+        assert index.by_mac_address("00-00-00-00-00-01") == [pf]
+        assert index.by_mac_address(MACAddress("00:00:00:00:00:02")) == []
+
+    def test_lookup_returns_copy(self):
+        interface = LinuxInterfaceInfo(name="eth0")
+        index = InterfaceInfoIndex([interface])
+        index.by_name("eth0").clear()
+        assert index.by_name("eth0") == [interface]
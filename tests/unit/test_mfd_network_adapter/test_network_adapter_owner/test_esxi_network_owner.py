@@ -82,6 +82,8 @@ class TestESXiNetworkOwner:
         """  # noqa: E501
     )
 
+    output_discovery = f"<<<0\n{output_lspci_n}<<<1\n{output_esxcfg_nics}<<<2\n{output_lspci_p}"
+
     @pytest.fixture()
     def owner(self, mocker):
         conn = mocker.create_autospec(RPyCConnection)
@@ -91,11 +93,9 @@ class TestESXiNetworkOwner:
 
     @pytest.fixture()
     def owner2(self, owner):
-        owner._connection.execute_command.side_effect = [
-            ConnectionCompletedProcess(return_code=0, args="command", stdout=self.output_lspci_n, stderr="stderr"),
-            ConnectionCompletedProcess(return_code=0, args="command", stdout=self.output_lspci_p, stderr="stderr"),
-            ConnectionCompletedProcess(return_code=0, args="command", stdout=self.output_esxcfg_nics, stderr="stderr"),
-        ]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=self.output_discovery, stderr="stderr"
+        )
         return owner
 
     @pytest.fixture()
@@ -255,39 +255,77 @@ class TestESXiNetworkOwner:
         mock_timeout_counter = mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.TimeoutCounter")
         mock_timeout_counter.return_value = False
         mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.sleep")
-        owner._get_esxcfg_nics = mocker.Mock(
-            return_value={
-                interface.pci_address: {
-                    "name": "name",
-                    "mac": "mac",
-                    "branding_string": "branding_string",
-                    "driver": "driver",
-                    "link": LinkState.UP,
-                    "speed": "speed",
-                    "duplex": "duplex",
-                    "mtu": "mtu",
-                }
-            }
-        )
+        owner._get_link_states = mocker.Mock(return_value={interface.pci_address: LinkState.UP})
         owner.wait_for_interfaces_up(interfaces=[interface])
 
     def test_wait_for_interfaces_up_timeout(self, mocker, owner, interface):
         mock_timeout_counter = mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.TimeoutCounter")
         mock_timeout_counter.return_value.__bool__.side_effect = [False, False, False, False, True]
         mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.sleep")
-        owner._get_esxcfg_nics = mocker.Mock(
-            return_value={
-                interface.pci_address: {
-                    "name": "name",
-                    "mac": "mac",
-                    "branding_string": "branding_string",
-                    "driver": "driver",
-                    "link": LinkState.DOWN,
-                    "speed": "speed",
-                    "duplex": "duplex",
-                    "mtu": "mtu",
-                }
-            }
-        )
+        owner._get_link_states = mocker.Mock(return_value={interface.pci_address: LinkState.DOWN})
         with pytest.raises(ESXiInterfacesLinkUpTimeout):
             owner.wait_for_interfaces_up(interfaces=[interface, interface])
+
+    def test_wait_for_interfaces_up_link_flap(self, mocker, owner, interface):
+        mock_timeout_counter = mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.TimeoutCounter")
+        mock_timeout_counter.return_value.__bool__.side_effect = [False, False, False, True]
+        mocker.patch("mfd_network_adapter.network_adapter_owner.esxi.sleep")
+        interface2 = ESXiNetworkInterface(
+            connection=interface._connection,
+            owner=None,
+            interface_info=InterfaceInfo(name="eth1", pci_address=PCIAddress(0, 0, 0, 1)),
+        )
+        owner._get_link_states = mocker.Mock(
+            side_effect=[
+                {interface.pci_address: LinkState.UP, interface2.pci_address: LinkState.DOWN},
+                {interface.pci_address: LinkState.DOWN, interface2.pci_address: LinkState.UP},
+                {interface.pci_address: LinkState.UP, interface2.pci_address: LinkState.UP},
+            ]
+        )
+        owner.wait_for_interfaces_up(interfaces=[interface, interface2])
+        assert owner._get_link_states.call_count == 3
+
+    def test__get_all_interfaces_info_single_command(self, owner2):
+        owner2._get_all_interfaces_info()
+        owner2._connection.execute_command.assert_called_once_with(
+            'echo "<<<0"; lspci -n | grep "Class 0200:"; echo "<<<1"; esxcfg-nics -l; echo "<<<2"; lspci -p',
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test__get_all_interfaces_info_pci_devices_cached(self, owner2):
+        first = owner2._get_all_interfaces_info()
+        owner2._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="command",
+            stdout=f"<<<0\n{self.output_lspci_n}<<<1\n{self.output_esxcfg_nics}",
+        )
+        assert owner2._get_all_interfaces_info() == first
+        assert "lspci -p" not in owner2._connection.execute_command.call_args.args[0]
+        assert owner2._connection.execute_command.call_count == 2
+
+    def test__get_all_interfaces_info_new_device_refreshes_pci_devices(self, owner2):
+        owner2._pci_devices = {PCIAddress(domain=0, bus=0x31, slot=0, func=0): PCIDevice("8086", "1521", "0", "0")}
+        owner2._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout=f"<<<0\n{self.output_lspci_n}<<<1\n{self.output_esxcfg_nics}",
+            ),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=self.output_lspci_p),
+        ]
+        assert len(owner2._get_all_interfaces_info()) == 16
+        owner2._connection.execute_command.assert_called_with("lspci -p", shell=True)
+        assert len(owner2._pci_devices) == 16
+
+    def test__get_link_states(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="0000:4b:00.0 Up\n0000:98:00.1 Down\n"
+        )
+        assert owner._get_link_states() == {
+            PCIAddress(domain=0, bus=0x4B, slot=0, func=0): LinkState.UP,
+            PCIAddress(domain=0, bus=0x98, slot=0, func=1): LinkState.DOWN,
+        }
+        owner._connection.execute_command.assert_called_once_with(
+            "esxcfg-nics -l | awk 'NR>1 {print $2, $4}'", shell=True
+        )
@@ -3,6 +3,7 @@
 """Test ARP Linux."""
 
 import ipaddress
+import json
 from ipaddress import IPv4Interface, IPv6Interface
 from textwrap import dedent
 
@@ -15,6 +16,7 @@ from mfd_typing.network_interface import LinuxInterfaceInfo
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 
 from mfd_network_adapter import NetworkInterface
+from mfd_network_adapter.network_adapter_owner.exceptions import ARPFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 ip_arp_table_output_ipv4 = dedent(
@@ -191,3 +193,84 @@ class TestLinuxARP:
         output = owner.arp.check_arp_response_state(interface=interface)
         owner._connection.execute_command.assert_called_with("ip link show interface")
         assert output is State.ENABLED
+
+    def test_get_neighbor_table(self, owner):
+        output = [
+            {"dst": "10.10.10.10", "dev": "br0", "lladdr": "AA:00:00:00:00:01", "state": ["REACHABLE"]},
+            {"dst": "10.10.10.11", "dev": "br0", "lladdr": "aa:00:00:00:00:02", "state": ["DELAY"]},
+            {"dst": "10.10.10.12", "dev": "br0", "state": ["FAILED"]},
+        ]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=json.dumps(output), stderr=""
+        )
+        assert owner.arp.get_neighbor_table() == {
+            int(ipaddress.ip_address("10.10.10.10")): MACAddress("aa:00:00:00:00:01"),
+            int(ipaddress.ip_address("10.10.10.11")): MACAddress("aa:00:00:00:00:02"),
+        }
+        owner._connection.execute_command.assert_called_once_with("ip -j -4 neigh show nud reachable nud delay")
+
+    def test_get_neighbor_table_interface(self, owner):
+        interface = NetworkInterface(
+            connection=owner._connection, interface_info=LinuxInterfaceInfo(name="eth1", namespace="ns1")
+        )
+        output = [{"dst": "fe80::1", "dev": "eth1", "lladdr": "aa:00:00:00:00:01", "state": ["PERMANENT"]}]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=json.dumps(output), stderr=""
+        )
+        assert owner.arp.get_neighbor_table(ip_ver=IPVersion.V6, allowed_states=["PERMANENT"], interface=interface) == {
+            int(ipaddress.ip_address("fe80::1")): MACAddress("aa:00:00:00:00:01")
+        }
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 ip -j -6 neigh show dev eth1 nud permanent"
+        )
+
+    def test_refresh_neighbor_table(self, owner):
+        output = [
+            {"dst": "10.10.10.10", "dev": "br0", "lladdr": "aa:00:00:00:00:01", "state": ["REACHABLE"]},
+            {"dst": "10.10.10.11", "dev": "br0", "lladdr": "aa:00:00:00:00:03", "state": ["REACHABLE"]},
+        ]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=json.dumps(output), stderr=""
+        )
+        first, second = int(ipaddress.ip_address("10.10.10.10")), int(ipaddress.ip_address("10.10.10.11"))
+        table = {first: MACAddress("aa:00:00:00:00:01"), second: MACAddress("aa:00:00:00:00:02")}
+        assert owner.arp.refresh_neighbor_table(table) == {second}
+        assert table[second] == MACAddress("aa:00:00:00:00:03")
+
+    def test_add_arp_entries(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.arp.linux.execute_ip_batch",
+            return_value={1: "RTNETLINK answers: File exists"},
+        )
+        interface = NetworkInterface(connection=owner._connection, interface_info=LinuxInterfaceInfo(name="eth1"))
+        owner.arp.add_arp_entries(
+            {
+                interface: {
+                    IPv4Interface("10.0.0.1/24"): MACAddress("00:00:00:00:00:01"),
+                    IPv6Interface("fe80::1/64"): MACAddress("00:00:00:00:00:02"),
+                }
+            }
+        )
+        batch_mock.assert_called_once_with(
+            owner._connection,
+            [
+                "neigh add 10.0.0.1 lladdr 00:00:00:00:00:01 dev eth1",
+                "neigh add fe80::1 lladdr 00:00:00:00:00:02 dev eth1",
+            ],
+            namespace=None,
+        )
+
+    def test_del_arp_entries(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.arp.linux.execute_ip_batch",
+            return_value={0: "RTNETLINK answers: Invalid argument"},
+        )
+        interface = NetworkInterface(
+            connection=owner._connection, interface_info=LinuxInterfaceInfo(name="eth1", namespace="ns1")
+        )
+        with pytest.raises(ARPFeatureException) as exc:
+            owner.arp.del_arp_entries({interface: {IPv4Interface("10.0.0.1/24"): MACAddress("00:00:00:00:00:01")}})
+        assert "Invalid argument" in exc.value.stderr
+        batch_mock.assert_called_once_with(
+            owner._connection, ["neigh del 10.0.0.1 lladdr 00:00:00:00:00:01 dev eth1"], namespace="ns1"
+        )
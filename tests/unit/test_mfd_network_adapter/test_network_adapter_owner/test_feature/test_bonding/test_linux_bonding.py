@@ -12,6 +12,8 @@ from mfd_ethtool import Ethtool
 from mfd_typing import OSName, PCIAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
+from mfd_network_adapter.network_adapter_owner.exceptions import BondingFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.bonding.data_structures import BondSpec, FailoverResult
 from mfd_network_adapter.network_adapter_owner.feature.bonding.linux import BondingParams
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
@@ -200,3 +202,96 @@ class TestLinuxBonding:
         )
         assert owner.bonding.get_children(interface) == ["eth3", "eth4"]
         owner._connection.execute_command.assert_called_with(f"cat /sys/class/net/{interface.name}/bonding/slaves")
+
+    def test_get_all_children(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="bond0: eth0 eth1\nbond1: \n"
+        )
+        assert owner.bonding.get_all_children() == {"bond0": ["eth0", "eth1"], "bond1": []}
+        assert owner._connection.execute_command.call_count == 1
+
+    def test_get_all_children_no_bonding(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr="No such file or directory"
+        )
+        assert owner.bonding.get_all_children() == {}
+
+    def test_create_bonds(self, owner, interface, interface_2, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.bonding.linux.execute_ip_batch", return_value={}
+        )
+        owner.get_interfaces = mocker.Mock(return_value=[interface, interface_2])
+        bonds = [
+            BondSpec(
+                name="eth2",
+                children=["eth3", "eth4"],
+                params={BondingParams.MODE: "active-backup", BondingParams.MIIMON: 100},
+                active_child="eth4",
+            ),
+            BondSpec(name="eth0"),
+        ]
+        assert owner.bonding.create_bonds(bonds) == [interface_2, interface]
+        batch_mock.assert_called_once_with(
+            owner._connection,
+            [
+                "link add eth2 type bond mode active-backup miimon 100",
+                "link set dev eth3 down",
+                "link set dev eth3 master eth2",
+                "link set dev eth4 down",
+                "link set dev eth4 master eth2",
+                "link set dev eth2 up",
+                "link set dev eth2 type bond active_slave eth4",
+                "link add eth0 type bond",
+                "link set dev eth0 up",
+            ],
+        )
+        owner.get_interfaces.assert_called_once()
+
+    def test_create_bonds_batch_error(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.bonding.linux.execute_ip_batch",
+            return_value={1: "Cannot find device"},
+        )
+        with pytest.raises(BondingFeatureException, match="link set dev eth3 down: Cannot find device"):
+            owner.bonding.create_bonds([BondSpec(name="bond0", children=["eth3"])])
+
+    def test_create_bonds_not_created(self, owner, interface, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.bonding.linux.execute_ip_batch", return_value={}
+        )
+        owner.get_interfaces = mocker.Mock(return_value=[interface])
+        with pytest.raises(BondingFeatureException, match="bond0 was not created properly"):
+            owner.bonding.create_bonds([BondSpec(name="bond0")])
+
+    def test_measure_failover(self, owner, interface):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="old=eth3\nnew=eth4\nstart=1000000000\nend=1250000000\n"
+        )
+        result = owner.bonding.measure_failover(interface, timeout=5)
+        assert result == FailoverResult(
+            bonding_interface="eth0",
+            previous_active_child="eth3",
+            new_active_child="eth4",
+            start_timestamp_ns=1_000_000_000,
+            end_timestamp_ns=1_250_000_000,
+        )
+        assert result.failover_time == 0.25
+        assert result.failed_over is True
+        command = owner._connection.execute_command.call_args.args[0]
+        assert "cat /sys/class/net/eth0/bonding/active_slave" in command
+        assert "-gt 5000000000" in command
+        assert 'ip link set dev "$old" up' in command
+
+    def test_measure_failover_timeout(self, owner, interface):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="old=eth3\nnew=\nstart=1000000000\nend=11000000000\n"
+        )
+        result = owner.bonding.measure_failover(interface, restore_child=False)
+        assert result.new_active_child is None
+        assert result.failed_over is False
+        assert 'ip link set dev "$old" up' not in owner._connection.execute_command.call_args.args[0]
+
+    def test_measure_failover_no_active_child(self, owner, interface):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=1, args="", stdout="")
+        with pytest.raises(BondingFeatureException, match="has no active child"):
+            owner.bonding.measure_failover(interface)
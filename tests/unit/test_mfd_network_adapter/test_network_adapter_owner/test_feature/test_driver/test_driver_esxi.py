@@ -144,3 +144,13 @@ class TestESXiDriver:
             owner.driver.wait_for_all_interfaces_load("test_driver")
 
         owner._get_esxcfg_nics.assert_called()
+
+    @pytest.mark.parametrize("method", ["load_module", "unload_module"])
+    def test_module_change_clears_interfaces_cache(self, owner, interface, mocker, method):
+        owner.driver._package_manager = mocker.Mock()
+        owner._created_interfaces.add(interface)
+        interface.driver._driver_info = mocker.Mock()
+        interface.ens._ens_settings = mocker.Mock()
+        getattr(owner.driver, method)(module_name="icen")
+        assert interface.driver._driver_info is None
+        assert interface.ens._ens_settings is None
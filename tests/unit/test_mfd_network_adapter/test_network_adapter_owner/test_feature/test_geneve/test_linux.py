@@ -11,6 +11,7 @@ from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
 from mfd_network_adapter.network_adapter_owner.exceptions import GeneveFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
@@ -187,3 +188,34 @@ class TestLinuxGeneve:
                 vni=42,
                 dstport=6083,
             )
+
+    def test_create_setup_geneve_tunnels(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="", stderr=""
+        )
+        tunnels = [
+            TunnelSpec(name="gnv0", vni=10, remote_ip_addr=IPv6Interface("fe80::1/64"), dstport=6081),
+            TunnelSpec(name="gnv1", vni=11, remote_ip_addr=IPv4Interface("10.10.10.2/24"), namespace_name="ns1"),
+        ]
+        assert owner.geneve.create_setup_geneve_tunnels(tunnels) == {}
+        owner._connection.execute_command.assert_has_calls(
+            [
+                call(
+                    "ip -force -batch -",
+                    input_data="link add gnv0 type geneve remote fe80::1 id 10 dstport 6081\nlink set gnv0 up\n",
+                    expected_return_codes=None,
+                ),
+                call(
+                    "ip netns exec ns1 ip -force -batch -",
+                    input_data="link add gnv1 type geneve remote 10.10.10.2 id 11\nlink set gnv1 up\n",
+                    expected_return_codes=None,
+                ),
+            ]
+        )
+
+    def test_delete_geneve_tunnels_failure(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr="RTNETLINK answers: Operation not permitted\nCommand failed -:1\n"
+        )
+        with pytest.raises(GeneveFeatureException, match="gnv0: link del gnv0: RTNETLINK answers: Operation not"):
+            owner.geneve.delete_geneve_tunnels([TunnelSpec(name="gnv0")])
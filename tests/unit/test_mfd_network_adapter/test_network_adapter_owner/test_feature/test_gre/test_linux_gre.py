@@ -9,6 +9,7 @@ from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
 from mfd_network_adapter.network_adapter_owner.exceptions import GREFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
@@ -76,3 +77,30 @@ class TestLinuxGRE:
         )
         with pytest.raises(GREFeatureException):
             owner.gre.delete_gre(gre_tunnel_name="gre1", namespace_name=None)
+
+    def test_create_setup_gres(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="", stderr=""
+        )
+        tunnel = TunnelSpec(
+            name="gre1",
+            local_ip_addr=IPv4Interface("192.168.1.1/24"),
+            remote_ip_addr=IPv4Interface("192.168.2.1/24"),
+            interface_name="eth0",
+            key_id=1234,
+            ip_addr=IPv4Interface("10.0.0.1/24"),
+        )
+        assert owner.gre.create_setup_gres([tunnel]) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip -force -batch -",
+            input_data="link add gre1 type gretap local 192.168.1.1 remote 192.168.2.1 key 1234 dev eth0\n"
+            "link set gre1 up\naddr add 10.0.0.1/24 dev gre1\n",
+            expected_return_codes=None,
+        )
+
+    def test_create_setup_gres_raises_exception_on_existing_tunnel(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr="RTNETLINK answers: File exists\nCommand failed -:1\n"
+        )
+        with pytest.raises(GREFeatureException, match="gre1: link add gre1"):
+            owner.gre.create_setup_gres([TunnelSpec(name="gre1")])
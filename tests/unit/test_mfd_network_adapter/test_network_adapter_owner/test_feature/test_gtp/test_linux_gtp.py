@@ -8,6 +8,7 @@ from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
 from mfd_network_adapter.network_adapter_owner.exceptions import GTPFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
@@ -67,3 +68,18 @@ class TestLinuxGTP:
         )
         with pytest.raises(GTPFeatureException):
             owner.gtp.delete_gtp_tunnel(tunnel_name="gtp1", namespace_name=None)
+
+    def test_create_setup_and_delete_gtp_tunnels(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="", stderr=""
+        )
+        tunnels = [TunnelSpec(name="gtp0"), TunnelSpec(name="gtp1", role="ggsn")]
+        assert owner.gtp.create_setup_gtp_tunnels(tunnels) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip -force -batch -",
+            input_data="link add gtp0 type gtp role sgsn\nlink set gtp0 up\n"
+            "link add gtp1 type gtp role ggsn\nlink set gtp1 up\n",
+            expected_return_codes=None,
+        )
+        assert owner.gtp.delete_gtp_tunnels(tunnels) == {}
+        assert owner._connection.execute_command.call_args.kwargs["input_data"] == "link del gtp0\nlink del gtp1\n"
@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Interrupt FreeBSD."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.exceptions import InterruptFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.interrupt.data_structures import IrqRateSample
+from mfd_network_adapter.network_adapter_owner.freebsd import FreeBSDNetworkAdapterOwner
+
+
+class TestFreeBSDInterrupt:
+    output = dedent(
+        """\
+        @@@ 1700000000
+        interrupt                          total       rate
+        irq264: ixl0:aq                       10          0
+        irq265: ixl0:rxq0                 500000         10
+        irq266: ixl1:rxq0                 400000         10
+        irq270: em0:irq0                    1234          1
+        Total                             901244         21
+        @@@ 1700000001
+        interrupt                          total       rate
+        irq264: ixl0:aq                        0          0
+        irq265: ixl0:rxq0                   2000       2000
+        irq266: ixl1:rxq0                   1500       1500
+        irq270: em0:irq0                       3          3
+        Total                               3503       3503
+        @@@ 1700000002
+        interrupt                          total       rate
+        irq264: ixl0:aq                        0          0
+        irq265: ixl0:rxq0                   2500       2500
+        """
+    )
+
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.FREEBSD
+        yield FreeBSDNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    def test_start_interrupt_rate_collector(self, owner):
+        collector = owner.interrupt.start_interrupt_rate_collector(interface_names=["ixl0"], interval=2)
+        command = owner._connection.start_process.call_args.args[0]
+        assert command.startswith("stdbuf -oL vmstat -ia -w2 |")
+        assert command.endswith("> /tmp/vmstat_interrupts.log 2>&1")
+        assert collector.process is owner._connection.start_process.return_value
+        assert collector.interface_names == ["ixl0"]
+
+    def test_get_interrupt_rate_series(self, owner):
+        collector = owner.interrupt.start_interrupt_rate_collector(interface_names=["ixl0", "ixl1"])
+        partial_output = self.output + "irq266: ixl1:rx"
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=partial_output
+        )
+        assert owner.interrupt.get_interrupt_rate_series(collector) == {
+            "ixl0": {
+                "aq": [IrqRateSample(1700000001, 0, 0), IrqRateSample(1700000002, 0, 0)],
+                "rxq0": [IrqRateSample(1700000001, 2000, 2000), IrqRateSample(1700000002, 2500, 2500)],
+            },
+            "ixl1": {"rxq0": [IrqRateSample(1700000001, 1500, 1500)]},
+        }
+        assert collector.offset == len(self.output)
+        owner._connection.execute_command.assert_called_once_with(
+            "tail -c +1 /tmp/vmstat_interrupts.log", expected_return_codes=None
+        )
+
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout="irq266: ixl1:rxq0                   1800       1800\n"
+        )
+        series = owner.interrupt.get_interrupt_rate_series(collector)
+        assert series["ixl1"]["rxq0"][-1] == IrqRateSample(1700000002, 1800, 1800)
+        assert owner._connection.execute_command.call_args.args[0] == (
+            f"tail -c +{len(self.output) + 1} /tmp/vmstat_interrupts.log"
+        )
+
+    def test_stop_interrupt_rate_collector(self, owner):
+        collector = owner.interrupt.start_interrupt_rate_collector()
+        collector.process.running = True
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=self.output
+        )
+        series = owner.interrupt.stop_interrupt_rate_collector(collector)
+        collector.process.kill.assert_called_once()
+        assert set(series) == {"ixl0", "ixl1", "em0"}
+        assert owner._connection.execute_command.call_args.args[0] == "rm -f /tmp/vmstat_interrupts.log"
+
+    def test_stop_interrupt_rate_collector_no_output(self, owner):
+        collector = owner.interrupt.start_interrupt_rate_collector()
+        collector.process.running = False
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=1, stdout="")
+        with pytest.raises(InterruptFeatureException):
+            owner.interrupt.stop_interrupt_rate_collector(collector)
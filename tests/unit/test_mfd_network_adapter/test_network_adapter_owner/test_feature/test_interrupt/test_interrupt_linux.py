@@ -0,0 +1,121 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Interrupt Linux."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.exceptions import InterruptFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.interrupt.data_structures import (
+    CoalescingSetting,
+    CoalescingSweepResult,
+)
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+
+PROC_INTERRUPTS = dedent(
+    """\
+                CPU0       CPU1
+     98:  {0:>10} {1:>10}  IR-PCI-MSIX-0000:5e:00.0    1-edge      ice-eth1-TxRx-0
+     99:  {2:>10} {3:>10}  IR-PCI-MSIX-0000:5e:00.0    2-edge      ice-eth1-TxRx-1
+    100:  {4:>10} {4:>10}  IR-PCI-MSIX-0000:5e:00.1    1-edge      ice-eth10-TxRx-0
+    """
+)
+ETHTOOL_STATS = dedent(
+    """\
+    NIC statistics:
+         rx_unicast: 100
+         rx_queue_0_packets: {0}
+         rx_queue_1_packets: {1}
+         tx_queue_0_packets: {2}
+         tx_queue_1_packets: {3}
+    """
+)
+
+
+def _sweep_output(apply: str = "rc=0") -> str:
+    sections = [
+        apply,
+        "1700000000.000000000\n" + PROC_INTERRUPTS.format(100, 200, 300, 400, 5),
+        ETHTOOL_STATS.format(1000, 2000, 10, 20),
+        "1700000005.000000000\n" + PROC_INTERRUPTS.format(600, 700, 800, 900, 50),
+        ETHTOOL_STATS.format(6000, 9000, 510, 520),
+    ]
+    return "".join(f"<<<{index}\n{output.rstrip()}\n" for index, output in enumerate(sections))
+
+
+class TestLinuxInterrupt:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    def test_get_coalescing_grid(self, owner):
+        assert owner.interrupt.get_coalescing_grid(rx_usecs=[0, 50], adaptive=[True, False]) == [
+            CoalescingSetting(adaptive_rx=True, adaptive_tx=True),
+            CoalescingSetting(rx_usecs=0, tx_usecs=0, adaptive_rx=False, adaptive_tx=False),
+            CoalescingSetting(rx_usecs=50, tx_usecs=50, adaptive_rx=False, adaptive_tx=False),
+        ]
+        assert len(owner.interrupt.get_coalescing_grid(rx_usecs=[0, 50], tx_usecs=[10, 20, 30])) == 6
+
+    def test_coalescing_setting_ethtool_options(self):
+        assert CoalescingSetting(rx_usecs=50, adaptive_rx=False).ethtool_options == "adaptive-rx off rx-usecs 50"
+        assert CoalescingSetting().ethtool_options == ""
+
+    def test_sweep_coalescing(self, owner):
+        setting = CoalescingSetting(rx_usecs=50, tx_usecs=50, adaptive_rx=False, adaptive_tx=False)
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=_sweep_output()
+        )
+        results = owner.interrupt.sweep_coalescing(["eth1"], [setting], window=5, settle_time=2)
+        assert results == [
+            CoalescingSweepResult(
+                interface_name="eth1",
+                setting=setting,
+                duration=5.0,
+                interrupts=2000,
+                rx_packets={0: 5000, 1: 7000},
+                tx_packets={0: 500, 1: 500},
+            )
+        ]
+        assert results[0].interrupt_rate == 400.0
+        assert results[0].packets_per_interrupt == 6.5
+        owner._connection.execute_command.assert_called_once()
+        assert owner._connection.execute_command.call_args.args[0] == (
+            'echo "<<<0"; ethtool -C eth1 adaptive-rx off adaptive-tx off rx-usecs 50 tx-usecs 50 2>&1; echo rc=$?; '
+            'echo "<<<1"; sleep 2; date +%s.%N; cat /proc/interrupts; echo "<<<2"; ethtool -S eth1 2>/dev/null; '
+            'echo "<<<3"; sleep 5; date +%s.%N; cat /proc/interrupts; echo "<<<4"; ethtool -S eth1 2>/dev/null'
+        )
+
+    def test_sweep_coalescing_namespace(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=_sweep_output()
+        )
+        owner.interrupt.sweep_coalescing(["eth1"], [CoalescingSetting(rx_usecs=10)], namespace="ns1")
+        command = owner._connection.execute_command.call_args.args[0]
+        assert "ip netns exec ns1 ethtool -C eth1 rx-usecs 10 2>&1" in command
+        assert "ip netns exec ns1 ethtool -S eth1 2>/dev/null" in command
+
+    def test_sweep_coalescing_apply_error(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=_sweep_output("netlink error: Operation not supported\nrc=1")
+        )
+        (result,) = owner.interrupt.sweep_coalescing(["eth1"], [CoalescingSetting(tx_usecs=10)])
+        assert result.error == "netlink error: Operation not supported"
+        assert result.interrupts == 2000
+
+    def test_sweep_coalescing_incomplete_output(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout="<<<0\nrc=0\n"
+        )
+        with pytest.raises(InterruptFeatureException, match="Incomplete output"):
+            owner.interrupt.sweep_coalescing(["eth1"], [CoalescingSetting(rx_usecs=10)])
+
+    def test_parse_queue_packets(self, owner):
+        output = "     rx-0.packets: 10\n     tx-1.packets: 20\n     rx0_packets: 30\n     rx_bytes: 40\n"
+        assert owner.interrupt._parse_queue_packets(output) == {"rx": {0: 30}, "tx": {1: 20}}
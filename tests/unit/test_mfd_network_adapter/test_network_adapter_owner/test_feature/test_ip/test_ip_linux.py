@@ -1,13 +1,18 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
+from ipaddress import IPv4Interface, IPv6Interface
+
 import pytest
 from mfd_common_libs import log_levels
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
-from mfd_typing import OSName
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
 
 from mfd_network_adapter.network_adapter_owner.exceptions import IPFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 
 
 class TestLinuxIP:
@@ -207,3 +212,127 @@ class TestLinuxIP:
         # Act & Assert
         with pytest.raises(IPFeatureException):
             owner.ip.rename_interface(current_name, new_name, namespace)
+
+    @pytest.fixture
+    def interfaces(self, owner):
+        return [
+            LinuxNetworkInterface(
+                connection=owner._connection,
+                interface_info=LinuxInterfaceInfo(pci_address=PCIAddress(0, 0, 0, idx), name=name, namespace=namespace),
+            )
+            for idx, (name, namespace) in enumerate([("eth0", None), ("eth1", None), ("eth2", "ns1")])
+        ]
+
+    def test_add_ips_bulk(self, owner, interfaces, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.ip.linux.execute_ip_batch", return_value={}
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="", stderr=""
+        )
+        mapping = {
+            interfaces[0]: [IPv4Interface("1.1.1.1/24"), IPv4Interface("1.1.1.2/24")],
+            interfaces[1]: [IPv4Interface("2.2.2.2/24")],
+            interfaces[2]: [IPv4Interface("3.3.3.3/24")],
+        }
+        owner.ip.add_ips_bulk(mapping)
+        batch_mock.assert_has_calls(
+            [
+                mocker.call(
+                    owner._connection,
+                    [
+                        "link set dev eth0 dynamic off",
+                        "link set dev eth1 dynamic off",
+                        "addr add 1.1.1.1/24 dev eth0",
+                        "addr add 1.1.1.2/24 dev eth0",
+                        "addr add 2.2.2.2/24 dev eth1",
+                    ],
+                    namespace=None,
+                ),
+                mocker.call(
+                    owner._connection,
+                    ["link set dev eth2 dynamic off", "addr add 3.3.3.3/24 dev eth2"],
+                    namespace="ns1",
+                ),
+            ]
+        )
+        owner._connection.execute_command.assert_not_called()
+
+    def test_add_ips_bulk_errors(self, owner, interfaces, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.ip.linux.execute_ip_batch",
+            return_value={0: "Cannot find device", 1: "RTNETLINK answers: File exists", 2: "Error: Invalid prefix"},
+        )
+        mapping = {interfaces[0]: [IPv4Interface("1.1.1.1/24"), IPv4Interface("1.1.1.2/24")]}
+        with pytest.raises(IPFeatureException, match="addr add 1.1.1.2/24 dev eth0: Error: Invalid prefix"):
+            owner.ip.add_ips_bulk(mapping)
+
+    def test_add_ips_bulk_ipv6_waits_for_dad(self, owner, interfaces, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.feature.ip.linux.execute_ip_batch", return_value={})
+        sleep_mock = mocker.patch("mfd_network_adapter.network_adapter_owner.feature.ip.linux.sleep")
+        tentative = [{"ifname": "eth0", "addr_info": [{"local": "fe80::1", "prefixlen": 64, "tentative": True}]}]
+        ready = [{"ifname": "eth0", "addr_info": [{"local": "fe80::1", "prefixlen": 64}]}]
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout="", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=json.dumps(tentative), stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=json.dumps(ready), stderr=""),
+        ]
+        owner.ip.add_ips_bulk({interfaces[0]: [IPv6Interface("fe80::1/64")]})
+        assert owner._connection.execute_command.call_args_list == [
+            mocker.call(
+                "for dev in eth0; do f=/proc/sys/net/ipv6/conf/$dev/keep_addr_on_down; "
+                "if [ -f $f ]; then echo 1 > $f; fi; done",
+                shell=True,
+                expected_return_codes=None,
+            ),
+            mocker.call("ip -j addr show"),
+            mocker.call("ip -j addr show"),
+        ]
+        sleep_mock.assert_called_once_with(1)
+
+    def test_wait_till_tentative_exit_bulk_not_found(self, owner, interfaces):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="[]", stderr=""
+        )
+        with pytest.raises(IPFeatureException, match="Not found fe80::1 on eth0"):
+            owner.ip.wait_till_tentative_exit_bulk({interfaces[0]: [IPv6Interface("fe80::1/64")]})
+
+    def test_wait_till_tentative_exit_bulk_dad_failed(self, owner, interfaces):
+        output = [{"ifname": "eth2", "addr_info": [{"local": "fe80::2", "tentative": True, "dadfailed": True}]}]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=json.dumps(output), stderr=""
+        )
+        with pytest.raises(IPFeatureException, match="Duplicate address detection failed"):
+            owner.ip.wait_till_tentative_exit_bulk({interfaces[2]: [IPv6Interface("fe80::2/64")]})
+        owner._connection.execute_command.assert_called_once_with("ip netns exec ns1 ip -j addr show")
+
+    def test_wait_till_tentative_exit_bulk_timeout(self, owner, interfaces, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.feature.ip.linux.sleep")
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.ip.linux.TimeoutCounter.__bool__",
+            side_effect=[False, True],
+        )
+        output = [{"ifname": "eth0", "addr_info": [{"local": "fe80::1", "tentative": True}]}]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=json.dumps(output), stderr=""
+        )
+        with pytest.raises(IPFeatureException, match="fe80::1 on eth0 still in tentative mode after 5s"):
+            owner.ip.wait_till_tentative_exit_bulk({interfaces[0]: [IPv6Interface("fe80::1/64")]}, timeout=5)
+
+    def test_del_ips_bulk(self, owner, interfaces, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.ip.linux.execute_ip_batch",
+            return_value={1: "RTNETLINK answers: Cannot assign requested address"},
+        )
+        owner.ip.del_ips_bulk({interfaces[0]: [IPv4Interface("1.1.1.1/24"), IPv6Interface("fe80::1/64")]})
+        batch_mock.assert_called_once_with(
+            owner._connection, ["addr del 1.1.1.1/24 dev eth0", "addr del fe80::1/64 dev eth0"], namespace=None
+        )
+
+    def test_del_ips_bulk_error(self, owner, interfaces, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.ip.linux.execute_ip_batch",
+            return_value={0: "Cannot find device"},
+        )
+        with pytest.raises(IPFeatureException, match="Cannot find device"):
+            owner.ip.del_ips_bulk({interfaces[0]: [IPv4Interface("1.1.1.1/24")]})
@@ -1,12 +1,66 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.exceptions import QueueFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.queue.data_structures import QueueSettings, QueueSettingsTarget
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.data_structures import (
+    Channels,
+    ChannelSettings,
+    RingBuffer,
+    RingBufferSettings,
+)
+
+RINGS_OUTPUT = dedent(
+    """\
+    Ring parameters for {name}:
+    Pre-set maximums:
+    RX:\t\t8192
+    RX Mini:\tn/a
+    RX Jumbo:\tn/a
+    TX:\t\t8192
+    Current hardware settings:
+    RX:\t\t{rx}
+    RX Mini:\tn/a
+    RX Jumbo:\tn/a
+    TX:\t\t1024
+    RX Buf Len:\tn/a
+    """
+)
+CHANNELS_OUTPUT = dedent(
+    """\
+    Channel parameters for eth1:
+    Pre-set maximums:
+    RX:\t\t64
+    TX:\t\t64
+    Other:\t\t1
+    Combined:\t64
+    Current hardware settings:
+    RX:\t\t0
+    TX:\t\t0
+    Other:\t\t1
+    Combined:\t8
+    """
+)
+STATS_OUTPUT = dedent(
+    """\
+    NIC statistics:
+         rx_unicast: 1000
+         rx_dropped: {dropped}
+         rx_missed_errors: {missed}
+    """
+)
+
+
+def _sections(*outputs: str) -> ConnectionCompletedProcess:
+    stdout = "".join(f"<<<{index}\n{output.rstrip()}\n" for index, output in enumerate(outputs))
+    return ConnectionCompletedProcess(return_code=0, args="", stdout=stdout, stderr="")
 
 
 class TestLinuxQueue:
@@ -26,3 +80,141 @@ class TestLinuxQueue:
         owner._connection.execute_command.assert_called_once_with(
             "cat /proc/interrupts | grep eth1 | wc -l", shell=True, expected_return_codes={0}
         )
+
+    def test_get_queue_settings(self, owner):
+        owner._connection.execute_command.return_value = _sections(
+            RINGS_OUTPUT.format(name="eth1", rx=512), CHANNELS_OUTPUT
+        )
+        assert owner.queue.get_queue_settings(["eth1"], namespace="ns1") == {
+            "eth1": QueueSettings(
+                rings=RingBufferSettings(maximum=RingBuffer(rx=8192, tx=8192), current=RingBuffer(rx=512, tx=1024)),
+                channels=ChannelSettings(
+                    maximum=Channels(rx=64, tx=64, other=1, combined=64),
+                    current=Channels(rx=0, tx=0, other=1, combined=8),
+                ),
+            )
+        }
+        owner._connection.execute_command.assert_called_once_with(
+            'echo "<<<0"; ip netns exec ns1 ethtool -g eth1 2>/dev/null; '
+            'echo "<<<1"; ip netns exec ns1 ethtool -l eth1 2>/dev/null',
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test_get_queue_settings_not_available(self, owner):
+        owner._connection.execute_command.return_value = _sections("", "")
+        with pytest.raises(QueueFeatureException, match="Cannot read queue settings of eth1"):
+            owner.queue.get_queue_settings(["eth1"])
+
+    def test_set_queue_settings(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="<<<1\nrc=0\n<<<0\nrc=0\nrx unmodified\nrc=80\n", stderr=""
+        )
+        owner.queue.set_queue_settings(
+            {
+                "eth1": QueueSettingsTarget(rings=RingBuffer(rx=4096), channels=Channels(combined=16)),
+                "eth2": QueueSettingsTarget(rings=RingBuffer(rx=4096, tx=4096)),
+                "eth3": QueueSettingsTarget(),
+            }
+        )
+        command = owner._connection.execute_command.call_args.args[0]
+        assert command == (
+            "( out=$(ethtool -L eth1 combined 16 2>&1; echo rc=$?; ethtool -G eth1 rx 4096 2>&1; echo rc=$?); "
+            "printf '<<<%s\\n%s\\n' 0 \"$out\" ) & "
+            "( out=$(ethtool -G eth2 rx 4096 tx 4096 2>&1; echo rc=$?); printf '<<<%s\\n%s\\n' 1 \"$out\" ) & "
+            "wait"
+        )
+
+    def test_set_queue_settings_nothing_to_set(self, owner):
+        owner.queue.set_queue_settings({"eth1": QueueSettingsTarget(rings=RingBuffer())})
+        owner._connection.execute_command.assert_not_called()
+
+    def test_set_queue_settings_failure(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="<<<0\nnetlink error: Invalid argument\nrc=1\n", stderr=""
+        )
+        with pytest.raises(QueueFeatureException, match="ethtool -G eth1 rx 16384: netlink error: Invalid argument"):
+            owner.queue.set_queue_settings({"eth1": QueueSettingsTarget(rings=RingBuffer(rx=16384))})
+
+    def test_recommend_ring_sizes(self, owner):
+        owner._connection.execute_command.return_value = _sections(
+            RINGS_OUTPUT.format(name="eth1", rx=512),
+            RINGS_OUTPUT.format(name="eth2", rx=512),
+            STATS_OUTPUT.format(dropped=10, missed=100),
+            STATS_OUTPUT.format(dropped=0, missed=0),
+            STATS_OUTPUT.format(dropped=15, missed=150),
+            STATS_OUTPUT.format(dropped=0, missed=0),
+        )
+        recommendations = owner.queue.recommend_ring_sizes(["eth1", "eth2"], window=5)
+        assert recommendations["eth1"].recommended == 1024
+        assert recommendations["eth1"].drops == {"rx_dropped": 5, "rx_missed_errors": 50}
+        assert recommendations["eth2"].recommended == 512
+        assert recommendations["eth2"].total_drops == 0
+        owner._connection.execute_command.assert_called_once()
+        command = owner._connection.execute_command.call_args.args[0]
+        assert 'echo "<<<4"; sleep 5; ethtool -S eth1 2>/dev/null' in command
+
+    def test_recommend_ring_sizes_apply(self, owner):
+        owner._connection.execute_command.side_effect = [
+            _sections(
+                RINGS_OUTPUT.format(name="eth1", rx=2048),
+                STATS_OUTPUT.format(dropped=0, missed=0),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+            ),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="<<<0\n\nrc=0\n", stderr=""),
+            _sections(
+                RINGS_OUTPUT.format(name="eth1", rx=4096),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+            ),
+        ]
+        recommendation = owner.queue.recommend_ring_sizes(["eth1"], apply=True)["eth1"]
+        assert recommendation.current == 4096
+        assert recommendation.recommended == 4096
+        assert recommendation.verified is True
+        assert "ethtool -G eth1 rx 4096" in owner._connection.execute_command.call_args_list[1].args[0]
+
+    def test_recommend_ring_sizes_apply_size_not_changed(self, owner):
+        owner._connection.execute_command.side_effect = [
+            _sections(
+                RINGS_OUTPUT.format(name="eth1", rx=2048),
+                STATS_OUTPUT.format(dropped=0, missed=0),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+            ),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="<<<0\nrc=0\n", stderr=""),
+            _sections(
+                RINGS_OUTPUT.format(name="eth1", rx=2048),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+                STATS_OUTPUT.format(dropped=0, missed=20),
+            ),
+        ]
+        recommendation = owner.queue.recommend_ring_sizes(["eth1"], apply=True)["eth1"]
+        assert recommendation.current == 2048
+        assert recommendation.verified is False
+        assert owner._connection.execute_command.call_count == 3
+
+    def test_recommend_ring_sizes_apply_max_iterations(self, owner):
+        measurements = [
+            _sections(
+                RINGS_OUTPUT.format(name="eth1", rx=rx),
+                STATS_OUTPUT.format(dropped=0, missed=0),
+                STATS_OUTPUT.format(dropped=0, missed=10),
+            )
+            for rx in (256, 512)
+        ]
+        applied = ConnectionCompletedProcess(return_code=0, args="", stdout="<<<0\nrc=0\n", stderr="")
+        owner._connection.execute_command.side_effect = [measurements[0], applied, measurements[1]]
+        recommendation = owner.queue.recommend_ring_sizes(["eth1"], apply=True, max_iterations=1)["eth1"]
+        assert recommendation.current == 512
+        assert recommendation.recommended == 1024
+        assert owner._connection.execute_command.call_count == 3
+
+    def test_recommend_ring_sizes_apply_unknown_size(self, owner):
+        owner._connection.execute_command.return_value = _sections(
+            RINGS_OUTPUT.format(name="eth1", rx="n/a"),
+            STATS_OUTPUT.format(dropped=0, missed=0),
+            STATS_OUTPUT.format(dropped=0, missed=10),
+        )
+        recommendation = owner.queue.recommend_ring_sizes(["eth1"], apply=True)["eth1"]
+        assert recommendation.current == 0
+        owner._connection.execute_command.assert_called_once()
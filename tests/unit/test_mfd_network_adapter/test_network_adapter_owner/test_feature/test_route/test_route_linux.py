@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Test Route Linux."""
 
+import json
 from ipaddress import IPv4Interface, IPv4Address
 
 import pytest
@@ -11,7 +12,13 @@ from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_typing import OSName
 
 from mfd_network_adapter.network_adapter_owner.exceptions import RouteFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.route.data_structures import (
+    RouteEntry,
+    RouteTableSnapshot,
+    RouteTableDiff,
+)
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 
 
 class TestLinuxRoute:
@@ -125,3 +132,145 @@ class TestLinuxRoute:
 
         # Assert
         owner._connection.execute_command.assert_called_once_with(command)
+
+    def test_route_entry_to_command_args(self):
+        assert RouteEntry(destination="10.0.0.0/24", device="eth0").to_command_args() == "10.0.0.0/24 dev eth0"
+        route = RouteEntry(
+            destination="10.0.0.0/24",
+            device="eth0",
+            gateway="10.0.1.1",
+            route_type="blackhole",
+            protocol="static",
+            metric=100,
+            table="10",
+            onlink=True,
+        )
+        assert route.to_command_args() == (
+            "blackhole 10.0.0.0/24 via 10.0.1.1 dev eth0 proto static metric 100 table 10 onlink"
+        )
+        route = RouteEntry(destination="default", device="eth0", metric=1024, ip_version=IPVersion.V6)
+        assert route.to_command_args() == "::/0 dev eth0 metric 1024"
+
+    def test_add_routes(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch",
+            return_value={0: "RTNETLINK answers: File exists"},
+        )
+        routes = [
+            RouteEntry(destination="10.0.0.0/24", device="eth0"),
+            RouteEntry(destination="10.0.1.0/24", device="eth0", gateway="10.0.0.1"),
+        ]
+        owner.route.add_routes(routes, namespace="ns1")
+        batch_mock.assert_called_once_with(
+            owner._connection,
+            ["route add 10.0.0.0/24 dev eth0", "route add 10.0.1.0/24 via 10.0.0.1 dev eth0"],
+            namespace="ns1",
+        )
+
+    def test_add_routes_error(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch",
+            return_value={0: "Error: Nexthop has invalid gateway."},
+        )
+        with pytest.raises(RouteFeatureException, match="route add 10.0.1.0/24 via 10.0.0.1: Error: Nexthop"):
+            owner.route.add_routes([RouteEntry(destination="10.0.1.0/24", gateway="10.0.0.1")])
+
+    def test_delete_routes(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch", return_value={}
+        )
+        owner.route.delete_routes([RouteEntry(destination="10.0.0.0/24", device="eth0")])
+        batch_mock.assert_called_once_with(owner._connection, ["route del 10.0.0.0/24 dev eth0"], namespace=None)
+
+    def test_delete_routes_error(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch",
+            return_value={0: "RTNETLINK answers: No such process"},
+        )
+        with pytest.raises(RouteFeatureException, match="No such process"):
+            owner.route.delete_routes([RouteEntry(destination="10.0.0.0/24", device="eth0")])
+
+    @staticmethod
+    def _routes_output(v4: list, v6: list) -> ConnectionCompletedProcess:
+        return ConnectionCompletedProcess(
+            return_code=0, args="", stdout=f"{json.dumps(v4)}\n{json.dumps(v6)}\n", stderr=""
+        )
+
+    def test_get_routes(self, owner):
+        v4 = [
+            {"dst": "default", "gateway": "10.0.0.1", "dev": "eth0", "protocol": "dhcp", "metric": 100, "flags": []},
+            {"dst": "10.0.0.0/24", "dev": "eth0", "protocol": "kernel", "scope": "link", "prefsrc": "10.0.0.5"},
+            {"type": "blackhole", "dst": "10.5.0.0/16", "flags": []},
+            {"dst": "10.6.0.0/16", "gateway": "10.7.0.1", "dev": "eth0", "flags": ["onlink"]},
+        ]
+        v6 = [
+            {"dst": "fd00::/64", "dev": "eth1", "protocol": "static", "metric": 1024, "flags": []},
+            {"dst": "default", "dev": "eth1", "metric": 1024, "flags": []},
+        ]
+        owner._connection.execute_command.return_value = self._routes_output(v4, v6)
+        assert owner.route.get_routes(namespace="ns1") == [
+            RouteEntry(destination="default", device="eth0", gateway="10.0.0.1", protocol="dhcp", metric=100),
+            RouteEntry(destination="10.5.0.0/16", route_type="blackhole"),
+            RouteEntry(destination="10.6.0.0/16", device="eth0", gateway="10.7.0.1", onlink=True),
+            RouteEntry(destination="fd00::/64", device="eth1", protocol="static", metric=1024, ip_version=IPVersion.V6),
+            RouteEntry(destination="default", device="eth1", metric=1024, ip_version=IPVersion.V6),
+        ]
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 ip -j -4 route show table main && ip netns exec ns1 ip -j -6 route show table main",
+            shell=True,
+        )
+        assert len(owner.route.get_routes(table="10", skip_kernel_routes=False)) == 6
+        assert owner.route.get_routes(table="10")[0].table == "10"
+
+    def test_snapshot_diff_restore(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch", return_value={}
+        )
+        link_route = {"dst": "10.1.0.0/24", "dev": "eth0", "scope": "link"}
+        gateway_route = {"dst": "10.2.0.0/24", "gateway": "10.1.0.1", "dev": "eth0"}
+        added_route = {"dst": "10.3.0.0/24", "dev": "eth1"}
+        owner._connection.execute_command.return_value = self._routes_output([link_route, gateway_route], [])
+        snapshot = owner.route.snapshot()
+        assert snapshot == RouteTableSnapshot(
+            routes=frozenset(
+                [
+                    RouteEntry(destination="10.1.0.0/24", device="eth0", scope="link"),
+                    RouteEntry(destination="10.2.0.0/24", device="eth0", gateway="10.1.0.1"),
+                ]
+            )
+        )
+
+        owner._connection.execute_command.return_value = self._routes_output(
+            [added_route], [{"dst": "default", "dev": "eth1"}]
+        )
+        expected_diff = RouteTableDiff(
+            added=[
+                RouteEntry(destination="10.3.0.0/24", device="eth1"),
+                RouteEntry(destination="default", device="eth1", ip_version=IPVersion.V6),
+            ],
+            removed=[
+                RouteEntry(destination="10.1.0.0/24", device="eth0", scope="link"),
+                RouteEntry(destination="10.2.0.0/24", device="eth0", gateway="10.1.0.1"),
+            ],
+        )
+        assert owner.route.diff(snapshot) == expected_diff
+        assert owner.route.restore(snapshot) == expected_diff
+        batch_mock.assert_called_once_with(
+            owner._connection,
+            [
+                "route del 10.3.0.0/24 dev eth1",
+                "route del ::/0 dev eth1",
+                "route add 10.1.0.0/24 dev eth0 scope link",
+                "route add 10.2.0.0/24 via 10.1.0.1 dev eth0",
+            ],
+            namespace=None,
+        )
+
+    def test_restore_error(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.execute_ip_batch",
+            return_value={0: "RTNETLINK answers: No such process"},
+        )
+        owner._connection.execute_command.return_value = self._routes_output([{"dst": "10.3.0.0/24"}], [])
+        with pytest.raises(RouteFeatureException, match="Restore of routing table failed"):
+            owner.route.restore(RouteTableSnapshot(routes=frozenset()))
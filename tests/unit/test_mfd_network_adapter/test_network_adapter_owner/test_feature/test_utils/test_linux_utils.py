@@ -6,10 +6,11 @@ from textwrap import dedent
 import pytest
 from mfd_common_libs import log_levels
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_network_adapter import NetworkInterface
 from mfd_typing import OSName
 
-from mfd_network_adapter.network_adapter_owner.data_structures import TunnelType
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec, TunnelType
 from mfd_network_adapter.network_adapter_owner.exceptions import UtilsFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
@@ -285,3 +286,66 @@ class TestLinuxUtils:
             shell=True,
         )
         assert result == {"TotalMemoryUsed": 15978408, "Cached": 100000, "Slab": 100000}
+
+    def test_add_tunnel_endpoints(self, owner, mocker):
+        owner._connection.execute_command = mocker.Mock(
+            return_value=ConnectionCompletedProcess(
+                return_code=1,
+                args="",
+                stdout="",
+                stderr='add tunnel "gre0" failed: File exists\nCommand failed -:1\n',
+            )
+        )
+        tunnels = [
+            TunnelSpec(
+                name="tun1",
+                tunnel_type=TunnelType.GRE,
+                remote_ip_addr=IPv4Address("192.168.1.1"),
+                local_ip_addr=IPv4Address("192.168.1.2"),
+                ttl=64,
+            ),
+            TunnelSpec(name="tun2", tunnel_type=TunnelType.GENEVE, remote_ip_addr=IPv4Address("192.168.1.1"), vni=2),
+        ]
+        assert owner.utils.add_tunnel_endpoints(tunnels) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip -force -batch -",
+            input_data="tunnel add tun1 mode gre remote 192.168.1.1 local 192.168.1.2 ttl 64\n"
+            "link add tun2 type geneve remote 192.168.1.1 vni 2 dstport 0\n",
+            expected_return_codes=None,
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stderr="")
+        assert owner.utils.delete_tunnel_endpoints(tunnels) == {}
+        assert owner._connection.execute_command.call_args.kwargs["input_data"] == "link del tun1\nlink del tun2\n"
+
+    def test_add_tunnel_endpoints_same_name_in_namespaces(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stderr="")
+        tunnels = [
+            TunnelSpec(
+                name="vx0",
+                tunnel_type=TunnelType.VXLAN,
+                vni=vni,
+                group_addr=IPv4Address("239.1.1.1"),
+                interface_name=interface_name,
+                namespace_name=namespace_name,
+            )
+            for vni, interface_name, namespace_name in ((10, "eth0", "ns1"), (20, "eth1", "ns2"))
+        ]
+        assert owner.utils.add_tunnel_endpoints(tunnels) == {}
+        assert [
+            (call.args[0], call.kwargs["input_data"]) for call in owner._connection.execute_command.call_args_list
+        ] == [
+            (
+                "ip netns exec ns1 ip -force -batch -",
+                "link add vx0 type vxlan id 10 group 239.1.1.1 dev eth0 dstport 0\n",
+            ),
+            (
+                "ip netns exec ns2 ip -force -batch -",
+                "link add vx0 type vxlan id 20 group 239.1.1.1 dev eth1 dstport 0\n",
+            ),
+        ]
+
+    def test_add_tunnel_endpoints_missing_params(self, owner, mocker):
+        owner._connection.execute_command = mocker.Mock()
+        with pytest.raises(ValueError):
+            owner.utils.add_tunnel_endpoints([TunnelSpec(name="tun1", tunnel_type=TunnelType.VXLAN)])
+        owner._connection.execute_command.assert_not_called()
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Test VLAN Linux."""
 
+from ipaddress import IPv4Interface
 from textwrap import dedent
 from unittest.mock import call
 
@@ -12,7 +13,9 @@ from mfd_kernel_namespace import add_namespace_call_command
 from mfd_package_manager import LinuxPackageManager
 from mfd_typing import MACAddress
 from mfd_typing import OSName
+from mfd_typing.network_interface import InterfaceType, VlanInterfaceInfo
 
+from mfd_network_adapter.network_adapter_owner.exceptions import VLANFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 
@@ -59,13 +62,60 @@ class TestLinuxVLAN:
         owner.vlan.remove_all_vlans()
         owner._connection.execute_command.assert_has_calls(
             [
-                call("ip link del vtest", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.4", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.2.5", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.2", expected_return_codes={0}, shell=True),
+                call("ls /proc/net/vlan", expected_return_codes={0, 2}, shell=True),
+                call(
+                    "ip -force -batch -",
+                    input_data="link del vtest\nlink del eth1.4\nlink del eth1.2.5\nlink del eth1.2\n",
+                    expected_return_codes=None,
+                ),
             ]
         )
 
+    def test_create_vlans(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.execute_ip_batch", return_value={}
+        )
+        vlans = owner.vlan.create_vlans(
+            interface_name="eth1",
+            vlan_ids=[2, 3],
+            protocol="802.1Q",
+            namespace_name="ns1",
+            ips={2: [IPv4Interface("1.1.1.1/24")]},
+            link_up=True,
+        )
+        batch_mock.assert_called_once_with(
+            owner._connection,
+            [
+                "link add link eth1 name eth1.2 type vlan protocol 802.1Q id 2",
+                "addr add 1.1.1.1/24 dev eth1.2",
+                "link set dev eth1.2 up",
+                "link add link eth1 name eth1.3 type vlan protocol 802.1Q id 3",
+                "link set dev eth1.3 up",
+            ],
+            namespace="ns1",
+        )
+        assert [vlan.name for vlan in vlans] == ["eth1.2", "eth1.3"]
+        assert vlans[1].vlan_info == VlanInterfaceInfo(vlan_id=3, parent="eth1")
+        assert vlans[1].interface_type == InterfaceType.VLAN
+        assert vlans[1].namespace == "ns1"
+
+    def test_create_vlans_error(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.execute_ip_batch",
+            return_value={1: "RTNETLINK answers: File exists"},
+        )
+        with pytest.raises(
+            VLANFeatureException, match="link add link eth1 name eth1.3 type vlan id 3: RTNETLINK answers: File exists"
+        ):
+            owner.vlan.create_vlans(interface_name="eth1", vlan_ids=[2, 3])
+
+    def test_remove_vlans(self, owner, mocker):
+        batch_mock = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.execute_ip_batch", return_value={}
+        )
+        owner.vlan.remove_vlans(vlan_ids=[2, 3], interface_name="eth1", namespace_name="ns1")
+        batch_mock.assert_called_once_with(owner._connection, ["link del eth1.2", "link del eth1.3"], namespace="ns1")
+
     def test_create_macvlan(self, owner):
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout="", stderr=""
@@ -10,6 +10,8 @@ from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelSpec
+from mfd_network_adapter.network_adapter_owner.exceptions import VxLANFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 
@@ -158,3 +160,73 @@ class TestLinuxVLAN:
         owner._connection.execute_command.assert_called_once_with(
             "ip netns exec ns1 ip link del vxlan0", expected_return_codes={}
         )
+
+    def test_create_setup_vxlans(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr="RTNETLINK answers: File exists\nCommand failed -:1\n"
+        )
+        tunnels = [
+            TunnelSpec(
+                name=f"vxlan{vni}",
+                vni=vni,
+                ip_addr=IPv4Interface(f"10.10.{vni}.1/24"),
+                group_addr=IPv4Interface("239.1.1.1"),
+                interface_name="eth0",
+            )
+            for vni in (1, 2)
+        ]
+        assert owner.vxlan.create_setup_vxlans(tunnels) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip -force -batch -",
+            input_data="link add vxlan1 type vxlan id 1 group 239.1.1.1 dev eth0 dstport 0\n"
+            "link set vxlan1 up\n"
+            "addr add 10.10.1.1/24 dev vxlan1\n"
+            "link add vxlan2 type vxlan id 2 group 239.1.1.1 dev eth0 dstport 0\n"
+            "link set vxlan2 up\n"
+            "addr add 10.10.2.1/24 dev vxlan2\n",
+            expected_return_codes=None,
+        )
+
+    def test_create_setup_vxlans_errors_per_tunnel(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr='Cannot find device "eth9"\nCommand failed -:3\n'
+        )
+        tunnels = [
+            TunnelSpec(name="vxlan1", vni=1, group_addr=IPv4Interface("239.1.1.1"), interface_name="eth0"),
+            TunnelSpec(name="vxlan2", vni=2, group_addr=IPv4Interface("239.1.1.1"), interface_name="eth9"),
+        ]
+        expected = {
+            (
+                None,
+                "vxlan2",
+            ): 'link add vxlan2 type vxlan id 2 group 239.1.1.1 dev eth9 dstport 0: Cannot find device "eth9"'
+        }
+        assert owner.vxlan.create_setup_vxlans(tunnels, raise_on_error=False) == expected
+        with pytest.raises(VxLANFeatureException, match="vxlan2: link add vxlan2"):
+            owner.vxlan.create_setup_vxlans(tunnels)
+
+    def test_create_setup_vxlans_address_exists(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr="RTNETLINK answers: File exists\nCommand failed -:3\n"
+        )
+        tunnel = TunnelSpec(
+            name="vxlan1",
+            vni=1,
+            ip_addr=IPv4Interface("10.10.1.1/24"),
+            group_addr=IPv4Interface("239.1.1.1"),
+            interface_name="eth0",
+        )
+        with pytest.raises(VxLANFeatureException, match="vxlan1: addr add 10.10.1.1/24 dev vxlan1: RTNETLINK"):
+            owner.vxlan.create_setup_vxlans([tunnel])
+
+    def test_delete_vxlans(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="", stderr='Cannot find device "vxlan2"\nCommand failed -:1\n'
+        )
+        tunnels = [TunnelSpec(name="vxlan2", namespace_name="ns1"), TunnelSpec(name="vxlan3", namespace_name="ns1")]
+        assert owner.vxlan.delete_vxlans(tunnels) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 ip -force -batch -",
+            input_data="link del vxlan2\nlink del vxlan3\n",
+            expected_return_codes=None,
+        )
@@ -420,7 +420,7 @@ class TestFreeBSDNetworkOwner:
         assert interfaces_list[0].interface_type == InterfaceType.MANAGEMENT
         assert all(interface.interface_type != InterfaceType.MANAGEMENT for interface in interfaces_list[1:])
 
-    def test__get_all_interfaces_info(self, owner, mocker, inet_info):
+    def test__get_all_interfaces_info(self, owner, mocker):
         expected_output = [
             LinuxInterfaceInfo(
                 pci_address=PCIAddress(domain=0, bus=24, slot=0, func=0),
@@ -526,19 +526,95 @@ class TestFreeBSDNetworkOwner:
         class      = network
         subclass   = ethernet"""  # noqa E501
         )
-        owner._connection.execute_command.side_effect = [
-            ConnectionCompletedProcess(args="", return_code=0, stdout=pciconf_output),
-            ConnectionCompletedProcess(args="", return_code=0, stdout="1300086"),
-        ]
-        vlan_info_mock = mocker.patch.object(owner, "_get_vlan_interfaces_data", mocker.Mock(return_value=[]))
+        inet_output = dedent(
+            """\
+            ix0: flags=8863<UP,BROADCAST,RUNNING,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \toptions=4e53fbb<RXCSUM,TXCSUM,VLAN_MTU>
+            \tinet 10.10.10.10 netmask 0xffffff80 broadcast 10.10.10.107
+            ix1: flags=8822<BROADCAST,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \toptions=4e53fbb<RXCSUM,TXCSUM,VLAN_MTU>
+            """
+        )
+        payload_output = f"<<<0\n{pciconf_output}\n<<<1\n<<<2\n{inet_output}<<<3\n<<<4\n1300086\n"
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=payload_output
+        )
         wa_mock = mocker.patch.object(owner, "_virtio_mlx_wa_name")
-        inet_info_mock = mocker.patch.object(owner, "_get_inet_information", mocker.Mock(return_value=inet_info))
 
         owner._connection._ip = "10.10.10.10"
         assert expected_output == owner._get_all_interfaces_info()
-        vlan_info_mock.assert_called_once()
-        inet_info_mock.assert_called_once()
         wa_mock.assert_not_called()
+        owner._connection.execute_command.assert_called_once()
+        payload = owner._connection.execute_command.call_args.args[0]
+        assert "sysctl -a" not in payload
+        assert 'echo "<<<4"; uname -K' in payload
+        assert owner._os_version == 1300086
+
+        owner._get_all_interfaces_info()
+        assert "uname -K" not in owner._connection.execute_command.call_args.args[0]
+
+    def test__get_all_interfaces_info_virtio_and_vlans(self, owner):
+        pciconf_output = dedent(
+            """\
+            virtio_pci1@pci0:0:3:0:	class=0x020000 rev=0x00 hdr=0x00 vendor=0x1af4 device=0x1000 subvendor=0x1af4 subdevice=0x0001
+                vendor     = 'Red Hat, Inc.'
+                device     = 'Virtio network device'
+                class      = network
+                subclass   = ethernet
+            virtio_pci2@pci0:0:4:0:	class=0x020000 rev=0x00 hdr=0x00 vendor=0x1af4 device=0x1000 subvendor=0x1af4 subdevice=0x0001
+                vendor     = 'Red Hat, Inc.'
+                device     = 'Virtio network device'
+                class      = network
+                subclass   = ethernet
+            """  # noqa E501
+        )
+        sysctl_output = "dev.vtnet.0.%parent: virtio_pci1\ndev.virtio_pci.1.%parent: pci0\n"
+        vlan_output = dedent(
+            """\
+            vlan0: flags=8843<UP,BROADCAST,RUNNING,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \tether 00:00:00:00:00:00
+            \tgroups: vlan
+            \tvlan: 10 vlanproto: 802.1q vlanpcp: 0 parent interface: vtnet0
+            vlan1: flags=8843<UP,BROADCAST,RUNNING,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \tether 00:00:00:00:00:00
+            \tgroups: vlan
+            \tvlan: 20 vlanproto: 802.1q vlanpcp: 0 parent interface: vtnet0
+            """
+        )
+        owner._os_version = 1300139
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=f"<<<0\n{pciconf_output}<<<1\n{sysctl_output}<<<2\n<<<3\n{vlan_output}"
+        )
+        assert owner._get_all_interfaces_info() == [
+            LinuxInterfaceInfo(
+                pci_address=PCIAddress(domain=0, bus=0, slot=3, func=0),
+                pci_device=PCIDevice(
+                    vendor_id=VendorID("1af4"),
+                    device_id=DeviceID("1000"),
+                    sub_vendor_id=SubVendorID("1af4"),
+                    sub_device_id=SubDeviceID("0001"),
+                ),
+                name="vtnet0",
+                interface_type=InterfaceType.PF,
+                installed=True,
+                branding_string="Virtio network device",
+            ),
+            LinuxInterfaceInfo(
+                interface_type=InterfaceType.VLAN, vlan_info=VlanInterfaceInfo(parent="vtnet0", vlan_id=10)
+            ),
+            LinuxInterfaceInfo(
+                interface_type=InterfaceType.VLAN, vlan_info=VlanInterfaceInfo(parent="vtnet0", vlan_id=20)
+            ),
+        ]
+        owner._connection.execute_command.assert_called_once()
+
+    def test__get_regex_pattern_reads_os_version_once(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout="1300139"
+        )
+        owner._get_regex_pattern()
+        owner._get_regex_pattern()
+        owner._connection.execute_command.assert_called_once_with("uname -K")
 
     def test__load_config_file(self, owner):
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
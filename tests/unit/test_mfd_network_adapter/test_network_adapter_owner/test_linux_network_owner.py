@@ -13,6 +13,7 @@ from mfd_typing import PCIDevice, PCIAddress, OSName, MACAddress, VendorID, Devi
 from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType, VlanInterfaceInfo
 
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
+from mfd_network_adapter.network_adapter_owner.exceptions import NetworkAdapterIncorrectData
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 sys_class_stdout = dedent(
@@ -192,6 +193,140 @@ class TestLinuxNetworkOwner:
         owner.unload_driver_module(driver_name="driver12")
         owner._connection.execute_command.assert_called_once_with("modprobe -r driver12")
 
+    def test_unload_driver_module_clears_interfaces_hardware_facts(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(args="", return_code=0)
+        mocker.patch.object(
+            owner,
+            "_get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:18:00.0"))],
+        )
+        mocker.patch.object(
+            owner, "_filter_interfaces_info", side_effect=lambda all_interfaces_info, **_: all_interfaces_info
+        )
+        interface = owner.get_interfaces(interface_names=["eth0"])[0]
+        interface._hardware_facts = mocker.sentinel.facts
+        owner.unload_driver_module(driver_name="driver12")
+        assert interface._hardware_facts is None
+
+    @staticmethod
+    def _single_interface_output(
+        netdevs="eth0", physfn="", lspci=None, bond="", address="00:00:00:00:00:01", ips="", namespaces=""
+    ):
+        if lspci is None:
+            lspci = (
+                "Slot:\t0000:18:00.0\nClass:\tEthernet controller [0200]\nVendor:\tIntel Corporation [8086]\n"
+                "Device:\tEthernet Controller 10G X550T [1563]\nSVendor:\tIntel Corporation [8086]\n"
+                "SDevice:\tDevice [35d4]\n"
+            )
+        sections = [netdevs, physfn, lspci, bond, address, ips, namespaces]
+        return "".join(
+            f"<<<{index}\n{section.rstrip()}\n" if section else f"<<<{index}\n"
+            for index, section in enumerate(sections)
+        )
+
+    def test_get_interface_by_name_without_full_scan(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output()
+        )
+        full_scan = mocker.patch.object(owner, "_get_all_interfaces_info")
+        interface = owner.get_interface(interface_name="eth0")
+        full_scan.assert_not_called()
+        owner._connection.execute_command.assert_called_once()
+        command = owner._connection.execute_command.call_args.args[0]
+        assert command.startswith("d=$(readlink -f /sys/class/net/eth0/device 2>/dev/null);")
+        assert interface.name == "eth0"
+        assert interface.pci_address == PCIAddress(data="0000:18:00.0")
+        assert interface.pci_device == PCIDevice(data="8086:1563:8086:35D4")
+        assert interface.interface_type is InterfaceType.PF
+        assert interface.mac_address == MACAddress("00:00:00:00:00:01")
+
+    def test_get_interface_by_pci_address_without_netdev(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output(netdevs="", address="")
+        )
+        full_scan = mocker.patch.object(owner, "_get_all_interfaces_info")
+        interface = owner.get_interface(pci_address=PCIAddress(data="0000:18:00.0"))
+        full_scan.assert_not_called()
+        assert owner._connection.execute_command.call_args.args[0].startswith("d=/sys/bus/pci/devices/0000:18:00.0;")
+        assert interface.name is None
+        assert interface.interface_type is InterfaceType.ETH_CONTROLLER
+        assert interface.installed is False
+
+    def test_get_interface_by_name_in_many_namespaces(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output(namespaces="ns1")
+        )
+        mocker.patch.object(
+            owner,
+            "_get_all_interfaces_info",
+            return_value=[
+                LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(data="0000:18:00.0")),
+                LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(data="0000:18:00.1"), namespace="ns1"),
+            ],
+        )
+        with pytest.raises(NetworkAdapterIncorrectData, match="should find only 1 interface"):
+            owner.get_interface(interface_name="eth1")
+
+    def test_get_interface_by_pci_address_with_namespaces(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output(namespaces="ns1")
+        )
+        full_scan = mocker.patch.object(owner, "_get_all_interfaces_info")
+        interface = owner.get_interface(pci_address=PCIAddress(data="0000:18:00.0"))
+        full_scan.assert_not_called()
+        assert interface.name == "eth0"
+
+    @pytest.mark.parametrize(
+        "ips, physfn, expected_type",
+        [
+            ("2: eth0    inet 10.10.10.10/8 brd 10.255.255.255 scope global eth0", "", InterfaceType.MANAGEMENT),
+            ("", "physfn", InterfaceType.VF),
+        ],
+    )
+    def test__get_single_interface_info_type(self, owner, mocker, ips, physfn, expected_type):
+        owner._connection._ip = "10.10.10.10"
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output(ips=ips, physfn=physfn)
+        )
+        info = owner._get_single_interface_info(pci_address=None, interface_name="eth0", namespace=None)
+        assert info.interface_type is expected_type
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"netdevs": "eth0\neth1"},
+            {"netdevs": "eth1"},
+            {"netdevs": "nac_eth0"},
+            {"bond": "bond"},
+            {"netdevs": "", "namespaces": "ns1"},
+            {"namespaces": "ns1 (id: 0)\nns2"},
+            {"lspci": "Slot:\t0000:18:00.0\nClass:\tNon-Volatile memory controller [0108]\n"},
+        ],
+    )
+    def test_get_interface_falls_back_to_full_scan(self, owner, mocker, kwargs):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=self._single_interface_output(**kwargs)
+        )
+        full_scan = mocker.patch.object(
+            owner,
+            "_get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:18:00.0"))],
+        )
+        interface = owner.get_interface(interface_name="eth0")
+        full_scan.assert_called_once()
+        assert interface.name == "eth0"
+
+    def test_get_interface_filtered_by_family_uses_full_scan(self, owner, mocker):
+        full_scan = mocker.patch.object(
+            owner,
+            "_get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:18:00.0"))],
+        )
+        mocker.patch.object(owner, "_filter_interfaces_info", return_value=full_scan.return_value)
+        owner.get_interface(interface_name="eth0", family="SGVL")
+        full_scan.assert_called_once()
+        owner._connection.execute_command.assert_not_called()
+
     def test_reload_driver_module(self, owner, mocker):
         time_sleep = 10
         owner.unload_driver_module = mocker.create_autospec(owner.unload_driver_module)
@@ -563,6 +698,19 @@ class TestLinuxNetworkOwner:
         vlan_info = VlanInterfaceInfo(vlan_id=1, parent="parent")
         owner._get_vlan_interfaces = mocker.Mock(return_value=vlan_ifaces)
         owner._get_vlan_info = mocker.Mock(return_value=vlan_info)
+        stdout = dedent(
+            """\
+            5: foo@parent: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN mode DEFAULT group default qlen 1000
+                link/ether 00:00:00:00:00:00 brd ff:ff:ff:ff:ff:ff promiscuity 0
+                vlan protocol 802.1Q id 1 <REORDER_HDR> addrgenmode eui64 numtxqueues 1 numrxqueues 1
+            6: bar@parent: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN mode DEFAULT group default qlen 1000
+                link/ether 00:00:00:00:00:00 brd ff:ff:ff:ff:ff:ff promiscuity 0
+                vlan protocol 802.1Q id 1 <REORDER_HDR> addrgenmode eui64 numtxqueues 1 numrxqueues 1
+            """
+        )
+        owner._connection.execute_command = mocker.Mock(
+            return_value=ConnectionCompletedProcess(args="", return_code=0, stdout=stdout)
+        )
 
         iface_1 = LinuxInterfaceInfo(name="foo", interface_type=InterfaceType.VIRTUAL_DEVICE)
         iface_2 = LinuxInterfaceInfo(name="bar", interface_type=InterfaceType.VIRTUAL_DEVICE)
@@ -574,6 +722,17 @@ class TestLinuxNetworkOwner:
         expected_ifaces = [iface_1_updated, iface_2_updated, iface_3]
         owner._update_vlans(ifaces)
         assert ifaces == expected_ifaces
+        owner._connection.execute_command.assert_called_once_with(command="ip -d link show type vlan", shell=True)
+        assert owner._get_vlan_info.call_args_list == [
+            mocker.call(string=stdout.split("6: ")[0]),
+            mocker.call(string="6: " + stdout.split("6: ")[1]),
+        ]
+
+    def test__update_vlans_no_vlans(self, owner, mocker):
+        owner._get_vlan_interfaces = mocker.Mock(return_value=[])
+        owner._connection.execute_command = mocker.Mock()
+        owner._update_vlans([LinuxInterfaceInfo(name="dunno", interface_type=InterfaceType.PF)])
+        owner._connection.execute_command.assert_not_called()
 
     def test__mark_management_interface_is_conn_ip(self, owner, mocker):
         name = "br0"
@@ -1054,7 +1213,7 @@ class TestLinuxNetworkOwner:
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
             args="", stdout=stdout_bonding, return_code=0
         )
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["aaa"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"aaa": []})
         iface_1 = LinuxInterfaceInfo(name="eth3", interface_type=InterfaceType.PF, installed=True)
         iface_2 = LinuxInterfaceInfo(name="aaa", interface_type=InterfaceType.GENERIC, installed=True)
         ifaces = [iface_1, iface_2]
@@ -1065,7 +1224,7 @@ class TestLinuxNetworkOwner:
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
             args="", stdout=stdout_bonding_2, return_code=0
         )
-        mocker.patch.object(owner.bonding, "get_children", return_value=["eth3"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"aaa": ["eth3"]})
         owner._mark_bonding_interfaces(ifaces)
         assert iface_1.interface_type == InterfaceType.BOND_SLAVE
 
@@ -1077,14 +1236,14 @@ class TestLinuxNetworkOwner:
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
             args="", stdout=stdout_bonding, return_code=0
         )
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=[])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={})
         iface = LinuxInterfaceInfo(name=None, interface_type=InterfaceType.GENERIC, installed=True)
         # Should not raise
         owner._mark_bonding_interfaces([iface])
 
     def test__mark_bonding_interfaces_no_bonding_interfaces(self, owner, mocker):
         """Test _mark_bonding_interfaces when no bonding interfaces exist."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=[])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={})
 
         iface_1 = LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.PF, installed=True)
         iface_2 = LinuxInterfaceInfo(name="eth1", interface_type=InterfaceType.VF, installed=True)
@@ -1100,12 +1259,11 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_multiple_bond_interfaces(self, owner, mocker):
         """Test _mark_bonding_interfaces with multiple bond interfaces."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0", "bond1"])
-        mocker.patch.object(owner.bonding, "get_children")
-        owner.bonding.get_children.side_effect = lambda bonding_interface: {
-            "bond0": ["eth0", "eth1"],
-            "bond1": ["eth2", "eth3"],
-        }.get(bonding_interface, [])
+        mocker.patch.object(
+            owner.bonding,
+            "get_all_children",
+            return_value={"bond0": ["eth0", "eth1"], "bond1": ["eth2", "eth3"]},
+        )
 
         bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
         bond1 = LinuxInterfaceInfo(name="bond1", interface_type=InterfaceType.VIRTUAL_DEVICE, installed=True)
@@ -1134,8 +1292,7 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_bond_with_no_children(self, owner, mocker):
         """Test _mark_bonding_interfaces when bond interface has no children."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        mocker.patch.object(owner.bonding, "get_children", return_value=[])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": []})
 
         bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
         eth0 = LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.PF, installed=True)
@@ -1152,7 +1309,7 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_empty_interface_list(self, owner, mocker):
         """Test _mark_bonding_interfaces with empty interface list."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": []})
 
         interfaces = []
 
@@ -1163,8 +1320,7 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_mixed_none_names(self, owner, mocker):
         """Test _mark_bonding_interfaces with mix of None and valid interface names."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        mocker.patch.object(owner.bonding, "get_children", return_value=["eth0"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": ["eth0"]})
 
         bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
         none_iface = LinuxInterfaceInfo(name=None, interface_type=InterfaceType.VF, installed=True)
@@ -1306,31 +1462,18 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_exception_handling(self, owner, mocker):
         """Test _mark_bonding_interfaces handles exceptions from bonding feature gracefully."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", side_effect=Exception("Bonding error"))
+        mocker.patch.object(owner.bonding, "get_all_children", side_effect=Exception("Bonding error"))
 
         eth0 = LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.PF, installed=True)
         interfaces = [eth0]
 
-        # Should raise the exception from get_bond_interfaces
+        # Should raise the exception from get_all_children
         with pytest.raises(Exception, match="Bonding error"):
             owner._mark_bonding_interfaces(interfaces)
 
-    def test__mark_bonding_interfaces_get_children_exception(self, owner, mocker):
-        """Test _mark_bonding_interfaces handles exceptions from get_children gracefully."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        mocker.patch.object(owner.bonding, "get_children", side_effect=Exception("Get children error"))
-
-        bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
-        interfaces = [bond0]
-
-        # Should raise the exception from get_children
-        with pytest.raises(Exception, match="Get children error"):
-            owner._mark_bonding_interfaces(interfaces)
-
     def test__mark_bonding_interfaces_interface_type_preservation(self, owner, mocker):
         """Test that _mark_bonding_interfaces preserves original interface types when appropriate."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        mocker.patch.object(owner.bonding, "get_children", return_value=["eth0"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": ["eth0"]})
 
         # Test various initial interface types
         bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.ETH_CONTROLLER, installed=True)
@@ -1369,8 +1512,7 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_duplicate_names(self, owner, mocker):
         """Test _mark_bonding_interfaces with duplicate interface names."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        mocker.patch.object(owner.bonding, "get_children", return_value=["eth0"])
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": ["eth0"]})
 
         # Create interfaces with duplicate names
         bond0_1 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
@@ -1392,8 +1534,7 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_case_sensitivity(self, owner, mocker):
         """Test _mark_bonding_interfaces with case sensitivity scenarios."""
-        mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["Bond0"])  # Uppercase B
-        mocker.patch.object(owner.bonding, "get_children", return_value=["Eth0"])  # Uppercase E
+        mocker.patch.object(owner.bonding, "get_all_children", return_value={"Bond0": ["Eth0"]})  # Uppercase
 
         bond_lower = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
         bond_upper = LinuxInterfaceInfo(name="Bond0", interface_type=InterfaceType.GENERIC, installed=True)
@@ -1472,8 +1613,8 @@ class TestLinuxNetworkOwner:
 
     def test__mark_bonding_interfaces_verify_call_sequence(self, owner, mocker):
         """Test that _mark_bonding_interfaces calls bonding methods in correct sequence."""
-        get_bond_interfaces_mock = mocker.patch.object(owner.bonding, "get_bond_interfaces", return_value=["bond0"])
-        get_children_mock = mocker.patch.object(owner.bonding, "get_children", return_value=["eth0"])
+        get_all_children_mock = mocker.patch.object(owner.bonding, "get_all_children", return_value={"bond0": ["eth0"]})
+        get_children_mock = mocker.patch.object(owner.bonding, "get_children")
 
         bond0 = LinuxInterfaceInfo(name="bond0", interface_type=InterfaceType.GENERIC, installed=True)
         eth0 = LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.PF, installed=True)
@@ -1482,12 +1623,6 @@ class TestLinuxNetworkOwner:
 
         owner._mark_bonding_interfaces(interfaces)
 
-        # Verify get_bond_interfaces is called first
-        get_bond_interfaces_mock.assert_called_once()
-
-        # Verify get_children is called for each bond interface
-        get_children_mock.assert_called_once_with(bonding_interface="bond0")
-
-        # Verify call order
-        assert get_bond_interfaces_mock.call_count == 1
-        assert get_children_mock.call_count == 1
+        # Verify children of all bonds are read once, without per bond calls
+        get_all_children_mock.assert_called_once()
+        get_children_mock.assert_not_called()
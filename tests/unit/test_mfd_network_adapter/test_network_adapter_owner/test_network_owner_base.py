@@ -1,6 +1,8 @@
 import re
+from copy import deepcopy
 
 import pytest
+from mfd_const import DEVICE_IDS
 from mfd_common_libs.exceptions import UnexpectedOSException
 from mfd_connect import RPyCConnection, SSHConnection
 from mfd_typing import OSName, PCIAddress, PCIDevice
@@ -36,6 +38,8 @@ class TestNetworkAdapterOwnerPublicAPI:
             OSName.WINDOWS: WindowsInterfaceInfo,
         }.get(test_data["system"], InterfaceInfo)
 
+        # public API is verified against full scan
+        o._get_single_interface_info = mocker.Mock(return_value=None)
         o._get_all_interfaces_info = mocker.Mock(
             return_value=[
                 interface_info_class(
@@ -290,6 +294,19 @@ class TestNetworkAdapterOwner:
         with pytest.raises(NetworkAdapterIncorrectData):
             owner._validate_filtering_args(**test_data)
 
+    def test__get_info_by_speed_and_family_does_not_modify_consts(self, owner):
+        e810 = InterfaceInfo(name="eth0", pci_device=PCIDevice(data="8086:1592"))
+        x520 = InterfaceInfo(name="eth1", pci_device=PCIDevice(data="8086:10FB"))
+        other_vendor = InterfaceInfo(name="eth2", pci_device=PCIDevice(data="15b3:1592"))
+        device_ids = deepcopy(DEVICE_IDS)
+        for _ in range(2):
+            assert owner._get_info_by_speed_and_family([e810, x520, other_vendor], family="CVL", speed="@10G") == [
+                e810,
+                x520,
+            ]
+        assert owner._get_info_by_speed_and_family([e810, x520, other_vendor], family=None, speed="100G") == [e810]
+        assert DEVICE_IDS == device_ids
+
     def test_validate_filtering_args_valid(self, owner):
         owner._validate_filtering_args(pci_address=_pci_address)
         owner._validate_filtering_args(pci_device=_pci_device)
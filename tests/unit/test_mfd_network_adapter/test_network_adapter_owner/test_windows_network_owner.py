@@ -1,11 +1,11 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
 from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
-from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 from mfd_network_adapter.network_adapter_owner.windows import WindowsNetworkAdapterOwner
 from mfd_typing import PCIDevice, PCIAddress, OSName, VendorID, DeviceID, SubDeviceID, SubVendorID, MACAddress
@@ -61,38 +61,9 @@ class TestWindowsNetworkOwner:
             return_code=0,
             args="",
             stderr="",
-            stdout=dedent(
-                """
-            Index     : 0
-            IPAddress :
-
-            Index     : 1
-            IPAddress :
-
-            Index     : 2
-            IPAddress :
-
-            Index     : 3
-            IPAddress :
-
-            Index     : 4
-            IPAddress :
-
-            Index     : 5
-            IPAddress :
-
-            Index     : 6
-            IPAddress :
-
-            Index     : 7
-            IPAddress : {10.10.10.10, fe80::eda6:1ac1:7f77:66e7}
-
-            Index     : 8
-            IPAddress :
-
-            Index     : 9
-            IPAddress : {1.1.1.1, fe80::2b4f:38e5:6ada:20a5}"""
-            ),
+            stdout='{"config":[{"Index":0,"IPAddress":null},{"Index":1,"IPAddress":null},'
+            '{"Index":7,"IPAddress":["10.10.10.10","fe80::eda6:1ac1:7f77:66e7"]},'
+            '{"Index":9,"IPAddress":["1.1.1.1","fe80::2b4f:38e5:6ada:20a5"]}]}',
         )
         ip = "10.10.10.10"
         owner._connection._ip = ip
@@ -161,57 +132,19 @@ class TestWindowsNetworkOwner:
             return_code=0,
             args="",
             stderr="",
-            stdout=dedent(
-                r"""
-            __GENUS             : 2
-            __CLASS             : Win32_NetworkAdapter
-            __SUPERCLASS        :
-            __DYNASTY           :
-            __RELPATH           :
-            __PROPERTY_COUNT    : 13
-            __DERIVATION        : {}
-            __SERVER            :
-            __NAMESPACE         :
-            __PATH              :
-            Description         : Intel(R) Ethernet Controller X550
-            GUID                : {F9E5C035-3B25-4CCF-8308-780F3623F0C6}
-            Index               : 2
-            Installed           : True
-            MACAddress          : 00:00:00:00:00:00
-            Manufacturer        : Intel Corporation
-            Name                : Intel(R) Ethernet Controller X550
-            NetConnectionID     : Ethernet 2
-            NetConnectionStatus : 7
-            PNPDeviceID         : PCI\VEN_8086&DEV_1563&SUBSYS_35D48086&REV_01\0000C9FFFF00000001
-            ProductName         : Intel(R) Ethernet Controller X550
-            ServiceName         : ixgbi
-            Speed               : 9223372036854775807
-            PSComputerName      :
-
-            __GENUS             : 2
-            __CLASS             : Win32_NetworkAdapter
-            __SUPERCLASS        :
-            __DYNASTY           :
-            __RELPATH           :
-            __PROPERTY_COUNT    : 13
-            __DERIVATION        : {}
-            __SERVER            :
-            __NAMESPACE         :
-            __PATH              :
-            Description         : Intel(R) Ethernet Controller X550
-            GUID                : {653E6E88-A9D0-4018-881F-74F81720251D}
-            Index               : 3
-            Installed           : True
-            MACAddress          : 00:00:00:00:00:00
-            Manufacturer        : Intel Corporation
-            Name                : Intel(R) Ethernet Controller X550
-            NetConnectionID     : Ethernet 3
-            NetConnectionStatus : 2
-            PNPDeviceID         : PCI\VEN_8086&DEV_1563&SUBSYS_35D48086&REV_01\0000C9FFFF00000000
-            ProductName         : Intel(R) Ethernet Controller X550
-            ServiceName         : ixgbi
-            Speed               :
-            PSComputerName      : """
+            stdout=(
+                '{"installed":[{"Description":"Intel(R) Ethernet Controller X550","Index":2,"Installed":true,'
+                '"MACAddress":"00:00:00:00:00:00","Manufacturer":"Intel Corporation",'
+                '"Name":"Intel(R) Ethernet Controller X550","NetConnectionID":"Ethernet 2","NetConnectionStatus":7,'
+                '"PNPDeviceID":"PCI\\\\VEN_8086&DEV_1563&SUBSYS_35D48086&REV_01\\\\0000C9FFFF00000001",'
+                '"ProductName":"Intel(R) Ethernet Controller X550","ServiceName":"ixgbi",'
+                '"GUID":"{F9E5C035-3B25-4CCF-8308-780F3623F0C6}","Speed":9223372036854775807},'
+                '{"Description":"Intel(R) Ethernet Controller X550","Index":3,"Installed":true,'
+                '"MACAddress":"00:00:00:00:00:00","Manufacturer":"Intel Corporation",'
+                '"Name":"Intel(R) Ethernet Controller X550","NetConnectionID":"Ethernet 3","NetConnectionStatus":2,'
+                '"PNPDeviceID":"PCI\\\\VEN_8086&DEV_1563&SUBSYS_35D48086&REV_01\\\\0000C9FFFF00000000",'
+                '"ProductName":"Intel(R) Ethernet Controller X550","ServiceName":"ixgbi",'
+                '"GUID":"{653E6E88-A9D0-4018-881F-74F81720251D}","Speed":null}]}'
             ),
         )
         nics = owner._get_available_interfaces()
@@ -258,27 +191,37 @@ class TestWindowsNetworkOwner:
             ),
         ]
         assert nics == expected_nics
+        command = owner._connection.execute_powershell.call_args.args[0]
+        assert "ConvertTo-Json" in command
+        assert "'installed'" in command
+        assert "'not_installed'" not in command
 
-    def test_update_vlan_info(self, owner):
+    def test_get_available_interfaces_not_installed(self, owner):
         owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
             return_code=0,
             args="",
             stderr="",
-            stdout=dedent(
-                """
-            InterfaceAlias : Ethernet 5
-            vlanid         : 0
-
-            InterfaceAlias : Ethernet 3
-            vlanid         :
-
-            InterfaceAlias : Ethernet 4
-            vlanid         : 50
-
-            InterfaceAlias : vEthernet (TEST_SWITCH5)
-            vlanid         : """
+            stdout=(
+                '{"installed":[],"not_installed":{"Description":"Ethernet Controller","Manufacturer":"Intel",'
+                '"Name":"Ethernet Controller","PNPDeviceID":"PCI\\\\VEN_8086&DEV_1592\\\\000000"}}'
             ),
         )
+        nics = owner._get_available_interfaces(only_installed=False)
+        owner._connection.execute_powershell.assert_called_once()
+        assert len(nics) == 1
+        assert nics[0].installed is False
+        assert nics[0].mac_address == MACAddress("00:00:00:00:00:00")
+        assert nics[0].net_connection_status == "6"
+        assert nics[0].name == ""
+
+    def test_update_vlan_info(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stderr="",
+            stdout='{"vlans":[{"InterfaceAlias":"Ethernet 5","VlanID":0},{"InterfaceAlias":"Ethernet 3","VlanID":null},'
+            '{"InterfaceAlias":"Ethernet 4","VlanID":50},{"InterfaceAlias":"vEthernet (TEST_SWITCH5)","VlanID":null}]}',
+        )
         nics = [WindowsInterfaceInfo(name="Ethernet 4")]
         owner._update_vlan_info(nics)
         assert nics[0].vlan_info.vlan_id == 50
@@ -288,27 +231,31 @@ class TestWindowsNetworkOwner:
             return_code=0,
             args="",
             stderr="",
-            stdout=dedent(
-                """
-            Name     : Ethernet 5
-            Segment  : 0
-            Bus      : 94
-            Device   : 0
-            Function : 1
-
-            Name     : Ethernet 4
-            Segment  : 1
-            Bus      : 2
-            Device   : 3
-            Function : 4"""
+            stdout=(
+                '{"hardware":[{"Name":"Ethernet 5","Segment":0,"Bus":94,"Device":0,"Function":1},'
+                '{"Name":"Ethernet 4","Segment":1,"Bus":2,"Device":3,"Function":4}],'
+                '"registry":{"PNPDeviceID":"PCI\\\\VEN_8086&DEV_1563\\\\3A","LocationInformation":"PCI bus 24, '
+                'device 0, function 1;(24,0,1)"}}'
             ),
         )
-        nics = [WindowsInterfaceInfo(name="Ethernet 4"), WindowsInterfaceInfo(name="Ethernet 5")]
+        nics = [
+            WindowsInterfaceInfo(name="Ethernet 4", pnp_device_id="PCI\\VEN_8086&DEV_1563\\1"),
+            WindowsInterfaceInfo(name="Ethernet 5", pnp_device_id="PCI\\VEN_8086&DEV_1563\\2"),
+            WindowsInterfaceInfo(name="Ethernet 6", pnp_device_id="PCI\\VEN_8086&DEV_1563\\3a"),
+            WindowsInterfaceInfo(name="vEthernet", pnp_device_id="VMBUS\\1", service_name="VMSMP"),
+        ]
         owner._update_pci_addresses(nics)
-        pci_address = PCIAddress(domain=0, bus=94, slot=0, func=1)
-        pci_address2 = PCIAddress(domain=1, bus=2, slot=3, func=4)
-        assert nics[0].pci_address == pci_address2
-        assert nics[1].pci_address == pci_address
+        assert nics[0].pci_address == PCIAddress(domain=1, bus=2, slot=3, func=4)
+        assert nics[1].pci_address == PCIAddress(domain=0, bus=94, slot=0, func=1)
+        assert nics[2].pci_address == PCIAddress(domain=0, bus=24, slot=0, func=1)
+        assert nics[3].pci_address is None
+        owner._connection.execute_powershell.assert_called_once()
+        command = owner._connection.execute_powershell.call_args.args[0]
+        assert (
+            "@('PCI\\VEN_8086&DEV_1563\\1', 'PCI\\VEN_8086&DEV_1563\\2', 'PCI\\VEN_8086&DEV_1563\\3a', 'VMBUS\\1') "
+            "| Where-Object { $_ } | ForEach-Object { Get-ItemProperty -LiteralPath "
+            '"HKLM:\\SYSTEM\\CurrentControlSet\\Enum\\$_"'
+        ) in command
 
     def test__update_cluster(self, owner):
         owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
@@ -367,129 +314,150 @@ class TestWindowsNetworkOwner:
         assert "Cluster Network 2" == nics[0].cluster_info.network
         assert "Cluster Network 1" == nics[2].cluster_info.network
 
-    def test__get_all_interfaces_info_cluster_case(self, owner, mocker):
-        nics = [
-            WindowsInterfaceInfo(name="vSMB1", mac_address=MACAddress("00:00:00:00:00:00")),
-            WindowsInterfaceInfo(name="Management", mac_address=MACAddress("00:00:00:00:00:00")),
-            WindowsInterfaceInfo(name="Ethernet 2", mac_address=MACAddress("00:00:00:00:00:00")),
+    @staticmethod
+    def _discovery_output(interface_names=("vSMB1", "Management", "Ethernet 2")):
+        interfaces = [
+            {
+                "Description": "Intel(R) Ethernet Controller X710",
+                "Index": index,
+                "Installed": True,
+                "MACAddress": f"00:00:00:00:00:0{index}",
+                "Manufacturer": "Intel Corporation",
+                "Name": "Intel(R) Ethernet Controller X710",
+                "NetConnectionID": name,
+                "NetConnectionStatus": 2,
+                "PNPDeviceID": f"PCI\\VEN_8086&DEV_1572&SUBSYS_00078086&REV_01\\00000000000000{index}",
+                "ProductName": "Intel(R) Ethernet Controller X710",
+                "ServiceName": "i40ea",
+                "GUID": "{00000000-0000-0000-0000-000000000000}",
+                "Speed": 10000000000,
+            }
+            for index, name in enumerate(interface_names, start=1)
         ]
-        owner._get_interfaces_and_verify_states = mocker.Mock(return_value=nics)
+        interfaces.append(
+            {
+                "Description": "WAN Miniport (IP)",
+                "Index": 4,
+                "Installed": True,
+                "MACAddress": None,
+                "Name": "WAN Miniport (IP)",
+                "NetConnectionID": None,
+                "PNPDeviceID": "SWD\\MSRRAS\\MS_NDISWANIP",
+                "ServiceName": "NdisWan",
+            }
+        )
+        return json.dumps(
+            {
+                "interfaces": interfaces,
+                "vlans": [{"InterfaceAlias": "Ethernet 2", "VlanID": 10}],
+                "hardware": [
+                    {"Name": "vSMB1", "Segment": 0, "Bus": 94, "Device": 0, "Function": 0},
+                    {"Name": "Management", "Segment": 0, "Bus": 94, "Device": 0, "Function": 1},
+                ],
+                "registry": {
+                    "PNPDeviceID": "PCI\\VEN_8086&DEV_1572&SUBSYS_00078086&REV_01\\000000000000003",
+                    "LocationInformation": "PCI bus 24, device 0, function 0;(24,0,0)",
+                },
+                "config": [{"Index": 2, "IPAddress": ["10.10.10.10"]}, {"Index": 3, "IPAddress": None}],
+            }
+        )
 
-        expected_nics = [
-            WindowsInterfaceInfo(
-                name="vSMB1",
-                mac_address=MACAddress("00:00:00:00:00:00"),
-                interface_type=InterfaceType.CLUSTER_STORAGE,
-                pci_device=PCIDevice(data="8086:1572"),
-                cluster_info=ClusterInfo(node=None, network="Cluster Network 2"),
-            ),
-            WindowsInterfaceInfo(
-                name="Management",
-                mac_address=MACAddress("00:00:00:00:00:00"),
-                interface_type=InterfaceType.CLUSTER_MANAGEMENT,
-                pci_device=PCIDevice(data="8086:1572"),
-                cluster_info=ClusterInfo(node=None, network="Cluster Network 1"),
-            ),
-            WindowsInterfaceInfo(
-                name="Ethernet 2",
-                mac_address=MACAddress("00:00:00:00:00:00"),
-                interface_type=InterfaceType.GENERIC,
-                pci_device=PCIDevice(data="8086:1572"),
-            ),
+    def test__get_all_interfaces_info_cluster_case(self, owner):
+        cluster = [
+            {"Name": "NODE-1 - Management", "Network": "Cluster Network 1"},
+            {"Name": "NODE-1 - vSMB1", "Network": "Cluster Network 2"},
+            {"Name": "NODE-1 - Embedded LOM 1 Port 1", "Network": "Cluster Network 3"},
+        ]
+        owner._connection.execute_powershell.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stderr="", stdout=self._discovery_output()),
+            ConnectionCompletedProcess(return_code=0, args="", stderr="", stdout=json.dumps({"cluster": cluster})),
         ]
+        owner._connection._ip = "10.10.10.10"
 
-        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
-            return_code=0,
-            args="",
-            stderr="",
-            stdout=dedent(
-                """
-                Name                           Network
-                ----                           -------
-                NODE-1 - Management            Cluster Network 1
-                NODE-2 - Management            Cluster Network 1
-                NODE-3 - Management            Cluster Network 1
-                NODE-4 - Management            Cluster Network 1
-                NODE-1 - vSMB1                 Cluster Network 2
-                NODE-1 - vSMB2                 Cluster Network 2
-                NODE-1 - vSMB3                 Cluster Network 2
-                NODE-1 - vSMB4                 Cluster Network 2
-                NODE-2 - vSMB1                 Cluster Network 2
-                NODE-2 - vSMB2                 Cluster Network 2
-                NODE-2 - vSMB3                 Cluster Network 2
-                NODE-2 - vSMB4                 Cluster Network 2
-                NODE-3 - vSMB1                 Cluster Network 2
-                NODE-3 - vSMB2                 Cluster Network 2
-                NODE-3 - vSMB3                 Cluster Network 2
-                NODE-3 - vSMB4                 Cluster Network 2
-                NODE-4 - vSMB1                 Cluster Network 2
-                NODE-4 - vSMB2                 Cluster Network 2
-                NODE-4 - vSMB3                 Cluster Network 2
-                NODE-4 - vSMB4                 Cluster Network 2
-                NODE-1 - Embedded LOM 1 Port 1 Cluster Network 3
-                NODE-2 - Embedded LOM 1 Port 1 Cluster Network 3
-                NODE-3 - Embedded LOM 1 Port 1 Cluster Network 3
-                NODE-4 - Embedded LOM 1 Port 1 Cluster Network 3
-                NODE-2 - PCIe Slot 6 Port 1    Cluster Network 4
-                NODE-2 - PCIe Slot 6 Port 2    Cluster Network 4
-                NODE-3 - PCIe Slot 6 Port 2    Cluster Network 4
-                """
-            ),
-        )
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._get_pci_device",
-            mocker.Mock(return_value=PCIDevice(data="8086:1572")),
-        )
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._update_nic_if_virtual",
-            mocker.Mock(return_value=None),
-        )
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._update_pci_addresses",
-            mocker.Mock(return_value=None),
-        )
         returned_nics = owner._get_all_interfaces_info()
 
-        assert returned_nics == expected_nics
-
-    def test__get_all_interfaces_info_cluster_service_unavailable(self, owner, mocker):
-        nics = [
-            WindowsInterfaceInfo(name="vSMB1", mac_address=MACAddress("00:00:00:00:00:00")),
-            WindowsInterfaceInfo(name="vSMB2", mac_address=MACAddress("00:00:00:00:00:00")),
-            WindowsInterfaceInfo(name="Ethernet 2", mac_address=MACAddress("00:00:00:00:00:00")),
+        assert owner._connection.execute_powershell.call_count == 2
+        assert [nic.name for nic in returned_nics] == ["vSMB1", "Management", "Ethernet 2"]
+        assert returned_nics[0].interface_type is InterfaceType.CLUSTER_STORAGE
+        assert returned_nics[0].cluster_info == ClusterInfo(network="Cluster Network 2")
+        assert returned_nics[0].pci_address == PCIAddress(0, 94, 0, 0)
+        assert returned_nics[1].cluster_info == ClusterInfo(network="Cluster Network 1")
+        assert returned_nics[1].pci_address == PCIAddress(0, 94, 0, 1)
+        assert returned_nics[1].pci_device == PCIDevice("8086", "1572", "8086", "0007")
+        # management interface detection is done after cluster update
+        assert returned_nics[1].interface_type is InterfaceType.MANAGEMENT
+        assert returned_nics[2].interface_type is InterfaceType.PF
+        assert returned_nics[2].cluster_info is None
+        assert returned_nics[2].vlan_info.vlan_id == 10
+        assert returned_nics[2].pci_address == PCIAddress(0, 24, 0, 0)
+
+    def test__get_all_interfaces_info_cluster_service_unavailable(self, owner):
+        owner._connection.execute_powershell.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stderr="", stdout=self._discovery_output()),
+            ConnectionCompletedProcess(return_code=0, args="", stderr="", stdout='{"cluster":[]}'),
         ]
-        owner._get_interfaces_and_verify_states = mocker.Mock(return_value=nics)
+        owner._connection._ip = "10.10.10.10"
 
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._get_pci_device",
-            mocker.Mock(return_value=PCIDevice(data="8086:1572")),
-        )
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._update_nic_if_virtual",
-            mocker.Mock(return_value=None),
-        )
-        mocker.patch(
-            "mfd_network_adapter.network_adapter_owner.windows.WindowsNetworkAdapterOwner._update_pci_addresses",
-            mocker.Mock(return_value=None),
+        returned_nics = owner._get_all_interfaces_info()
+
+        assert len(returned_nics) == 3
+        assert all(nic.cluster_info is None for nic in returned_nics)
+        assert returned_nics[0].interface_type is InterfaceType.PF
+        discovery_command, cluster_command = (c.args[0] for c in owner._connection.execute_powershell.call_args_list)
+        assert "for ($try = 1; $try -le 4; $try++)" in discovery_command
+        assert "Get-Cluster" not in discovery_command
+        assert "Get-Cluster -ErrorAction Stop" in cluster_command
+
+    def test__get_all_interfaces_info_no_cluster_query_without_vsmb(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stderr="", stdout=self._discovery_output(("Ethernet 1", "Management", "Ethernet 2"))
         )
-        mock_update_cluster = mocker.patch.object(owner, "_update_cluster")
+        owner._connection._ip = "10.10.10.10"
 
-        # execute_powershell raises on Get-Cluster but succeeds for everything else
-        def _execute_powershell_side_effect(command, *args, **kwargs):
-            if "Get-Cluster" in command and "NetworkInterface" not in command:
-                raise ConnectionCalledProcessError(returncode=1, cmd=command)
-            return ConnectionCompletedProcess(return_code=0, args=command, stdout="", stderr="")
+        returned_nics = owner._get_all_interfaces_info()
 
-        owner._connection.execute_powershell.side_effect = _execute_powershell_side_effect
+        owner._connection.execute_powershell.assert_called_once()
+        assert "Get-Cluster" not in owner._connection.execute_powershell.call_args.args[0]
+        assert all(nic.cluster_info is None for nic in returned_nics)
+
+    def test__get_all_interfaces_info_b06bdrv_nic(self, owner):
+        output = json.loads(self._discovery_output(("Ethernet 1",)))
+        output["interfaces"][0]["PNPDeviceID"] = "B06BDRV\\L2ND&PCI_16A11028&SUBSYS_1F5F1028&REV_10\\5&1"
+        output["hardware"] = []
+        output["config"] = []
+        output["registry"] = {
+            "PNPDeviceID": "B06BDRV\\L2ND&PCI_16A11028&SUBSYS_1F5F1028&REV_10\\5&1",
+            "LocationInformation": "PCI bus 1, device 0, function 1;(1,0,1)",
+        }
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stderr="", stdout=json.dumps(output)
+        )
+        owner._connection._ip = "10.10.10.10"
 
-        # Must not raise
         returned_nics = owner._get_all_interfaces_info()
 
-        # _update_cluster must never have been called since Get-Cluster failed
-        mock_update_cluster.assert_not_called()
+        assert returned_nics[0].pci_address == PCIAddress(0, 1, 0, 1)
+        command = owner._connection.execute_powershell.call_args.args[0]
+        assert "'registry' = @(try { $nics.PNPDeviceID | Where-Object { $_ } | ForEach-Object {" in command
 
-        # All three NICs (with mac_address set) should be returned
-        assert len(returned_nics) == 3
+    def test__get_interfaces_and_verify_states(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stderr="",
+            stdout=json.dumps(
+                {
+                    "interfaces": [
+                        {"Name": "Ethernet", "Installed": True, "PNPDeviceID": "PCI\\VEN_8086&DEV_1572\\0"},
+                        {"Name": "Ethernet Controller", "PNPDeviceID": "PCI\\VEN_8086&DEV_1572\\1"},
+                    ]
+                }
+            ),
+        )
+        nics = owner._get_interfaces_and_verify_states(retries=2)
+        assert [nic.installed for nic in nics] == [True, False]
+        owner._connection.execute_powershell.assert_called_once()
+        assert "$try -le 2" in owner._connection.execute_powershell.call_args.args[0]
 
     def test_get_log_cpu_no(self, owner):
         output = dedent(
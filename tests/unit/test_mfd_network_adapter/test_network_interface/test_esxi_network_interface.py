@@ -55,13 +55,7 @@ class TestESXiNetworkInterface:
     def interface(self, owner):
         owner._connection.execute_command.side_effect = [
             ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_lspci_n, stderr="stderr"
-            ),
-            ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_lspci_p, stderr="stderr"
-            ),
-            ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_esxcfg_nics, stderr="stderr"
+                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_discovery, stderr="stderr"
             ),
         ]
         interface = owner.get_interface()
@@ -146,10 +140,17 @@ class TestESXiNetworkInterface:
         assert interface.get_numa_node() == 1
 
     def test_get_firmware_version(self, interface):
+        output = (
+            '{"AdvertisedAutoNegotiation": true, "DriverInfo": {"BusInfo": "0000:4b:00:0", "Driver": "i40en", '
+            '"FirmwareVersion": "8.15 0x80009621 1.2829.0", "Version": "2.5.0.28"}, "Name": "vmnic0"}'
+        )
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=self.output_esxcli, stderr="stderr"
+            return_code=0, args="command", stdout=output, stderr="stderr"
         )
         assert interface.get_firmware_version() == "8.15 0x80009621 1.2829.0"
+        interface._connection.execute_command.assert_called_with(
+            f"esxcli --formatter=json network nic get -n {interface.name}"
+        )
 
     def test_get_driver_info(self, interface):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
@@ -4,10 +4,19 @@
 import pytest
 from mfd_common_libs.exceptions import UnexpectedOSException
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_packet_capture import Tshark, Tcpdump
 from mfd_typing import OSName, OSType
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
+from mfd_network_adapter.network_interface.exceptions import CaptureFeatureException
+from mfd_network_adapter.network_interface.feature.capture.data_structures import (
+    CaptureCounter,
+    CaptureCounterCollector,
+    CaptureCounterKey,
+    CaptureTool,
+    FlowKey,
+)
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 
 
@@ -58,3 +67,103 @@ class TestCaptureLinux:
     def test_pktcap_start_tcpdump_not_supported(self, interface):
         with pytest.raises(UnexpectedOSException, match="Found unexpected OS"):
             interface.capture.pktcap
+
+    def test_start_counter_capture_tcpdump_ring_buffer(self, interface):
+        collector = interface.capture.start_counter_capture(
+            key=CaptureCounterKey.VLAN,
+            tool=CaptureTool.TCPDUMP,
+            capture_filter="udp port 53",
+            ring_buffer_path="/tmp/ring.pcap",
+            ring_file_size=20000,
+            ring_files=3,
+        )
+        command = interface._connection.start_process.call_args.args[0]
+        assert command.startswith(
+            "sh -c 'echo $$ > /tmp/capture_counters_eth0.tsv.pid; exec tcpdump -i eth0 -l -tt -nn -e -q "
+            "-w /tmp/ring.pcap -C 20 -W 3 --print '\"'\"'udp port 53'\"'\"' 2>/dev/null' | awk "
+        )
+        assert "k = vlan; packets[k]++" in command
+        assert command.endswith("> /tmp/capture_counters_eth0.tsv")
+        assert collector.output_path == "/tmp/capture_counters_eth0.tsv"
+        assert collector.ring_buffer_path == "/tmp/ring.pcap"
+
+    def test_start_counter_capture_tshark(self, interface):
+        interface.capture.start_counter_capture(output_path="/tmp/out.tsv")
+        command = interface._connection.start_process.call_args.args[0]
+        assert "exec tshark -i eth0 -l -n -T fields -E separator=/t -E occurrence=f -e frame.time_epoch" in command
+        assert 'k = proto "\\t" src "\\t" sport "\\t" dst "\\t" dport;' in command
+
+    def test_read_and_stop_counters(self, interface, mocker):
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="",
+                stdout="C\t1700000000.5\t17\t10.0.0.1\t5000\t10.0.0.2\t6000\t2\t300\nC\t1700000001.3\t6\tfe80::1",
+            ),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=""),
+            ConnectionCompletedProcess(
+                return_code=0, args="", stdout="C\t1700000001.3\t6\tfe80::1\t40000\tfe80::2\t22\t1\t60\n"
+            ),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=""),
+        ]
+        collector = CaptureCounterCollector(
+            process=mocker.Mock(running=False),
+            output_path="/tmp/c.tsv",
+            pid_path="/tmp/c.tsv.pid",
+            key=CaptureCounterKey.FLOW,
+        )
+        assert list(interface.capture.read_counters(collector)) == [
+            CaptureCounter(
+                timestamp=1700000000.5,
+                key=FlowKey(protocol="17", src_ip="10.0.0.1", src_port="5000", dst_ip="10.0.0.2", dst_port="6000"),
+                packets=2,
+                bytes=300,
+            )
+        ]
+        assert collector.offset == 52
+        assert interface.capture.stop_counter_capture(collector) == [
+            CaptureCounter(
+                timestamp=1700000001.3,
+                key=FlowKey(protocol="6", src_ip="fe80::1", src_port="40000", dst_ip="fe80::2", dst_port="22"),
+                packets=1,
+                bytes=60,
+            )
+        ]
+        assert [call.args[0] for call in interface._connection.execute_command.call_args_list] == [
+            "tail -c +1 /tmp/c.tsv",
+            "kill -INT $(cat /tmp/c.tsv.pid)",
+            "tail -c +53 /tmp/c.tsv",
+            "rm -f /tmp/c.tsv /tmp/c.tsv.pid",
+        ]
+
+    def test_stream_counters(self, interface, mocker):
+        process = mocker.Mock()
+        type(process).running = mocker.PropertyMock(side_effect=[True, False])
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout="C\t1.0\t10\t1\t60\n"),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="C\t2.0\t\t3\t180\n"),
+        ]
+        sleep = mocker.patch("mfd_network_adapter.network_interface.feature.capture.linux.time.sleep")
+        collector = CaptureCounterCollector(
+            process=process, output_path="/tmp/c.tsv", pid_path="/tmp/c.tsv.pid", key=CaptureCounterKey.VLAN
+        )
+        assert list(interface.capture.stream_counters(collector, poll_interval=5)) == [
+            CaptureCounter(timestamp=1.0, key=10, packets=1, bytes=60),
+            CaptureCounter(timestamp=2.0, key=None, packets=3, bytes=180),
+        ]
+        sleep.assert_called_once_with(5)
+
+    def test_stop_counter_capture_not_started(self, interface, mocker):
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=1, args="", stdout=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=""),
+        ]
+        collector = CaptureCounterCollector(
+            process=mocker.Mock(running=False),
+            output_path="/tmp/c.tsv",
+            pid_path="/tmp/c.tsv.pid",
+            key=CaptureCounterKey.VLAN,
+        )
+        with pytest.raises(CaptureFeatureException, match="did not start"):
+            interface.capture.stop_counter_capture(collector)
@@ -46,3 +46,6 @@ class TestCaptureLinux:
     def test_pktcap_start_tcpdump_not_supported(self, interface):
         with pytest.raises(UnexpectedOSException, match="Found unexpected OS"):
             interface.capture.pktcap
+
+    def test_counter_capture_not_supported(self, interface):
+        assert not hasattr(interface.capture, "start_counter_capture")
@@ -10,6 +10,7 @@ from mfd_typing import OSName
 from mfd_typing.driver_info import DriverInfo
 
 from mfd_network_adapter.network_adapter_owner.esxi import ESXiNetworkAdapterOwner
+from mfd_network_adapter.network_interface.exceptions import DriverInfoNotFound
 from tests.unit.test_mfd_network_adapter.test_network_adapter_owner.test_esxi_network_owner import TestESXiNetworkOwner
 
 
@@ -54,13 +55,7 @@ class TestESXiDriverFeature:
     def interface(self, owner):
         owner._connection.execute_command.side_effect = [
             ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_lspci_n, stderr="stderr"
-            ),
-            ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_lspci_p, stderr="stderr"
-            ),
-            ConnectionCompletedProcess(
-                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_esxcfg_nics, stderr="stderr"
+                return_code=0, args="command", stdout=TestESXiNetworkOwner.output_discovery, stderr="stderr"
             ),
         ]
         interface = owner.get_interface()
@@ -68,13 +63,46 @@ class TestESXiDriverFeature:
         return interface
 
     def test_get_firmware_version(self, interface):
+        output = (
+            '{"AdvertisedAutoNegotiation": true, "DriverInfo": {"BusInfo": "0000:4b:00:0", "Driver": "i40en", '
+            '"FirmwareVersion": "8.15 0x80009621 1.2829.0", "Version": "2.5.0.28"}, "Name": "vmnic0"}'
+        )
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=self.output_esxcli, stderr="stderr"
+            return_code=0, args="command", stdout=output, stderr="stderr"
         )
         assert interface.get_firmware_version() == "8.15 0x80009621 1.2829.0"
+        interface._connection.execute_command.assert_called_with(
+            f"esxcli --formatter=json network nic get -n {interface.name}"
+        )
 
     def test_get_driver_info(self, interface):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="command", stdout=self.output_esxcli, stderr="stderr"
         )
         assert interface.get_driver_info() == DriverInfo(driver_name="i40en", driver_version="2.5.0.28")
+
+    def test_get_firmware_version_not_found(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout='{"Name": "vmnic0"}', stderr=""
+        )
+        with pytest.raises(DriverInfoNotFound):
+            interface.driver.get_firmware_version()
+
+    def test_get_driver_info_cached(self, interface, mocker):
+        get_driver_info = mocker.patch.object(
+            interface.driver.package_manager,
+            "get_driver_info",
+            return_value=DriverInfo(driver_name="i40en", driver_version="2.5.0.28"),
+        )
+        get_module_params = mocker.patch.object(
+            interface.driver.package_manager, "get_module_params_as_dict", return_value={"RSS": "4"}
+        )
+        assert interface.driver.get_driver_info(cached=True) == DriverInfo("i40en", "2.5.0.28")
+        assert interface.driver.get_module_params_as_dict(cached=True) == {"RSS": "4"}
+        assert interface.driver.get_module_params_as_dict(cached=True) == {"RSS": "4"}
+        get_driver_info.assert_called_once()
+        get_module_params.assert_called_once_with("i40en")
+
+        interface.driver.clear_cache()
+        interface.driver.get_driver_info(cached=True)
+        assert get_driver_info.call_count == 2
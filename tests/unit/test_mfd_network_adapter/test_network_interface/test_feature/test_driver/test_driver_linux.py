@@ -88,9 +88,21 @@ class TestDriverLinux:
         return interface
 
     def test_get_driver_info(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=""
+        )
         expected_out = DriverInfo(driver_name="ice", driver_version="1.1.1.1")
         assert interface.driver.get_driver_info() == expected_out
 
+    def test_get_driver_info_from_hardware_facts(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="<<<4\nversion:        1.14.9\nname:           ice\n"
+        )
+        expected_out = DriverInfo(driver_name="ice", driver_version="1.14.9")
+        assert interface.driver.get_driver_info() == expected_out
+        assert interface.driver.get_driver_info() == expected_out
+        interface._connection.execute_command.assert_called_once()
+
     def test_get_formatted_driver_version(self, mocker, interface):
         expected_out = {"major": 2, "build2": None, "minor": 22, "build": 18, "rc": None}
         ethtool_output = dedent(
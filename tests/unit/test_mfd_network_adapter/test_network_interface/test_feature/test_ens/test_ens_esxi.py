@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 import pytest
 from mfd_connect import SSHConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName, PCIAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
@@ -132,3 +133,33 @@ class TestESXiFeatureENS:
         ens_feature._check_if_nsxt_present = mocker.create_autospec(ens_feature._check_if_nsxt_present)
         ens_feature._check_if_nsxt_present.return_value = False
         assert ens_feature.is_ens_interrupt_enabled() is False
+
+    def test_is_ens_enabled_cached(self, ens_feature):
+        ens_feature._interface()._interface_info.name = "vmnic4"
+        ens_feature._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=ens_data_output
+        )
+        assert ens_feature.is_ens_enabled(cached=True) is True
+        assert ens_feature.is_ens_capable(cached=True) is True
+        assert ens_feature.is_ens_interrupt_enabled(cached=True) is False
+        ens_feature._connection.execute_command.assert_called_once()
+
+        ens_feature.clear_cache()
+        assert ens_feature.is_ens_enabled(cached=True) is True
+        assert ens_feature._connection.execute_command.call_count == 2
+        ens_feature.is_ens_enabled()
+        assert ens_feature._connection.execute_command.call_count == 3
+
+    def test_is_ens_enabled_cached_without_nsxt(self, ens_feature, mocker):
+        ens_feature._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="", stdout="esxcfg-nics: invalid option -- 'e'"
+        )
+        ens_feature._interface().driver.get_drv_info = mocker.MagicMock(return_value={"driver": "icen_ens"})
+        assert ens_feature.is_ens_enabled(cached=True) is True
+        assert ens_feature.is_ens_enabled(cached=True) is True
+        ens_feature._connection.execute_command.assert_called_once()
+        ens_feature._interface().driver.get_drv_info.assert_called_once()
+
+        ens_feature.clear_cache()
+        ens_feature.is_ens_enabled(cached=True)
+        assert ens_feature._interface().driver.get_drv_info.call_count == 2
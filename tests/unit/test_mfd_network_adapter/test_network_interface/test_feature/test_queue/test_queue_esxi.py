@@ -81,6 +81,21 @@ class TestQueueESXi:
         )
         assert ["8", "9", "10"] == interface.queue.get_rx_sec_queues(primary_queue="0")
 
+    def test_get_all_rx_sec_queues(self, interface):
+        interface._connection.execute_command.return_value.stdout = dedent(
+            """\
+        <<<vsish /net/pNics/Ethernet/rxqueues/queues/0/rss/rxSecQueues
+        1/
+        2/
+        >>>vsish 0
+        <<<vsish /net/pNics/Ethernet/rxqueues/queues/3/rss/rxSecQueues
+        >>>vsish 1
+        """
+        )
+        assert interface.queue.get_all_rx_sec_queues() == {"0": ["1", "2"], "3": None}
+        command = interface._connection.execute_command.call_args.args[0]
+        assert command.startswith("for entry in $(vsish -e ls /net/pNics/Ethernet/rxqueues/queues); do")
+
     def test_read_primary_or_secondary_queues_vsish(self, interface):
         vsish_output = """0/
         1/
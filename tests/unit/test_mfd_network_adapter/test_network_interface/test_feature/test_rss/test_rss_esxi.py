@@ -316,24 +316,28 @@ class TestEsxiNetworkInterface:
         assert interface.rss.get_queues_for_rss_engine() == output
 
     def test__vsish_queues_i40en(self, interface):
-        output_primary = "0\n"
-        output = "4/\n5/\n6/\n7/\n8/\n9/\n10/\n11/\n12/\n13/\n14/\n15/\n16/\n17/\n18/\n"
-        interface._connection.execute_command.side_effect = (
-            ConnectionCompletedProcess(return_code=0, args="", stdout=output_primary, stderr=""),
-            ConnectionCompletedProcess(return_code=0, args="", stdout=output, stderr=""),
+        output = (
+            "<<<vsish /net/pNics/vmnic1/rxqueues/queues/0/rss/rxSecQueues\n"
+            "4/\n5/\n6/\n7/\n8/\n9/\n10/\n11/\n12/\n13/\n14/\n15/\n16/\n17/\n18/\n"
+            ">>>vsish 0\n"
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
         )
         assert interface.rss._vsish_queues("i40en") == {
             "0": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15"]
         }
 
     def test__vsish_queues_ixgben(self, interface):
-        output_primary = "0\n"
-        output = "1/\n2/\n3/\n"
-        interface._connection.execute_command.side_effect = (
-            ConnectionCompletedProcess(return_code=0, args="", stdout=output_primary, stderr=""),
-            ConnectionCompletedProcess(return_code=0, args="", stdout=output, stderr=""),
+        output = (
+            "<<<vsish /net/pNics/vmnic1/rxqueues/queues/0/rss/rxSecQueues\n1/\n2/\n3/\n>>>vsish 0\n"
+            "<<<vsish /net/pNics/vmnic1/rxqueues/queues/1/rss/rxSecQueues\nError: not found\n>>>vsish 1\n"
         )
-        assert interface.rss._vsish_queues("ixgben") == {"0": ["0", "1", "2", "3"]}
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert interface.rss._vsish_queues("ixgben") == {"0": ["0", "1", "2", "3"], "1": ["1"]}
+        interface._connection.execute_command.assert_called_once()
 
     def test_retrieves_netq_rss_queues_correctly(self, interface, mocker):
         mocker.patch(
@@ -361,3 +365,26 @@ class TestEsxiNetworkInterface:
 
         result = interface.rss.get_netq_defq_rss_queues(netq_rss=False)
         assert result == ["0", "1", "2"]
+
+    def test_get_rx_pkts_stats_ens_state_cached(self, interface):
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout="vmnic1  icen  True  False  00:00:00:00:00:00"),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="rxq0: totalPkts=5 totalBytes=30"),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="rxq0: totalPkts=7 totalBytes=40"),
+        ]
+        assert interface.rss.get_rx_pkts_stats() == {"rxq0": "5"}
+        assert interface.rss.get_rx_pkts_stats() == {"rxq0": "7"}
+        assert interface._connection.execute_command.call_count == 3
+
+    def test_get_queues_for_rss_engine_driver_info_cached(self, mocker, interface):
+        get_driver_info = mocker.patch(
+            "mfd_package_manager.ESXiPackageManager.get_driver_info",
+            mocker.create_autospec(
+                ESXiPackageManager.get_driver_info,
+                return_value=DriverInfo(driver_name="ixgben", driver_version="1.0"),
+            ),
+        )
+        mocker.patch.object(ESXiRSS, "_vsish_queues", return_value={"0": ["0", "1"]})
+        interface.rss.get_queues_for_rss_engine()
+        interface.rss.get_queues_for_rss_engine()
+        get_driver_info.assert_called_once()
@@ -20,8 +20,10 @@ from mfd_typing import (
 from mfd_typing.network_interface import InterfaceInfo
 
 from mfd_network_adapter.network_interface.esxi import ESXiNetworkInterface
+from mfd_network_adapter.network_interface.exceptions import StatisticNotFoundException
 from mfd_network_adapter.network_interface.feature.stats import ESXiStats
-from mfd_network_adapter.network_interface.feature.stats.data_structures import ESXiVfStats
+from mfd_network_adapter.network_interface.feature.stats.esxi import TX_BYTES, RX_BYTES, TX_PKTS, RX_PKTS
+from mfd_network_adapter.network_interface.feature.stats.data_structures import ESXiVfStats, QueueCounters
 
 
 class TestESXiNetworkInterfaceStats:
@@ -756,11 +758,15 @@ class TestESXiNetworkInterfaceStats:
             },
         }
         mocker.patch.object(interface.virtualization, "get_connected_vfs_info", return_value=vfs)
-        stats._connection.execute_command.side_effect = [
-            ConnectionCompletedProcess(stdout=output_vf0, return_code=0, args=""),
-            ConnectionCompletedProcess(stdout=output_vf1, return_code=0, args=""),
-        ]
+        name = interface.name
+        stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            stdout=f"<<<vsish /net/sriov/{name}/vfs/0/stats\n{output_vf0}>>>vsish 0\n"
+            f"<<<vsish /net/sriov/{name}/vfs/1/stats\n{output_vf1}>>>vsish 0\n",
+            return_code=0,
+            args="",
+        )
         assert stats.get_vf_stats() == ESXiVfStats(general_stats, detailed_stats)
+        stats._connection.execute_command.assert_called_once()
 
     def test_get_single_vf_stats(self, interface, stats):
         output = dedent(
@@ -823,3 +829,65 @@ class TestESXiNetworkInterfaceStats:
             stdout=output, return_code=0, args=""
         )
         assert stats.get_single_vf_stats(1) == expected_result
+
+    def test_get_multiple_vf_stats_missing_vf(self, interface, stats):
+        stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            stdout=f'<<<vsish /net/sriov/{interface.name}/vfs/0/stats\n{{"rxUnicastPkts" : 1,\n}}\n>>>vsish 0\n'
+            f"<<<vsish /net/sriov/{interface.name}/vfs/7/stats\nError\n>>>vsish 1\n",
+            return_code=0,
+            args="",
+        )
+        with pytest.raises(StatisticNotFoundException, match=r"Missing statistics for VFs \['7'\]"):
+            stats.get_multiple_vf_stats([0, 7])
+
+    def test_get_vf_stats_deltas(self, interface, stats, mocker):
+        mocker.patch("mfd_network_adapter.network_interface.feature.stats.esxi.sleep")
+        get_connected_vfs_info = mocker.patch.object(
+            interface.virtualization,
+            "get_connected_vfs_info",
+            return_value=[VFInfo(vf_id="0", pci_address=PCIAddress(0, 0, 0, 0), owner_world_id="1")],
+        )
+        counters = [dict.fromkeys(TX_BYTES + RX_BYTES + TX_PKTS + RX_PKTS, 0) for _ in range(3)]
+        counters[1]["rxUnicastPkts"] = 10
+        counters[2]["rxUnicastPkts"] = 25
+        mocker.patch.object(stats, "get_multiple_vf_stats", side_effect=[{"0": counter} for counter in counters])
+
+        deltas = stats.get_vf_stats_deltas(interval=1, samples=2)
+
+        assert [delta.general["rxpkt"] for delta in deltas] == [10, 15]
+        assert [delta.detailed["0"]["rxUnicastPkts"] for delta in deltas] == [10, 15]
+        get_connected_vfs_info.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "ens_enabled, command",
+        [
+            (False, "privstats get -n eth0"),
+            (True, "nsxdp-cli ens uplink stats get -n eth0"),
+        ],
+    )
+    def test_get_queue_counters(self, stats, interface, mocker, ens_enabled, command):
+        mocker.patch.object(interface.ens, "is_ens_enabled", return_value=ens_enabled)
+        output = dedent(
+            """\
+            10
+            NIC Private statistics:
+               rxq0: totalPkts=100 totalBytes=6400 ipv4Pkts=100
+               rxq1: totalPkts=200 totalBytes=12800
+               txq0: totalPkts=300 totalBytes=19200
+               txq1: totalPkts=400 totalBytes=25600
+            """
+        )
+        stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert stats.get_queue_counters() == QueueCounters(
+            timestamp=10.0,
+            rx_packets=[100, 200],
+            tx_packets=[300, 400],
+            rx_bytes=[6400, 12800],
+            tx_bytes=[19200, 25600],
+        )
+        executed = stats._connection.execute_command.call_args.args[0]
+        assert executed.startswith("date +%s; ")
+        assert command in executed
+        interface.ens.is_ens_enabled.assert_called_once_with(cached=True)
@@ -10,6 +10,7 @@ from mfd_typing import PCIAddress, OSName
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
 from mfd_network_adapter.network_interface.exceptions import StatisticNotFoundException
+from mfd_network_adapter.network_interface.feature.stats.data_structures import QueueCounters
 from mfd_network_adapter.network_interface.freebsd import FreeBSDNetworkInterface
 
 
@@ -132,3 +133,30 @@ class TestStatsFreeBSD:
             match=f"Statistics random_stat not found on {interface.stats._interface().name} adapter",
         ):
             interface.stats.get_stats(name="random_stat")
+
+    def test_get_queue_counters(self, interface):
+        out = dedent(
+            """\
+            10
+            dev.ixl.0.pf.rxq01.packets: 20
+            dev.ixl.0.pf.rxq01.bytes: 2000
+            dev.ixl.0.pf.rxq00.packets: 10
+            dev.ixl.0.pf.rxq00.bytes: 1000
+            dev.ixl.0.pf.txq00.packets: 30
+            dev.ixl.0.pf.txq00.bytes: 3000
+            dev.ixl.0.pf.rxq00.irqs: 5
+            """
+        )
+        interface.stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=out, return_code=0, stderr=""
+        )
+        assert interface.stats.get_queue_counters() == QueueCounters(
+            timestamp=10.0, rx_packets=[10, 20], tx_packets=[30, 0], rx_bytes=[1000, 2000], tx_bytes=[3000, 0]
+        )
+        interface.stats._connection.execute_command.assert_called_with(
+            "date +%s; sysctl dev.eth.0.", shell=True, expected_return_codes={0}
+        )
+
+    def test_learn_queue_counter_layout_ix(self, interface):
+        layout = interface.stats._learn_queue_counter_layout({"queue1.tx_bytes": "0", "queue1.interrupt_rate": "0"})
+        assert layout.positions == {"queue1.tx_bytes": ("tx_bytes", 1)}
@@ -11,7 +11,7 @@ from mfd_connect.base import ConnectionCompletedProcess
 from mfd_ethtool import Ethtool
 from mfd_network_adapter.network_interface.exceptions import StatisticNotFoundException
 from mfd_network_adapter.network_interface.feature.driver import LinuxDriver
-from mfd_network_adapter.network_interface.feature.stats.data_structures import Direction, Protocol
+from mfd_network_adapter.network_interface.feature.stats.data_structures import Direction, Protocol, QueueCounters
 from mfd_network_adapter.network_interface.feature.stats.linux import LinuxStats
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.stat_checker.base import Value
@@ -400,3 +400,79 @@ class TestWindowsNetworkInterface:
             )
             == invalid_stat
         )
+
+    def test_get_queue_counters(self, stats):
+        output = dedent(
+            """\
+            1700000000.500000000
+            NIC statistics:
+                 rx_unicast: 100
+                 tx_queue_0_packets: 30
+                 tx_queue_0_bytes: 3000
+                 tx_queue_1_packets: 40
+                 tx_queue_1_bytes: 4000
+                 rx_queue_0_packets: 10
+                 rx_queue_0_bytes: 1000
+                 rx_queue_1_packets: 20
+                 rx_queue_1_bytes: 2000
+            """
+        )
+        stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert stats.get_queue_counters() == QueueCounters(
+            timestamp=1700000000.5,
+            rx_packets=[10, 20],
+            tx_packets=[30, 40],
+            rx_bytes=[1000, 2000],
+            tx_bytes=[3000, 4000],
+        )
+        stats._connection.execute_command.assert_called_once_with("date +%s.%N; ethtool -S eth0", shell=True)
+        layout = stats._queue_counter_layout
+        stats._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output.replace("1000", "1500"), stderr=""
+        )
+        assert stats.get_queue_counters().rx_bytes == [1500, 2000]
+        assert stats._queue_counter_layout is layout
+
+    @pytest.mark.parametrize(
+        "stat_name, position",
+        [
+            ("rx-3.packets", ("rx_packets", 3)),
+            ("tx-queue-2.tx_bytes", ("tx_bytes", 2)),
+            ("rx5_bytes", ("rx_bytes", 5)),
+            ("rx_queue_1._packets", ("rx_packets", 1)),
+        ],
+    )
+    def test_learn_queue_counter_layout(self, stats, stat_name, position):
+        layout = stats._learn_queue_counter_layout({stat_name: "0", "rx_packets": "0", "rx_queue_drops": "0"})
+        assert layout.positions == {stat_name: position}
+        assert layout.queues == position[1] + 1
+        assert layout.stats_count == 3
+
+    def test_get_queue_counters_relearn_layout(self, stats):
+        stats._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout="1.0\n rx-0.packets: 1\n", stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0, args="", stdout="2.0\n rx-0.packets: 2\n rx-1.packets: 3\n", stderr=""
+            ),
+        ]
+        assert stats.get_queue_counters().rx_packets == [1]
+        assert stats.get_queue_counters().rx_packets == [2, 3]
+
+    def test_queue_counters_delta_and_rates(self):
+        previous = QueueCounters(
+            timestamp=10.0, rx_packets=[0, 10], tx_packets=[0, 0], rx_bytes=[0, 0], tx_bytes=[5, 5]
+        )
+        current = QueueCounters(
+            timestamp=12.0, rx_packets=[20, 30], tx_packets=[4, 0], rx_bytes=[0, 0], tx_bytes=[5, 9]
+        )
+        assert current.delta(previous) == QueueCounters(
+            timestamp=12.0, rx_packets=[20, 20], tx_packets=[4, 0], rx_bytes=[0, 0], tx_bytes=[0, 4]
+        )
+        assert current.rates(previous) == {
+            "rx_packets": [10.0, 10.0],
+            "tx_packets": [2.0, 0.0],
+            "rx_bytes": [0.0, 0.0],
+            "tx_bytes": [0.0, 2.0],
+        }
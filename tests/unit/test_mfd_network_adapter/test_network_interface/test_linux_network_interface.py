@@ -1,18 +1,23 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-import re
+import json
 from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
-from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_ethtool import Ethtool
 from mfd_typing import PCIAddress, OSName, OSBitness
+from mfd_typing.driver_info import DriverInfo
 from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceInfo, InterfaceType
 
 from mfd_network_adapter.exceptions import NetworkInterfaceIncomparableObject
-from mfd_network_adapter.network_interface.data_structures import RingBufferSettings, RingBuffer
+from mfd_network_adapter.network_interface.data_structures import (
+    RingBufferSettings,
+    RingBuffer,
+    HardwareFacts,
+    InterfaceConfigSnapshot,
+)
 from mfd_network_adapter.network_interface.exceptions import (
     BrandingStringException,
     DeviceStringException,
@@ -20,12 +25,156 @@ from mfd_network_adapter.network_interface.exceptions import (
     RDMADeviceNotFound,
     RingBufferSettingException,
     DeviceSetupException,
+    NumaNodeException,
+    InterfaceConfigRestoreException,
 )
 from mfd_network_adapter.network_interface.feature.ip import LinuxIP
 from mfd_network_adapter.network_interface.feature.link import LinuxLink
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.stat_checker.linux import LinuxStatChecker
 
+LSPCI_OUTPUT = dedent(
+    """\
+    00:03.0 Ethernet controller: Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)
+        Subsystem: Intel Corporation PRO/1000 MT Desktop Adapter
+        Flags: bus master, 66MHz, medium devsel, latency 64, IRQ 19
+        Memory at f0000000 (32-bit, non-prefetchable) [size=128K]
+        I/O ports at d010 [size=8]
+        Capabilities: <access denied>
+        Kernel driver in use: e1000
+        Kernel modules: e1000
+    """
+)
+
+
+def _facts_output(lspci: str = "", numa: str = "", ethtool: str = "", ethernet: str = "", modinfo: str = "") -> str:
+    sections = [lspci, numa, ethtool, ethernet, modinfo]
+    return "".join(f"<<<{index}\n{output.rstrip()}\n" for index, output in enumerate(sections))
+
+
+IP_LINK_OUTPUT = [
+    {
+        "ifname": "eth0",
+        "mtu": 1500,
+        "vfinfo_list": [
+            {
+                "vf": 0,
+                "address": "00:11:22:33:44:55",
+                "vlan_list": [{"vlan": 10, "qos": 2}],
+                "spoofchk": True,
+                "link_state": "auto",
+                "trust": False,
+            }
+        ],
+    }
+]
+IP_ADDR_OUTPUT = [
+    {
+        "ifname": "eth0",
+        "mtu": 1500,
+        "addr_info": [
+            {"family": "inet", "local": "10.10.10.1", "prefixlen": 24, "scope": "global"},
+            {"family": "inet", "local": "10.10.20.1", "prefixlen": 24, "scope": "global", "dynamic": True},
+            {"family": "inet6", "local": "fe80::1", "prefixlen": 64, "scope": "link"},
+        ],
+    }
+]
+ETHTOOL_OFFLOAD_OUTPUT = dedent(
+    """\
+    Features for eth0:
+    rx-checksumming: on
+    tx-checksumming: on
+    \ttx-checksum-ipv4: on
+    tcp-segmentation-offload: off
+    large-receive-offload: off [fixed]
+    """
+)
+ETHTOOL_COALESCING_OUTPUT = dedent(
+    """\
+    Coalesce parameters for eth0:
+    Adaptive RX: off  TX: on
+    stats-block-usecs: n/a
+    rx-usecs: 50
+    rx-frames: n/a
+    tx-usecs: 100
+    """
+)
+ETHTOOL_RINGS_OUTPUT = dedent(
+    """\
+    Ring parameters for eth0:
+    Pre-set maximums:
+    RX:\t\t4096
+    RX Mini:\tn/a
+    RX Jumbo:\tn/a
+    TX:\t\t4096
+    Current hardware settings:
+    RX:\t\t512
+    RX Mini:\tn/a
+    RX Jumbo:\tn/a
+    TX:\t\t1024
+    RX Buf Len:\tn/a
+    """
+)
+ETHTOOL_CHANNELS_OUTPUT = dedent(
+    """\
+    Channel parameters for eth0:
+    Pre-set maximums:
+    RX:\t\t64
+    TX:\t\t64
+    Other:\t\t1
+    Combined:\t64
+    Current hardware settings:
+    RX:\t\t0
+    TX:\t\t0
+    Other:\t\t1
+    Combined:\t8
+    """
+)
+ETHTOOL_PAUSE_OUTPUT = dedent(
+    """\
+    Pause parameters for eth0:
+    Autonegotiate:\toff
+    RX:\t\ton
+    TX:\t\ton
+    RX negotiated: on
+    """
+)
+
+
+def _config_output(ip_link: list = IP_LINK_OUTPUT, vfs_count: str = "1") -> str:
+    sections = [
+        json.dumps(ip_link),
+        json.dumps(IP_ADDR_OUTPUT),
+        ETHTOOL_OFFLOAD_OUTPUT,
+        ETHTOOL_COALESCING_OUTPUT,
+        ETHTOOL_RINGS_OUTPUT,
+        ETHTOOL_CHANNELS_OUTPUT,
+        ETHTOOL_PAUSE_OUTPUT,
+        vfs_count,
+    ]
+    return "".join(f"<<<{index}\n{output.rstrip()}\n" for index, output in enumerate(sections))
+
+
+def _config_snapshot() -> InterfaceConfigSnapshot:
+    return InterfaceConfigSnapshot(
+        mtu=1500,
+        ip_addresses=["10.10.10.1/24"],
+        offload={
+            "rx-checksumming": "on",
+            "tx-checksumming": "on",
+            "tx-checksum-ipv4": "on",
+            "tcp-segmentation-offload": "off",
+        },
+        coalescing={"adaptive-rx": "off", "adaptive-tx": "on", "rx-usecs": "50", "tx-usecs": "100"},
+        rings={"rx": "512", "tx": "1024"},
+        channels={"rx": "0", "tx": "0", "other": "1", "combined": "8"},
+        flow_control={"autoneg": "off", "rx": "on", "tx": "on"},
+        vfs_count=1,
+        vfs={
+            0: {"mac": "00:11:22:33:44:55", "vlan": "10", "qos": "2", "spoofchk": "on", "trust": "off", "state": "auto"}
+        },
+    )
+
 
 class TestLinuxNetworkInterface:
     @pytest.fixture(params=[{"namespace": None}])
@@ -112,20 +261,8 @@ class TestLinuxNetworkInterface:
         assert type(interface.link) is LinuxLink
 
     def test_get_branding_string(self, interface):
-        output = dedent(
-            """\
-        00:03.0 Ethernet controller: Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)
-            Subsystem: Intel Corporation PRO/1000 MT Desktop Adapter
-            Flags: bus master, 66MHz, medium devsel, latency 64, IRQ 19
-            Memory at f0000000 (32-bit, non-prefetchable) [size=128K]
-            I/O ports at d010 [size=8]
-            Capabilities: <access denied>
-            Kernel driver in use: e1000
-            Kernel modules: e1000
-        """
-        )
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=output, stderr="stderr"
+            return_code=0, args="command", stdout=_facts_output(lspci=LSPCI_OUTPUT), stderr="stderr"
         )
         assert interface.get_branding_string() == "Intel Corporation PRO/1000 MT Desktop Adapter"
 
@@ -140,22 +277,69 @@ class TestLinuxNetworkInterface:
             interface.get_branding_string()
 
     def test_get_device_string(self, interface):
-        output = dedent(
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_facts_output(lspci=LSPCI_OUTPUT), stderr="stderr"
+        )
+        assert interface.get_device_string() == "Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)"
+
+    def test_get_hardware_facts(self, interface):
+        ethtool_output = dedent(
+            """\
+            driver: ice
+            version: 1.14.9
+            firmware-version: 4.40 0x8001c967 1.3534.0
+            bus-info: 0000:00:00.0
+            """
+        )
+        ethernet_output = dedent(
             """\
-        00:03.0 Ethernet controller: Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)
-            Subsystem: Intel Corporation PRO/1000 MT Desktop Adapter
-            Flags: bus master, 66MHz, medium devsel, latency 64, IRQ 19
-            Memory at f0000000 (32-bit, non-prefetchable) [size=128K]
-            I/O ports at d010 [size=8]
-            Capabilities: <access denied>
-            Kernel driver in use: e1000
-            Kernel modules: e1000
-        """
+            00:03.0 Ethernet controller: Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)
+            00:03.1 Ethernet controller: Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)
+            00:04.0 Ethernet controller: Intel Corporation Ethernet Controller E810-C for SFP (rev 02)
+            """
         )
+        modinfo_output = "filename:       /lib/modules/ice.ko\nversion:        1.14.9\nname:           ice\n"
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=output, stderr="stderr"
+            return_code=0,
+            args="command",
+            stdout=_facts_output(LSPCI_OUTPUT, "1\n", ethtool_output, ethernet_output, modinfo_output),
+        )
+        expected = HardwareFacts(
+            branding_string="Intel Corporation PRO/1000 MT Desktop Adapter",
+            device_string="Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)",
+            numa_node=1,
+            number_of_ports=2,
+            driver_name="ice",
+            driver_version="1.14.9",
+            firmware_version="4.40 0x8001c967 1.3534.0",
+            driver_info=DriverInfo(driver_name="ice", driver_version="1.14.9"),
+        )
+        assert interface.get_hardware_facts() == expected
+        assert interface.get_number_of_ports() == 2
+        assert interface.get_firmware_version() == "4.40 0x8001c967 1.3534.0"
+        assert interface.get_numa_node() == 1
+        interface._connection.execute_command.assert_called_once_with(
+            'echo "<<<0"; lspci -s 0000:00:00.0 -v; '
+            'echo "<<<1"; cat /sys/class/net/eth0/device/numa_node; '
+            'echo "<<<2"; ethtool -i eth0; '
+            'echo "<<<3"; lspci | grep Eth; '
+            "echo \"<<<4\"; modinfo $(ethtool -i eth0 | sed -n 's/^driver: //p')",
+            shell=True,
+            expected_return_codes=None,
         )
-        assert interface.get_device_string() == "Intel Corporation 82540EM Gigabit Ethernet Controller (rev 02)"
+
+    def test_clear_hardware_facts(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_facts_output(numa="0\n")
+        )
+        assert interface.get_numa_node() == 0
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_facts_output(numa="1\n")
+        )
+        assert interface.get_numa_node() == 0
+        interface.clear_hardware_facts()
+        assert interface.get_numa_node() == 1
+        assert interface._connection.execute_command.call_count == 2
 
     def test_get_device_string_not_found(self, interface):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
@@ -227,27 +411,17 @@ class TestLinuxNetworkInterface:
             assert interface.get_rdma_device_name()
 
     def test_get_numa_node(self, interface):
-        output = "0"
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=output, stderr="stderr"
+            return_code=0, args="command", stdout=_facts_output(numa="0"), stderr="stderr"
         )
         assert interface.get_numa_node() == 0
 
-    def test_get_numa_node_failure(self, interface, mocker):
-        interface._interface_info.name = "eth0"
-        mocker.patch.object(
-            interface,
-            "get_numa_node",
-            side_effect=ConnectionCalledProcessError(1, ["cat", "/sys/class/net/eth0/devices/numa_node"]),
+    def test_get_numa_node_failure(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_facts_output(), stderr="No such file or directory"
         )
-        with pytest.raises(
-            ConnectionCalledProcessError,
-            match=re.escape(
-                "Command '['cat', '/sys/class/net/eth0/devices/numa_node']' returned unexpected exit status "
-                "1.\n\nstdout: None"
-            ),
-        ):
-            assert interface.get_numa_node()
+        with pytest.raises(NumaNodeException, match="NUMA node cannot be determined for interface: eth0"):
+            interface.get_numa_node()
 
     def test_get_ring_settings(self, interface):
         ethtool_output = dedent(
@@ -285,26 +459,23 @@ class TestLinuxNetworkInterface:
             "ethtool -G eth0 rx 512 tx 512", custom_exception=RingBufferSettingException
         )
 
-    def test_get_number_of_ports(self, interface, mocker):
-        output = "      4  Intel Corporation Ethernet Controller E810-C for SFP (rev 02)"
-        interface.get_device_string = mocker.Mock(return_value="Intel Corporation Ethernet Controller E810-C for SFP")
+    def test_get_number_of_ports(self, interface):
+        lspci_output = "00:00.0 Ethernet controller: Intel Corporation Ethernet Controller E810-C for SFP (rev 02)\n"
+        ethernet_output = "\n".join(
+            f"00:00.{func} Ethernet controller: Intel Corporation Ethernet Controller E810-C for SFP (rev 02)"
+            for func in range(4)
+        )
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout=output, stderr="stderr"
+            return_code=0,
+            args="command",
+            stdout=_facts_output(lspci=lspci_output, ethernet=ethernet_output),
+            stderr="stderr",
         )
         assert interface.get_number_of_ports() == 4
-        cmd = (
-            "lspci "
-            "| grep Eth "
-            "| awk -F ':' '{print $NF}' "
-            "| uniq -c "
-            "| grep 'Intel Corporation Ethernet Controller E810-C for SFP'"
-        )
-        interface._connection.execute_command.assert_called_with(command=cmd, shell=True, expected_return_codes={0})
 
-    def test_get_number_of_ports_not_found(self, interface, mocker):
-        interface.get_device_string = mocker.Mock(return_value="")
+    def test_get_number_of_ports_not_found(self, interface):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout="", stderr="stderr"
+            return_code=0, args="command", stdout=_facts_output(lspci=LSPCI_OUTPUT), stderr="stderr"
         )
         with pytest.raises(
             DeviceSetupException,
@@ -347,3 +518,114 @@ class TestLinuxNetworkInterface:
         mock_execute.assert_called_once_with(
             f"devlink dev reload pci/{interface.pci_address}", expected_return_codes={0, 1}
         )
+
+    def test_config_snapshot(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_config_output(), stderr=""
+        )
+        assert interface.config_snapshot() == _config_snapshot()
+        interface._connection.execute_command.assert_called_once()
+        command = interface._connection.execute_command.call_args.args[0]
+        assert 'echo "<<<0"; ip -j link show dev eth0 2>/dev/null' in command
+        assert 'echo "<<<7"; cat /sys/class/net/eth0/device/sriov_numvfs 2>/dev/null' in command
+
+    @pytest.mark.parametrize("interface", [{"namespace": "ns1"}], indirect=True)
+    def test_config_snapshot_namespace(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_config_output(), stderr=""
+        )
+        interface.config_snapshot()
+        command = interface._connection.execute_command.call_args.args[0]
+        assert command.startswith("ip netns exec ns1 sh -c ")
+        assert 'echo "<<<2"; ethtool -k eth0 2>/dev/null' in command
+
+    def test_config_snapshot_not_available(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="".join(f"<<<{index}\n" for index in range(8)), stderr=""
+        )
+        assert interface.config_snapshot() == InterfaceConfigSnapshot()
+
+    def test_config_restore_not_changed(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=_config_output(), stderr=""
+        )
+        assert interface.config_restore(_config_snapshot()) == []
+        interface._connection.execute_command.assert_called_once()
+
+    def test_config_restore(self, interface):
+        snapshot = _config_snapshot()
+        snapshot.mtu = 9000
+        snapshot.ip_addresses = ["10.10.30.1/24"]
+        snapshot.offload["tcp-segmentation-offload"] = "on"
+        snapshot.offload["large-receive-offload"] = "on"
+        snapshot.coalescing.update({"adaptive-tx": "off", "tx-usecs": "20"})
+        snapshot.rings["rx"] = "4096"
+        snapshot.channels["combined"] = "16"
+        snapshot.flow_control["tx"] = "off"
+        snapshot.vfs[0]["qos"] = "0"
+        expected_commands = [
+            "ethtool -L eth0 combined 16",
+            "ethtool -G eth0 rx 4096",
+            'printf "%s\\n" "link set dev eth0 mtu 9000" "addr del 10.10.10.1/24 dev eth0" '
+            '"addr add 10.10.30.1/24 dev eth0" "link set dev eth0 vf 0 vlan 10 qos 0" | ip -force -batch -',
+            "ethtool -K eth0 tcp-segmentation-offload on",
+            "ethtool -C eth0 adaptive-tx off tx-usecs 20",
+            "ethtool -A eth0 tx off",
+        ]
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=_config_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout="".join(f"<<<{index}\nrc=0\n" for index in range(len(expected_commands))),
+                stderr="",
+            ),
+        ]
+        assert interface.config_restore(snapshot) == expected_commands
+        command = interface._connection.execute_command.call_args.args[0]
+        assert 'echo "<<<1"; { ethtool -G eth0 rx 4096; } 2>&1; echo "rc=$?"' in command
+
+    def test_config_restore_adaptive_coalescing(self, interface):
+        snapshot = _config_snapshot()
+        snapshot.coalescing.update({"adaptive-rx": "on", "rx-usecs": "20"})
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=_config_output(), stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="<<<0\nrc=0\n", stderr=""),
+        ]
+        assert interface.config_restore(snapshot) == ["ethtool -C eth0 adaptive-rx on"]
+
+    @pytest.mark.parametrize("interface", [{"namespace": "ns1"}], indirect=True)
+    def test_config_restore_vfs(self, interface):
+        snapshot = _config_snapshot()
+        snapshot.vfs_count = 2
+        snapshot.vfs[1] = {"mac": "00:11:22:33:44:66", "spoofchk": "on"}
+        expected_commands = [
+            "ip netns exec ns1 sh -c 'echo 0 > /sys/class/net/eth0/device/sriov_numvfs && "
+            "echo 2 > /sys/class/net/eth0/device/sriov_numvfs'",
+            'printf "%s\\n" "link set dev eth0 vf 0 mac 00:11:22:33:44:55 vlan 10 qos 2 spoofchk on trust off '
+            'state auto" "link set dev eth0 vf 1 mac 00:11:22:33:44:66 spoofchk on" '
+            "| ip netns exec ns1 ip -force -batch -",
+        ]
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=_config_output(), stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="<<<0\nrc=0\n<<<1\nrc=0\n", stderr=""),
+        ]
+        assert interface.config_restore(snapshot) == expected_commands
+
+    def test_config_restore_failure(self, interface):
+        snapshot = _config_snapshot()
+        snapshot.rings["rx"] = "8192"
+        snapshot.channels["combined"] = "16"
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=_config_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="command",
+                stdout="<<<0\nrc=0\n<<<1\nnetlink error: Invalid argument\nrc=1\n",
+                stderr="",
+            ),
+        ]
+        with pytest.raises(
+            InterfaceConfigRestoreException, match="ethtool -G eth0 rx 8192: netlink error: Invalid argument"
+        ):
+            interface.config_restore(snapshot)